@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Benchmark InMemoryObjectSource load, churn, and responder reads at scale."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import asdict, dataclass
+
+from trishul_snmp import OID, InMemoryObjectSource, IntegerValue, V2cManager, V2cResponder
+
+_BASE_OID: OID = (1, 3, 6, 1, 4, 1, 99999, 1)
+_COLUMNS = 10
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectStoreBenchmark:
+    objects: int
+    bulk_load_s: float
+    churn_per_s: float
+    lookup_next_per_s: float
+    getbulk_per_s: float
+    getbulk_varbinds: int
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark InMemoryObjectSource and V2cResponder with large object stores"
+    )
+    parser.add_argument(
+        "--objects",
+        type=int,
+        default=1_000_000,
+        help="Objects loaded into the source (default: 1000000)",
+    )
+    parser.add_argument(
+        "--churn",
+        type=int,
+        default=20_000,
+        help="Row insert/delete pairs applied after loading (default: 20000)",
+    )
+    parser.add_argument(
+        "--lookups",
+        type=int,
+        default=200_000,
+        help="Successor lookups measured directly on the source (default: 200000)",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=500,
+        help="GETBULK requests sent to a local responder (default: 500)",
+    )
+    parser.add_argument(
+        "--max-repetitions",
+        type=int,
+        default=25,
+        help="GETBULK max repetitions (default: 25)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="Emit JSON instead of a plain-text report",
+    )
+    return parser
+
+
+def _object_oid(index: int) -> OID:
+    return (*_BASE_OID, index % _COLUMNS + 1, index // _COLUMNS + 1)
+
+
+async def _getbulk_rate(
+    source: InMemoryObjectSource,
+    *,
+    requests: int,
+    max_repetitions: int,
+    rng: random.Random,
+    rows: int,
+) -> tuple[float, int]:
+    varbinds = 0
+    async with V2cResponder(host="127.0.0.1", port=0, source=source) as responder:
+        local = responder.local_address
+        assert local is not None
+        serve_task = asyncio.create_task(responder.serve_forever())
+        async with V2cManager(
+            host="127.0.0.1",
+            port=local[1],
+            community="public",
+            timeout=5.0,
+            retries=0,
+        ) as manager:
+            started = time.perf_counter()
+            for _ in range(requests):
+                column = rng.randint(1, _COLUMNS)
+                row = rng.randint(1, rows)
+                response = await manager.get_bulk(
+                    (*_BASE_OID, column, row),
+                    max_repetitions=max_repetitions,
+                )
+                varbinds += len(response.varbinds)
+            elapsed = time.perf_counter() - started
+        await responder.close()
+        await serve_task
+    return requests / elapsed, varbinds // max(requests, 1)
+
+
+async def run_benchmark(args: argparse.Namespace) -> ObjectStoreBenchmark:
+    rng = random.Random(args.seed)
+    indexes = list(range(args.objects))
+    rng.shuffle(indexes)
+    objects = [(_object_oid(index), IntegerValue(index)) for index in indexes]
+
+    started = time.perf_counter()
+    source = InMemoryObjectSource(objects=objects)
+    bulk_load = time.perf_counter() - started
+    del objects
+
+    rows = max(args.objects // _COLUMNS, 1)
+    started = time.perf_counter()
+    for churn in range(args.churn):
+        row = (*_BASE_OID, rng.randint(1, _COLUMNS), rows + churn + 1)
+        source.set_object(row, IntegerValue(churn))
+        source.delete_object(row)
+    churn_rate = args.churn / (time.perf_counter() - started)
+
+    probes = [_object_oid(rng.randrange(args.objects)) for _ in range(args.lookups)]
+    started = time.perf_counter()
+    for probe in probes:
+        source.lookup_next(probe)
+    lookup_rate = args.lookups / (time.perf_counter() - started)
+
+    getbulk_rate, getbulk_varbinds = await _getbulk_rate(
+        source,
+        requests=args.requests,
+        max_repetitions=args.max_repetitions,
+        rng=rng,
+        rows=rows,
+    )
+    return ObjectStoreBenchmark(
+        objects=args.objects,
+        bulk_load_s=bulk_load,
+        churn_per_s=churn_rate,
+        lookup_next_per_s=lookup_rate,
+        getbulk_per_s=getbulk_rate,
+        getbulk_varbinds=getbulk_varbinds,
+    )
+
+
+def _format_result(result: ObjectStoreBenchmark) -> str:
+    lines = [
+        f"objects           {result.objects}",
+        f"bulk_load_s       {result.bulk_load_s:.3f}",
+        f"churn_per_s       {result.churn_per_s:.1f}",
+        f"lookup_next_per_s {result.lookup_next_per_s:.1f}",
+        f"getbulk_per_s     {result.getbulk_per_s:.1f}",
+        f"getbulk_varbinds  {result.getbulk_varbinds}",
+    ]
+    return "\n".join(lines)
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    result = await run_benchmark(args)
+    if args.json_output:
+        print(json.dumps(asdict(result), indent=2))
+    else:
+        print(_format_result(result))
+    return 0
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
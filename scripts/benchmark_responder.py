@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Benchmark V2cResponder throughput and latency under concurrent pollers."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import time
+from dataclasses import asdict, dataclass
+
+from trishul_snmp import (
+    OID,
+    AsyncCallbackObjectSource,
+    IntegerValue,
+    SnmpValueType,
+    V2cManager,
+    V2cResponder,
+)
+
+_BASE_OID: OID = (1, 3, 6, 1, 4, 1, 99999, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class ResponderBenchmark:
+    workers: int
+    pollers: int
+    requests: int
+    lookup_delay_ms: float
+    elapsed_s: float
+    client_throughput: float
+    median_ms: float
+    p95_ms: float
+    max_ms: float
+    server_throughput: float
+    server_mean_ms: float
+    server_max_ms: float
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark V2cResponder worker pools against concurrent local pollers"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16],
+        help="Responder worker counts to compare (default: 1 4 16)",
+    )
+    parser.add_argument(
+        "--pollers",
+        type=int,
+        default=16,
+        help="Concurrent manager clients (default: 16)",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=50,
+        help="GET requests sent by each poller (default: 50)",
+    )
+    parser.add_argument(
+        "--objects",
+        type=int,
+        default=1000,
+        help="Objects exposed by the simulated source (default: 1000)",
+    )
+    parser.add_argument(
+        "--lookup-delay-ms",
+        type=float,
+        default=2.0,
+        help="Simulated backend latency per source lookup (default: 2.0)",
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="Emit JSON instead of a plain-text report",
+    )
+    return parser
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    if not sorted_samples:
+        raise ValueError("Cannot compute percentile for empty samples")
+    index = max(0, min(len(sorted_samples) - 1, math.ceil(len(sorted_samples) * fraction) - 1))
+    return sorted_samples[index]
+
+
+def _build_source(objects: int, delay: float) -> AsyncCallbackObjectSource:
+    async def exact_lookup(oid: OID) -> SnmpValueType | None:
+        await asyncio.sleep(delay)
+        if len(oid) == len(_BASE_OID) + 1 and oid[:-1] == _BASE_OID and oid[-1] < objects:
+            return IntegerValue(oid[-1])
+        return None
+
+    async def next_lookup(oid: OID) -> tuple[OID, SnmpValueType] | None:
+        await asyncio.sleep(delay)
+        index = oid[-1] + 1 if oid[:-1] == _BASE_OID else 0
+        if index >= objects:
+            return None
+        return (*_BASE_OID, index), IntegerValue(index)
+
+    return AsyncCallbackObjectSource(exact_lookup=exact_lookup, next_lookup=next_lookup)
+
+
+async def _poll(port: int, *, poller: int, requests: int, objects: int) -> list[float]:
+    samples_ms: list[float] = []
+    async with V2cManager(
+        host="127.0.0.1",
+        port=port,
+        community="public",
+        timeout=5.0,
+        retries=0,
+    ) as manager:
+        for request in range(requests):
+            oid = (*_BASE_OID, (poller * requests + request) % objects)
+            started = time.perf_counter()
+            await manager.get(oid)
+            samples_ms.append((time.perf_counter() - started) * 1000)
+    return samples_ms
+
+
+async def run_benchmark(args: argparse.Namespace, workers: int) -> ResponderBenchmark:
+    source = _build_source(args.objects, args.lookup_delay_ms / 1000)
+    async with V2cResponder(host="127.0.0.1", port=0, source=source) as responder:
+        local = responder.local_address
+        assert local is not None
+        serve_task = asyncio.create_task(responder.serve_forever(workers=workers))
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                _poll(local[1], poller=poller, requests=args.requests, objects=args.objects)
+                for poller in range(args.pollers)
+            )
+        )
+        elapsed = time.perf_counter() - started
+        stats = responder.stats
+        await responder.close()
+        await serve_task
+
+    samples = sorted(sample for result in results for sample in result)
+    return ResponderBenchmark(
+        workers=workers,
+        pollers=args.pollers,
+        requests=len(samples),
+        lookup_delay_ms=args.lookup_delay_ms,
+        elapsed_s=elapsed,
+        client_throughput=len(samples) / elapsed,
+        median_ms=statistics.median(samples),
+        p95_ms=_percentile(samples, 0.95),
+        max_ms=samples[-1],
+        server_throughput=stats.throughput,
+        server_mean_ms=stats.mean_latency * 1000,
+        server_max_ms=stats.max_latency * 1000,
+    )
+
+
+def _format_results(results: list[ResponderBenchmark]) -> str:
+    headers = [
+        "workers",
+        "pollers",
+        "requests",
+        "req_per_s",
+        "median_ms",
+        "p95_ms",
+        "max_ms",
+        "server_mean_ms",
+        "server_max_ms",
+    ]
+    rows = [
+        [
+            str(result.workers),
+            str(result.pollers),
+            str(result.requests),
+            f"{result.client_throughput:.1f}",
+            f"{result.median_ms:.3f}",
+            f"{result.p95_ms:.3f}",
+            f"{result.max_ms:.3f}",
+            f"{result.server_mean_ms:.3f}",
+            f"{result.server_max_ms:.3f}",
+        ]
+        for result in results
+    ]
+
+    widths = [len(header) for header in headers]
+    for row in rows:
+        for index, value in enumerate(row):
+            widths[index] = max(widths[index], len(value))
+
+    def format_row(values: list[str]) -> str:
+        return "  ".join(value.ljust(widths[index]) for index, value in enumerate(values))
+
+    lines = [format_row(headers), format_row(["-" * width for width in widths])]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    results = [await run_benchmark(args, workers) for workers in args.workers]
+    if args.json_output:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(_format_results(results))
+    return 0
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tests._bundle_fixtures import _base_module, _write_json
+from trishul_snmp import (
+    BundleError,
+    BundleValidationError,
+    MibBundle,
+    UnknownOidError,
+    UnknownSymbolError,
+    load_bundle,
+    load_mapped_bundle,
+    write_mapped_bundle,
+)
+from trishul_snmp.mib.registry import MibRegistry
+
+
+def _module(name: str, objects: dict[str, str]) -> dict[object, object]:
+    payload = _base_module(module=name)
+    payload["objects"] = {
+        symbol: {
+            "oid": oid,
+            "object_type": "OBJECT-TYPE",
+            "class": "objecttype",
+            "nodetype": "scalar",
+            "syntax": "Integer32",
+            "max_access": "read-only",
+            "status": "current",
+        }
+        for symbol, oid in objects.items()
+    }
+    return payload
+
+
+def _write_module(path: Path, name: str, objects: dict[str, str]) -> None:
+    _write_json(path, _module(name, objects))
+    stat = path.stat()
+    # Guarantee a new stamp even on filesystems with coarse mtime resolution.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _write_bundle(path: Path) -> Path:
+    path.mkdir()
+    _write_module(path / "A-MIB.json", "A-MIB", {"alpha": "1.3.6.1.4.1.1.1"})
+    _write_module(path / "B-MIB.json", "B-MIB", {"beta": "1.3.6.1.4.1.2.1"})
+    return path
+
+
+def test_reload_without_changes_keeps_registry(tmp_path: Path) -> None:
+    bundle = load_bundle(_write_bundle(tmp_path / "bundle"))
+    registry = bundle._registry
+
+    assert bundle.reload() == ()
+    assert bundle._registry is registry
+
+
+def test_reload_rebuilds_only_changed_modules(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    bundle = load_bundle(bundle_dir)
+    untouched = bundle.resolve_node("B-MIB", "beta")
+    pinned = bundle.pinned()
+
+    _write_module(
+        bundle_dir / "A-MIB.json",
+        "A-MIB",
+        {"alpha": "1.3.6.1.4.1.1.1", "alphaExtra": "1.3.6.1.4.1.1.2"},
+    )
+
+    assert bundle.pinned() is pinned
+    assert bundle.reload() == ("A-MIB",)
+    assert bundle.translate("1.3.6.1.4.1.1.2.0") == "A-MIB::alphaExtra.0"
+    assert bundle.resolve_node("B-MIB", "beta") is untouched
+    with pytest.raises(UnknownSymbolError):
+        pinned.resolve("A-MIB::alphaExtra")
+    assert bundle.pinned() is not pinned
+    assert bundle.pinned().resolve("A-MIB::alphaExtra") == (1, 3, 6, 1, 4, 1, 1, 2)
+
+
+def test_reload_picks_up_added_and_removed_files(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    bundle = load_bundle(bundle_dir)
+
+    _write_module(bundle_dir / "C-MIB.json", "C-MIB", {"gamma": "1.3.6.1.4.1.3.1"})
+    (bundle_dir / "B-MIB.json").unlink()
+
+    assert bundle.reload() == ("B-MIB", "C-MIB")
+    assert bundle.translate("C-MIB::gamma") == "1.3.6.1.4.1.3.1"
+    assert list(bundle.modules) == ["A-MIB", "C-MIB"]
+    with pytest.raises(UnknownOidError):
+        bundle.lookup("1.3.6.1.4.1.2.1")
+
+
+def test_reload_handles_module_rename_and_oid_index(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    bundle = load_bundle(bundle_dir)
+
+    _write_module(bundle_dir / "B-MIB.json", "B2-MIB", {"beta": "1.3.6.1.4.1.2.1"})
+    _write_json(
+        bundle_dir / "oid_index.json",
+        {"oids": {"1.3.6.1.4.1.1.1": {"module": "A-MIB", "object": "alpha"}}},
+    )
+
+    assert bundle.reload() == ("B-MIB", "B2-MIB")
+    assert bundle.translate("1.3.6.1.4.1.2.1") == "B2-MIB::beta"
+    assert bundle._registry._oid_index
+
+    (bundle_dir / "oid_index.json").unlink()
+    assert bundle.reload() == ()
+    assert not bundle._registry._oid_index
+
+
+def test_reload_failure_keeps_previous_registry(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    bundle = load_bundle(bundle_dir)
+    registry = bundle._registry
+
+    (bundle_dir / "A-MIB.json").write_text("{broken", encoding="utf-8")
+
+    with pytest.raises(BundleValidationError):
+        bundle.reload()
+    assert bundle._registry is registry
+    assert bundle.translate("A-MIB::alpha") == "1.3.6.1.4.1.1.1"
+
+    _write_module(bundle_dir / "A-MIB.json", "A-MIB", {"alpha": "1.3.6.1.4.1.1.9"})
+    assert bundle.reload() == ("A-MIB",)
+    assert bundle.translate("A-MIB::alpha") == "1.3.6.1.4.1.1.9"
+
+
+def test_reload_single_module_file(tmp_path: Path) -> None:
+    module_path = tmp_path / "A-MIB.json"
+    _write_module(module_path, "A-MIB", {"alpha": "1.3.6.1.4.1.1.1"})
+    bundle = load_bundle(module_path)
+
+    _write_module(module_path, "A-MIB", {"alpha": "1.3.6.1.4.1.1.5"})
+
+    assert bundle.reload() == ("A-MIB",)
+    assert bundle.translate("A-MIB::alpha") == "1.3.6.1.4.1.1.5"
+
+    module_path.unlink()
+    with pytest.raises(BundleValidationError, match="does not exist"):
+        bundle.reload()
+
+
+def test_reload_requires_file_backed_bundle(tmp_path: Path) -> None:
+    bundle = MibBundle(MibRegistry({}), source=tmp_path)
+
+    with pytest.raises(BundleError, match="cannot be reloaded"):
+        bundle.reload()
+
+
+def test_replace_modules_restores_shadowed_oids(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    _write_module(bundle_dir / "Z-MIB.json", "Z-MIB", {"zeta": "1.3.6.1.4.1.1.1"})
+    bundle = load_bundle(bundle_dir)
+    assert bundle.translate("1.3.6.1.4.1.1.1") == "Z-MIB::zeta"
+
+    (bundle_dir / "Z-MIB.json").unlink()
+
+    assert bundle.reload() == ("Z-MIB",)
+    assert bundle.translate("1.3.6.1.4.1.1.1") == "A-MIB::alpha"
+
+
+def test_reload_keeps_fresh_load_order_for_added_modules(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    bundle = load_bundle(bundle_dir)
+
+    _write_module(bundle_dir / "AA-MIB.json", "AA-MIB", {"dup": "1.3.6.1.4.1.2.1"})
+
+    assert bundle.reload() == ("AA-MIB",)
+    fresh = load_bundle(bundle_dir)
+    assert list(bundle.modules) == list(fresh.modules) == ["A-MIB", "AA-MIB", "B-MIB"]
+    assert bundle.translate("1.3.6.1.4.1.2.1") == fresh.translate("1.3.6.1.4.1.2.1")
+    assert bundle.translate("1.3.6.1.4.1.2.1") == "B-MIB::beta"
+
+    # an updated module keeps its place, so B-MIB still wins the duplicate
+    _write_module(bundle_dir / "AA-MIB.json", "AA-MIB", {"dup": "1.3.6.1.4.1.2.1", "x": "1.9"})
+    assert bundle.reload() == ("AA-MIB",)
+    assert bundle.translate("1.3.6.1.4.1.2.1") == "B-MIB::beta"
+
+
+def test_reload_applies_manifest_order(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    _write_module(bundle_dir / "Z-MIB.json", "Z-MIB", {"zeta": "1.3.6.1.4.1.1.1"})
+    manifest = bundle_dir / "manifest.json"
+    _write_json(manifest, {"modules": ["A-MIB.json", "B-MIB.json", "Z-MIB.json"]})
+    bundle = load_bundle(bundle_dir)
+    registry = bundle._registry
+    assert bundle.translate("1.3.6.1.4.1.1.1") == "Z-MIB::zeta"
+
+    _write_json(manifest, {"modules": ["Z-MIB.json", "B-MIB.json", "A-MIB.json"]})
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert bundle.reload() == ("A-MIB", "Z-MIB")
+    assert registry.translate("1.3.6.1.4.1.1.1") == "Z-MIB::zeta"
+    assert list(bundle.modules) == ["Z-MIB", "B-MIB", "A-MIB"]
+    assert bundle.translate("1.3.6.1.4.1.1.1") == "A-MIB::alpha"
+    assert bundle.translate("1.3.6.1.4.1.1.1") == load_bundle(bundle_dir).translate(
+        "1.3.6.1.4.1.1.1"
+    )
+    assert bundle.reload() == ()
+
+
+def test_reload_mapped_bundle_reports_changed_modules(tmp_path: Path) -> None:
+    bundle_dir = _write_bundle(tmp_path / "bundle")
+    source = load_bundle(bundle_dir)
+    index_path = write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx")
+    mapped = load_mapped_bundle(index_path)
+
+    assert mapped.reload() == ()
+
+    _write_module(bundle_dir / "B-MIB.json", "B-MIB", {"beta": "1.3.6.1.4.1.2.7"})
+    source.reload()
+    write_mapped_bundle(source, index_path)
+
+    assert mapped.reload() == ("B-MIB",)
+    assert mapped.translate("B-MIB::beta") == "1.3.6.1.4.1.2.7"
+
+    index_path.unlink()
+    with pytest.raises(BundleValidationError, match="does not exist"):
+        mapped.reload()
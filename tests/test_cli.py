@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 from pathlib import Path
 
@@ -8,9 +9,12 @@ import pytest
 
 from trishul_snmp import (
     IntegerValue,
+    LoggedNotification,
     NotificationEvent,
+    NotificationLogWriter,
     NotificationMemberBinding,
     ObjectIdentifierValue,
+    ReplayStats,
     __version__,
 )
 from trishul_snmp.cli.main import _handle_translate, main, run
@@ -437,6 +441,47 @@ def test_cli_translate_with_single_module_bundle(tmp_path: Path, capsys) -> None
     assert captured.out.strip() == "1.3.6.1.2.1.2.2.1.2.7"
 
 
+def test_cli_translate_streams_stdin(monkeypatch, tmp_path: Path, capsys) -> None:
+    _write_json(tmp_path / "IF-MIB.json", _if_mib_payload())
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO("IF-MIB::ifDescr.7\n\n1.3.6.1.2.1.2.2.1.2.9\n1.3.6.1.2.1.2.2.1.2.10\n"),
+    )
+
+    exit_code = main(["translate", "--bundle", str(tmp_path / "IF-MIB.json"), "-"])
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert captured.out.splitlines() == [
+        "1.3.6.1.2.1.2.2.1.2.7",
+        "IF-MIB::ifDescr.9",
+        "IF-MIB::ifDescr.10",
+    ]
+
+
+def test_cli_translate_stdin_unknown_targets(monkeypatch, tmp_path: Path, capsys) -> None:
+    _write_json(tmp_path / "IF-MIB.json", _if_mib_payload())
+    bundle_path = str(tmp_path / "IF-MIB.json")
+
+    monkeypatch.setattr(
+        "sys.stdin", io.StringIO("1.3.6.1.2.1.2.2.1.2.1\n2.25.1\n1.3.6.1.2.1.2.2.1.2.2\n")
+    )
+    assert main(["translate", "--bundle", bundle_path, "-"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == ["IF-MIB::ifDescr.1"]
+    assert "Unknown numeric OID: 2.25.1" in captured.err
+
+    monkeypatch.setattr(
+        "sys.stdin", io.StringIO("1.3.6.1.2.1.2.2.1.2.1\n2.25.1\n1.3.6.1.2.1.2.2.1.2.2\n")
+    )
+    assert main(["translate", "--bundle", bundle_path, "--keep-unknown", "-"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "IF-MIB::ifDescr.1",
+        "2.25.1",
+        "IF-MIB::ifDescr.2",
+    ]
+
+
 def test_cli_get_renders_text_and_uses_bundle(monkeypatch, tmp_path: Path, capsys) -> None:
     _write_json(tmp_path / "IF-MIB.json", _if_mib_payload())
     FakeManager.created.clear()
@@ -906,6 +951,83 @@ def test_cli_listen_rejects_negative_count(capsys) -> None:
     assert captured.err.strip() == "tsnmp: --count cannot be negative"
 
 
+def test_cli_replay_reads_each_source_format(monkeypatch, tmp_path: Path, capsys) -> None:
+    calls: list[dict[str, object]] = []
+
+    async def fake_replay(datagrams: list[object], **kwargs: object) -> ReplayStats:
+        calls.append({"datagrams": datagrams, **kwargs})
+        return ReplayStats(sent=len(datagrams), errors=0, bytes_sent=6, elapsed=0.5, max_lag=0.0)
+
+    monkeypatch.setattr("trishul_snmp.cli.main.replay_notifications", fake_replay)
+
+    with NotificationLogWriter(tmp_path / "log") as writer:
+        writer.append(b"\x30\x00", ("10.0.0.1", 162), timestamp=10.0)
+        writer.append(b"\x30\x01", ("10.0.0.2", 162), timestamp=11.0)
+    exit_code = main(
+        [
+            "replay",
+            str(tmp_path / "log"),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            "9162",
+            "--speed",
+            "10",
+            "--max-gap",
+            "0.5",
+            "--source-host",
+            "10.0.0.2",
+        ]
+    )
+    assert exit_code == 0
+    assert calls[0]["datagrams"] == [
+        LoggedNotification(timestamp=11.0, source_address=("10.0.0.2", 162), data=b"\x30\x01")
+    ]
+    assert (calls[0]["host"], calls[0]["port"], calls[0]["speed"], calls[0]["max_gap"]) == (
+        "127.0.0.1",
+        9162,
+        10.0,
+        0.5,
+    )
+    assert "sent=1 errors=0 bytes=6 elapsed=0.500s rate=2.0/s" in capsys.readouterr().out
+
+    hex_file = tmp_path / "traps.hex"
+    hex_file.write_text("3000\n30:01\n")
+    exit_code = main(
+        ["replay", str(hex_file), "--host", "127.0.0.1", "--rate", "500", "--repeat", "3", "--json"]
+    )
+    assert exit_code == 0
+    assert calls[1]["datagrams"] == [b"\x30\x00", b"\x30\x01"]
+    assert (calls[1]["rate"], calls[1]["repeat"], calls[1]["sockets"]) == (500.0, 3, 4)
+    assert json.loads(capsys.readouterr().out)["rate"] == 4.0
+
+    capture = tmp_path / "traps.pcap"
+    capture.write_bytes(bytes.fromhex("d4c3b2a1020004000000000000000000ffff000065000000"))
+    exit_code = main(
+        ["replay", str(capture), "--host", "127.0.0.1", "--max-speed", "--capture-port", "1162"]
+    )
+    assert exit_code == 0
+    assert calls[2]["datagrams"] == [] and calls[2]["speed"] is None
+
+    exit_code = main(["replay", str(hex_file), "--host", "127.0.0.1", "--start", "5"])
+    assert exit_code == 1
+    assert "require a notification log" in capsys.readouterr().err
+
+
+def test_cli_replay_fails_when_sends_fail(monkeypatch, tmp_path: Path, capsys) -> None:
+    async def failing_replay(datagrams: list[object], **kwargs: object) -> ReplayStats:
+        del kwargs
+        return ReplayStats(sent=0, errors=len(datagrams), bytes_sent=0, elapsed=0.1, max_lag=0.0)
+
+    monkeypatch.setattr("trishul_snmp.cli.main.replay_notifications", failing_replay)
+    hex_file = tmp_path / "traps.hex"
+    hex_file.write_text("3000\n")
+
+    exit_code = main(["replay", str(hex_file), "--format", "hex", "--host", "127.0.0.1"])
+    assert exit_code == 1
+    assert "errors=1" in capsys.readouterr().out
+
+
 def test_cli_main_renders_handler_value_errors(monkeypatch, capsys) -> None:
     class ExplodingManager(FakeManager):
         async def get(self, *targets: str) -> Response:
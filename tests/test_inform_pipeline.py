@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import replace
+from typing import Any, cast
+
+import pytest
+
+from trishul_snmp import (
+    ErrorStatus,
+    InformPipeline,
+    IntegerValue,
+    NotificationEvent,
+    V2cNotifier,
+    V3NotificationListener,
+    V3Notifier,
+)
+from trishul_snmp.errors import ProtocolError, RequestTimeoutError, TransportError
+from trishul_snmp.security.usm import AuthProtocol, UsmLocalEngine, UsmUser
+from trishul_snmp.transport.dispatcher import RequestDispatcher
+from trishul_snmp.transport.udp import UdpClient
+from trishul_snmp.wire.message import decode_message, encode_message
+from trishul_snmp.wire.pdu import PduType
+
+_LINK_DOWN = "1.3.6.1.6.3.1.1.5.3"
+_IF_INDEX = "1.3.6.1.2.1.2.2.1.1.3"
+
+
+class _Manager(asyncio.DatagramProtocol):
+    """Answers v2c informs after *delay*, dropping or ignoring chosen request-ids.
+
+    With *noise*, junk, a trap, and an unmatched response precede each answer.
+    """
+
+    def __init__(
+        self, *, delay: float, drop_first: set[int], ignore: set[int], noise: bool
+    ) -> None:
+        self.delay = delay
+        self.drop_first = drop_first
+        self.ignore = ignore
+        self.noise = noise
+        self.received: list[int] = []
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = cast(asyncio.DatagramTransport, transport)
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        message = decode_message(data)
+        request_id = message.pdu.request_id
+        self.received.append(request_id)
+        if request_id in self.ignore:
+            return
+        if request_id in self.drop_first:
+            self.drop_first.discard(request_id)
+            return
+        reply = encode_message(
+            replace(message, pdu=replace(message.pdu, pdu_type=PduType.RESPONSE))
+        )
+        assert self.transport is not None
+        if self.noise:
+            trap = replace(message.pdu, pdu_type=PduType.SNMPV2_TRAP)
+            unmatched = replace(message.pdu, pdu_type=PduType.RESPONSE, request_id=999)
+            self.transport.sendto(b"junk", addr)
+            for pdu in (trap, unmatched):
+                self.transport.sendto(encode_message(replace(message, pdu=pdu)), addr)
+        asyncio.get_running_loop().call_later(self.delay, self.transport.sendto, reply, addr)
+
+
+async def _manager(
+    *,
+    delay: float = 0.0,
+    drop_first: frozenset[int] = frozenset(),
+    ignore: frozenset[int] = frozenset(),
+    noise: bool = False,
+) -> tuple[_Manager, int]:
+    try:
+        transport, protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _Manager(
+                delay=delay, drop_first=set(drop_first), ignore=set(ignore), noise=noise
+            ),
+            local_addr=("127.0.0.1", 0),
+        )
+    except OSError as exc:
+        if exc.errno in {1, 13}:
+            pytest.skip(f"UDP sockets are not permitted in this environment: {exc}")
+        raise
+    return protocol, transport.get_extra_info("sockname")[1]
+
+
+def test_pipeline_keeps_a_window_of_informs_outstanding() -> None:
+    async def scenario() -> None:
+        manager, port = await _manager(delay=0.05)
+        async with V2cNotifier(host="127.0.0.1", port=port, community="public") as notifier:
+            async with InformPipeline(notifier, window=4, recv_buffer_size=1 << 20) as pipeline:
+                assert pipeline.window == 4
+                futures = [
+                    await pipeline.submit(_LINK_DOWN, varbinds=[(_IF_INDEX, IntegerValue(n))])
+                    for n in range(4)
+                ]
+                # the window is full until the delayed acks arrive
+                assert pipeline.stats.outstanding == 4
+                blocked = asyncio.create_task(pipeline.submit(_LINK_DOWN))
+                await asyncio.sleep(0.01)
+                assert not blocked.done()
+                responses = await asyncio.gather(*futures)
+                futures.append(await blocked)
+                responses.append(await pipeline.send_inform(_LINK_DOWN, uptime=9))
+                await futures[-1]
+
+        assert [response.request_id for response in responses] == [1, 2, 3, 4, 6]
+        assert all(response.error_status is ErrorStatus.NO_ERROR for response in responses)
+        assert responses[0].varbinds[2].value == IntegerValue(0)
+        assert sorted(manager.received) == [1, 2, 3, 4, 5, 6]
+        stats = pipeline.stats
+        assert (stats.sent, stats.acked, stats.retransmits, stats.timeouts) == (6, 6, 0, 0)
+        assert stats.outstanding == 0
+        assert 0.05 <= stats.mean_latency <= stats.max_latency < 1.0
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_retransmits_lost_informs_and_times_out() -> None:
+    async def scenario() -> None:
+        manager, port = await _manager(drop_first=frozenset({1}), ignore=frozenset({2}))
+        async with V2cNotifier(host="127.0.0.1", port=port, community="public") as notifier:
+            pipeline = InformPipeline(notifier, timeout=0.05, retries=2)
+            with pytest.raises(TransportError, match="not open"):
+                await pipeline.submit(_LINK_DOWN)
+            async with pipeline:
+                lost = await pipeline.submit(_LINK_DOWN)
+                ignored = await pipeline.submit(_LINK_DOWN)
+                assert (await lost).request_id == 1
+                with pytest.raises(RequestTimeoutError):
+                    await ignored
+                await pipeline.open()
+        await pipeline.close()
+
+        assert manager.received.count(1) == 2
+        assert manager.received.count(2) == 3
+        stats = pipeline.stats
+        assert (stats.sent, stats.acked, stats.retransmits, stats.timeouts) == (2, 1, 3, 1)
+        assert stats.max_latency >= 0.05
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_ignores_stray_datagrams_and_send_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    original = UdpClient.send
+    failures = [True]
+
+    async def flaky_send(self: UdpClient, data: bytes) -> None:
+        if failures:
+            failures.pop()
+            raise TransportError("Failed to send UDP datagram")
+        await original(self, data)
+
+    monkeypatch.setattr(UdpClient, "send", flaky_send)
+
+    async def scenario() -> None:
+        manager, port = await _manager(noise=True)
+        async with V2cNotifier(host="127.0.0.1", port=port, community="public") as notifier:
+            async with InformPipeline(notifier, timeout=0.1) as pipeline:
+                future = await pipeline.submit(_LINK_DOWN)
+                response = await asyncio.wait_for(future, timeout=2.0)
+        # the first send failed, so only the retransmission reached the manager
+        assert manager.received == [1]
+        assert response.request_id == 1
+        assert (pipeline.stats.retransmits, pipeline.stats.acked) == (1, 1)
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_discovers_v3_peer_engine() -> None:
+    async def scenario() -> None:
+        user = UsmUser(
+            username="forwarder",
+            auth_protocol=AuthProtocol.MD5,
+            auth_key=b"\xaa" * hashlib.md5(b"").digest_size,
+            auth_key_localized=True,
+        )
+        engine = UsmLocalEngine(
+            engine_id=b"\x80\x00\x01\x02\x03" + b"\x46" * 12, engine_boots=4, engine_time=90
+        )
+        events: list[NotificationEvent] = []
+        try:
+            listener = V3NotificationListener(
+                host="127.0.0.1", port=0, user=user, local_engine=engine, handler=events.append
+            )
+            await listener.open()
+        except TransportError as exc:
+            cause = exc.__cause__
+            if isinstance(cause, OSError) and cause.errno in {1, 13}:
+                pytest.skip(f"UDP sockets are not permitted in this environment: {cause}")
+            raise
+        local = listener.local_address
+        assert local is not None
+        # a trap-capable notifier skips discovery on open, so the pipeline performs it
+        sender = replace(engine, engine_id=b"\x80\x00\x01\x02\x03" + b"\x47" * 12)
+        async with V3Notifier(
+            host="127.0.0.1", port=local[1], user=user, local_engine=sender
+        ) as notifier:
+            assert not notifier._usm_model().peer_engine_discovered
+            async with InformPipeline(notifier, window=8) as pipeline:
+                futures = [await pipeline.submit(_LINK_DOWN, uptime=n) for n in range(8)]
+                responses = await asyncio.wait_for(asyncio.gather(*futures), timeout=2.0)
+        await listener.close()
+        assert [response.request_id for response in responses] == list(range(1, 9))
+        assert pipeline.stats.acked == 8
+        assert [event.uptime for event in events] == list(range(8))
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_validates_arguments() -> None:
+    notifier = V2cNotifier(host="127.0.0.1", community="public")
+    for kwargs, message in (
+        ({"window": 0}, "window must be at least 1"),
+        ({"timeout": 0}, "timeout must be > 0"),
+        ({"retries": -1}, "retries cannot be negative"),
+        ({"recv_buffer_size": 0}, "recv_buffer_size must be positive"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            InformPipeline(notifier, **kwargs)  # type: ignore[arg-type]
+    with pytest.raises(TransportError, match="not open"):
+        UdpClient("127.0.0.1", 162).set_recv_buffer_size(1 << 16)
+
+
+def test_pipeline_stops_when_the_notifier_is_closed() -> None:
+    async def scenario() -> None:
+        manager, port = await _manager(ignore=frozenset({1}))
+        notifier = V2cNotifier(host="127.0.0.1", port=port, community="public")
+        pipeline = InformPipeline(notifier, window=1, timeout=5.0)
+        await pipeline.open()
+        future = await pipeline.submit(_LINK_DOWN)
+        blocked = asyncio.create_task(pipeline.submit(_LINK_DOWN))
+        await asyncio.sleep(0.01)
+        await notifier.close()
+        with pytest.raises(TransportError, match="notifier was closed"):
+            await asyncio.wait_for(future, timeout=2.0)
+        with pytest.raises(TransportError, match="not open"):
+            await asyncio.wait_for(blocked, timeout=2.0)
+        await asyncio.wait_for(pipeline.close(), timeout=2.0)
+        assert manager.received == [1]
+        assert pipeline.stats.outstanding == 0
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_releases_the_window_when_encoding_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    original = RequestDispatcher.prepare_request
+    failures = [True, True]
+
+    def failing_prepare(self: RequestDispatcher, *args: Any, **kwargs: Any) -> Any:
+        if failures:
+            failures.pop()
+            raise ProtocolError("Unable to encode SNMP message")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(RequestDispatcher, "prepare_request", failing_prepare)
+
+    async def scenario() -> None:
+        manager, port = await _manager()
+        async with V2cNotifier(host="127.0.0.1", port=port, community="public") as notifier:
+            async with InformPipeline(notifier, window=1) as pipeline:
+                for _ in range(2):
+                    with pytest.raises(ProtocolError):
+                        await pipeline.submit(_LINK_DOWN)
+                response = await asyncio.wait_for(pipeline.send_inform(_LINK_DOWN), timeout=2.0)
+        assert response.request_id == manager.received[0]
+        assert pipeline.stats.sent == 1
+
+    asyncio.run(scenario())
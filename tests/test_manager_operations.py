@@ -3,7 +3,12 @@ from __future__ import annotations
 import pytest
 
 from trishul_snmp.errors import UnknownSymbolError
-from trishul_snmp.manager.operations import normalize_targets
+from trishul_snmp.manager.operations import (
+    compile_targets,
+    normalize_targets,
+    request_varbinds_for,
+)
+from trishul_snmp.wire.pdu import Pdu, PduType, build_null_varbinds, encode_pdu
 
 
 def test_normalize_targets_requires_at_least_one_target() -> None:
@@ -25,3 +30,37 @@ def test_normalize_targets_accepts_numeric_oid_text_without_bundle() -> None:
 def test_normalize_targets_rejects_unrecognized_text() -> None:
     with pytest.raises(UnknownSymbolError, match="Unrecognized target format: not-an-oid"):
         normalize_targets(("not-an-oid",), bundle=None)
+
+
+def test_compile_targets_pre_encodes_null_varbinds() -> None:
+    compiled = compile_targets(("1.3.6.1.2.1.1.3.0", (1, 3, 6, 1, 2, 1, 1, 5, 0)), bundle=None)
+
+    assert compiled.oids == ((1, 3, 6, 1, 2, 1, 1, 3, 0), (1, 3, 6, 1, 2, 1, 1, 5, 0))
+    assert compiled.varbinds == build_null_varbinds(compiled.oids)
+    assert all(varbind.encoded is not None for varbind in compiled.varbinds)
+
+    pdu = Pdu(
+        pdu_type=PduType.GET,
+        request_id=7,
+        error_status=0,
+        error_index=0,
+        varbinds=compiled.varbinds,
+    )
+    plain = Pdu(
+        pdu_type=PduType.GET,
+        request_id=7,
+        error_status=0,
+        error_index=0,
+        varbinds=build_null_varbinds(compiled.oids),
+    )
+    assert encode_pdu(pdu) == encode_pdu(plain)
+
+
+def test_request_varbinds_for_reuses_and_mixes_compiled_targets() -> None:
+    compiled = compile_targets(("1.3.6.1.2.1.1.3.0",), bundle=None)
+
+    assert request_varbinds_for((compiled,), bundle=None) is compiled.varbinds
+    mixed = request_varbinds_for(("1.3.6.1.2.1.1.1.0", compiled, "1.3.6.1.2.1.1.5.0"), bundle=None)
+    assert [varbind.oid[-2] for varbind in mixed] == [1, 3, 5]
+    with pytest.raises(ValueError, match="At least one target is required"):
+        request_varbinds_for((), bundle=None)
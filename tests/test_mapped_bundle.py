@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests._bundle_fixtures import _base_module, _write_json, write_scalar_instance_alias_bundle
+from trishul_snmp import (
+    BundleValidationError,
+    MappedMibRegistry,
+    TimeTicksValue,
+    UnknownOidError,
+    UnknownSymbolError,
+    VarBind,
+    load_bundle,
+    load_mapped_bundle,
+    write_mapped_bundle,
+)
+from trishul_snmp.mib.render import enrich_varbinds
+
+
+def _write_app_module(path: Path) -> None:
+    payload = _base_module(module="APP-MIB", imports={"SNMPv2-MIB": ["sysUpTime"]})
+    payload["objects"] = {
+        "appStatus": {
+            "oid": "1.3.6.1.4.1.99999.1",
+            "object_type": "OBJECT-TYPE",
+            "class": "objecttype",
+            "nodetype": "scalar",
+            "syntax": "AppState",
+            "max_access": "read-only",
+            "status": "current",
+            "description": "Current application state.",
+            "constraints": {"enum": {"up": 1, "down": 2}},
+        },
+    }
+    payload["notifications"] = {
+        "appDown": {
+            "oid": "1.3.6.1.4.1.99999.0.1",
+            "object_type": "NOTIFICATION-TYPE",
+            "class": "notificationtype",
+            "status": "current",
+            "description": "Application went down.",
+            "members": [{"module": "APP-MIB", "object": "appStatus"}],
+        }
+    }
+    payload["types"] = {
+        "AppState": {
+            "class": "textualconvention",
+            "base_type": "Integer32",
+            "display_hint": "d",
+            "status": "current",
+            "constraints": {"enum": {"up": 1, "down": 2}},
+        }
+    }
+    _write_json(path / "APP-MIB.json", payload)
+
+
+def _write_bundle(path: Path) -> Path:
+    path.mkdir()
+    bundle_dir = write_scalar_instance_alias_bundle(path)
+    _write_app_module(bundle_dir)
+    _write_json(
+        bundle_dir / "manifest.json",
+        {
+            "modules": [
+                "DISMAN-EXPRESSION-MIB.json",
+                "SNMPv2-MIB.json",
+                "APP-MIB.json",
+            ]
+        },
+    )
+    return bundle_dir
+
+
+def test_mapped_bundle_matches_json_bundle(tmp_path: Path) -> None:
+    source = load_bundle(_write_bundle(tmp_path / "bundle"))
+    index_path = write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx")
+    mapped = load_mapped_bundle(index_path)
+
+    assert isinstance(mapped._registry, MappedMibRegistry)
+    assert mapped.source == index_path
+    for target in (
+        "SNMPv2-MIB::sysUpTime.0",
+        "1.3.6.1.2.1.1.3.0",
+        "1.3.6.1.2.1.1.3",
+        "APP-MIB::appStatus.0",
+        "1.3.6.1.4.1.99999.0.1",
+        "1.3.6.1.4.1.99999.1.7.8",
+    ):
+        assert mapped.translate(target) == source.translate(target)
+    assert mapped.lookup("1.3.6.1.2.1.1.3.0") == source.lookup("1.3.6.1.2.1.1.3.0")
+    assert mapped.resolve_type("APP-MIB", "AppState") == source.resolve_type("APP-MIB", "AppState")
+    assert mapped.resolve_node("APP-MIB", "appDown") == source.resolve_node("APP-MIB", "appDown")
+    assert list(mapped.modules) == sorted(source.modules)
+    assert [node.symbolic for node in mapped.iter_objects(module="APP-MIB")] == [
+        "APP-MIB::appStatus"
+    ]
+    assert [node.name for node in mapped.search("went down")] == ["appDown"]
+
+    with pytest.raises(UnknownSymbolError):
+        mapped.resolve("APP-MIB::missing")
+    with pytest.raises(UnknownOidError):
+        mapped.lookup("2.25")
+
+
+def test_mapped_bundle_module_records_resolve_members_lazily(tmp_path: Path) -> None:
+    source = load_bundle(_write_bundle(tmp_path / "bundle"))
+    mapped = load_mapped_bundle(write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx"))
+
+    module = mapped.modules["APP-MIB"]
+    original = source.modules["APP-MIB"]
+
+    assert module.imports == original.imports
+    assert module.module_metadata == original.module_metadata
+    assert dict(module.objects) == dict(original.objects)
+    assert dict(module.notifications) == dict(original.notifications)
+    assert dict(module.types) == dict(original.types)
+    assert "appDown" not in module.objects
+    assert module.objects["appStatus"].description == "Current application state."
+    with pytest.raises(KeyError):
+        module.objects["appDown"]
+    with pytest.raises(KeyError):
+        mapped.modules["NOPE-MIB"]
+
+    registry = mapped._registry
+    assert ("APP-MIB", "appStatus") in registry._symbol_index
+    assert ("APP-MIB", "missing") not in registry._symbol_index
+    assert "not-a-key" not in registry._symbol_index
+    assert len(registry._exact_oid_index) == 5
+    assert (1, 3, 6, 1, 2, 1, 1, 3, 0) in set(registry._oid_index)
+    with pytest.raises(KeyError):
+        registry._exact_oid_index[(9, 9)]
+
+
+def test_mapped_bundle_enriches_varbinds(tmp_path: Path) -> None:
+    source = load_bundle(_write_bundle(tmp_path / "bundle"))
+    mapped = load_mapped_bundle(write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx"))
+    varbinds = (VarBind(oid=(1, 3, 6, 1, 2, 1, 1, 3, 0), value=TimeTicksValue(42)),)
+
+    assert enrich_varbinds(mapped, varbinds) == enrich_varbinds(source, varbinds)
+
+
+def test_mapped_bundle_rejects_invalid_files(tmp_path: Path) -> None:
+    with pytest.raises(BundleValidationError, match="does not exist"):
+        load_mapped_bundle(tmp_path / "missing.tsnmpidx")
+
+    empty = tmp_path / "empty.tsnmpidx"
+    empty.write_bytes(b"")
+    with pytest.raises(BundleValidationError, match="empty"):
+        load_mapped_bundle(empty)
+
+    short = tmp_path / "short.tsnmpidx"
+    short.write_bytes(b"TSNMP")
+    with pytest.raises(BundleValidationError, match="truncated"):
+        load_mapped_bundle(short)
+
+    wrong = tmp_path / "wrong.tsnmpidx"
+    wrong.write_bytes(b"NOTANIDX" + bytes(8))
+    with pytest.raises(BundleValidationError, match="not a mapped bundle index"):
+        load_mapped_bundle(wrong)
+
+    source = load_bundle(_write_bundle(tmp_path / "bundle"))
+    valid = write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx").read_bytes()
+
+    future = tmp_path / "future.tsnmpidx"
+    future.write_bytes(valid[:8] + (99).to_bytes(4, "little") + valid[12:])
+    with pytest.raises(BundleValidationError, match="version 99"):
+        load_mapped_bundle(future)
+
+    cut = tmp_path / "cut.tsnmpidx"
+    cut.write_bytes(valid[:-10])
+    with pytest.raises(BundleValidationError, match="truncated"):
+        load_mapped_bundle(cut)
+
+
+def test_mapped_registry_close_releases_mapping(tmp_path: Path) -> None:
+    source = load_bundle(_write_bundle(tmp_path / "bundle"))
+    mapped = load_mapped_bundle(write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx"))
+    registry = mapped._registry
+    assert isinstance(registry, MappedMibRegistry)
+
+    assert mapped.translate("APP-MIB::appStatus") == "1.3.6.1.4.1.99999.1"
+    registry.close()
+
+    with pytest.raises(ValueError):
+        mapped.translate("APP-MIB::appStatus")
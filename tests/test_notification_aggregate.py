@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from trishul_snmp import (
+    IntegerValue,
+    NotificationAggregator,
+    NotificationEvent,
+    NotificationSummary,
+    ObjectIdentifierValue,
+    TimeTicksValue,
+    VarBind,
+    notification_fingerprint,
+)
+
+_LINK_DOWN = (1, 3, 6, 1, 6, 3, 1, 1, 5, 3)
+_LINK_UP = (1, 3, 6, 1, 6, 3, 1, 1, 5, 4)
+
+
+def _event(
+    *,
+    host: str = "10.0.0.1",
+    trap_oid: tuple[int, ...] = _LINK_DOWN,
+    if_index: int = 3,
+    uptime: int = 100,
+    request_id: int = 1,
+) -> NotificationEvent:
+    return NotificationEvent(
+        request_id=request_id,
+        community="public",
+        source_address=(host, 40000 + request_id),
+        pdu_type="snmpv2-trap",
+        varbinds=(
+            VarBind(oid=(1, 3, 6, 1, 2, 1, 1, 3, 0), value=TimeTicksValue(uptime)),
+            VarBind(
+                oid=(1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0),
+                value=ObjectIdentifierValue(trap_oid),
+            ),
+            VarBind(oid=(1, 3, 6, 1, 2, 1, 2, 2, 1, 1, if_index), value=IntegerValue(if_index)),
+        ),
+        notification_oid=trap_oid,
+        uptime=uptime,
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_aggregator_suppresses_duplicates_within_sliding_window(clock: list[float]) -> None:
+    aggregator = NotificationAggregator(window=5.0, max_age=60.0)
+    first = _event()
+    assert aggregator.add(first) is first
+    for request_id in range(2, 6):
+        clock[0] += 1.0
+        assert aggregator.add(_event(request_id=request_id, uptime=100 + request_id)) is None
+    other = _event(if_index=4)
+    assert aggregator.add(other) is other
+    assert aggregator.add(_event(host="10.0.0.2")) is not None
+    assert aggregator.add(_event(trap_oid=_LINK_UP)) is not None
+
+    clock[0] += 4.0
+    assert aggregator.expire() == []
+    assert aggregator.next_expiry() == pytest.approx(1.0)
+    clock[0] += 1.0
+    [summary] = aggregator.expire()
+    assert summary == NotificationSummary(event=first, count=5, first_seen=1000.0, last_seen=1004.0)
+    assert summary.suppressed == 4
+    payload = summary.to_dict()
+    assert payload["request_id"] == 1
+    assert payload["aggregated"] == {
+        "count": 5,
+        "suppressed": 4,
+        "first_seen": 1000.0,
+        "last_seen": 1004.0,
+    }
+
+    stats = aggregator.stats
+    assert (stats.received, stats.forwarded, stats.suppressed) == (8, 4, 4)
+    assert (stats.summaries, stats.evicted, stats.tracked) == (1, 0, 0)
+    assert aggregator.next_expiry() is None
+
+    # a repeat after the window has passed starts a new window
+    assert aggregator.add(first) is first
+    clock[0] += 6.0
+    assert aggregator.add(first) is first
+    assert aggregator.flush() == []
+
+
+def test_aggregator_bounds_tracked_fingerprints(clock: list[float]) -> None:
+    aggregator = NotificationAggregator(window=60.0, max_keys=2)
+    assert aggregator.window == aggregator.max_age == 60.0 and aggregator.max_keys == 2
+    for if_index in (1, 2):
+        aggregator.add(_event(if_index=if_index))
+        aggregator.add(_event(if_index=if_index))
+    clock[0] += 1.0
+    aggregator.add(_event(if_index=1))
+    aggregator.add(_event(if_index=3))
+
+    # interface 2 was least recently seen, so it is evicted with its summary ready
+    assert aggregator.next_expiry() == 0.0
+    [evicted] = aggregator.expire()
+    assert evicted.event.varbinds[-1].value == IntegerValue(2)
+    assert evicted.count == 2
+    assert aggregator.stats.evicted == 1
+    assert aggregator.stats.tracked == 2
+
+    summaries = aggregator.flush()
+    assert [summary.count for summary in summaries] == [3]
+    assert aggregator.stats.tracked == 0
+
+    custom = NotificationAggregator(key=lambda event: event.notification_oid)
+    assert custom.add(_event(if_index=1)) is not None
+    assert custom.add(_event(if_index=2, host="10.0.0.9")) is None
+
+    with pytest.raises(ValueError, match="window must be positive"):
+        NotificationAggregator(window=0)
+    with pytest.raises(ValueError, match="max_age must be positive"):
+        NotificationAggregator(max_age=0)
+    with pytest.raises(ValueError, match="max_keys must be at least 1"):
+        NotificationAggregator(max_keys=0)
+
+
+def test_aggregator_summarizes_a_storm_that_never_goes_quiet(clock: list[float]) -> None:
+    aggregator = NotificationAggregator(window=5.0)
+    assert aggregator.add(_event()) is not None
+    summaries: list[NotificationSummary] = []
+    forwarded = 1
+    # a link flapping every two seconds for half a minute
+    for _ in range(15):
+        clock[0] += 2.0
+        assert aggregator.next_expiry() is not None
+        summaries.extend(aggregator.expire())
+        forwarded += aggregator.add(_event()) is not None
+    assert [(summary.first_seen, summary.last_seen) for summary in summaries] == [
+        (start, start + 4.0) for start in (1000.0, 1006.0, 1012.0, 1018.0, 1024.0)
+    ]
+    assert all(summary.count == 3 for summary in summaries)
+    assert forwarded == 6
+    stats = aggregator.stats
+    assert (stats.received, stats.forwarded, stats.suppressed) == (16, 6, 10)
+
+    # the next repeat closes an aged window even without an expire() in between
+    aggregator = NotificationAggregator(window=5.0, max_age=5.0)
+    for step in (0.0, 3.0, 3.0):
+        clock[0] += step
+        aggregator.add(_event())
+    [summary] = aggregator.expire()
+    assert (summary.count, summary.last_seen - summary.first_seen) == (2, 3.0)
+    assert aggregator.stats.forwarded == 2
+    assert aggregator.next_expiry() == pytest.approx(5.0)
+
+
+def test_fingerprint_ignores_uptime_and_request_id() -> None:
+    assert notification_fingerprint(_event(uptime=1, request_id=1)) == notification_fingerprint(
+        _event(uptime=999, request_id=2)
+    )
+    assert notification_fingerprint(_event(if_index=1)) != notification_fingerprint(
+        _event(if_index=2)
+    )
+
+
+def test_aggregate_stream_yields_summaries_while_source_is_idle() -> None:
+    async def scenario() -> None:
+        aggregator = NotificationAggregator(window=0.05)
+        release = asyncio.Event()
+
+        async def source() -> AsyncIterator[NotificationEvent]:
+            for request_id in range(1, 4):
+                yield _event(request_id=request_id)
+            await release.wait()
+            yield _event(if_index=9)
+
+        stream = aggregator.aggregate(source())
+        first = await stream.__anext__()
+        assert isinstance(first, NotificationEvent) and first.request_id == 1
+        summary = await asyncio.wait_for(stream.__anext__(), timeout=2.0)
+        assert isinstance(summary, NotificationSummary) and summary.count == 3
+        release.set()
+        rest = [item async for item in stream]
+        assert [type(item) for item in rest] == [NotificationEvent]
+
+        async def endless() -> AsyncIterator[NotificationEvent]:
+            while True:
+                yield _event()
+                await asyncio.sleep(3600)
+
+        stream = aggregator.aggregate(endless())
+        assert isinstance(await stream.__anext__(), NotificationEvent)
+        await stream.aclose()
+
+    asyncio.run(scenario())
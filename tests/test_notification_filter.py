@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from trishul_snmp import (
+    IntegerValue,
+    NotificationFilter,
+    ObjectIdentifierValue,
+    OctetStringValue,
+    TimeTicksValue,
+    UsmLocalEngine,
+    UsmUser,
+    V2cNotificationListener,
+    V3NotificationListener,
+)
+from trishul_snmp.security.usm import AuthProtocol, UsmModel
+from trishul_snmp.wire.message import SnmpMessage, encode_message
+from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
+
+_SNMP_TRAP_OID = (1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0)
+_LINK_DOWN = (1, 3, 6, 1, 6, 3, 1, 1, 5, 3)
+_ENTERPRISE = (1, 3, 6, 1, 4, 1, 9999)
+
+
+def _varbinds(trap_oid: tuple[int, ...] | None) -> tuple[RawVarBind, ...]:
+    varbinds = [RawVarBind(oid=(1, 3, 6, 1, 2, 1, 1, 3, 0), value=TimeTicksValue(42))]
+    if trap_oid is not None:
+        varbinds.append(RawVarBind(oid=_SNMP_TRAP_OID, value=ObjectIdentifierValue(trap_oid)))
+    varbinds.append(RawVarBind(oid=(1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 3), value=IntegerValue(3)))
+    return tuple(varbinds)
+
+
+def _v2c(
+    trap_oid: tuple[int, ...] | None = _LINK_DOWN,
+    *,
+    community: str = "public",
+    pdu_type: PduType = PduType.SNMPV2_TRAP,
+) -> bytes:
+    return encode_message(
+        SnmpMessage(
+            version=1,
+            community=community,
+            pdu=Pdu(
+                pdu_type=pdu_type,
+                request_id=77,
+                error_status=0,
+                error_index=0,
+                varbinds=_varbinds(trap_oid),
+            ),
+        )
+    )
+
+
+def test_notification_filter_matches_sources_communities_and_trap_oids() -> None:
+    everything = NotificationFilter()
+    assert everything.accepts_source("192.0.2.1")
+    assert everything.accepts_community("anything")
+    assert everything.accepts_trap_oid(None)
+
+    rules = NotificationFilter(
+        allow_sources=["10.0.0.0/8", "2001:db8::1"],
+        deny_sources=["10.9.0.0/16"],
+        allow_communities=["public", "ops"],
+        deny_communities=["ops"],
+        allow_trap_oids=[(1, 3, 6, 1, 6, 3, 1, 1, 5), _ENTERPRISE],
+        deny_trap_oids=["1.3.6.1.6.3.1.1.5.1"],
+    )
+    assert rules.accepts_source("10.1.2.3")
+    assert rules.accepts_source("2001:db8::1%eth0")
+    assert not rules.accepts_source("10.9.0.1")
+    assert not rules.accepts_source("192.0.2.1")
+    assert not rules.accepts_source("not-an-address")
+    assert rules.accepts_community("public")
+    assert rules.accepts_community(b"public")
+    assert not rules.accepts_community("ops")
+    assert not rules.accepts_community("private")
+    assert rules.accepts_trap_oid(_LINK_DOWN)
+    assert rules.accepts_trap_oid((*_ENTERPRISE, 0, 1))
+    assert not rules.accepts_trap_oid((1, 3, 6, 1, 6, 3, 1, 1, 5, 1))
+    assert not rules.accepts_trap_oid((1, 3, 6, 1, 4, 1, 8888))
+    assert not rules.accepts_trap_oid(None)
+    assert rules.accepts_varbinds(_varbinds(_LINK_DOWN))
+    assert not rules.accepts_varbinds(_varbinds(None))
+
+    deny_only = NotificationFilter(deny_sources=["192.0.2.0/24"])
+    assert deny_only.accepts_source("not-an-address")
+    assert not deny_only.accepts_source("192.0.2.7")
+    assert deny_only.accepts_varbinds(())
+
+    with pytest.raises(ValueError, match="Invalid source address or network"):
+        NotificationFilter(allow_sources=["router.example"])
+
+
+def test_notification_filter_peeks_raw_v2c_messages() -> None:
+    source = ("10.0.0.5", 50000)
+    community_only = NotificationFilter(allow_communities=["public"])
+    assert community_only.accepts_v2c(_v2c(), source)
+    assert not community_only.accepts_v2c(_v2c(community="private"), source)
+
+    trap_rules = NotificationFilter(allow_trap_oids=[_LINK_DOWN])
+    assert trap_rules.accepts_v2c(_v2c(), source)
+    assert trap_rules.accepts_v2c(_v2c(pdu_type=PduType.INFORM_REQUEST), source)
+    assert not trap_rules.accepts_v2c(_v2c(_ENTERPRISE), source)
+    assert not trap_rules.accepts_v2c(_v2c(None), source)
+    assert not NotificationFilter(allow_sources=["10.1.0.0/16"]).accepts_v2c(_v2c(), source)
+
+    odd = encode_message(
+        SnmpMessage(
+            version=1,
+            community="public",
+            pdu=Pdu(
+                pdu_type=PduType.SNMPV2_TRAP,
+                request_id=1,
+                error_status=0,
+                error_index=0,
+                varbinds=(RawVarBind(oid=_SNMP_TRAP_OID, value=OctetStringValue(b"x")),),
+            ),
+        )
+    )
+    assert not trap_rules.accepts_v2c(odd, source)
+    assert NotificationFilter(deny_trap_oids=[_ENTERPRISE]).accepts_v2c(odd, source)
+
+    data = _v2c()
+    for malformed in (b"", b"\x02\x01\x00", data[:-3], b"\x30\x03\x02\x01\x01"):
+        assert not community_only.accepts_v2c(malformed, source)
+        assert not trap_rules.accepts_v2c(malformed, source)
+
+    restored = pickle.loads(pickle.dumps(trap_rules))
+    assert restored.accepts_v2c(_v2c(), source)
+    assert not restored.accepts_v2c(_v2c(_ENTERPRISE), source)
+
+
+def test_v2c_listener_drops_filtered_notifications_before_decoding() -> None:
+    listener = V2cNotificationListener(
+        host="127.0.0.1",
+        port=0,
+        notification_filter=NotificationFilter(
+            allow_sources=["127.0.0.0/8"],
+            deny_trap_oids=[_ENTERPRISE],
+        ),
+    )
+    local = ("127.0.0.1", 40000)
+
+    event, reply = listener._process(_v2c(pdu_type=PduType.INFORM_REQUEST), local)
+    assert event is not None and event.notification_oid == _LINK_DOWN
+    assert reply is not None
+
+    assert listener._process(_v2c(_ENTERPRISE, pdu_type=PduType.INFORM_REQUEST), local) == (
+        None,
+        None,
+    )
+    assert listener._process(_v2c(), ("192.0.2.1", 40000)) == (None, None)
+
+
+def test_v3_listener_filters_sources_before_decrypting_and_trap_oids_before_enrichment() -> None:
+    user = UsmUser(username="listener", auth_protocol=AuthProtocol.NONE)
+    engine = UsmLocalEngine(
+        engine_id=b"\x80\x00\x01\x02\x03" + b"\x44" * 12, engine_boots=1, engine_time=1
+    )
+    listener = V3NotificationListener(
+        host="127.0.0.1",
+        port=0,
+        user=user,
+        local_engine=engine,
+        notification_filter=NotificationFilter(
+            allow_sources=["127.0.0.1"],
+            allow_trap_oids=[_LINK_DOWN],
+        ),
+    )
+
+    def notification(trap_oid: tuple[int, ...]) -> bytes:
+        model = UsmModel(user=user, local_engine=engine)
+        return model.wrap_pdu(
+            Pdu(
+                pdu_type=PduType.INFORM_REQUEST,
+                request_id=5,
+                error_status=0,
+                error_index=0,
+                varbinds=_varbinds(trap_oid),
+            )
+        )
+
+    local = ("127.0.0.1", 40000)
+    event, reply = listener._process(notification(_LINK_DOWN), local)
+    assert event is not None and event.notification_oid == _LINK_DOWN
+    assert reply is not None
+    assert listener._process(notification(_ENTERPRISE), local) == (None, None)
+    assert listener._process(notification(_LINK_DOWN), ("127.0.0.2", 40000)) == (None, None)
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from trishul_snmp import (
+    DropPolicy,
     ErrorStatus,
     IntegerValue,
     ObjectIdentifierValue,
@@ -18,7 +19,7 @@ from trishul_snmp import (
     load_bundle,
 )
 from trishul_snmp.errors import TransportError
-from trishul_snmp.notify.events import notification_event_from_message
+from trishul_snmp.notify.events import NotificationEvent, notification_event_from_message
 from trishul_snmp.notify.listener import _community_allowed
 from trishul_snmp.types import SocketAddress
 from trishul_snmp.wire.message import SnmpMessage, encode_message
@@ -264,6 +265,171 @@ def test_notification_listener_community_allowlist_filters_events() -> None:
     asyncio.run(scenario())
 
 
+def test_notification_listener_bounded_queue_counts_storm_drops() -> None:
+    async def scenario() -> None:
+        try:
+            async with V2cNotificationListener(
+                host="127.0.0.1",
+                port=0,
+                max_queue=5,
+                drop_policy=DropPolicy.DROP_OLDEST,
+                recv_buffer_size=1 << 20,
+            ) as listener:
+                async with V2cNotifier(
+                    host="127.0.0.1",
+                    port=_listener_port(listener),
+                    community="public",
+                    timeout=0.2,
+                    retries=0,
+                ) as notifier:
+                    sent = [await notifier.send_trap("1.3.6.1.6.3.1.1.5.3") for _ in range(20)]
+                    for _ in range(100):
+                        if listener.stats.received == len(sent):
+                            break
+                        await asyncio.sleep(0.01)
+                    stats = listener.stats
+                    events = [await listener.receive() for _ in range(stats.queued)]
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+
+        assert stats.received == 20
+        assert stats.dropped == 15
+        assert stats.queued == stats.high_water == 5
+        assert [event.request_id for event in events] == sent[-5:]
+        assert listener.stats.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_notification_listener_handler_mode_dispatches_from_callback() -> None:
+    async def scenario() -> None:
+        events: list[NotificationEvent] = []
+        try:
+            listener = V2cNotificationListener(
+                host="127.0.0.1",
+                port=0,
+                communities=["public"],
+                handler=events.append,
+            )
+            await listener.open()
+            async with V2cNotifier(
+                host="127.0.0.1",
+                port=_listener_port(listener),
+                community="public",
+                timeout=0.5,
+                retries=0,
+            ) as notifier:
+                trap_id = await notifier.send_trap("1.3.6.1.6.3.1.1.5.3")
+                response = await notifier.send_inform("1.3.6.1.6.3.1.1.5.4")
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+
+        with pytest.raises(TransportError, match="delivers events to its handler"):
+            await listener.receive()
+        with pytest.raises(TransportError, match="delivers events to its handler"):
+            await listener.receive_batch(10)
+        waiter = asyncio.create_task(listener.wait_closed())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await listener.close()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        await listener.wait_closed()
+
+        assert [event.request_id for event in events] == [trap_id, response.request_id]
+        assert events[1].is_inform is True
+        assert response.error_status is ErrorStatus.NO_ERROR
+        assert listener.stats.received == 2
+
+    asyncio.run(scenario())
+
+
+def test_notification_listener_async_handler_tasks_finish_on_close() -> None:
+    async def scenario() -> None:
+        handled: list[int] = []
+        failures: list[object] = []
+
+        async def handler(event: NotificationEvent) -> None:
+            await asyncio.sleep(0.01)
+            if event.uptime == 13:
+                raise RuntimeError("handler failed")
+            handled.append(event.request_id)
+
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _loop, context: failures.append(context["exception"]))
+        try:
+            listener = V2cNotificationListener(host="127.0.0.1", port=0, handler=handler)
+            await listener.open()
+            async with V2cNotifier(
+                host="127.0.0.1",
+                port=_listener_port(listener),
+                community="public",
+                timeout=0.2,
+                retries=0,
+            ) as notifier:
+                sent = [await notifier.send_trap("1.3.6.1.6.3.1.1.5.3") for _ in range(3)]
+                await notifier.send_trap("1.3.6.1.6.3.1.1.5.3", uptime=13)
+            for _ in range(100):
+                if listener.stats.received == 4:
+                    break
+                await asyncio.sleep(0.01)
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+        await listener.close()
+
+        assert sorted(handled) == sorted(sent)
+        assert len(failures) == 1 and str(failures[0]) == "handler failed"
+
+    asyncio.run(scenario())
+
+
+def test_notification_listener_receive_batch_drains_queued_events() -> None:
+    async def scenario() -> None:
+        try:
+            async with V2cNotificationListener(
+                host="127.0.0.1",
+                port=0,
+                communities=["public"],
+            ) as listener:
+                async with V2cNotifier(
+                    host="127.0.0.1",
+                    port=_listener_port(listener),
+                    community="public",
+                    timeout=0.2,
+                    retries=0,
+                ) as notifier:
+                    sent = [await notifier.send_trap("1.3.6.1.6.3.1.1.5.3") for _ in range(5)]
+                async with V2cNotifier(
+                    host="127.0.0.1",
+                    port=_listener_port(listener),
+                    community="private",
+                    timeout=0.2,
+                    retries=0,
+                ) as filtered:
+                    await filtered.send_trap("1.3.6.1.6.3.1.1.5.3")
+                for _ in range(100):
+                    if listener.stats.queued == 6:
+                        break
+                    await asyncio.sleep(0.01)
+
+                first = await listener.receive_batch(3, timeout=1.0)
+                rest = await listener.receive_batch(10, timeout=1.0)
+                empty = await listener.receive_batch(10, timeout=0.05)
+                with pytest.raises(ValueError, match="at least 1"):
+                    await listener.receive_batch(0)
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+
+        assert [event.request_id for event in first] == sent[:3]
+        assert [event.request_id for event in rest] == sent[3:]
+        assert empty == []
+
+    asyncio.run(scenario())
+
+
 def test_notification_listener_async_iterator_stops_on_close() -> None:
     async def scenario() -> None:
         listener = V2cNotificationListener(host="127.0.0.1", port=0)
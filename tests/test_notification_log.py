@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from trishul_snmp import (
+    IntegerValue,
+    LoggedNotification,
+    NotificationEvent,
+    NotificationLogError,
+    NotificationLogReader,
+    NotificationLogWriter,
+    ObjectIdentifierValue,
+    TimeTicksValue,
+    UsmLocalEngine,
+    UsmUser,
+    V2cNotificationListener,
+)
+from trishul_snmp.notify import log as log_module
+from trishul_snmp.security.usm import AuthProtocol, UsmModel
+from trishul_snmp.transport.udp import ReceivedDatagram
+from trishul_snmp.wire.message import SnmpMessage, encode_message
+from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
+
+_LINK_DOWN = (1, 3, 6, 1, 6, 3, 1, 1, 5, 3)
+
+
+def _pdu(request_id: int, if_index: int = 3) -> Pdu:
+    return Pdu(
+        pdu_type=PduType.SNMPV2_TRAP,
+        request_id=request_id,
+        error_status=0,
+        error_index=0,
+        varbinds=(
+            RawVarBind(oid=(1, 3, 6, 1, 2, 1, 1, 3, 0), value=TimeTicksValue(42)),
+            RawVarBind(
+                oid=(1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0),
+                value=ObjectIdentifierValue(_LINK_DOWN),
+            ),
+            RawVarBind(oid=(1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 3), value=IntegerValue(if_index)),
+        ),
+    )
+
+
+def _trap(request_id: int) -> bytes:
+    return encode_message(SnmpMessage(version=1, community="public", pdu=_pdu(request_id)))
+
+
+def test_log_round_trips_records_and_seeks_by_time_and_source(tmp_path: Path) -> None:
+    directory = tmp_path / "traps"
+    with NotificationLogWriter(directory, index_interval=4) as writer:
+        for request_id in range(20):
+            host = "10.0.0.1" if request_id % 5 else "10.0.0.9"
+            writer.append(
+                _trap(request_id), (host, 1000 + request_id), timestamp=100.0 + request_id
+            )
+        assert writer.records == 20
+        assert writer.segment_path == directory / "0000000000.log"
+    assert writer.segment_path is None
+
+    reader = NotificationLogReader(directory)
+    records = list(reader.records())
+    assert len(records) == 20
+    assert records[3] == LoggedNotification(
+        timestamp=103.0, source_address=("10.0.0.1", 1003), data=_trap(3)
+    )
+
+    window = list(reader.records(start=105.0, end=110.0))
+    assert [record.timestamp for record in window] == [105.0, 106.0, 107.0, 108.0, 109.0]
+    rare = list(reader.records(sources=["10.0.0.9"]))
+    assert [record.source_address for record in rare] == [
+        ("10.0.0.9", 1000 + n) for n in (0, 5, 10, 15)
+    ]
+    assert list(reader.records(sources=["192.0.2.1"])) == []
+
+    events = list(reader.events(start=118.0))
+    assert [event.request_id for event in events] == [18, 19]
+    assert events[0].source_address == ("10.0.0.1", 1018)
+    assert events[0].notification_oid == _LINK_DOWN
+
+
+def test_log_reads_only_matching_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with NotificationLogWriter(tmp_path, index_interval=10) as writer:
+        for request_id in range(100):
+            writer.append(_trap(request_id), ("10.0.0.1", 162), timestamp=float(request_id))
+
+    parsed: list[int] = []
+    original = log_module._parse
+
+    def counting_parse(data: bytes) -> Iterator[LoggedNotification]:
+        records = list(original(data))
+        parsed.append(len(records))
+        return iter(records)
+
+    monkeypatch.setattr(log_module, "_parse", counting_parse)
+    records = NotificationLogReader(tmp_path).records(start=42, end=45)
+    assert [record.timestamp for record in records] == [42.0, 43.0, 44.0]
+    # one indexed block plus the empty unindexed tail
+    assert parsed == [10, 0]
+
+
+def test_log_rotates_prunes_and_tolerates_unindexed_tails(tmp_path: Path) -> None:
+    record_size = len(_trap(0)) + log_module._RECORD.size + len("10.0.0.1")
+    writer = NotificationLogWriter(
+        tmp_path, segment_bytes=log_module._HEADER.size + 3 * record_size, max_segments=2
+    )
+    for request_id in range(10):
+        writer.append(_trap(request_id), ("10.0.0.1", 162), timestamp=float(request_id))
+    writer.close()
+    reader = NotificationLogReader(tmp_path)
+    assert [path.name for path in reader.segments] == ["0000000002.log", "0000000003.log"]
+    assert [record.timestamp for record in reader.records()] == [6.0, 7.0, 8.0, 9.0]
+
+    aged = NotificationLogWriter(tmp_path, segment_seconds=10.0)
+    aged.append(_trap(1), ("10.0.0.1", 162), timestamp=1000.0)
+    aged.append(_trap(2), ("10.0.0.1", 162), timestamp=1011.0)
+    aged.flush()
+    # a writer that stopped without indexing leaves records missing from the index
+    aged.append(_trap(3), ("10.0.0.1", 162), timestamp=1012.0)
+    assert aged._segment is not None and aged.segment_path is not None
+    aged._segment.flush()
+    with aged.segment_path.open("ab") as handle:
+        handle.write(log_module._RECORD.pack(1013.0, 5, 162, 8) + b"10.0.0.1" + b"\x30\x03")
+    assert [path.name for path in reader.segments][-2:] == ["0000000004.log", "0000000005.log"]
+    assert [record.timestamp for record in reader.records(start=1000.0)] == [
+        1000.0,
+        1011.0,
+        1012.0,
+    ]
+    aged.close()
+
+
+def test_log_rejects_invalid_configuration_and_files(tmp_path: Path) -> None:
+    for kwargs, message in (
+        ({"segment_bytes": 0}, "segment_bytes must be at least 1"),
+        ({"segment_seconds": 0}, "segment_seconds must be positive"),
+        ({"max_segments": 0}, "max_segments must be at least 1"),
+        ({"index_interval": 0}, "index_interval must be at least 1"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            NotificationLogWriter(tmp_path, **kwargs)  # type: ignore[arg-type]
+    with NotificationLogWriter(tmp_path) as writer:
+        with pytest.raises(ValueError, match="Source host is too long"):
+            writer.append(b"x", ("h" * 256, 162))
+
+    with pytest.raises(NotificationLogError, match="does not exist"):
+        NotificationLogReader(tmp_path / "missing")
+    (tmp_path / "0000000009.log").write_bytes(b"not a log")
+    with pytest.raises(NotificationLogError, match="not a supported notification log:"):
+        list(NotificationLogReader(tmp_path).records())
+    (tmp_path / "0000000009.idx").write_bytes(b"junk")
+    with pytest.raises(NotificationLogError, match="not a supported notification log index"):
+        list(NotificationLogReader(tmp_path).records())
+
+
+def test_listeners_log_accepted_datagrams(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        queued_log = NotificationLogWriter(tmp_path / "queued")
+        listener = V2cNotificationListener(
+            host="127.0.0.1", port=0, communities=["public"], notification_log=queued_log
+        )
+        source = ("10.0.0.7", 50000)
+        assert await listener._accept(ReceivedDatagram(data=_trap(1), source_address=source))
+        rejected = encode_message(SnmpMessage(version=1, community="other", pdu=_pdu(2)))
+        assert (
+            await listener._accept(ReceivedDatagram(data=rejected, source_address=source)) is None
+        )
+        queued_log.close()
+
+        events: list[NotificationEvent] = []
+        handler_log = NotificationLogWriter(tmp_path / "handler")
+        handled = V2cNotificationListener(
+            host="127.0.0.1", port=0, handler=events.append, notification_log=handler_log
+        )
+        handled._dispatch(_trap(3), source)
+        handled._dispatch(b"junk", source)
+        handler_log.close()
+        assert [event.request_id for event in events] == [3]
+
+        for name, request_id in (("queued", 1), ("handler", 3)):
+            [event] = NotificationLogReader(tmp_path / name).events()
+            assert (event.request_id, event.source_address) == (request_id, source)
+
+    asyncio.run(scenario())
+
+
+def test_log_events_decode_v3_records_for_configured_user(tmp_path: Path) -> None:
+    user = UsmUser(username="audit", auth_protocol=AuthProtocol.NONE)
+    engine = UsmLocalEngine(
+        engine_id=b"\x80\x00\x01\x02\x03" + b"\x55" * 8, engine_boots=1, engine_time=1
+    )
+    with NotificationLogWriter(tmp_path) as writer:
+        writer.append(UsmModel(user=user, local_engine=engine).wrap_pdu(_pdu(7)), ("10.0.0.2", 162))
+        writer.append(_trap(8), ("10.0.0.2", 162))
+
+    reader = NotificationLogReader(tmp_path)
+    assert [event.request_id for event in reader.events(user=user)] == [7]
+    assert [event.request_id for event in reader.events()] == [8]
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import struct
+from pathlib import Path
+
+import pytest
+
+from trishul_snmp import (
+    IntegerValue,
+    LoggedNotification,
+    NotificationEvent,
+    ObjectIdentifierValue,
+    ReplayStats,
+    TimeTicksValue,
+    V2cNotificationListener,
+    read_hex_datagrams,
+    read_pcap,
+    replay_notifications,
+)
+from trishul_snmp.errors import TransportError
+from trishul_snmp.transport.udp import UdpClient
+from trishul_snmp.wire.message import SnmpMessage, encode_message
+from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
+
+
+def _trap(request_id: int) -> bytes:
+    return encode_message(
+        SnmpMessage(
+            version=1,
+            community="public",
+            pdu=Pdu(
+                pdu_type=PduType.SNMPV2_TRAP,
+                request_id=request_id,
+                error_status=0,
+                error_index=0,
+                varbinds=(
+                    RawVarBind(oid=(1, 3, 6, 1, 2, 1, 1, 3, 0), value=TimeTicksValue(1)),
+                    RawVarBind(
+                        oid=(1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0),
+                        value=ObjectIdentifierValue((1, 3, 6, 1, 6, 3, 1, 1, 5, 3)),
+                    ),
+                    RawVarBind(oid=(1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 1), value=IntegerValue(1)),
+                ),
+            ),
+        )
+    )
+
+
+def _udp(payload: bytes, *, source_port: int = 40000, port: int = 162) -> bytes:
+    return struct.pack(">HHHH", source_port, port, 8 + len(payload), 0) + payload
+
+
+def _ipv4(udp: bytes, *, source: str = "10.0.0.1", protocol: int = 17, fragment: int = 0) -> bytes:
+    header = struct.pack(
+        ">BBHHHBBH4s4s",
+        0x45,
+        0,
+        20 + len(udp),
+        1,
+        fragment,
+        64,
+        protocol,
+        0,
+        ipaddress.IPv4Address(source).packed,
+        ipaddress.IPv4Address("10.0.0.254").packed,
+    )
+    return header + udp
+
+
+def _ipv6(udp: bytes, *, source: str = "2001:db8::1") -> bytes:
+    header = struct.pack(
+        ">IHBB16s16s",
+        6 << 28,
+        len(udp),
+        17,
+        64,
+        ipaddress.IPv6Address(source).packed,
+        ipaddress.IPv6Address("2001:db8::fe").packed,
+    )
+    return header + udp
+
+
+def _pcap(
+    frames: list[tuple[float, bytes]],
+    *,
+    linktype: int,
+    order: str = "<",
+    nanoseconds: bool = False,
+) -> bytes:
+    magic = 0xA1B23C4D if nanoseconds else 0xA1B2C3D4
+    scale = 1_000_000_000 if nanoseconds else 1_000_000
+    data = struct.pack(f"{order}IHHiIII", magic, 2, 4, 0, 0, 65535, linktype)
+    for timestamp, frame in frames:
+        seconds = int(timestamp)
+        fraction = round((timestamp - seconds) * scale)
+        data += struct.pack(f"{order}IIII", seconds, fraction, len(frame), len(frame)) + frame
+    return data
+
+
+def _skip_if_udp_restricted(exc: Exception) -> None:
+    cause = exc.__cause__
+    if isinstance(cause, OSError) and cause.errno in {1, 13}:
+        pytest.skip(f"UDP sockets are not permitted in this environment: {cause}")
+
+
+def test_read_pcap_extracts_notification_datagrams(tmp_path: Path) -> None:
+    ethernet = b"\x00" * 12
+    vlan = b"\x81\x00\x00\x05"
+    frames = [
+        (100.25, ethernet + vlan + b"\x08\x00" + _ipv4(_udp(_trap(1)))),
+        (100.5, ethernet + b"\x08\x00" + _ipv4(_udp(_trap(2), port=161))),
+        (100.75, ethernet + b"\x08\x00" + _ipv4(_udp(_trap(3)), fragment=0x2000)),
+        (101.0, ethernet + b"\x08\x00" + _ipv4(_udp(_trap(4)), protocol=6)),
+        (101.25, ethernet + b"\x86\xdd" + _ipv6(_udp(_trap(5), source_port=50000))),
+        (101.5, ethernet + b"\x08\x06" + b"\x00" * 28),
+        (101.75, b"\x00" * 6),
+    ]
+    path = tmp_path / "traps.pcap"
+    path.write_bytes(_pcap(frames, linktype=1))
+
+    records = read_pcap(path)
+    assert records == [
+        LoggedNotification(timestamp=100.25, source_address=("10.0.0.1", 40000), data=_trap(1)),
+        LoggedNotification(timestamp=101.25, source_address=("2001:db8::1", 50000), data=_trap(5)),
+    ]
+    assert [record.data for record in read_pcap(path, port=None)] == [
+        _trap(1),
+        _trap(2),
+        _trap(5),
+    ]
+
+    cooked = [
+        (1.0, b"\x00" * 14 + b"\x08\x00" + _ipv4(_udp(_trap(6)))),
+        (2.0, b"\x00" * 8),
+    ]
+    path.write_bytes(_pcap(cooked, linktype=113, order=">", nanoseconds=True))
+    assert [(record.timestamp, record.data) for record in read_pcap(path)] == [(1.0, _trap(6))]
+
+    cooked2 = [(1.0, b"\x86\xdd" + b"\x00" * 18 + _ipv6(_udp(_trap(7)))), (2.0, b"\x00")]
+    path.write_bytes(_pcap(cooked2, linktype=276))
+    assert [record.data for record in read_pcap(path)] == [_trap(7)]
+
+    loopback = [
+        (1.0, struct.pack("<I", 2) + _ipv4(_udp(_trap(8)))),
+        (2.0, struct.pack(">I", 30) + _ipv6(_udp(_trap(9)))),
+        (3.0, b"\x02"),
+    ]
+    path.write_bytes(_pcap(loopback, linktype=0))
+    assert [record.data for record in read_pcap(path)] == [_trap(8), _trap(9)]
+
+    raw = [
+        (1.0, _ipv4(_udp(_trap(10)))),
+        (2.0, _ipv6(_udp(_trap(11)))),
+        (3.0, b""),
+        (4.0, _ipv4(_udp(b"")[:6])),
+        (5.0, _ipv4(struct.pack(">HHHH", 1, 162, 64, 0))),
+    ]
+    path.write_bytes(_pcap(raw, linktype=101))
+    assert [record.data for record in read_pcap(path)] == [_trap(10), _trap(11)]
+
+    path.write_bytes(_pcap([(1.0, _ipv4(_udp(_trap(12))))], linktype=147))
+    assert read_pcap(path) == []
+
+    for invalid in (b"\x00" * 4, b"\x0a\x0d\x0d\x0a" + b"\x00" * 28):
+        path.write_bytes(invalid)
+        with pytest.raises(ValueError, match="not a supported pcap capture"):
+            read_pcap(path)
+
+
+def test_read_hex_datagrams_skips_comments_and_separators(tmp_path: Path) -> None:
+    path = tmp_path / "traps.hex"
+    path.write_text(f"# captured traps\n\n{_trap(1).hex()}\n0x{_trap(2).hex(':')}\n")
+    assert read_hex_datagrams(path) == [_trap(1), _trap(2)]
+
+    path.write_text("30 0g\n")
+    with pytest.raises(ValueError, match="Invalid hex datagram on line 1"):
+        read_hex_datagrams(path)
+
+
+def test_replay_keeps_scaled_gaps_rates_and_repeats() -> None:
+    async def scenario() -> None:
+        events: list[NotificationEvent] = []
+        listener = V2cNotificationListener(host="127.0.0.1", port=0, handler=events.append)
+        try:
+            await listener.open()
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+        local = listener.local_address
+        assert local is not None
+
+        records = [
+            LoggedNotification(
+                timestamp=10.0 + step, source_address=("10.0.0.1", 162), data=_trap(step)
+            )
+            for step in range(3)
+        ]
+        scaled = await replay_notifications(records, host="127.0.0.1", port=local[1], speed=20.0)
+        assert scaled.sent == 3 and scaled.errors == 0
+        assert scaled.bytes_sent == sum(len(record.data) for record in records)
+        assert scaled.elapsed >= 0.09
+
+        capped = await replay_notifications(
+            records, host="127.0.0.1", port=local[1], speed=1.0, max_gap=0.01, sockets=2
+        )
+        assert capped.elapsed < 0.5
+
+        fixed = await replay_notifications(
+            [_trap(9), _trap(10)], host="127.0.0.1", port=local[1], rate=40.0, repeat=2
+        )
+        assert fixed.sent == 4 and fixed.elapsed >= 0.07
+        assert fixed.rate == pytest.approx(fixed.sent / fixed.elapsed)
+
+        burst = await replay_notifications(
+            [_trap(11)] * 300, host="127.0.0.1", port=local[1], speed=None, sockets=1
+        )
+        assert burst.sent == 300 and burst.max_lag == 0.0
+
+        await asyncio.sleep(0.05)
+        await listener.close()
+        # the unpaced burst may overflow the receive buffer, the paced sends may not
+        assert [event.request_id for event in events[:10]] == [0, 1, 2, 0, 1, 2, 9, 10, 9, 10]
+
+    asyncio.run(scenario())
+
+
+def test_replay_counts_send_errors_and_validates_arguments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attempts: list[bytes] = []
+
+    async def fake_open(self: UdpClient) -> None:
+        return None
+
+    async def fake_send(self: UdpClient, data: bytes) -> None:
+        attempts.append(data)
+        if len(attempts) % 2 == 0:
+            raise TransportError("Failed to send UDP datagram")
+
+    monkeypatch.setattr(UdpClient, "open", fake_open)
+    monkeypatch.setattr(UdpClient, "send", fake_send)
+
+    async def scenario() -> None:
+        stats = await replay_notifications([b"a", b"bb", b"ccc"], host="192.0.2.1")
+        assert (stats.sent, stats.errors, stats.bytes_sent) == (2, 1, 4)
+        empty = await replay_notifications([], host="192.0.2.1")
+        assert (empty.sent, empty.errors, empty.max_lag) == (0, 0, 0.0)
+
+        for kwargs, message in (
+            ({"speed": 0}, "speed must be positive"),
+            ({"rate": -1}, "rate must be positive"),
+            ({"max_gap": -1}, "max_gap cannot be negative"),
+            ({"sockets": 0}, "sockets must be at least 1"),
+            ({"repeat": 0}, "repeat must be at least 1"),
+        ):
+            with pytest.raises(ValueError, match=message):
+                await replay_notifications([b"a"], host="192.0.2.1", **kwargs)  # type: ignore[arg-type]
+
+    asyncio.run(scenario())
+    assert ReplayStats(sent=1, errors=0, bytes_sent=1, elapsed=0.0, max_lag=0.0).rate == 0.0
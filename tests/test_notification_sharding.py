@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import socket
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from trishul_snmp import (
+    NotificationFilter,
+    ShardedNotificationListener,
+    SnmpNotificationListener,
+    UsmLocalEngine,
+    UsmUser,
+    V2cNotifier,
+    V3NotificationListener,
+    load_bundle,
+    write_mapped_bundle,
+)
+from trishul_snmp.errors import TransportError
+from trishul_snmp.notify import sharding
+from trishul_snmp.notify.sharding import _load_worker_bundle, _serve_worker, _WorkerConfig
+from trishul_snmp.transport.udp import DropPolicy
+
+
+def _skip_if_udp_restricted(exc: Exception) -> None:
+    cause = exc.__cause__
+    if isinstance(cause, OSError) and cause.errno in {1, 13}:
+        pytest.skip(f"UDP sockets are not permitted in this environment: {cause}")
+    if "Operation not permitted" in str(exc) or "Permission denied" in str(exc):
+        pytest.skip(f"UDP sockets are not permitted in this environment: {exc}")
+
+
+def _config(**overrides: Any) -> _WorkerConfig:
+    values: dict[str, Any] = {
+        "host": "127.0.0.1",
+        "port": 0,
+        "communities": None,
+        "user": None,
+        "users": (),
+        "local_engine": None,
+        "bundle_source": None,
+        "max_queue": 0,
+        "drop_policy": DropPolicy.DROP_NEWEST,
+        "recv_buffer_size": None,
+        "notification_filter": None,
+    }
+    values.update(overrides)
+    return _WorkerConfig(**values)
+
+
+async def _send_traps(port: int, count: int) -> list[int]:
+    async with V2cNotifier(
+        host="127.0.0.1",
+        port=port,
+        community="public",
+        timeout=0.2,
+        retries=0,
+    ) as notifier:
+        return [await notifier.send_trap("1.3.6.1.6.3.1.1.5.3") for _ in range(count)]
+
+
+def test_sharded_listener_forwards_events_from_worker_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # a tiny pending limit exercises pausing and resuming the worker pipes
+    monkeypatch.setattr(sharding, "_MAX_PENDING_EVENTS", 2)
+
+    async def scenario() -> None:
+        listener = ShardedNotificationListener(
+            host="127.0.0.1",
+            port=0,
+            workers=2,
+            communities=["public"],
+        )
+        try:
+            await listener.open()
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+        address = listener.local_address
+        assert address is not None and address[1] > 0
+        assert listener.workers == 2
+        await listener.open()
+
+        sent = await _send_traps(address[1], 8)
+        received: list[dict[str, Any]] = []
+        async for event in listener:
+            received.append(event)
+            if len(received) == len(sent):
+                break
+        assert sorted(event["request_id"] for event in received) == sorted(sent)
+        assert {event["community"] for event in received} == {"public"}
+        assert all(event["pdu_type"] == "snmpv2-trap" for event in received)
+
+        next_event = asyncio.create_task(listener.__anext__())
+        await asyncio.sleep(0)
+        await listener.close()
+        with pytest.raises(StopAsyncIteration):
+            await next_event
+
+    asyncio.run(scenario())
+
+
+def test_sharded_listener_reports_worker_failures() -> None:
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        ShardedNotificationListener(workers=0)
+    with pytest.raises(ValueError, match="provided together"):
+        ShardedNotificationListener(user=UsmUser(username="notify"))
+
+    async def scenario() -> None:
+        listener = ShardedNotificationListener(host="127.0.0.1", port=0, workers=1)
+        with pytest.raises(TransportError, match="not open"):
+            await listener.receive()
+
+        blocker = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            blocker.bind(("127.0.0.1", 0))
+        except OSError as exc:
+            blocker.close()
+            pytest.skip(f"UDP sockets are not permitted in this environment: {exc}")
+        port = blocker.getsockname()[1]
+        try:
+            async with ShardedNotificationListener(host="127.0.0.1", port=port, workers=2):
+                pytest.fail("workers bound a port held without SO_REUSEPORT")
+        except TransportError as exc:
+            assert "worker failed" in str(exc)
+        finally:
+            blocker.close()
+
+    asyncio.run(scenario())
+
+
+def test_sharded_listener_surfaces_exited_workers() -> None:
+    async def scenario() -> None:
+        listener = ShardedNotificationListener(host="127.0.0.1", port=0, workers=1)
+        try:
+            await listener.open()
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+        for process in listener._processes:
+            process.kill()
+        with pytest.raises(TransportError, match="worker exited"):
+            await asyncio.wait_for(listener.receive(), timeout=10.0)
+        await listener.close()
+
+    asyncio.run(scenario())
+
+
+def test_sharded_worker_serves_listener_over_pipe() -> None:
+    async def scenario() -> None:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        worker = asyncio.create_task(_serve_worker(_config(communities=("public",)), sender))
+        loop = asyncio.get_running_loop()
+        assert await loop.run_in_executor(None, receiver.poll, 5.0)
+        status, detail = receiver.recv()
+        if status == "error":
+            worker.cancel()
+            pytest.skip(f"UDP sockets are not permitted in this environment: {detail}")
+        assert status == "ready"
+
+        [request_id] = await _send_traps(detail[1], 1)
+        while not receiver.poll():
+            await asyncio.sleep(0.01)
+        assert receiver.recv()["request_id"] == request_id
+        worker.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await worker
+
+        await _serve_worker(_config(recv_buffer_size=-1), sender)
+        status, detail = receiver.recv()
+        assert status == "error" and "recv_buffer_size" in detail
+
+    asyncio.run(scenario())
+
+
+def test_sharded_worker_listener_kind_and_bundle_reload(tmp_path: Path) -> None:
+    module = {
+        "module": "SHARD-MIB",
+        "language": "SMIv2",
+        "generated_by": "trishul-smi",
+        "generated_at": "2026-05-06T12:00:00Z",
+        "imports": {},
+        "objects": {},
+        "types": {},
+        "notifications": {},
+        "module_metadata": {"lastupdated": None, "revisions": []},
+    }
+    (tmp_path / "SHARD-MIB.json").write_text(json.dumps(module), encoding="utf-8")
+    bundle = load_bundle(tmp_path)
+    mapped = write_mapped_bundle(bundle, tmp_path / "bundle.map")
+
+    assert set(_load_worker_bundle(tmp_path).modules) == {"SHARD-MIB"}
+    assert set(_load_worker_bundle(mapped).modules) == {"SHARD-MIB"}
+    assert set(_load_worker_bundle(tmp_path / "SHARD-MIB.json").modules) == {"SHARD-MIB"}
+
+    user = UsmUser(username="notify")
+    engine = UsmLocalEngine(engine_id=bytes.fromhex("8000010203"), engine_boots=1, engine_time=1)
+    rules = NotificationFilter(deny_communities=["private"])
+    listener = sharding._worker_listener(
+        _config(user=user, local_engine=engine, notification_filter=rules)
+    )
+    assert isinstance(listener, V3NotificationListener)
+    assert listener._filter is rules
+    v2c = sharding._worker_listener(_config(notification_filter=rules))
+    assert isinstance(v2c, SnmpNotificationListener)
+    assert v2c._filter is rules
+    assert ShardedNotificationListener(bundle=bundle)._config.bundle_source == tmp_path
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_right
+
+import pytest
+
+from trishul_snmp import InMemoryObjectSource, IntegerValue, UnknownSymbolError
+from trishul_snmp.responder import _oid_index
+from trishul_snmp.responder._oid_index import SortedOidIndex
+
+
+def test_sorted_oid_index_matches_reference_under_churn(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_oid_index, "_LOAD", 4)
+    rng = random.Random(7)
+    index = SortedOidIndex()
+    reference: list[tuple[int, ...]] = []
+
+    for _ in range(3000):
+        oid = (1, 3, rng.randint(0, 20), rng.randint(0, 20))
+        if oid in reference and rng.random() < 0.6:
+            assert index.discard(oid) is True
+            reference.remove(oid)
+        elif oid not in reference:
+            index.add(oid)
+            reference.append(oid)
+            reference.sort()
+        else:
+            assert index.discard((9, 9)) is False
+
+        assert len(index) == len(reference)
+        probe = (1, 3, rng.randint(0, 21))
+        position = bisect_right(reference, probe)
+        expected = reference[position] if position < len(reference) else None
+        assert index.successor(probe) == expected
+        assert list(index.iter_from(probe)) == reference[position:]
+
+    assert list(index) == reference
+    assert all(len(block) <= 8 for block in index._blocks)
+
+
+def test_sorted_oid_index_bulk_update_and_clear(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_oid_index, "_LOAD", 3)
+    index = SortedOidIndex([(1, 5), (1, 1), (1, 5)])
+    assert list(index) == [(1, 1), (1, 5)]
+
+    index.update([(1, index_value) for index_value in range(10, 20)])
+    assert len(index) == 12
+    index.update([(1, 3)])
+    assert list(index)[:3] == [(1, 1), (1, 3), (1, 5)]
+    assert index.successor((1, 19)) is None
+    assert index.discard((1, 20)) is False
+    assert index.discard((2,)) is False
+
+    for oid in list(index):
+        assert index.discard(oid) is True
+    assert len(index) == 0
+    assert index.successor(()) is None
+
+    index.add((1, 2))
+    index.clear()
+    assert list(index) == []
+
+
+def test_in_memory_source_set_objects_sorts_new_oids_once() -> None:
+    source = InMemoryObjectSource(
+        objects=[((1, 3, 6, 1, 4, 1, 9, row), IntegerValue(row)) for row in range(500, 0, -1)]
+    )
+    assert source.oids[:2] == ((1, 3, 6, 1, 4, 1, 9, 1), (1, 3, 6, 1, 4, 1, 9, 2))
+
+    updated = source.set_objects(
+        [
+            ("1.3.6.1.4.1.9.0", IntegerValue(0)),
+            ((1, 3, 6, 1, 4, 1, 9, 1), IntegerValue(-1)),
+            ((1, 3, 6, 1, 4, 1, 9, 0), IntegerValue(-2)),
+        ]
+    )
+    assert updated == ((1, 3, 6, 1, 4, 1, 9, 0), (1, 3, 6, 1, 4, 1, 9, 1), (1, 3, 6, 1, 4, 1, 9, 0))
+    assert len(source.oids) == 501
+    assert source.lookup_exact((1, 3, 6, 1, 4, 1, 9, 0)) == IntegerValue(-2)
+    assert source.lookup_next((1, 3, 6, 1, 4, 1, 9)) == ((1, 3, 6, 1, 4, 1, 9, 0), IntegerValue(-2))
+    assert source.set_objects([]) == ()
+
+    with pytest.raises(UnknownSymbolError):
+        source.set_objects(
+            [((1, 3, 6, 1, 4, 1, 9, 999), IntegerValue(1)), ("IF-MIB::x", IntegerValue(1))]
+        )
+    assert source.lookup_exact((1, 3, 6, 1, 4, 1, 9, 999)) is None
@@ -8,7 +8,10 @@ from pathlib import Path
 import pytest
 
 from trishul_snmp import (
+    AsyncCallbackObjectSource,
     CallbackObjectSource,
+    Counter32Value,
+    CounterRule,
     ErrorStatus,
     InMemoryObjectSource,
     IntegerValue,
@@ -24,7 +27,13 @@ from trishul_snmp import (
 from trishul_snmp.errors import TransportError
 from trishul_snmp.types import EndOfMibViewValue, SocketAddress
 from trishul_snmp.wire.message import SnmpMessage, decode_message, encode_message
-from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
+from trishul_snmp.wire.pdu import (
+    Pdu,
+    PduType,
+    RawVarBind,
+    build_encoded_varbind,
+    build_null_varbinds,
+)
 
 
 def _write_json(path: Path, payload: dict[object, object]) -> None:
@@ -122,6 +131,32 @@ class _FakeServer:
         self.sent.append((data, addr))
 
 
+class _QueueServer:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[_FakeDatagram | Exception] = asyncio.Queue()
+        self.sent: list[tuple[bytes, SocketAddress]] = []
+
+    async def receive(self) -> _FakeDatagram:
+        item = await self.queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def sendto(self, data: bytes, addr: SocketAddress) -> None:
+        self.sent.append((data, addr))
+
+
+def _get_request(request_id: int, oid: tuple[int, ...], *, port: int = 40000) -> _FakeDatagram:
+    data = encode_message(
+        SnmpMessage(
+            version=1,
+            community="public",
+            pdu=Pdu(PduType.GET, request_id, 0, 0, build_null_varbinds([oid])),
+        )
+    )
+    return _FakeDatagram(data=data, source_address=("127.0.0.1", port))
+
+
 def test_in_memory_object_source_supports_symbolic_targets_and_order(tmp_path: Path) -> None:
     _write_json(tmp_path / "IF-MIB.json", _if_mib_payload())
     bundle = load_bundle(tmp_path / "IF-MIB.json")
@@ -154,6 +189,108 @@ def test_in_memory_object_source_supports_symbolic_targets_and_order(tmp_path: P
     assert source.delete_object("IF-MIB::ifDescr.2") is False
 
 
+def test_in_memory_object_source_caches_encoded_static_varbinds() -> None:
+    scalar = (1, 3, 6, 1, 2, 1, 1, 5, 0)
+    counter = (1, 3, 6, 1, 2, 1, 1, 9, 0)
+    source = InMemoryObjectSource(
+        objects=[(scalar, OctetStringValue(b"sim")), (counter, CounterRule(start=1))]
+    )
+
+    first = source.lookup_exact_varbind(scalar)
+    assert first is not None
+    assert first.encoded == build_encoded_varbind(scalar, OctetStringValue(b"sim")).encoded
+    assert source.lookup_exact_varbind(scalar) is first
+    assert source.lookup_next_varbind((1, 3, 6, 1, 2, 1, 1)) is first
+
+    assert source.lookup_exact_varbind(counter) == RawVarBind(oid=counter, value=Counter32Value(1))
+    assert source.lookup_next_varbind(scalar) == RawVarBind(oid=counter, value=Counter32Value(2))
+    assert source.lookup_exact_varbind((1, 3)) is None
+    assert source.lookup_next_varbind(counter) is None
+
+    source.set_object(scalar, OctetStringValue(b"changed"))
+    replaced = source.lookup_exact_varbind(scalar)
+    assert replaced is not None
+    assert replaced.value == OctetStringValue(b"changed")
+    assert replaced.encoded == build_encoded_varbind(scalar, OctetStringValue(b"changed")).encoded
+
+    source.delete_object(scalar)
+    assert source.lookup_exact_varbind(scalar) is None
+    source.set_object(scalar, IntegerValue(3))
+    source.clear()
+    assert source.lookup_next_varbind(()) is None
+
+    uncached = InMemoryObjectSource(objects=[(scalar, IntegerValue(4))], cache_encoded=False)
+    plain = uncached.lookup_exact_varbind(scalar)
+    assert plain == RawVarBind(oid=scalar, value=IntegerValue(4))
+    assert plain is not None and plain.encoded is None
+
+
+def test_v2c_responder_cached_varbinds_encode_identically() -> None:
+    objects = [
+        ((1, 3, 6, 1, 2, 1, 2, 2, 1, 2, index), OctetStringValue(f"eth{index}".encode()))
+        for index in range(1, 6)
+    ]
+    requests = [
+        Pdu(PduType.GET, 1, 0, 0, build_null_varbinds([objects[0][0], (1, 3, 6, 9)])),
+        Pdu(PduType.GET_NEXT, 2, 0, 0, build_null_varbinds([(1, 3, 6, 1, 2, 1, 2, 2)])),
+        Pdu(PduType.GET_BULK, 3, 1, 4, build_null_varbinds([(1, 3), (1, 3, 6, 1, 2, 1, 2)])),
+    ]
+    cached = V2cResponder(source=InMemoryObjectSource(objects=objects))
+    uncached = V2cResponder(
+        source=CallbackObjectSource(
+            exact_lookup=InMemoryObjectSource(objects=objects).lookup_exact,
+            next_lookup=InMemoryObjectSource(objects=objects).lookup_next,
+        )
+    )
+
+    for pdu in requests:
+        message = SnmpMessage(version=1, community="public", pdu=pdu)
+        cached_response = cached._build_response_message(message)
+        uncached_response = uncached._build_response_message(message)
+        assert cached_response is not None and uncached_response is not None
+        assert encode_message(cached_response) == encode_message(uncached_response)
+
+
+def test_v2c_responder_range_bulk_matches_stepwise_lookups() -> None:
+    objects: list[tuple[tuple[int, ...], IntegerValue | CounterRule]] = [
+        ((1, 3, 6, 1, 2, 1, 2, 2, 1, column, row), IntegerValue(column * 100 + row))
+        for column in (1, 2, 10)
+        for row in range(1, 8)
+    ]
+    objects.append(((1, 3, 6, 1, 2, 1, 1, 3, 0), CounterRule(start=7, increment=0)))
+    ranged = InMemoryObjectSource(objects=objects)
+    stepwise = InMemoryObjectSource(objects=objects)
+    ranged_responder = V2cResponder(source=ranged)
+    stepwise_responder = V2cResponder(
+        source=CallbackObjectSource(
+            exact_lookup=stepwise.lookup_exact,
+            next_lookup=stepwise.lookup_next,
+        )
+    )
+    request = build_null_varbinds(
+        [
+            (1, 3, 6, 1, 2, 1, 1),
+            (1, 3, 6, 1, 2, 1, 2, 2, 1, 1),
+            (1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 5),
+            (1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 7),
+            (1, 3, 9),
+        ]
+    )
+
+    for non_repeaters, max_repetitions in ((0, 1), (1, 4), (2, 30), (9, 3), (0, 0)):
+        expected = stepwise_responder._build_bulk_varbinds(
+            request, non_repeaters=non_repeaters, max_repetitions=max_repetitions
+        )
+        actual = ranged_responder._build_bulk_varbinds(
+            request, non_repeaters=non_repeaters, max_repetitions=max_repetitions
+        )
+        assert actual == expected
+
+    assert list(ranged.iter_from((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 6))) == [
+        RawVarBind(oid=(1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 7), value=IntegerValue(1007))
+    ]
+
+
 def test_callback_object_source_delegates() -> None:
     seen: list[tuple[str, tuple[int, ...]]] = []
 
@@ -430,10 +567,10 @@ def test_v2c_responder_serve_validation_and_forever_forwarding(monkeypatch) -> N
         with pytest.raises(TransportError, match="boom"):
             await responder.serve(count=1)
 
-    seen: list[int] = []
+    seen: list[tuple[int, int]] = []
 
-    async def fake_serve(*, count: int = 0) -> int:
-        seen.append(count)
+    async def fake_serve(*, count: int = 0, workers: int = 1) -> int:
+        seen.append((count, workers))
         return 0
 
     async def call_forever() -> None:
@@ -443,7 +580,7 @@ def test_v2c_responder_serve_validation_and_forever_forwarding(monkeypatch) -> N
     asyncio.run(bad_count())
     asyncio.run(raise_transport())
     asyncio.run(call_forever())
-    assert seen == [0]
+    assert seen == [(0, 1)]
 
 
 def test_v2c_responder_handle_request_skips_invalid_and_unsupported_messages() -> None:
@@ -494,6 +631,174 @@ def test_v2c_responder_handle_request_skips_invalid_and_unsupported_messages() -
     assert response.pdu.varbinds[0].value == TimeTicksValue(9)
 
 
+def test_v2c_responder_workers_do_not_block_on_slow_async_lookups() -> None:
+    slow_oid = (1, 3, 6, 1, 2, 1, 1, 1, 0)
+    fast_oid = (1, 3, 6, 1, 2, 1, 1, 5, 0)
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def exact_lookup(oid: tuple[int, ...]) -> OctetStringValue:
+            if oid == slow_oid:
+                await release.wait()
+            return OctetStringValue(bytes(str(oid[-2]), "ascii"))
+
+        async def next_lookup(oid: tuple[int, ...]) -> None:
+            return None
+
+        responder = V2cResponder(
+            source=AsyncCallbackObjectSource(exact_lookup=exact_lookup, next_lookup=next_lookup)
+        )
+        server = _QueueServer()
+        responder._server = server  # type: ignore[assignment]
+        serve_task = asyncio.create_task(responder.serve(count=3, workers=2))
+
+        server.queue.put_nowait(_FakeDatagram(b"junk", ("127.0.0.1", 40000)))
+        server.queue.put_nowait(_get_request(1, slow_oid))
+        server.queue.put_nowait(_get_request(2, fast_oid))
+        server.queue.put_nowait(_get_request(3, fast_oid))
+        while len(server.sent) < 2:
+            await asyncio.sleep(0)
+        assert responder.stats.in_flight == 1
+
+        release.set()
+        assert await serve_task == 3
+
+        request_ids = [decode_message(data).pdu.request_id for data, _ in server.sent]
+        assert request_ids == [2, 3, 1]
+        stats = responder.stats
+        assert (stats.received, stats.responded, stats.discarded, stats.in_flight) == (4, 3, 1, 0)
+        assert stats.max_latency >= stats.mean_latency > 0
+        assert stats.throughput > 0
+
+    asyncio.run(scenario())
+
+
+def test_v2c_responder_workers_keep_order_per_request_id() -> None:
+    oid = (1, 3, 6, 1, 2, 1, 1, 3, 0)
+
+    async def scenario() -> None:
+        calls: list[int] = []
+        release = asyncio.Event()
+
+        async def exact_lookup(oid: tuple[int, ...]) -> IntegerValue:
+            calls.append(len(calls) + 1)
+            call = calls[-1]
+            if call == 1:
+                await release.wait()
+            return IntegerValue(call)
+
+        async def next_lookup(oid: tuple[int, ...]) -> None:
+            return None
+
+        responder = V2cResponder(
+            source=AsyncCallbackObjectSource(exact_lookup=exact_lookup, next_lookup=next_lookup)
+        )
+        server = _QueueServer()
+        responder._server = server  # type: ignore[assignment]
+        serve_task = asyncio.create_task(responder.serve(count=3, workers=3))
+
+        server.queue.put_nowait(_get_request(7, oid))
+        server.queue.put_nowait(_get_request(7, oid))
+        server.queue.put_nowait(_get_request(7, oid, port=40001))
+        while not server.sent:
+            await asyncio.sleep(0)
+        release.set()
+        assert await serve_task == 3
+
+        sent = [(addr[1], decode_message(data).pdu.varbinds[0].value) for data, addr in server.sent]
+        assert sent == [
+            (40001, IntegerValue(2)),
+            (40000, IntegerValue(1)),
+            (40000, IntegerValue(3)),
+        ]
+        assert not responder._inflight
+
+    asyncio.run(scenario())
+
+
+def test_v2c_responder_async_source_handles_all_pdu_types() -> None:
+    objects = {
+        (1, 3, 6, 1, 2, 1, 1, 3, 0): TimeTicksValue(5),
+        (1, 3, 6, 1, 2, 1, 1, 5, 0): OctetStringValue(b"sim"),
+    }
+
+    async def exact_lookup(oid: tuple[int, ...]) -> TimeTicksValue | OctetStringValue | None:
+        await asyncio.sleep(0)
+        return objects.get(oid)
+
+    async def next_lookup(
+        oid: tuple[int, ...],
+    ) -> tuple[tuple[int, ...], TimeTicksValue | OctetStringValue] | None:
+        return next(((key, value) for key, value in sorted(objects.items()) if key > oid), None)
+
+    source = AsyncCallbackObjectSource(exact_lookup=exact_lookup, next_lookup=next_lookup)
+    asynchronous = V2cResponder(source=source)
+    synchronous = V2cResponder(objects=list(objects.items()))
+    requests = [
+        Pdu(PduType.GET, 1, 0, 0, build_null_varbinds([(1, 3, 6, 1, 2, 1, 1, 3, 0), (1, 3)])),
+        Pdu(PduType.GET_NEXT, 2, 0, 0, build_null_varbinds([(1, 3, 6, 1, 2, 1, 1, 3, 0)])),
+        Pdu(PduType.GET_BULK, 3, 1, 3, build_null_varbinds([(1, 3), (1, 3, 6, 1, 2, 1, 1)])),
+        Pdu(PduType.GET_BULK, 4, -1, -1, build_null_varbinds([(1, 3)])),
+        Pdu(PduType.SET, 5, 0, 0, build_null_varbinds([(1, 3, 6, 1, 2, 1, 1, 3, 0)])),
+        Pdu(PduType.RESPONSE, 6, 0, 0, ()),
+    ]
+
+    async def scenario() -> None:
+        for pdu in requests:
+            assert await asynchronous._build_response_pdu_async(pdu) == (
+                synchronous._build_response_pdu(pdu)
+            )
+
+    asyncio.run(scenario())
+    assert asynchronous.source is source
+    with pytest.raises(TypeError, match="asynchronous"):
+        asynchronous._build_response_pdu(requests[0])
+
+
+def test_v2c_responder_worker_pool_validation_and_shutdown() -> None:
+    async def bad_workers() -> None:
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            await V2cResponder().serve(workers=0)
+
+    async def failing_worker() -> None:
+        responder = V2cResponder()
+        server = _QueueServer()
+        responder._server = server  # type: ignore[assignment]
+        server.queue.put_nowait(TransportError("boom"))
+        with pytest.raises(TransportError, match="boom"):
+            await responder.serve(workers=4)
+
+    async def close_pool() -> None:
+        try:
+            async with V2cResponder(
+                host="127.0.0.1",
+                port=0,
+                objects=[("1.3.6.1.2.1.1.3.0", TimeTicksValue(3))],
+            ) as responder:
+                serve_task = asyncio.create_task(responder.serve_forever(workers=3))
+                async with V2cManager(
+                    host="127.0.0.1",
+                    port=_responder_port(responder),
+                    community="public",
+                    timeout=0.5,
+                    retries=0,
+                ) as manager:
+                    response = await manager.get("1.3.6.1.2.1.1.3.0")
+                await responder.close()
+                await asyncio.wait_for(serve_task, timeout=1)
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+
+        assert response.varbinds[0].value == TimeTicksValue(3)
+        assert responder.stats.responded == 1
+
+    asyncio.run(bad_workers())
+    asyncio.run(failing_worker())
+    asyncio.run(close_pool())
+
+
 def test_v2c_responder_set_and_bulk_edge_cases() -> None:
     responder = V2cResponder(objects=[("1.3.6.1.2.1.1.3.0", TimeTicksValue(9))])
 
@@ -535,3 +840,75 @@ def test_v2c_responder_set_and_bulk_edge_cases() -> None:
     assert unsupported is None
     assert bulk == ()
     assert isinstance(end_of_mib.value, EndOfMibViewValue)
+
+
+def test_v2c_responder_truncates_bulk_responses_to_size_limit() -> None:
+    base = (1, 3, 6, 1, 4, 1, 99, 1)
+    objects = [((*base, row), OctetStringValue(b"x" * (row % 40))) for row in range(1, 2001)]
+    source = InMemoryObjectSource(objects=objects)
+    limited = V2cResponder(source=source, max_response_size=1500)
+    stepwise = V2cResponder(
+        source=CallbackObjectSource(
+            exact_lookup=source.lookup_exact, next_lookup=source.lookup_next
+        ),
+        max_response_size=1500,
+    )
+    request = SnmpMessage(
+        version=1,
+        community="public",
+        pdu=Pdu(PduType.GET_BULK, 9, 1, 10_000, build_null_varbinds([base, base, (*base, 7)])),
+    )
+    unbounded = limited._build_bulk_varbinds(
+        request.pdu.varbinds, non_repeaters=1, max_repetitions=200
+    )
+
+    assert limited.max_response_size == 1500
+    for responder in (limited, stepwise):
+        response = responder._build_response_message(request)
+        assert response is not None
+        encoded = encode_message(response)
+        varbinds = response.pdu.varbinds
+        assert 1400 < len(encoded) <= 1500
+        assert response.pdu.error_status == 0
+        assert varbinds == unbounded[: len(varbinds)]
+        assert decode_message(encoded).pdu.varbinds == varbinds
+
+
+def test_v2c_responder_size_limit_for_get_and_async_sources() -> None:
+    big = OctetStringValue(b"y" * 400)
+    oids = [(1, 3, 6, 1, 4, 1, 99, 2, index) for index in range(4)]
+    responder = V2cResponder(objects=[(oid, big) for oid in oids], max_response_size=1000)
+
+    fits = responder._build_response_message(
+        SnmpMessage(1, "public", Pdu(PduType.GET, 1, 0, 0, build_null_varbinds(oids[:2])))
+    )
+    too_big = responder._build_response_message(
+        SnmpMessage(1, "public", Pdu(PduType.GET_NEXT, 2, 0, 0, build_null_varbinds(oids[:3])))
+    )
+    assert fits is not None and len(fits.pdu.varbinds) == 2
+    assert too_big is not None
+    assert too_big.pdu.error_status == int(ErrorStatus.TOO_BIG)
+    assert (too_big.pdu.error_index, too_big.pdu.varbinds) == (0, ())
+
+    async def exact_lookup(oid: tuple[int, ...]) -> OctetStringValue:
+        return big
+
+    async def next_lookup(oid: tuple[int, ...]) -> tuple[tuple[int, ...], OctetStringValue]:
+        return (*oid, 1), big
+
+    async_responder = V2cResponder(
+        source=AsyncCallbackObjectSource(exact_lookup=exact_lookup, next_lookup=next_lookup),
+        max_response_size=1000,
+    )
+    bulk = asyncio.run(
+        async_responder._build_response_message_async(
+            SnmpMessage(
+                1, "public", Pdu(PduType.GET_BULK, 3, 0, 2**31 - 1, build_null_varbinds(oids))
+            )
+        )
+    )
+    assert bulk is not None and len(bulk.pdu.varbinds) == 2
+    assert len(encode_message(bulk)) <= 1000
+
+    with pytest.raises(ValueError, match="at least 484"):
+        V2cResponder(max_response_size=100)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from trishul_snmp import (
+    AsyncCallbackObjectSource,
+    CallbackObjectSource,
+    Counter32Value,
+    CounterRule,
+    InMemoryObjectSource,
+    IntegerValue,
+    OctetStringValue,
+    OverlayObjectSource,
+    RequestTimeoutError,
+    ResponderFarm,
+    V2cManager,
+)
+from trishul_snmp.errors import TransportError
+from trishul_snmp.wire.message import SnmpMessage, encode_message
+from trishul_snmp.wire.pdu import Pdu, PduType, build_null_varbinds
+
+_SYS_DESCR = (1, 3, 6, 1, 2, 1, 1, 1, 0)
+_SYS_NAME = (1, 3, 6, 1, 2, 1, 1, 5, 0)
+_IF_IN_OCTETS = (1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 1)
+
+
+def _skip_if_udp_restricted(exc: Exception) -> None:
+    cause = exc.__cause__
+    if isinstance(cause, OSError) and cause.errno in {1, 13}:
+        pytest.skip(f"UDP sockets are not permitted in this environment: {cause}")
+
+
+def _base_source() -> InMemoryObjectSource:
+    return InMemoryObjectSource(
+        objects=[
+            (_SYS_DESCR, OctetStringValue(b"simulated device")),
+            (_SYS_NAME, OctetStringValue(b"template")),
+            (_IF_IN_OCTETS, Counter32Value(0)),
+        ]
+    )
+
+
+def test_overlay_source_prefers_overrides_and_shares_base_encodings() -> None:
+    base = _base_source()
+    first = OverlayObjectSource(base, objects=[(_SYS_NAME, OctetStringValue(b"agent-1"))])
+    second = OverlayObjectSource(
+        base,
+        objects=[
+            (_SYS_NAME, OctetStringValue(b"agent-2")),
+            (_IF_IN_OCTETS, CounterRule(start=5000)),
+            ((1, 3, 6, 1, 2, 1, 1, 4, 0), OctetStringValue(b"ops")),
+        ],
+    )
+
+    assert first.base is base
+    assert first.lookup_exact(_SYS_NAME) == OctetStringValue(b"agent-1")
+    assert second.lookup_exact(_SYS_NAME) == OctetStringValue(b"agent-2")
+    assert first.lookup_exact(_SYS_DESCR) == OctetStringValue(b"simulated device")
+    assert first.lookup_exact((1, 3)) is None
+    assert first.lookup_exact_varbind((1, 3)) is None
+    assert first.lookup_exact_varbind(_SYS_DESCR) is second.lookup_exact_varbind(_SYS_DESCR)
+
+    walk: list[tuple[tuple[int, ...], object]] = []
+    oid: tuple[int, ...] = (1, 3)
+    while (match := second.lookup_next(oid)) is not None:
+        walk.append(match)
+        oid = match[0]
+    assert walk == [
+        (_SYS_DESCR, OctetStringValue(b"simulated device")),
+        ((1, 3, 6, 1, 2, 1, 1, 4, 0), OctetStringValue(b"ops")),
+        (_SYS_NAME, OctetStringValue(b"agent-2")),
+        (_IF_IN_OCTETS, Counter32Value(5000)),
+    ]
+    assert [varbind.oid for varbind in second.iter_from((1, 3))] == [oid for oid, _ in walk]
+    assert [varbind.oid for varbind in first.iter_from(_SYS_DESCR)] == [_SYS_NAME, _IF_IN_OCTETS]
+
+    assert second.delete_object(_SYS_NAME) is True
+    assert second.lookup_exact(_SYS_NAME) == OctetStringValue(b"template")
+    assert second.set_objects([(_SYS_DESCR, IntegerValue(1))]) == (_SYS_DESCR,)
+    assert set(second.overlay.oids) == {
+        _SYS_DESCR,
+        (1, 3, 6, 1, 2, 1, 1, 4, 0),
+        _IF_IN_OCTETS,
+    }
+
+
+def test_overlay_source_over_plain_base_source() -> None:
+    objects = {_SYS_DESCR: OctetStringValue(b"cb"), _SYS_NAME: OctetStringValue(b"cb-name")}
+    base = CallbackObjectSource(
+        exact_lookup=objects.get,
+        next_lookup=lambda oid: next(
+            ((key, value) for key, value in sorted(objects.items()) if key > oid), None
+        ),
+    )
+    overlay = OverlayObjectSource(base)
+    overlay.set_object(_SYS_NAME, OctetStringValue(b"override"))
+
+    exact = overlay.lookup_exact_varbind(_SYS_DESCR)
+    assert exact is not None and exact.value == OctetStringValue(b"cb")
+    assert overlay.lookup_next(_SYS_DESCR) == (_SYS_NAME, OctetStringValue(b"override"))
+    assert overlay.lookup_next(_SYS_NAME) is None
+    assert overlay.lookup_next((1, 3)) == (_SYS_DESCR, OctetStringValue(b"cb"))
+    assert [varbind.value for varbind in overlay.iter_from((1, 3))] == [
+        OctetStringValue(b"cb"),
+        OctetStringValue(b"override"),
+    ]
+
+
+def test_responder_farm_serves_agents_with_shared_base() -> None:
+    base = _base_source()
+
+    async def scenario() -> None:
+        farm = ResponderFarm(communities=["public"])
+        agents = [
+            farm.add_agent(
+                OverlayObjectSource(
+                    base,
+                    objects=[(_SYS_NAME, OctetStringValue(f"agent-{index}".encode()))],
+                )
+            )
+            for index in range(3)
+        ]
+        assert agents[0].local_address is None
+        try:
+            async with farm:
+                serve_task = asyncio.create_task(farm.serve_forever())
+                names: list[str] = []
+                for agent in farm.agents:
+                    address = agent.local_address
+                    assert address is not None
+                    async with V2cManager(
+                        host="127.0.0.1",
+                        port=address[1],
+                        community="public",
+                        timeout=0.5,
+                        retries=0,
+                    ) as manager:
+                        response = await manager.get(_SYS_NAME, _SYS_DESCR)
+                        names.append(str(response.varbinds[0].display_value))
+                        assert response.varbinds[1].value == OctetStringValue(b"simulated device")
+                        walked = await manager.walk("1.3.6.1.2.1")
+                        assert len(walked) == 3
+                address = agents[0].local_address
+                assert address is not None
+                async with V2cManager(
+                    host="127.0.0.1",
+                    port=address[1],
+                    community="private",
+                    timeout=0.05,
+                    retries=0,
+                ) as manager:
+                    with pytest.raises(RequestTimeoutError):
+                        await manager.get(_SYS_NAME)
+                stats = farm.stats
+            await asyncio.wait_for(serve_task, timeout=1)
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+
+        assert names == ["agent-0", "agent-1", "agent-2"]
+        assert stats.discarded == 1
+        assert stats.responded == stats.received - 1
+        assert stats.max_latency >= stats.mean_latency > 0
+        assert agents[0].local_address is None
+
+    asyncio.run(scenario())
+
+
+def test_responder_farm_discards_unusable_datagrams() -> None:
+    farm = ResponderFarm()
+    agent = farm.add_agent(_base_source())
+    unsupported = encode_message(
+        SnmpMessage(version=1, community="public", pdu=Pdu(PduType.RESPONSE, 1, 0, 0, ()))
+    )
+    request = encode_message(
+        SnmpMessage(
+            version=1,
+            community="public",
+            pdu=Pdu(PduType.GET, 2, 0, 0, build_null_varbinds([_SYS_NAME])),
+        )
+    )
+
+    farm._handle_datagram(agent, b"junk", ("127.0.0.1", 40000))
+    farm._handle_datagram(agent, unsupported, ("127.0.0.1", 40000))
+    farm._handle_datagram(agent, request, ("127.0.0.1", 40000))
+
+    stats = farm.stats
+    assert (stats.received, stats.responded, stats.discarded) == (3, 0, 3)
+    assert stats.throughput == 0.0
+    assert stats.mean_latency == 0.0
+
+
+def test_responder_farm_lifecycle_errors() -> None:
+    async def exact_lookup(oid: tuple[int, ...]) -> None:
+        return None
+
+    with pytest.raises(ValueError, match="at least 484"):
+        ResponderFarm(max_response_size=0)
+    assert ResponderFarm(max_response_size=484).add_agent(_base_source()).max_response_size == 484
+
+    with pytest.raises(TypeError, match="synchronous sources"):
+        ResponderFarm().add_agent(
+            AsyncCallbackObjectSource(  # type: ignore[arg-type]
+                exact_lookup=exact_lookup,
+                next_lookup=exact_lookup,
+            )
+        )
+
+    async def scenario() -> None:
+        farm = ResponderFarm()
+        with pytest.raises(TransportError, match="not open"):
+            await farm.serve_forever()
+
+        bad = ResponderFarm()
+        bad.add_agent(_base_source(), host="256.0.0.1")
+        with pytest.raises(TransportError, match="Unable to bind"):
+            await bad.open()
+        assert all(agent.local_address is None for agent in bad.agents)
+
+        try:
+            async with ResponderFarm() as opened:
+                await opened.open()
+                with pytest.raises(RuntimeError, match="before the farm is opened"):
+                    opened.add_agent(_base_source())
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+
+    asyncio.run(scenario())
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from trishul_snmp import (
+    Counter64Value,
+    EndOfMibViewValue,
+    Gauge32Value,
+    InMemoryObjectSource,
+    IntegerValue,
+    IpAddressValue,
+    ObjectIdentifierValue,
+    OctetStringValue,
+    SnapshotError,
+    SnapshotSource,
+    TimeTicksValue,
+    V2cManager,
+    V2cResponder,
+    record_snapshot,
+    write_snapshot,
+)
+from trishul_snmp.types import SnmpValueType
+from trishul_snmp.wire.pdu import build_encoded_varbind
+
+_OBJECTS: list[tuple[tuple[int, ...], SnmpValueType]] = [
+    ((1, 3, 6, 1, 2, 1, 1, 1, 0), OctetStringValue(b"recorded router")),
+    ((1, 3, 6, 1, 2, 1, 1, 2, 0), ObjectIdentifierValue((1, 3, 6, 1, 4, 1, 9, 1, 1))),
+    ((1, 3, 6, 1, 2, 1, 1, 3, 0), TimeTicksValue(123456)),
+    ((1, 3, 6, 1, 2, 1, 2, 2, 1, 5, 1), Gauge32Value(1_000_000_000)),
+    ((1, 3, 6, 1, 2, 1, 2, 2, 1, 5, 128), Gauge32Value(10)),
+    ((1, 3, 6, 1, 2, 1, 4, 20, 1, 1, 10, 0, 0, 1), IpAddressValue("10.0.0.1")),
+    ((1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 6, 1), Counter64Value(2**40)),
+    ((1, 3, 6, 1, 4, 1, 200_000, 1), IntegerValue(-5)),
+]
+
+
+def _skip_if_udp_restricted(exc: Exception) -> None:
+    cause = exc.__cause__
+    if isinstance(cause, OSError) and cause.errno in {1, 13}:
+        pytest.skip(f"UDP sockets are not permitted in this environment: {cause}")
+
+
+def test_snapshot_source_matches_in_memory_source(tmp_path: Path) -> None:
+    path = write_snapshot(
+        [*reversed(_OBJECTS), ((1, 3, 6, 1, 9), EndOfMibViewValue())],
+        tmp_path / "device.snap",
+    )
+    snapshot = SnapshotSource(path)
+    reference = InMemoryObjectSource(objects=_OBJECTS)
+
+    assert snapshot.path == path
+    assert len(snapshot) == len(_OBJECTS)
+    probes = [(), (1, 3), (1, 3, 6, 1, 2, 1, 2, 2, 1, 5), (1, 3, 6, 1, 9), (2,)]
+    probes += [oid for oid, _ in _OBJECTS]
+    probes += [(*oid, 0) for oid, _ in _OBJECTS]
+    for probe in probes:
+        assert snapshot.lookup_exact(probe) == reference.lookup_exact(probe)
+        assert snapshot.lookup_next(probe) == reference.lookup_next(probe)
+        assert list(snapshot.iter_from(probe)) == list(reference.iter_from(probe))
+
+    for oid, value in _OBJECTS:
+        varbind = snapshot.lookup_exact_varbind(oid)
+        assert varbind is not None
+        assert varbind.encoded == build_encoded_varbind(oid, value).encoded
+
+    assert snapshot.lookup_exact((1, 3, 2**33)) is None
+    assert snapshot.lookup_next_varbind((1, 3, 2**33)) is None
+    snapshot.close()
+
+
+def test_snapshot_writer_deduplicates_and_validates(tmp_path: Path) -> None:
+    path = write_snapshot(
+        [((1, 3, 6), IntegerValue(1)), ([1, 3, 6], IntegerValue(2))],
+        tmp_path / "dup.snap",
+    )
+    snapshot = SnapshotSource(path)
+    assert len(snapshot) == 1
+    assert snapshot.lookup_exact((1, 3, 6)) == IntegerValue(2)
+
+    with pytest.raises(ValueError, match="cannot be stored"):
+        write_snapshot([((1, 3, -1), IntegerValue(1))], tmp_path / "bad.snap")
+    with pytest.raises(ValueError, match="cannot be stored"):
+        write_snapshot([((), IntegerValue(1))], tmp_path / "bad.snap")
+    assert not (tmp_path / "bad.snap").exists()
+
+    empty = SnapshotSource(write_snapshot([], tmp_path / "empty.snap"))
+    assert empty.lookup_next(()) is None
+    assert list(empty.iter_from(())) == []
+
+
+def test_snapshot_source_rejects_invalid_files(tmp_path: Path) -> None:
+    with pytest.raises(SnapshotError, match="does not exist"):
+        SnapshotSource(tmp_path / "missing.snap")
+
+    (tmp_path / "empty.snap").write_bytes(b"")
+    with pytest.raises(SnapshotError, match="empty"):
+        SnapshotSource(tmp_path / "empty.snap")
+
+    (tmp_path / "short.snap").write_bytes(b"TSNMP")
+    with pytest.raises(SnapshotError, match="truncated"):
+        SnapshotSource(tmp_path / "short.snap")
+
+    (tmp_path / "other.snap").write_bytes(b"NOTASNAP" + bytes(8))
+    with pytest.raises(SnapshotError, match="not a supported snapshot"):
+        SnapshotSource(tmp_path / "other.snap")
+
+    data = write_snapshot(_OBJECTS, tmp_path / "full.snap").read_bytes()
+    (tmp_path / "cut.snap").write_bytes(data[:20])
+    with pytest.raises(SnapshotError, match="truncated"):
+        SnapshotSource(tmp_path / "cut.snap")
+
+
+def test_record_snapshot_replays_walked_device(tmp_path: Path) -> None:
+    async def walk(source: InMemoryObjectSource | SnapshotSource) -> list[tuple[object, object]]:
+        async with V2cResponder(host="127.0.0.1", port=0, source=source) as responder:
+            address = responder.local_address
+            assert address is not None
+            serve_task = asyncio.create_task(responder.serve_forever())
+            async with V2cManager(
+                host="127.0.0.1",
+                port=address[1],
+                community="public",
+                timeout=1.0,
+                retries=0,
+            ) as manager:
+                if isinstance(source, InMemoryObjectSource):
+                    await record_snapshot(manager, tmp_path / "walk.snap", max_repetitions=3)
+                walked = await manager.walk("1.3.6.1", max_repetitions=5)
+            await responder.close()
+            await serve_task
+        return [(varbind.oid, varbind.value) for varbind in walked]
+
+    async def scenario() -> None:
+        try:
+            recorded = await walk(InMemoryObjectSource(objects=_OBJECTS))
+            replayed = await walk(SnapshotSource(tmp_path / "walk.snap"))
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+        assert recorded == list(_OBJECTS)
+        assert replayed == recorded
+
+    asyncio.run(scenario())
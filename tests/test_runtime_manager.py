@@ -208,3 +208,28 @@ def test_v2c_manager_get_next_and_walk_variants(tmp_path: Path) -> None:
         ]
 
     asyncio.run(scenario())
+
+
+def test_v2c_manager_accepts_compiled_targets(tmp_path: Path) -> None:
+    _write_json(tmp_path / "IF-MIB.json", _if_mib_payload())
+
+    async def scenario() -> None:
+        async with _build_manager(bundle_path=tmp_path / "IF-MIB.json") as manager:
+            compiled = manager.compile_targets("IF-MIB::ifDescr.1", "1.3.6.1.2.1.1.3.0")
+            response = await manager.get(compiled)
+            mixed = await manager.get(compiled, "IF-MIB::ifDescr.2")
+            following = await manager.get_next(manager.compile_targets("IF-MIB::ifTable"))
+            bulk = await manager.get_bulk(
+                manager.compile_targets("IF-MIB::ifTable"), max_repetitions=2
+            )
+
+        assert compiled.oids == ((1, 3, 6, 1, 2, 1, 2, 2, 1, 2, 1), (1, 3, 6, 1, 2, 1, 1, 3, 0))
+        assert [vb.display_value for vb in response.varbinds] == ["eth0", "12345"]
+        assert [vb.display_value for vb in mixed.varbinds] == ["eth0", "12345", "eth1"]
+        assert following.varbinds[0].display_name == "IF-MIB::ifIndex.1"
+        assert [vb.display_name for vb in bulk.varbinds] == [
+            "IF-MIB::ifIndex.1",
+            "IF-MIB::ifIndex.2",
+        ]
+
+    asyncio.run(scenario())
@@ -4,6 +4,8 @@ import json
 import time
 from pathlib import Path
 
+import pytest
+
 from trishul_snmp import (
     Counter32Value,
     Counter64Value,
@@ -171,6 +173,51 @@ def test_timestamp_rule_custom_type() -> None:
     assert isinstance(v, Counter32Value)
 
 
+# --- Tick caching and batched reads ---
+
+
+def test_rules_with_ttl_evaluate_once_per_tick(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    counter = CounterRule(start=1, ttl=5.0)
+    uptime = UptimeRule(ttl=0.5)
+    random_rule = RandomNumericRule(min=0, max=1_000_000, ttl=5.0)
+
+    assert counter.ttl == 5.0
+    first = random_rule.get_value()
+    assert counter.get_value() is counter.get_value()
+    assert random_rule.get_value() is first
+    assert uptime.get_value() == TimeTicksValue(0)
+
+    now[0] += 1.0
+    assert counter.get_value() == Counter32Value(1)
+    assert uptime.get_value() == TimeTicksValue(100)
+    now[0] += 5.0
+    assert counter.get_value() == Counter32Value(2)
+    assert counter.get_values(3) == [Counter32Value(2)] * 3
+
+    with pytest.raises(ValueError, match="ttl cannot be negative"):
+        TimestampRule(ttl=-1.0)
+
+
+def test_rules_get_values_batches_reads() -> None:
+    counter = CounterRule(start=5, increment=2)
+    assert counter.get_values(3) == [Counter32Value(5), Counter32Value(7), Counter32Value(9)]
+    assert counter.get_value() == Counter32Value(11)
+    assert counter.get_values(0) == []
+    assert CounterRule(start=4, increment=0).get_values(2) == [Counter32Value(4)] * 2
+
+    values = RandomNumericRule(min=3, max=6).get_values(200)
+    assert len(values) == 200
+    assert {value.value for value in values} <= {3, 4, 5, 6}
+    assert all(isinstance(value, Gauge32Value) for value in values)
+
+    stamps = TimestampRule().get_values(4)
+    assert len(set(stamps)) == 1 and isinstance(stamps[0], IntegerValue)
+    ticks = UptimeRule().get_values(2)
+    assert ticks[0] == ticks[1] and isinstance(ticks[0], TimeTicksValue)
+
+
 # --- SimulationRule protocol ---
 
 
@@ -220,6 +267,37 @@ def test_in_memory_source_mixes_rules_and_static_values() -> None:
     assert isinstance(dynamic, TimeTicksValue)
 
 
+def test_in_memory_source_rule_ttl_reuses_encoded_rule_varbinds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [10.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    oid = (1, 3, 6, 1, 2, 1, 1, 3, 0)
+    source = InMemoryObjectSource(
+        objects=[(oid, CounterRule(start=1)), ((1, 3, 6, 1, 2, 1, 1, 4, 0), IntegerValue(9))],
+        rule_ttl=1.0,
+    )
+
+    assert source.lookup_exact(oid) == Counter32Value(1)
+    assert source.lookup_exact_varbind(oid) is source.lookup_next_varbind((1, 3))
+    assert next(source.iter_from((1, 3))).value == Counter32Value(1)
+    assert source.lookup_next((1, 3)) == (oid, Counter32Value(1))
+
+    now[0] += 1.0
+    assert [varbind.value for varbind in source.iter_from((1, 3))] == [
+        Counter32Value(2),
+        IntegerValue(9),
+    ]
+    source.set_object(oid, CounterRule(start=50))
+    assert source.lookup_exact(oid) == Counter32Value(50)
+    source.delete_object(oid)
+    assert source.lookup_exact_varbind(oid) is None
+    source.clear()
+
+    with pytest.raises(ValueError, match="rule_ttl cannot be negative"):
+        InMemoryObjectSource(rule_ttl=-0.5)
+
+
 # --- from_bundle ---
 
 
@@ -296,3 +374,64 @@ def test_from_bundle_skips_deprecated_by_default(tmp_path: Path) -> None:
 
     source_with_dep = InMemoryObjectSource.from_bundle(bundle, include_deprecated=True)
     assert source_with_dep.lookup_exact((1, 3, 6, 1, 2, 1, 99, 1, 0)) == IntegerValue(0)
+
+
+def test_from_bundle_lazy_matches_eager_walk(tmp_path: Path) -> None:
+    _write_json(tmp_path / "RFC1213-MIB.json", _sys_mib_payload())
+    bundle = load_bundle(tmp_path / "RFC1213-MIB.json")
+    eager = InMemoryObjectSource.from_bundle(bundle, max_instances=3)
+    lazy = InMemoryObjectSource.from_bundle(bundle, max_instances=3, lazy=True)
+
+    assert lazy._lazy_columns
+    walked: list[tuple[int, ...]] = []
+    oid: tuple[int, ...] = ()
+    while (varbind := lazy.lookup_next_varbind(oid)) is not None:
+        walked.append(varbind.oid)
+        oid = varbind.oid
+    assert walked == list(eager.oids)
+    assert not lazy._lazy_columns
+    ranged = InMemoryObjectSource.from_bundle(bundle, max_instances=3, lazy=True)
+    assert [varbind.oid for varbind in ranged.iter_from(())] == walked
+    cached = InMemoryObjectSource.from_bundle(bundle, max_instances=3, rule_ttl=60.0)
+    assert [varbind.oid for varbind in cached.iter_from(())] == walked
+    assert list(cached.iter_from(())) == list(cached.iter_from(()))
+    assert lazy.lookup_next((1, 3, 6, 1, 2, 1, 2, 2, 1, 1)) == (
+        (1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 1),
+        IntegerValue(1),
+    )
+
+
+def test_from_bundle_lazy_materializes_columns_on_first_touch(tmp_path: Path) -> None:
+    _write_json(tmp_path / "RFC1213-MIB.json", _sys_mib_payload())
+    bundle = load_bundle(tmp_path / "RFC1213-MIB.json")
+    if_index = (1, 3, 6, 1, 2, 1, 2, 2, 1, 1)
+    if_in_octets = (1, 3, 6, 1, 2, 1, 2, 2, 1, 10)
+
+    source = InMemoryObjectSource.from_bundle(bundle, lazy=True)
+    columns = set(source._lazy_columns)
+    assert if_index in columns and if_in_octets in columns
+    assert len(source._values) == 2
+
+    assert source.lookup_exact(if_index + (2,)) == IntegerValue(2)
+    assert if_index not in source._lazy_columns
+    assert if_in_octets in source._lazy_columns
+    assert source.lookup_exact_varbind(if_index + (9,)) is None
+
+    source.set_object(if_in_octets + (1,), Counter32Value(99))
+    assert source.lookup_exact(if_in_octets + (1,)) == Counter32Value(99)
+    assert isinstance(source.lookup_exact(if_in_octets + (2,)), Counter32Value)
+
+    assert not source._lazy_columns
+
+    lazy_again = InMemoryObjectSource.from_bundle(bundle, lazy=True)
+    assert lazy_again.delete_object(if_in_octets + (1,)) is True
+    assert lazy_again.lookup_exact(if_in_octets + (1,)) is None
+    lazy_again.set_objects([(if_index + (1,), IntegerValue(7))])
+    assert lazy_again.lookup_exact(if_index + (1,)) == IntegerValue(7)
+    assert len(lazy_again.oids) == len(InMemoryObjectSource.from_bundle(bundle).oids) - 1
+    lazy_again.clear()
+    assert lazy_again.lookup_next(()) is None
+
+    untouched = InMemoryObjectSource.from_bundle(bundle, lazy=True)
+    assert len(untouched.oids) == 6
+    assert not untouched._lazy_columns
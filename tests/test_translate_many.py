@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests._bundle_fixtures import write_scalar_instance_alias_bundle
+from trishul_snmp import (
+    InvalidOidError,
+    TranslationError,
+    UnknownOidError,
+    UnknownSymbolError,
+    load_bundle,
+    load_mapped_bundle,
+    write_mapped_bundle,
+)
+from trishul_snmp.mib import registry as mib_registry
+from trishul_snmp.mib.mapped import _MappedIndex
+
+_TARGETS = [
+    "1.3.6.1.2.1.1.3.0",
+    "1.3.6.1.2.1.1.3.0.5",
+    ".1.3.6.1.2.1.1.3",
+    "1.3.6.1.2.1.1.3.7.1",
+    "1.3.6.1.2.1.1.3.7.2",
+    "SNMPv2-MIB::sysUpTime.0",
+    "SNMPv2-MIB::sysUpTime",
+    "SNMPv2-MIB::sysUpTime.4",
+    "1.3.6.1.2.1.1",
+    "1.3.06.1.2.1.1.3.1",
+]
+
+
+def test_translate_many_matches_single_translate(tmp_path: Path) -> None:
+    bundle = load_bundle(write_scalar_instance_alias_bundle(tmp_path))
+
+    results = list(bundle.translate_many(_TARGETS * 2))
+
+    assert results == [bundle.translate(target) for target in _TARGETS * 2]
+    assert results[:3] == [
+        "SNMPv2-MIB::sysUpTime.0",
+        "DISMAN-EXPRESSION-MIB::sysUpTimeInstance.5",
+        "SNMPv2-MIB::sysUpTime",
+    ]
+
+
+def test_translate_many_accepts_sequences_and_padded_text(tmp_path: Path) -> None:
+    bundle = load_bundle(write_scalar_instance_alias_bundle(tmp_path))
+
+    assert list(bundle.translate_many([(1, 3, 6, 1, 2, 1, 1, 3, 9), " SNMPv2-MIB::system "])) == [
+        "SNMPv2-MIB::sysUpTime.9",
+        "1.3.6.1.2.1.1",
+    ]
+
+
+def test_translate_many_is_lazy_and_raises_per_target(tmp_path: Path) -> None:
+    bundle = load_bundle(write_scalar_instance_alias_bundle(tmp_path))
+    results = bundle.translate_many(["1.3.6.1.2.1.1.3.0", "2.25", "1.3.6.1.2.1.1.3.0"])
+
+    assert next(results) == "SNMPv2-MIB::sysUpTime.0"
+    with pytest.raises(UnknownOidError, match="2.25"):
+        next(results)
+
+    for bad, error in (
+        ("", TranslationError),
+        ("1.3.x", InvalidOidError),
+        ("SNMPv2-MIB::missing", UnknownSymbolError),
+        ("SNMPv2-MIB::sysUpTime.x", UnknownSymbolError),
+    ):
+        with pytest.raises(error):
+            list(bundle.translate_many([bad]))
+
+
+def test_translate_many_keep_unknown_passes_targets_through(tmp_path: Path) -> None:
+    bundle = load_bundle(write_scalar_instance_alias_bundle(tmp_path))
+
+    results = list(
+        bundle.translate_many(
+            ["2.25\n", "SNMPv2-MIB::missing", (2, 25, 7), "1.3.6.1.2.1.1.3.1"],
+            keep_unknown=True,
+        )
+    )
+
+    assert results == [
+        "2.25",
+        "SNMPv2-MIB::missing",
+        "2.25.7",
+        "SNMPv2-MIB::sysUpTime.1",
+    ]
+
+
+def test_translate_many_bounds_its_caches(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(mib_registry, "_TRANSLATE_CACHE_SIZE", 2)
+    bundle = load_bundle(write_scalar_instance_alias_bundle(tmp_path))
+    targets = [f"1.3.6.1.2.1.1.3.{index}.1" for index in range(10)] + ["1.3.6.1.2.1.1.3.0"]
+
+    assert list(bundle.translate_many(targets)) == [bundle.translate(t) for t in targets]
+
+
+def test_translate_many_on_mapped_bundle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = load_bundle(write_scalar_instance_alias_bundle(tmp_path))
+    mapped = load_mapped_bundle(write_mapped_bundle(source, tmp_path / "bundle.tsnmpidx"))
+
+    def no_scan(self: object) -> None:
+        raise AssertionError("the mapped OID index must be probed, not copied")
+
+    # numeric lookups binary-search the mapped index instead of decoding all of it
+    monkeypatch.setattr(_MappedIndex, "__iter__", no_scan)
+
+    assert list(mapped.translate_many(_TARGETS)) == list(source.translate_many(_TARGETS))
@@ -8,6 +8,9 @@ import pytest
 
 from trishul_snmp.errors import RequestTimeoutError, TransportError
 from trishul_snmp.transport.udp import (
+    DatagramQueueStats,
+    DropPolicy,
+    ReceivedDatagram,
     UdpClient,
     UdpServer,
     _QueueingDatagramProtocol,
@@ -33,18 +36,42 @@ class _FakeSocket:
         self.closed = True
 
 
+class _FakeServerSocket:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.options: list[tuple[int, int, int]] = []
+
+    def setsockopt(self, level: int, option: int, value: int) -> None:
+        if self.fail:
+            raise OSError("setsockopt failed")
+        self.options.append((level, option, value))
+
+
 class _FakeDatagramTransport:
     def __init__(self, *, sockname: tuple[str, int] = ("127.0.0.1", 40161)) -> None:
         self.sockname = sockname
         self.closed = False
+        self.reading = True
+        self.socket = _FakeServerSocket()
         self.sendto_calls: list[tuple[bytes, tuple[str, int]]] = []
         self.protocol: asyncio.DatagramProtocol | None = None
 
     def get_extra_info(self, name: str):
         if name == "sockname":
             return self.sockname
+        if name == "socket":
+            return self.socket
         return None
 
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def pause_reading(self) -> None:
+        self.reading = False
+
+    def resume_reading(self) -> None:
+        self.reading = True
+
     def sendto(self, data: bytes, addr: tuple[str, int]) -> None:
         self.sendto_calls.append((data, addr))
 
@@ -124,7 +151,14 @@ class _BindLoop:
     def create_future(self):
         return asyncio.Future()
 
-    async def create_datagram_endpoint(self, factory, *, local_addr: tuple[str, int]):
+    async def create_datagram_endpoint(
+        self,
+        factory,
+        *,
+        local_addr: tuple[str, int],
+        reuse_port: bool | None = None,
+    ):
+        del reuse_port
         self.endpoint_calls.append(local_addr)
         protocol = factory()
         self.transport.protocol = cast(asyncio.DatagramProtocol, protocol)
@@ -136,8 +170,16 @@ class _BindFailLoop:
     def create_future(self):
         return asyncio.Future()
 
-    async def create_datagram_endpoint(self, factory, *, local_addr: tuple[str, int]):
+    async def create_datagram_endpoint(
+        self,
+        factory,
+        *,
+        local_addr: tuple[str, int],
+        reuse_port: bool | None = None,
+    ):
         del factory, local_addr
+        if reuse_port:
+            raise ValueError("reuse_port not supported by socket module")
         raise OSError("bind failed")
 
 
@@ -373,6 +415,8 @@ def test_udp_server_open_wraps_bind_failure(monkeypatch) -> None:
     async def scenario() -> None:
         with pytest.raises(TransportError, match="Unable to bind UDP server socket"):
             await server.open()
+        with pytest.raises(TransportError, match="SO_REUSEPORT is not supported"):
+            await UdpServer("127.0.0.1", 162, reuse_port=True).open()
 
     asyncio.run(scenario())
 
@@ -431,3 +475,147 @@ def test_udp_server_close_sendto_and_receive_cover_error_paths() -> None:
             await server.receive()
 
     asyncio.run(scenario())
+
+
+def test_udp_server_bounded_queue_drop_policies(monkeypatch) -> None:
+    peer = ("127.0.0.1", 40000)
+
+    async def scenario(policy: DropPolicy) -> tuple[list[bytes], DatagramQueueStats]:
+        transport = _FakeDatagramTransport()
+        monkeypatch.setattr(asyncio, "get_running_loop", lambda: _BindLoop(transport))
+        server = UdpServer("127.0.0.1", 0, max_queue=2, drop_policy=policy)
+        await server.open()
+        assert transport.protocol is not None
+        for index in range(5):
+            transport.protocol.datagram_received(bytes([index]), peer)
+        stats = server.stats
+        received = [(await server.receive()).data for _ in range(stats.queued)]
+        await server.close()
+        return received, stats
+
+    newest, stats = asyncio.run(scenario(DropPolicy.DROP_NEWEST))
+    assert newest == [b"\x00", b"\x01"]
+    assert stats == DatagramQueueStats(received=5, dropped=3, queued=2, high_water=2)
+
+    oldest, stats = asyncio.run(scenario(DropPolicy.DROP_OLDEST))
+    assert oldest == [b"\x03", b"\x04"]
+    assert stats == DatagramQueueStats(received=5, dropped=3, queued=2, high_water=2)
+
+    paused, stats = asyncio.run(scenario(DropPolicy.PAUSE))
+    assert paused == [bytes([index]) for index in range(5)]
+    assert stats == DatagramQueueStats(received=5, dropped=0, queued=5, high_water=5)
+
+
+def test_udp_server_pause_policy_resumes_reading_when_drained(monkeypatch) -> None:
+    transport = _FakeDatagramTransport()
+    monkeypatch.setattr(asyncio, "get_running_loop", lambda: _BindLoop(transport))
+    server = UdpServer("127.0.0.1", 0, max_queue=2, drop_policy=DropPolicy.PAUSE)
+
+    async def scenario() -> None:
+        await server.open()
+        assert transport.protocol is not None
+        transport.protocol.datagram_received(b"one", ("127.0.0.1", 40000))
+        assert transport.reading is True
+        transport.protocol.datagram_received(b"two", ("127.0.0.1", 40000))
+        assert transport.reading is False
+
+        assert (await server.receive()).data == b"one"
+        assert transport.reading is True
+        await server.close()
+
+    asyncio.run(scenario())
+    assert server.stats.received == 2
+    assert server.stats.queued == 0
+
+
+def test_udp_server_receive_buffer_size_and_validation(monkeypatch) -> None:
+    transport = _FakeDatagramTransport()
+    monkeypatch.setattr(asyncio, "get_running_loop", lambda: _BindLoop(transport))
+
+    async def scenario() -> None:
+        server = UdpServer("127.0.0.1", 0, recv_buffer_size=1 << 20)
+        assert server.stats == DatagramQueueStats(received=0, dropped=0, queued=0, high_water=0)
+        await server.open()
+        assert transport.socket.options == [(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)]
+        await server.close()
+
+        transport.closed = False
+        transport.socket = _FakeServerSocket(fail=True)
+        with pytest.raises(TransportError, match="receive buffer size"):
+            await UdpServer("127.0.0.1", 0, recv_buffer_size=1024).open()
+        assert transport.closed is True
+
+    asyncio.run(scenario())
+
+    with pytest.raises(ValueError, match="max_queue cannot be negative"):
+        UdpServer("127.0.0.1", 0, max_queue=-1)
+    with pytest.raises(ValueError, match="recv_buffer_size must be positive"):
+        UdpServer("127.0.0.1", 0, recv_buffer_size=0)
+
+
+def test_udp_server_receive_batch_and_wait_closed(monkeypatch) -> None:
+    transport = _FakeDatagramTransport()
+    monkeypatch.setattr(asyncio, "get_running_loop", lambda: _BindLoop(transport))
+    server = UdpServer("127.0.0.1", 0)
+
+    async def scenario() -> None:
+        with pytest.raises(TransportError, match="not open"):
+            await server.receive_batch(4)
+        with pytest.raises(ValueError, match="max_count must be at least 1"):
+            await server.receive_batch(0)
+        await server.wait_closed()
+        await server.open()
+        assert transport.protocol is not None
+        assert await server.receive_batch(4, timeout=0.01) == []
+        for index in range(3):
+            transport.protocol.datagram_received(bytes([index]), ("127.0.0.1", 40000))
+        assert [item.data for item in await server.receive_batch(2)] == [b"\x00", b"\x01"]
+
+        waiter = asyncio.ensure_future(server.wait_closed())
+        await server.close()
+        await waiter
+        assert server._queue is None
+
+    asyncio.run(scenario())
+
+
+def test_udp_server_receive_batch_stops_at_close_marker() -> None:
+    async def scenario() -> None:
+        server = UdpServer("127.0.0.1", 0)
+        queue: asyncio.Queue = asyncio.Queue()
+        server._queue = queue
+        queue.put_nowait(ReceivedDatagram(data=b"last", source_address=("127.0.0.1", 1)))
+        queue.put_nowait(_ServerClosed(None))
+        assert [item.data for item in await server.receive_batch(8)] == [b"last"]
+        with pytest.raises(TransportError, match="UDP server is closed"):
+            await server.receive_batch(8)
+        with pytest.raises(TransportError, match="UDP server is closed"):
+            await server.receive()
+
+        closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        closed.set_exception(RuntimeError("boom"))
+        server._closed = closed
+        await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_udp_server_datagram_handler_bypasses_queue(monkeypatch) -> None:
+    transport = _FakeDatagramTransport()
+    monkeypatch.setattr(asyncio, "get_running_loop", lambda: _BindLoop(transport))
+    seen: list[tuple[bytes, tuple[str, int]]] = []
+    server = UdpServer(
+        "127.0.0.1", 0, datagram_handler=lambda data, addr: seen.append((data, addr))
+    )
+
+    async def scenario() -> None:
+        await server.open()
+        assert transport.protocol is not None
+        transport.protocol.datagram_received(b"trap", ("127.0.0.1", 40000))
+        server.send_nowait(b"ack", ("127.0.0.1", 40000))
+        assert server.stats.queued == 0
+        await server.close()
+
+    asyncio.run(scenario())
+    assert seen == [(b"trap", ("127.0.0.1", 40000))]
+    assert transport.sendto_calls == [(b"ack", ("127.0.0.1", 40000))]
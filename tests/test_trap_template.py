@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from trishul_snmp import (
+    IntegerValue,
+    NotificationEvent,
+    OctetStringValue,
+    TrapTemplate,
+    UsmLocalEngine,
+    UsmUser,
+    V2cNotificationListener,
+    blast_traps,
+    decode_notification,
+)
+from trishul_snmp.errors import ProtocolError, TransportError
+from trishul_snmp.notify.client import encode_notification_raw_varbinds
+from trishul_snmp.security.community import CommunityModel
+from trishul_snmp.security.model import SecurityModel
+from trishul_snmp.security.usm import AuthProtocol, PrivProtocol, UsmModel
+from trishul_snmp.transport.udp import UdpClient
+from trishul_snmp.wire.pdu import Pdu, PduType
+from trishul_snmp.wire.v3message import decode_v3_message
+
+_LINK_DOWN = (1, 3, 6, 1, 6, 3, 1, 1, 5, 3)
+_IF_INDEX = (1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 3)
+_IF_DESCR = (1, 3, 6, 1, 2, 1, 2, 2, 1, 2, 3)
+_ENGINE = UsmLocalEngine(
+    engine_id=b"\x80\x00\x01\x02\x03" + b"\x55" * 8, engine_boots=3, engine_time=1200
+)
+
+
+def _reference(security: SecurityModel, request_id: int, if_index: int, descr: bytes) -> bytes:
+    varbinds = encode_notification_raw_varbinds(
+        _LINK_DOWN,
+        varbinds=[(_IF_INDEX, IntegerValue(if_index)), (_IF_DESCR, OctetStringValue(descr))],
+        uptime=42,
+    )
+    return security.wrap_pdu(Pdu(PduType.SNMPV2_TRAP, request_id, 0, 0, varbinds))
+
+
+def _template(**kwargs: object) -> TrapTemplate:
+    return TrapTemplate(
+        _LINK_DOWN,
+        varbinds=[(_IF_INDEX, IntegerValue(3)), (_IF_DESCR, OctetStringValue(b"eth0"))],
+        variables=[_IF_INDEX],
+        uptime=42,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _skip_if_udp_restricted(exc: Exception) -> None:
+    cause = exc.__cause__
+    if isinstance(cause, OSError) and cause.errno in {1, 13}:
+        pytest.skip(f"UDP sockets are not permitted in this environment: {cause}")
+
+
+def test_v2c_template_matches_the_notifier_encoding() -> None:
+    template = _template(community="public")
+    assert template.variables == 1 and template.request_id == 0
+    community = CommunityModel("public")
+    # request-ids and values that change width force the message to be re-assembled
+    for request_id, if_index in ((1, 3), (2, 3), (3, 300), (4, 7), (5, -70000)):
+        data = template.render(uptime=42, values=[IntegerValue(if_index)])
+        assert data == _reference(community, request_id, if_index, b"eth0")
+    assert template.request_id == 5
+    assert template.render(uptime=42) == _reference(community, 6, -70000, b"eth0")
+    for _ in range(200):
+        template.render(uptime=42)
+    assert template.render(uptime=42) == _reference(community, 207, -70000, b"eth0")
+
+    event = decode_notification(template.render(uptime=2**32 + 5))
+    assert (event.request_id, event.uptime) == (208, 5)
+    assert decode_notification(template.render()).uptime >= 42
+
+
+def test_v3_template_stamps_a_fresh_hmac_per_message() -> None:
+    user = UsmUser(username="blaster", auth_protocol=AuthProtocol.SHA1, auth_key=b"auth-secret")
+    template = _template(user=user, local_engine=_ENGINE)
+    reference = UsmModel(user=user, local_engine=_ENGINE)
+    for request_id, if_index in enumerate((3, 127, 128, 40000), start=1):
+        data = template.render(uptime=42, values=[IntegerValue(if_index)])
+        assert data == _reference(reference, request_id, if_index, b"eth0")
+        assert decode_v3_message(data).msg_id == request_id
+        event = decode_notification(data, user=user)
+        assert event.varbinds[2].value == IntegerValue(if_index)
+
+    private = UsmUser(
+        username="blaster",
+        auth_protocol=AuthProtocol.SHA256,
+        auth_key=b"auth-secret",
+        priv_protocol=PrivProtocol.AES128,
+        priv_key=b"priv-secret",
+    )
+    encrypted = _template(user=private, local_engine=_ENGINE, context_name=b"lab")
+    first, second = encrypted.render(), encrypted.render(values=[IntegerValue(9)])
+    assert decode_v3_message(first).msg_data_bytes != decode_v3_message(second).msg_data_bytes
+    assert [decode_notification(data, user=private).request_id for data in (first, second)] == [
+        1,
+        2,
+    ]
+    assert decode_notification(second, user=private).varbinds[2].value == IntegerValue(9)
+
+    plain = UsmUser(username="blaster", auth_protocol=AuthProtocol.NONE)
+    unauthenticated = _template(user=plain, local_engine=_ENGINE)
+    assert unauthenticated.render(uptime=42) == _reference(
+        UsmModel(user=plain, local_engine=_ENGINE), 1, 3, b"eth0"
+    )
+
+
+def test_template_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError, match="exactly one of community or user"):
+        TrapTemplate(_LINK_DOWN)
+    with pytest.raises(ValueError, match="not a notification varbind"):
+        TrapTemplate(_LINK_DOWN, community="public", variables=[_IF_INDEX])
+    with pytest.raises(ValueError, match="Duplicate template variable"):
+        TrapTemplate(
+            _LINK_DOWN,
+            community="public",
+            varbinds=[(_IF_INDEX, IntegerValue(3))],
+            variables=[_IF_INDEX, "1.3.6.1.2.1.2.2.1.1.3"],
+        )
+    with pytest.raises(ProtocolError, match="local_engine"):
+        _template(user=UsmUser(username="blaster", auth_protocol=AuthProtocol.NONE))
+    with pytest.raises(ValueError, match="Expected 1 template values, got 2"):
+        _template(community="public").render(values=[IntegerValue(1), IntegerValue(2)])
+
+
+def test_blast_traps_paces_and_varies_traps() -> None:
+    async def scenario() -> None:
+        events: list[NotificationEvent] = []
+        listener = V2cNotificationListener(host="127.0.0.1", port=0, handler=events.append)
+        try:
+            await listener.open()
+        except Exception as exc:
+            _skip_if_udp_restricted(exc)
+            raise
+        local = listener.local_address
+        assert local is not None
+
+        template = _template(community="public")
+        stats = await blast_traps(
+            template,
+            host="127.0.0.1",
+            port=local[1],
+            count=5,
+            rate=50.0,
+            sockets=2,
+            values=lambda index: [IntegerValue(index * 10)],
+        )
+        assert (stats.sent, stats.errors) == (5, 0) and stats.elapsed >= 0.08
+        await asyncio.sleep(0.05)
+        await listener.close()
+        assert [event.request_id for event in events] == [1, 2, 3, 4, 5]
+        assert [event.varbinds[2].value for event in events] == [
+            IntegerValue(value) for value in (0, 10, 20, 30, 40)
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_blast_traps_counts_send_errors_and_validates_arguments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attempts: list[bytes] = []
+
+    async def fake_open(self: UdpClient) -> None:
+        return None
+
+    async def fake_send(self: UdpClient, data: bytes) -> None:
+        attempts.append(data)
+        if len(attempts) % 2 == 0:
+            raise TransportError("Failed to send UDP datagram")
+
+    monkeypatch.setattr(UdpClient, "open", fake_open)
+    monkeypatch.setattr(UdpClient, "send", fake_send)
+    template = _template(community="public")
+
+    async def scenario() -> None:
+        stats = await blast_traps(template, host="192.0.2.1", count=3)
+        assert (stats.sent, stats.errors, stats.max_lag) == (2, 1, 0.0)
+        assert stats.bytes_sent == len(attempts[0]) + len(attempts[2])
+
+        for kwargs, message in (
+            ({"count": -1}, "count cannot be negative"),
+            ({"count": 1, "rate": 0}, "rate must be positive"),
+            ({"count": 1, "sockets": 0}, "sockets must be at least 1"),
+        ):
+            with pytest.raises(ValueError, match=message):
+                await blast_traps(template, host="192.0.2.1", **kwargs)  # type: ignore[arg-type]
+
+    asyncio.run(scenario())
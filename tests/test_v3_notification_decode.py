@@ -445,6 +445,33 @@ def test_is_discovery_probe_rejects_regular_notification() -> None:
     assert is_discovery_probe(raw) is False
 
 
+def test_v3_notification_helpers_reuse_a_decoded_view() -> None:
+    user = _make_user(level="authPriv")
+    sender_engine = _make_local_engine(0x9A)
+    raw = _make_message(
+        user=user,
+        pdu=_make_notification_pdu(PduType.SNMPV2_TRAP, request_id=110),
+        local_engine=sender_engine,
+    )
+    probe = UsmModel(user=_make_user(level="noAuthNoPriv"))._build_discovery_probe()
+    view = decode_v3_message(raw)
+    probe_view = decode_v3_message(probe)
+
+    assert is_discovery_probe(raw, view=view) is False
+    assert is_discovery_probe(probe, view=probe_view) is True
+    local_engine = _make_local_engine(0xAA)
+    assert encode_discovery_report(
+        probe, local_engine=local_engine, view=probe_view
+    ) == encode_discovery_report(probe, local_engine=local_engine)
+    with pytest.raises(ProtocolError, match="discovery probe"):
+        encode_discovery_report(b"\x30\x00", local_engine=local_engine)
+
+    envelope = decode_v3_notification_message(raw, user=user, view=view)
+    assert envelope is not None
+    assert envelope.view is view
+    assert envelope.pdu.request_id == 110
+
+
 def test_decode_notification_with_user_rejects_v2c_message() -> None:
     raw = encode_message(
         SnmpMessage(
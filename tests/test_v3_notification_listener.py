@@ -19,6 +19,7 @@ from trishul_snmp.security.usm import (
     UsmLocalEngine,
     UsmModel,
     UsmUser,
+    UsmUserTable,
 )
 from trishul_snmp.types import SocketAddress
 from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
@@ -338,3 +339,138 @@ def test_v3_notification_listener_anext_re_raises_transport_when_not_closed() ->
             await listener.__anext__()
 
     asyncio.run(scenario())
+
+
+def test_usm_user_table_validates_users_and_evicts_least_recent_codecs() -> None:
+    alice = _make_user(level="noAuthNoPriv", username="alice")
+    bob = _make_user(level="authNoPriv", username="bob")
+    with pytest.raises(ValueError, match="At least one USM user"):
+        UsmUserTable([])
+    with pytest.raises(ValueError, match="Duplicate USM username"):
+        UsmUserTable([alice, _make_user(level="authPriv", username="alice")])
+    with pytest.raises(ValueError, match="max_keys must be at least 1"):
+        UsmUserTable([alice], max_keys=0)
+
+    table = UsmUserTable([alice, bob], max_keys=2)
+    assert len(table) == 2 and b"bob" in table and b"carol" not in table
+    assert table.users == (alice, bob)
+    assert table.max_keys == 2
+    assert table.get(b"alice") is alice and table.get(b"carol") is None
+
+    first = table.codec(alice, b"engine-1")
+    assert table.codec(alice, b"engine-1") is first
+    second = table.codec(bob, b"engine-1")
+    table.codec(alice, b"engine-1")
+    table.codec(alice, b"engine-2")
+    assert table.cached_keys == 2
+    assert table.codec(alice, b"engine-1") is first
+    assert table.codec(bob, b"engine-1") is not second
+
+
+def test_v3_notification_listener_serves_many_users_and_engines_without_rederiving_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    alice = UsmUser(username="alice", auth_protocol=AuthProtocol.MD5, auth_key=b"alicepassword")
+    bob = UsmUser(
+        username="bob",
+        auth_protocol=AuthProtocol.SHA1,
+        auth_key=b"bobauthpassword",
+        priv_protocol=PrivProtocol.AES128,
+        priv_key=b"bobprivpassword",
+    )
+    listener_engine = _make_local_engine(0x61)
+    device_engines = [_make_local_engine(0x62), _make_local_engine(0x63)]
+    traps: list[tuple[UsmUser, bytes]] = []
+    for user in (alice, bob):
+        for engine in device_engines:
+            raw = _make_raw_notification(
+                user=user,
+                pdu_type=PduType.SNMPV2_TRAP,
+                request_id=len(traps),
+                local_engine=engine,
+            )
+            traps.append((user, raw))
+    inform = _make_raw_notification(
+        user=bob,
+        pdu_type=PduType.INFORM_REQUEST,
+        request_id=99,
+        peer_engine=listener_engine,
+    )
+    stranger = _make_raw_notification(
+        user=_make_user(level="noAuthNoPriv", username="carol"),
+        pdu_type=PduType.SNMPV2_TRAP,
+        request_id=5,
+        local_engine=device_engines[0],
+    )
+
+    derivations: list[bytes] = []
+    localize_key = UsmModel._localize_key
+    localize_priv_key = UsmModel._localize_priv_key
+
+    def counted_key(self: UsmModel, password: bytes, engine_id: bytes) -> bytes:
+        derivations.append(engine_id)
+        return localize_key(self, password, engine_id)
+
+    def counted_priv_key(self: UsmModel, password: bytes, engine_id: bytes) -> bytes:
+        derivations.append(engine_id)
+        return localize_priv_key(self, password, engine_id)
+
+    monkeypatch.setattr(UsmModel, "_localize_key", counted_key)
+    monkeypatch.setattr(UsmModel, "_localize_priv_key", counted_priv_key)
+
+    listener = V3NotificationListener(users=[alice, bob], local_engine=listener_engine)
+    assert listener.users.users == (alice, bob)
+    for _ in range(3):
+        for user, raw in traps:
+            event, reply = listener._process(raw, ("127.0.0.1", 40020))
+            assert event is not None and event.username == user.username
+            assert reply is None
+    # one auth key per (user, engine) plus one priv key per bob engine
+    assert len(derivations) == 6
+
+    event, reply = listener._process(inform, ("127.0.0.1", 40021))
+    assert event is not None and event.username == "bob" and event.is_inform
+    assert reply is not None
+    assert decode_v3_message(reply).usm_params.username == b"bob"
+    assert listener._process(stranger, ("127.0.0.1", 40022)) == (None, None)
+
+    with pytest.raises(ValueError, match="At least one USM user"):
+        V3NotificationListener(local_engine=listener_engine)
+
+
+def test_v3_notification_listener_decodes_each_message_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from trishul_snmp.notify import listener as listener_module
+    from trishul_snmp.notify import v3 as v3_module
+    from trishul_snmp.security import usm as usm_module
+
+    user = _make_user(level="authPriv")
+    listener_engine = _make_local_engine(0x71)
+    inform = _make_raw_notification(
+        user=user,
+        pdu_type=PduType.INFORM_REQUEST,
+        request_id=8,
+        peer_engine=listener_engine,
+    )
+    probe = UsmModel(user=_make_user(level="noAuthNoPriv"))._build_discovery_probe()
+    listener = V3NotificationListener(user=user, local_engine=listener_engine)
+
+    decoded: list[bytes] = []
+
+    def counted(data: bytes) -> object:
+        decoded.append(data)
+        return decode_v3_message(data)
+
+    for module in (listener_module, v3_module, usm_module):
+        monkeypatch.setattr(module, "decode_v3_message", counted)
+
+    event, reply = listener._process(inform, ("127.0.0.1", 40030))
+    assert event is not None and reply is not None
+    assert decoded == [inform]
+
+    decoded.clear()
+    _, report = listener._process(probe, ("127.0.0.1", 40031))
+    assert report is not None
+    assert decoded == [probe]
+    assert listener._process(b"\x30\x00", ("127.0.0.1", 40032)) == (None, None)
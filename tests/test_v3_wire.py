@@ -6,6 +6,7 @@ import pytest
 
 from trishul_snmp.errors import ProtocolError
 from trishul_snmp.types import NullValue, OctetStringValue
+from trishul_snmp.wire.ber import encode_tlv
 from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
 from trishul_snmp.wire.v3message import (
     MSG_FLAG_AUTH,
@@ -16,6 +17,7 @@ from trishul_snmp.wire.v3message import (
     decode_v3_message,
     encode_scoped_pdu,
     encode_v3_message,
+    encode_v3_message_with_auth_offset,
 )
 
 # ── fixtures ─────────────────────────────────────────────────────────────────
@@ -219,6 +221,35 @@ def test_v3_message_auth_params_offset_is_correct() -> None:
     assert raw[offset : offset + len(sentinel)] == sentinel
 
 
+@pytest.mark.parametrize(
+    ("engine_id", "username", "msg_data_size"),
+    [(b"", b"", 4), (b"\x80" * 5, b"u" * 130, 200), (b"\x80" * 32, b"user", 70_000)],
+)
+def test_encoder_reports_auth_params_offset_without_decoding(
+    engine_id: bytes,
+    username: bytes,
+    msg_data_size: int,
+) -> None:
+    sentinel = b"\xca\xfe\xba\xbe\x00\x01\x02\x03\x04\x05\x06\x07"
+    usm = UsmParams(
+        engine_id=engine_id,
+        engine_boots=2**31 - 1,
+        engine_time=5,
+        username=username,
+        auth_params=sentinel,
+        priv_params=b"\x00" * 8,
+    )
+    msg_data = encode_tlv(0x04, b"\x00" * msg_data_size)
+
+    raw, offset = encode_v3_message_with_auth_offset(
+        7, 65507, MSG_FLAG_AUTH | MSG_FLAG_PRIV, usm, msg_data
+    )
+
+    assert raw == encode_v3_message(7, 65507, MSG_FLAG_AUTH | MSG_FLAG_PRIV, usm, msg_data)
+    assert offset == decode_v3_message(raw).auth_params_offset
+    assert raw[offset : offset + len(sentinel)] == sentinel
+
+
 def test_v3_message_scoped_pdu_survives_roundtrip() -> None:
     """scoped_pdu_bytes in V3MessageView must exactly equal what was passed in."""
     usm = _make_usm()
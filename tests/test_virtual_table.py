@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import pytest
+
+from trishul_snmp import (
+    Gauge32Value,
+    InMemoryObjectSource,
+    IntegerValue,
+    IpAddressValue,
+    RangeSource,
+    V2cResponder,
+    VirtualTableSource,
+)
+from trishul_snmp.types import EndOfMibViewValue
+from trishul_snmp.wire.pdu import build_null_varbinds
+
+_ROUTE_ENTRY = (1, 3, 6, 1, 2, 1, 4, 24, 4, 1)
+
+
+def _walk(source: VirtualTableSource | InMemoryObjectSource) -> list[tuple[object, object]]:
+    walked: list[tuple[object, object]] = []
+    oid: tuple[int, ...] = ()
+    while (match := source.lookup_next(oid)) is not None:
+        walked.append(match)
+        oid = match[0]
+    return walked
+
+
+def test_virtual_table_matches_materialized_table() -> None:
+    rows = range(2, 30, 3)
+    table = VirtualTableSource(
+        {
+            (*_ROUTE_ENTRY, 7): lambda row: IntegerValue(row * 10),
+            (*_ROUTE_ENTRY, 1): lambda row: Gauge32Value(row),
+        },
+        rows=rows,
+    )
+    reference = InMemoryObjectSource(
+        objects=[((*_ROUTE_ENTRY, 1, row), Gauge32Value(row)) for row in rows]
+        + [((*_ROUTE_ENTRY, 7, row), IntegerValue(row * 10)) for row in rows]
+    )
+
+    assert table.entry == _ROUTE_ENTRY
+    assert table.rows is rows
+    assert isinstance(table, RangeSource)
+    assert _walk(table) == _walk(reference)
+    for probe in (
+        (1, 3),
+        (2,),
+        _ROUTE_ENTRY,
+        (*_ROUTE_ENTRY, 0),
+        (*_ROUTE_ENTRY, 1, 4),
+        (*_ROUTE_ENTRY, 1, 5, 9),
+        (*_ROUTE_ENTRY, 1, 29),
+        (*_ROUTE_ENTRY, 3, 1),
+        (*_ROUTE_ENTRY, 7, 29),
+        (*_ROUTE_ENTRY, 8),
+    ):
+        assert table.lookup_next(probe) == reference.lookup_next(probe)
+        assert [(varbind.oid, varbind.value) for varbind in table.iter_from(probe)] == [
+            (varbind.oid, varbind.value) for varbind in reference.iter_from(probe)
+        ]
+    for probe in (
+        (*_ROUTE_ENTRY, 1, 5),
+        (*_ROUTE_ENTRY, 1, 6),
+        (*_ROUTE_ENTRY, 1, 5, 0),
+        (*_ROUTE_ENTRY, 2, 5),
+        (*_ROUTE_ENTRY, 9, 5),
+        (*_ROUTE_ENTRY, 7),
+        (1, 3, 6, 1, 2, 1, 4, 24, 3, 1, 1, 5),
+    ):
+        assert table.lookup_exact(probe) == reference.lookup_exact(probe)
+
+
+def test_virtual_table_with_row_index_function() -> None:
+    def address(row: int) -> tuple[int, ...]:
+        return (10, row >> 16 & 0xFF, row >> 8 & 0xFF, row & 0xFF)
+
+    table = VirtualTableSource(
+        {
+            f"{'.'.join(map(str, _ROUTE_ENTRY))}.1": lambda row: IpAddressValue(
+                ".".join(map(str, address(row)))
+            ),
+        },
+        rows=range(10_000_000),
+        row_index=address,
+    )
+
+    assert table.lookup_exact((*_ROUTE_ENTRY, 1, 10, 1, 0, 5)) == IpAddressValue("10.1.0.5")
+    assert table.lookup_exact((*_ROUTE_ENTRY, 1, 10, 1, 0)) is None
+    assert table.lookup_next((*_ROUTE_ENTRY, 1, 10, 99, 255, 255, 1)) == (
+        (*_ROUTE_ENTRY, 1, 10, 100, 0, 0),
+        IpAddressValue("10.100.0.0"),
+    )
+    assert table.lookup_next((*_ROUTE_ENTRY, 1, 10, 100)) == table.lookup_next(
+        (*_ROUTE_ENTRY, 1, 10, 99, 255, 255)
+    )
+    assert table.lookup_next((*_ROUTE_ENTRY, 1, 10, 152, 150, 127)) is None
+
+    responder = V2cResponder(source=table)
+    bulk = responder._build_bulk_varbinds(
+        build_null_varbinds([(*_ROUTE_ENTRY, 1, 10, 152, 150, 125)]),
+        non_repeaters=0,
+        max_repetitions=4,
+    )
+    assert [varbind.oid[-1] for varbind in bulk] == [126, 127, 127, 127]
+    assert isinstance(bulk[-1].value, EndOfMibViewValue)
+
+
+def test_virtual_table_validation_and_empty_rows() -> None:
+    column = (*_ROUTE_ENTRY, 1)
+    with pytest.raises(ValueError, match="ascending range"):
+        VirtualTableSource({column: IntegerValue}, rows=range(10, 0, -1))
+    with pytest.raises(ValueError, match="non-negative"):
+        VirtualTableSource({column: IntegerValue}, rows=range(-1, 5))
+    with pytest.raises(ValueError, match="one entry OID"):
+        VirtualTableSource({column: IntegerValue, (1, 3, 6, 1): IntegerValue}, rows=range(3))
+    with pytest.raises(ValueError, match="one entry OID"):
+        VirtualTableSource({(1,): IntegerValue}, rows=range(3))
+
+    empty = VirtualTableSource({column: IntegerValue}, rows=range(0))
+    assert empty.lookup_next(()) is None
+    assert list(empty.iter_from(())) == []
+    assert empty.lookup_exact((*column, 0)) is None
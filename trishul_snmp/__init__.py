@@ -5,27 +5,53 @@ from trishul_snmp.errors import (
     BundleError,
     BundleValidationError,
     InvalidOidError,
+    NotificationLogError,
     ProtocolError,
     RequestTimeoutError,
+    SnapshotError,
     TranslationError,
     TransportError,
     UnknownOidError,
     UnknownSymbolError,
 )
 from trishul_snmp.manager.client import SnmpManager, V2cManager, V3Manager
+from trishul_snmp.manager.operations import CompiledTargets
 from trishul_snmp.mib.bundle import MibBundle
 from trishul_snmp.mib.loader import load_bundle
+from trishul_snmp.mib.mapped import MappedMibRegistry, load_mapped_bundle, write_mapped_bundle
+from trishul_snmp.notify.aggregate import (
+    AggregationStats,
+    NotificationAggregator,
+    NotificationSummary,
+    notification_fingerprint,
+)
 from trishul_snmp.notify.client import SnmpNotifier, V2cNotifier, V3Notifier
 from trishul_snmp.notify.events import (
     NotificationEvent,
     NotificationMemberBinding,
     decode_notification,
 )
+from trishul_snmp.notify.filter import NotificationFilter
 from trishul_snmp.notify.listener import (
     SnmpNotificationListener,
     V2cNotificationListener,
     V3NotificationListener,
 )
+from trishul_snmp.notify.log import (
+    LoggedNotification,
+    NotificationLogReader,
+    NotificationLogWriter,
+)
+from trishul_snmp.notify.pipeline import InformPipeline, InformPipelineStats
+from trishul_snmp.notify.replay import (
+    ReplayStats,
+    read_hex_datagrams,
+    read_pcap,
+    replay_notifications,
+)
+from trishul_snmp.notify.sharding import ShardedNotificationListener
+from trishul_snmp.notify.template import TrapTemplate, blast_traps
+from trishul_snmp.responder.farm import FarmAgent, ResponderFarm
 from trishul_snmp.responder.rules import (
     CounterRule,
     RandomNumericRule,
@@ -33,16 +59,31 @@ from trishul_snmp.responder.rules import (
     TimestampRule,
     UptimeRule,
 )
-from trishul_snmp.responder.server import V2cResponder
+from trishul_snmp.responder.server import ResponderStats, V2cResponder
+from trishul_snmp.responder.snapshot import SnapshotSource, record_snapshot, write_snapshot
 from trishul_snmp.responder.sources import (
+    AsyncCallbackObjectSource,
+    AsyncResponderSource,
     CallbackObjectSource,
     InMemoryObjectSource,
+    OverlayObjectSource,
+    RangeSource,
     ResponderSource,
+    VarBindSource,
 )
+from trishul_snmp.responder.virtual import VirtualTableSource
 from trishul_snmp.security.community import CommunityModel
 from trishul_snmp.security.model import SecurityModel
-from trishul_snmp.security.usm import AuthProtocol, PrivProtocol, UsmLocalEngine, UsmModel, UsmUser
+from trishul_snmp.security.usm import (
+    AuthProtocol,
+    PrivProtocol,
+    UsmLocalEngine,
+    UsmModel,
+    UsmUser,
+    UsmUserTable,
+)
 from trishul_snmp.session import SnmpSession
+from trishul_snmp.transport.udp import DatagramQueueStats, DropPolicy
 from trishul_snmp.types import (
     OID,
     Counter32Value,
@@ -68,41 +109,66 @@ from trishul_snmp.types import (
 )
 
 __all__ = [
+    "AggregationStats",
+    "AsyncCallbackObjectSource",
+    "AsyncResponderSource",
     "AuthProtocol",
     "AuthenticationError",
     "BundleError",
     "BundleValidationError",
     "CallbackObjectSource",
     "CommunityModel",
+    "CompiledTargets",
     "Counter32Value",
     "Counter64Value",
     "CounterRule",
+    "DatagramQueueStats",
+    "DropPolicy",
     "EndOfMibViewValue",
     "ErrorStatus",
+    "FarmAgent",
     "Gauge32Value",
     "InvalidOidError",
     "IntegerValue",
     "IpAddressValue",
     "InMemoryObjectSource",
+    "InformPipeline",
+    "InformPipelineStats",
+    "LoggedNotification",
+    "MappedMibRegistry",
     "MibBundle",
     "NoSuchInstanceValue",
     "NoSuchObjectValue",
     "NullValue",
+    "NotificationAggregator",
     "NotificationEvent",
+    "NotificationFilter",
+    "NotificationLogError",
+    "NotificationLogReader",
+    "NotificationLogWriter",
     "NotificationMemberBinding",
+    "NotificationSummary",
     "ObjectIdentifierValue",
     "OID",
     "OidMatch",
     "OctetStringValue",
     "OpaqueValue",
+    "OverlayObjectSource",
     "PrivProtocol",
     "ProtocolError",
     "RandomNumericRule",
+    "RangeSource",
+    "ReplayStats",
     "RequestTimeoutError",
+    "ResponderFarm",
     "ResponderSource",
+    "ResponderStats",
     "Response",
     "SecurityModel",
+    "ShardedNotificationListener",
     "SimulationRule",
+    "SnapshotError",
+    "SnapshotSource",
     "SnmpManager",
     "SnmpNotificationListener",
     "SnmpNotifier",
@@ -114,12 +180,14 @@ __all__ = [
     "TimestampRule",
     "TranslationError",
     "TransportError",
+    "TrapTemplate",
     "UnknownOidError",
     "UnknownSymbolError",
     "UptimeRule",
     "UsmLocalEngine",
     "UsmModel",
     "UsmUser",
+    "UsmUserTable",
     "V2cManager",
     "V2cNotificationListener",
     "V2cNotifier",
@@ -128,9 +196,20 @@ __all__ = [
     "V3Manager",
     "V3Notifier",
     "VarBind",
+    "VarBindSource",
+    "VirtualTableSource",
     "__version__",
+    "blast_traps",
     "decode_notification",
     "load_bundle",
+    "load_mapped_bundle",
+    "notification_fingerprint",
+    "read_hex_datagrams",
+    "read_pcap",
+    "record_snapshot",
+    "replay_notifications",
+    "write_mapped_bundle",
+    "write_snapshot",
 ]
 
 __version__ = "0.4.2"
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import TypeAlias, cast
 
 from trishul_snmp import (
+    NotificationLogReader,
     SnmpManager,
     SnmpNotifier,
     V2cManager,
@@ -20,6 +21,9 @@ from trishul_snmp import (
     V3Notifier,
     __version__,
     decode_notification,
+    read_hex_datagrams,
+    read_pcap,
+    replay_notifications,
 )
 from trishul_snmp.cli.common import (
     V2cCliSecurity,
@@ -39,6 +43,7 @@ from trishul_snmp.cli.common import (
 )
 from trishul_snmp.cli.output import (
     render_notification_event,
+    render_replay_stats,
     render_request_id,
     render_response,
     render_translation,
@@ -46,12 +51,18 @@ from trishul_snmp.cli.output import (
 )
 from trishul_snmp.errors import TsnmpError
 from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.notify.log import LoggedNotification
 from trishul_snmp.types import ErrorStatus, Response
 
 HandlerResult: TypeAlias = int | Coroutine[object, object, int]
 Handler: TypeAlias = Callable[[argparse.Namespace], HandlerResult]
 ResponseOperation: TypeAlias = Callable[[SnmpManager, argparse.Namespace], Awaitable[Response]]
 
+# libpcap microsecond and nanosecond magic numbers in either byte order
+_PCAP_MAGICS = frozenset(
+    {b"\xa1\xb2\xc3\xd4", b"\xd4\xc3\xb2\xa1", b"\xa1\xb2\x3c\x4d", b"\x4d\x3c\xb2\xa1"}
+)
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Build the top-level argument parser."""
@@ -66,7 +77,15 @@ def build_parser() -> argparse.ArgumentParser:
         help="Translate numeric OIDs and symbolic names using a compiled bundle",
     )
     add_bundle_option(translate, required=True)
-    translate.add_argument("target", help="Numeric OID or MODULE::symbol target")
+    translate.add_argument(
+        "target",
+        help="Numeric OID or MODULE::symbol target, or '-' to read one target per line from stdin",
+    )
+    translate.add_argument(
+        "--keep-unknown",
+        action="store_true",
+        help="In stdin mode, echo untranslatable targets unchanged instead of failing",
+    )
     translate.set_defaults(handler=_handle_translate)
 
     get = subparsers.add_parser("get", help="Perform an SNMP GET request")
@@ -178,6 +197,93 @@ def build_parser() -> argparse.ArgumentParser:
     )
     decode_cmd.set_defaults(handler=_handle_decode_notification)
 
+    replay = subparsers.add_parser(
+        "replay",
+        help="Replay captured notification datagrams at a controlled rate",
+    )
+    replay.add_argument(
+        "source",
+        type=Path,
+        help="Notification log directory, pcap capture, or file of hex datagrams",
+    )
+    replay.add_argument("--host", required=True, help="Target notification receiver hostname or IP")
+    replay.add_argument("--port", type=int, default=162, help="Target UDP port (default: 162)")
+    replay.add_argument(
+        "--format",
+        dest="source_format",
+        choices=("auto", "log", "pcap", "hex"),
+        default="auto",
+        help="Input format (default: auto, detected from the source)",
+    )
+    pace_group = replay.add_mutually_exclusive_group()
+    pace_group.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Divide captured inter-arrival gaps by this factor (default: 1.0)",
+    )
+    pace_group.add_argument(
+        "--max-speed",
+        action="store_true",
+        help="Send as fast as possible, ignoring captured gaps",
+    )
+    pace_group.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Send at a fixed number of datagrams per second, ignoring captured gaps",
+    )
+    replay.add_argument(
+        "--max-gap",
+        type=float,
+        default=None,
+        help="Compress any captured gap longer than this many seconds",
+    )
+    replay.add_argument(
+        "--sockets",
+        type=int,
+        default=4,
+        help="Number of sending UDP sockets (default: 4)",
+    )
+    replay.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of passes over the input (default: 1)",
+    )
+    replay.add_argument(
+        "--capture-port",
+        type=int,
+        default=162,
+        help="Destination UDP port selected from a pcap capture (default: 162)",
+    )
+    replay.add_argument(
+        "--start",
+        type=float,
+        default=None,
+        help="Only replay log records received at or after this Unix time",
+    )
+    replay.add_argument(
+        "--end",
+        type=float,
+        default=None,
+        help="Only replay log records received before this Unix time",
+    )
+    replay.add_argument(
+        "--source-host",
+        dest="source_hosts",
+        action="append",
+        default=None,
+        help="Only replay log records from this source host; repeat for several",
+    )
+    replay.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="Emit machine-readable JSON output",
+    )
+    replay.set_defaults(handler=_handle_replay)
+
     version = subparsers.add_parser("version", help="Print the installed version")
     version.set_defaults(handler=_handle_version)
 
@@ -214,10 +320,24 @@ def _handle_translate(args: argparse.Namespace) -> int:
     bundle = load_bundle_from_args(args)
     if bundle is None:
         raise ValueError("translate requires --bundle")
+    if args.target == "-":
+        return _stream_translations(bundle, keep_unknown=args.keep_unknown)
     print(render_translation(bundle.translate(args.target)))
     return 0
 
 
+def _stream_translations(bundle: MibBundle, *, keep_unknown: bool) -> int:
+    lines = (line for line in sys.stdin if line.strip())
+    write = sys.stdout.write
+    try:
+        for result in bundle.translate_many(lines, keep_unknown=keep_unknown):
+            write(render_translation(result))
+            write("\n")
+    finally:
+        sys.stdout.flush()
+    return 0
+
+
 async def _handle_get(args: argparse.Namespace) -> int:
     return await _run_response_command(args, _perform_get)
 
@@ -361,6 +481,21 @@ def _handle_decode_notification(args: argparse.Namespace) -> int:
     return 0
 
 
+async def _handle_replay(args: argparse.Namespace) -> int:
+    stats = await replay_notifications(
+        _load_replay_datagrams(args),
+        host=args.host,
+        port=args.port,
+        speed=None if args.max_speed else args.speed,
+        rate=args.rate,
+        max_gap=args.max_gap,
+        sockets=args.sockets,
+        repeat=args.repeat,
+    )
+    print(render_replay_stats(stats, json_output=args.json_output))
+    return 0 if stats.errors == 0 else 1
+
+
 def _manager_from_args(args: argparse.Namespace, *, bundle: MibBundle | None) -> SnmpManager:
     security = parse_cli_security(args)
     if isinstance(security, V2cCliSecurity):
@@ -461,3 +596,26 @@ def _load_notification_bytes(args: argparse.Namespace) -> bytes:
     if args.file_input is not None:
         return cast(Path, args.file_input).read_bytes()
     raise ValueError("decode-notification requires --hex or --file")
+
+
+def _load_replay_datagrams(args: argparse.Namespace) -> list[LoggedNotification] | list[bytes]:
+    source = cast(Path, args.source)
+    source_format = args.source_format
+    if source_format == "auto":
+        source_format = _detect_replay_format(source)
+    if source_format == "log":
+        reader = NotificationLogReader(source)
+        return list(reader.records(start=args.start, end=args.end, sources=args.source_hosts))
+    if args.start is not None or args.end is not None or args.source_hosts is not None:
+        raise ValueError("--start, --end, and --source-host require a notification log")
+    if source_format == "pcap":
+        return read_pcap(source, port=args.capture_port)
+    return read_hex_datagrams(source)
+
+
+def _detect_replay_format(source: Path) -> str:
+    if source.is_dir():
+        return "log"
+    with source.open("rb") as handle:
+        magic = handle.read(4)
+    return "pcap" if magic in _PCAP_MAGICS else "hex"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 
 from trishul_snmp.notify.events import NotificationEvent, NotificationMemberBinding
+from trishul_snmp.notify.replay import ReplayStats
 from trishul_snmp.types import ErrorStatus, Response, VarBind
 
 
@@ -42,6 +43,24 @@ def render_request_id(request_id: int, *, json_output: bool) -> str:
     return f"request_id={request_id}"
 
 
+def render_replay_stats(stats: ReplayStats, *, json_output: bool) -> str:
+    """Render the outcome of a notification replay."""
+    if json_output:
+        payload = {
+            "sent": stats.sent,
+            "errors": stats.errors,
+            "bytes_sent": stats.bytes_sent,
+            "elapsed": stats.elapsed,
+            "rate": stats.rate,
+            "max_lag": stats.max_lag,
+        }
+        return json.dumps(payload, indent=2)
+    return (
+        f"sent={stats.sent} errors={stats.errors} bytes={stats.bytes_sent} "
+        f"elapsed={stats.elapsed:.3f}s rate={stats.rate:.1f}/s max_lag={stats.max_lag:.3f}s"
+    )
+
+
 def render_notification_event(
     event: NotificationEvent,
     *,
@@ -43,6 +43,14 @@ class ProtocolError(TsnmpError):
     """Raised when an SNMP message is malformed or unsupported."""
 
 
+class SnapshotError(TsnmpError):
+    """Raised when a responder snapshot file is missing or invalid."""
+
+
+class NotificationLogError(TsnmpError):
+    """Raised when a notification log directory or segment is missing or invalid."""
+
+
 class TransportError(TsnmpError):
     """Raised for socket or network transport failures."""
 
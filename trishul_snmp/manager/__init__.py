@@ -1,5 +1,6 @@
 """Manager package."""
 
 from trishul_snmp.manager.client import V2cManager
+from trishul_snmp.manager.operations import CompiledTargets
 
-__all__ = ["V2cManager"]
+__all__ = ["CompiledTargets", "V2cManager"]
@@ -7,8 +7,10 @@ from types import TracebackType
 from typing import TypeVar
 
 from trishul_snmp.manager.operations import (
-    build_request_varbinds,
+    CompiledTargets,
+    compile_targets,
     normalize_targets,
+    request_varbinds_for,
     response_from_pdu,
 )
 from trishul_snmp.manager.walk import walk_subtree
@@ -68,17 +70,21 @@ class SnmpManager:
         """Close the UDP transport."""
         await self._session.close()
 
-    async def get(self, *targets: str | Sequence[int]) -> Response:
+    def compile_targets(self, *targets: str | Sequence[int]) -> CompiledTargets:
+        """Resolve *targets* once for reuse across ``get``/``get_next``/``get_bulk`` calls."""
+        return compile_targets(targets, bundle=self._session.bundle)
+
+    async def get(self, *targets: str | Sequence[int] | CompiledTargets) -> Response:
         """Perform an SNMP GET request."""
         return await self._request(PduType.GET, targets)
 
-    async def get_next(self, *targets: str | Sequence[int]) -> Response:
+    async def get_next(self, *targets: str | Sequence[int] | CompiledTargets) -> Response:
         """Perform an SNMP GETNEXT request."""
         return await self._request(PduType.GET_NEXT, targets)
 
     async def get_bulk(
         self,
-        *targets: str | Sequence[int],
+        *targets: str | Sequence[int] | CompiledTargets,
         non_repeaters: int = 0,
         max_repetitions: int = 10,
     ) -> Response:
@@ -131,13 +137,12 @@ class SnmpManager:
     async def _request(
         self,
         pdu_type: PduType,
-        targets: tuple[str | Sequence[int], ...],
+        targets: tuple[str | Sequence[int] | CompiledTargets, ...],
         *,
         error_status: int = 0,
         error_index: int = 0,
     ) -> Response:
-        oids = normalize_targets(targets, bundle=self._session.bundle)
-        raw_varbinds = build_request_varbinds(oids)
+        raw_varbinds = request_varbinds_for(targets, bundle=self._session.bundle)
         async with self._session.lock:
             pdu = await self._session.dispatcher.send_pdu(
                 pdu_type,
@@ -2,14 +2,78 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
 from trishul_snmp._runtime import normalize_targets as normalize_targets
 from trishul_snmp._runtime import response_from_pdu as response_from_pdu
-from trishul_snmp.types import OID
-from trishul_snmp.wire.pdu import RawVarBind, build_null_varbinds
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.types import OID, NullValue
+from trishul_snmp.wire.pdu import RawVarBind, build_encoded_varbind, build_null_varbinds
+
+__all__ = [
+    "CompiledTargets",
+    "build_request_varbinds",
+    "compile_targets",
+    "normalize_targets",
+    "request_varbinds_for",
+    "response_from_pdu",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTargets:
+    """Request targets resolved once, with their NULL varbinds pre-encoded."""
+
+    oids: tuple[OID, ...]
+    varbinds: tuple[RawVarBind, ...] = field(repr=False)
+
 
-__all__ = ["normalize_targets", "build_request_varbinds", "response_from_pdu"]
+def compile_targets(
+    targets: tuple[str | Sequence[int], ...],
+    *,
+    bundle: MibBundle | None,
+) -> CompiledTargets:
+    """Resolve *targets* and pre-encode request varbinds for repeated use."""
+    oids = normalize_targets(targets, bundle=bundle)
+    return CompiledTargets(
+        oids=oids,
+        varbinds=tuple(build_encoded_varbind(oid, NullValue()) for oid in oids),
+    )
 
 
 def build_request_varbinds(oids: tuple[OID, ...]) -> tuple[RawVarBind, ...]:
     """Build request varbinds using NULL placeholders."""
     return build_null_varbinds(oids)
+
+
+def request_varbinds_for(
+    targets: tuple[str | Sequence[int] | CompiledTargets, ...],
+    *,
+    bundle: MibBundle | None,
+) -> tuple[RawVarBind, ...]:
+    """Return request varbinds, reusing compiled target sets without any per-call work."""
+    if len(targets) == 1 and isinstance(targets[0], CompiledTargets):
+        return targets[0].varbinds
+
+    varbinds: list[RawVarBind] = []
+    pending: list[str | Sequence[int]] = []
+    for target in targets:
+        if isinstance(target, CompiledTargets):
+            if pending:
+                varbinds.extend(_plain_varbinds(pending, bundle=bundle))
+                pending.clear()
+            varbinds.extend(target.varbinds)
+        else:
+            pending.append(target)
+    if pending or not varbinds:
+        varbinds.extend(_plain_varbinds(pending, bundle=bundle))
+    return tuple(varbinds)
+
+
+def _plain_varbinds(
+    targets: list[str | Sequence[int]],
+    *,
+    bundle: MibBundle | None,
+) -> tuple[RawVarBind, ...]:
+    return build_request_varbinds(normalize_targets(tuple(targets), bundle=bundle))
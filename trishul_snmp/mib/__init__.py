@@ -2,5 +2,12 @@
 
 from trishul_snmp.mib.bundle import MibBundle
 from trishul_snmp.mib.loader import load_bundle
+from trishul_snmp.mib.mapped import MappedMibRegistry, load_mapped_bundle, write_mapped_bundle
 
-__all__ = ["MibBundle", "load_bundle"]
+__all__ = [
+    "MappedMibRegistry",
+    "MibBundle",
+    "load_bundle",
+    "load_mapped_bundle",
+    "write_mapped_bundle",
+]
@@ -2,29 +2,73 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Mapping, Sequence
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Protocol
 
+from trishul_snmp.errors import BundleError
 from trishul_snmp.mib.models import MibModuleRecord, MibNode, MibTypeRecord
 from trishul_snmp.mib.registry import MibRegistry
 from trishul_snmp.types import OidMatch
 
 
+class _BundleReloader(Protocol):
+    def reload(self, registry: MibRegistry) -> tuple[MibRegistry, tuple[str, ...]]: ...
+
+
 class MibBundle:
     """Loaded MIB artifact set used for translation and enrichment."""
 
     def __init__(self, registry: MibRegistry, *, source: Path) -> None:
         self._registry = registry
+        self._reloader: _BundleReloader | None = None
+        self._reload_lock = threading.Lock()
+        self._pinned: MibBundle | None = None
         self.source = source
 
     @property
     def modules(self) -> Mapping[str, MibModuleRecord]:
         return self._registry.modules
 
+    def reload(self) -> tuple[str, ...]:
+        """Re-read changed bundle artifacts and swap in the rebuilt registry.
+
+        Returns the names of modules that were added, updated, removed, or
+        reordered. The new registry is built beside the current one and installed with a single
+        attribute swap, so concurrent lookups see either the old or the new index.
+        """
+        if self._reloader is None:
+            raise BundleError("Bundle was not loaded from files and cannot be reloaded")
+        with self._reload_lock:
+            registry, changed = self._reloader.reload(self._registry)
+            self._registry = registry
+        return changed
+
+    def pinned(self) -> MibBundle:
+        """Return a view bound to the current registry that ignores later reloads.
+
+        The view is shared until :meth:`reload` swaps in a new registry.
+        """
+        registry = self._registry
+        view = self._pinned
+        if view is None or view._registry is not registry:
+            view = self._pinned = MibBundle(registry, source=self.source)
+        return view
+
     def translate(self, target: str | Sequence[int]) -> str:
         """Translate symbolic targets to numeric OIDs and vice versa."""
         return self._registry.translate(target)
 
+    def translate_many(
+        self,
+        targets: Iterable[str | Sequence[int]],
+        *,
+        keep_unknown: bool = False,
+    ) -> Iterator[str]:
+        """Translate many targets lazily with shared parsing and lookup caches."""
+        return self._registry.translate_many(targets, keep_unknown=keep_unknown)
+
     def display_symbolic(self, target: str | Sequence[int]) -> str:
         """Render a numeric OID using user-facing symbolic display policy."""
         return self._registry.display_symbolic(target)
@@ -27,24 +27,130 @@ class _LoadedDirectory:
     oid_index: dict[OID, _OidIndexEntry]
 
 
+@dataclass(frozen=True, slots=True)
+class _DirectoryPaths:
+    module_paths: tuple[Path, ...]
+    oid_index_path: Path | None
+
+
 def load_bundle(path: str | Path) -> MibBundle:
     """Load a bundle from a module JSON file or a directory of module JSON files."""
     source = Path(path).expanduser()
-    if source.is_file():
-        module_record = _load_module_json(source)
-        registry = MibRegistry({module_record.module: module_record})
-        return MibBundle(registry, source=source)
-
-    if source.is_dir():
-        loaded = _discover_directory(source)
-        modules = [_load_module_json(module_path) for module_path in loaded.module_paths]
-        registry = MibRegistry(
-            {module.module: module for module in modules},
-            oid_index=loaded.oid_index,
+    if not source.exists():
+        raise BundleValidationError("Bundle path does not exist", path=source)
+
+    reloader = _FileReloader(source)
+    snapshot = reloader.scan()
+    module_names: dict[Path, str] = {}
+    modules: dict[str, MibModuleRecord] = {}
+    for module_path in snapshot.module_paths:
+        module = _load_module_json(module_path)
+        module_names[module_path] = module.module
+        modules[module.module] = module
+    oid_index = _load_oid_index(snapshot.oid_index_path) if snapshot.oid_index_path else {}
+    registry = MibRegistry(modules, oid_index=oid_index)
+    reloader.commit(snapshot, module_names)
+    bundle = MibBundle(registry, source=source)
+    bundle._reloader = reloader
+    return bundle
+
+
+@dataclass(frozen=True, slots=True)
+class _FileSnapshot:
+    module_paths: tuple[Path, ...]
+    oid_index_path: Path | None
+    stamps: dict[Path, tuple[int, int]]
+
+
+class _FileReloader:
+    """Tracks module and sidecar file stamps so reloads re-read only changed files."""
+
+    def __init__(self, source: Path) -> None:
+        self._source = source
+        self._stamps: dict[Path, tuple[int, int]] = {}
+        self._module_names: dict[Path, str] = {}
+
+    def scan(self) -> _FileSnapshot:
+        source = self._source
+        if source.is_file():
+            module_paths: tuple[Path, ...] = (source,)
+            oid_index_path = None
+            sidecars: tuple[Path, ...] = ()
+        elif source.is_dir():
+            loaded = _discover_directory_paths(source)
+            module_paths = loaded.module_paths
+            oid_index_path = loaded.oid_index_path
+            sidecars = tuple(
+                sidecar
+                for sidecar in (source / "manifest.json", oid_index_path)
+                if sidecar is not None and sidecar.exists()
+            )
+        else:
+            raise BundleValidationError("Bundle path does not exist", path=source)
+        stamps = {path: _file_stamp(path) for path in (*module_paths, *sidecars)}
+        return _FileSnapshot(
+            module_paths=module_paths,
+            oid_index_path=oid_index_path,
+            stamps=stamps,
+        )
+
+    def commit(self, snapshot: _FileSnapshot, module_names: dict[Path, str]) -> None:
+        self._stamps = snapshot.stamps
+        self._module_names = module_names
+
+    def reload(self, registry: MibRegistry) -> tuple[MibRegistry, tuple[str, ...]]:
+        snapshot = self.scan()
+        changed_paths = [
+            path
+            for path in snapshot.module_paths
+            if self._stamps.get(path) != snapshot.stamps[path]
+        ]
+        removed_paths = [path for path in self._module_names if path not in snapshot.stamps]
+        index_changed = snapshot.oid_index_path is not None and self._stamps.get(
+            snapshot.oid_index_path
+        ) != snapshot.stamps.get(snapshot.oid_index_path)
+        index_removed = snapshot.oid_index_path is None and any(
+            path.name == "oid_index.json" for path in self._stamps
         )
-        return MibBundle(registry, source=source)
 
-    raise BundleValidationError("Bundle path does not exist", path=source)
+        module_names = {
+            path: name for path, name in self._module_names.items() if path in snapshot.stamps
+        }
+        updated: dict[str, MibModuleRecord] = {}
+        removed = {self._module_names[path] for path in removed_paths}
+        for path in changed_paths:
+            module = _load_module_json(path)
+            previous = module_names.get(path)
+            if previous is not None and previous != module.module:
+                removed.add(previous)
+            module_names[path] = module.module
+            updated[module.module] = module
+        removed -= set(updated)
+
+        oid_index: dict[OID, _OidIndexEntry] | None = None
+        if index_changed and snapshot.oid_index_path is not None:
+            oid_index = _load_oid_index(snapshot.oid_index_path)
+        elif index_removed:
+            oid_index = {}
+
+        # the manifest or the set of files can reorder modules, which decides duplicate OIDs
+        order = tuple(dict.fromkeys(module_names[path] for path in snapshot.module_paths))
+        kept = [name for name in registry.modules if name in order and name not in updated]
+        moved = {
+            before
+            for before, after in zip(kept, [name for name in order if name in kept], strict=True)
+            if before != after
+        }
+
+        if not updated and not removed and not moved and oid_index is None:
+            self.commit(snapshot, module_names)
+            return registry, ()
+
+        new_registry = registry.replace_modules(
+            updated, removed=removed, oid_index=oid_index, order=order
+        )
+        self.commit(snapshot, module_names)
+        return new_registry, tuple(sorted({*updated, *removed, *moved}))
 
 
 def _load_module_json(path: Path) -> MibModuleRecord:
@@ -53,6 +159,12 @@ def _load_module_json(path: Path) -> MibModuleRecord:
 
 
 def _discover_directory(path: Path) -> _LoadedDirectory:
+    loaded = _discover_directory_paths(path)
+    oid_index = _load_oid_index(loaded.oid_index_path) if loaded.oid_index_path else {}
+    return _LoadedDirectory(module_paths=loaded.module_paths, oid_index=oid_index)
+
+
+def _discover_directory_paths(path: Path) -> _DirectoryPaths:
     manifest_path = path / "manifest.json"
     module_paths: tuple[Path, ...]
     if manifest_path.exists():
@@ -73,8 +185,10 @@ def _discover_directory(path: Path) -> _LoadedDirectory:
         )
 
     oid_index_path = path / "oid_index.json"
-    oid_index = _load_oid_index(oid_index_path) if oid_index_path.exists() else {}
-    return _LoadedDirectory(module_paths=module_paths, oid_index=oid_index)
+    return _DirectoryPaths(
+        module_paths=module_paths,
+        oid_index_path=oid_index_path if oid_index_path.exists() else None,
+    )
 
 
 def _module_paths_from_manifest(bundle_dir: Path, manifest_path: Path) -> tuple[Path, ...]:
@@ -154,6 +268,14 @@ def _load_oid_index(path: Path) -> dict[OID, _OidIndexEntry]:
     return normalized
 
 
+def _file_stamp(path: Path) -> tuple[int, int]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise BundleValidationError("Missing bundle artifact", path=path) from exc
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _read_json(path: Path) -> object:
     try:
         return json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,561 @@
+"""Memory-mapped, read-only bundle indexes shared across processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from trishul_snmp.errors import BundleValidationError
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.mib.models import MibMemberRef, MibModuleRecord, MibNode, MibTypeRecord
+from trishul_snmp.mib.registry import MibRegistry, _OidIndexEntry, oid_to_string, parse_oid
+from trishul_snmp.types import OID
+
+_MAGIC = b"TSNMPMAP"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sII")
+_SECTION = struct.Struct("<QQ")
+_ENTRY = struct.Struct("<IIII")
+_SECTION_NAMES = ("modules", "symbols", "oids", "types", "accelerator", "blob")
+_MAX_BLOB_SIZE = 0xFFFFFFFF
+_NODE_CACHE_SIZE = 4096
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def write_mapped_bundle(bundle: MibBundle, path: str | Path) -> Path:
+    """Serialize *bundle* indexes to a single file suitable for :func:`load_mapped_bundle`."""
+    target = Path(path).expanduser()
+    registry = bundle._registry
+    writer = _BlobWriter()
+
+    modules: list[tuple[bytes, int, int]] = []
+    symbols: list[tuple[bytes, int, int]] = []
+    oids: list[tuple[bytes, int, int]] = []
+    types: list[tuple[bytes, int, int]] = []
+    accelerator: list[tuple[bytes, int, int]] = []
+
+    node_records: dict[int, tuple[int, int]] = {}
+    for module in registry.modules.values():
+        for node in module.iter_nodes():
+            node_records[id(node)] = writer.add_json(_node_payload(node, writer))
+        payload = _module_payload(module)
+        payload["digest"] = _module_digest(module)
+        modules.append((_text_key(module.module), *writer.add_json(payload)))
+
+    for (module_name, symbol), node in registry._symbol_index.items():
+        symbols.append((_symbol_key(module_name, symbol), *_record_for(node, node_records, writer)))
+    for oid, node in registry._exact_oid_index.items():
+        oids.append((_oid_key(oid), *_record_for(node, node_records, writer)))
+    for (module_name, type_name), type_record in registry._type_index.items():
+        types.append(
+            (_symbol_key(module_name, type_name), *writer.add_json(_type_payload(type_record)))
+        )
+    for oid, entry in registry._oid_index.items():
+        accelerator.append(
+            (_oid_key(oid), *writer.add_bytes(_symbol_key(entry.module, entry.symbol)))
+        )
+
+    sections = [
+        _pack_entries(entries, writer) for entries in (modules, symbols, oids, types, accelerator)
+    ]
+    blob = writer.finish()
+    sections.append(blob)
+
+    header_size = _HEADER.size + _SECTION.size * len(sections)
+    table = bytearray()
+    offset = header_size
+    for section in sections:
+        table += _SECTION.pack(offset, len(section))
+        offset += len(section)
+
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(sections)))
+        handle.write(table)
+        for section in sections:
+            handle.write(section)
+    os.replace(tmp_path, target)
+    return target
+
+
+def load_mapped_bundle(path: str | Path) -> MibBundle:
+    """Map an index written by :func:`write_mapped_bundle` read-only and wrap it in a bundle."""
+    source = Path(path).expanduser()
+    registry = MappedMibRegistry(source)
+    bundle = MibBundle(registry, source=source)
+    bundle._reloader = _MappedReloader(source, registry._file.stamp)
+    return bundle
+
+
+class MappedMibRegistry(MibRegistry):
+    """Registry whose indexes are binary-searched directly in a read-only mapping.
+
+    Pages of the file are shared between every process that maps it; nodes are
+    only materialized on lookup and descriptions are decoded from the mapping
+    when a node record is first read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        file = _MappedIndexFile(path)
+        self._file = file
+        self._mapped_modules = _MappedModules(file)
+        self._modules = self._mapped_modules
+        self._symbol_index = _symbol_table(file)
+        self._exact_oid_index = _MappedIndex(
+            file,
+            "oids",
+            encode_key=_oid_key,
+            decode_key=_decode_oid_key,
+            decode_value=file.node_at,
+        )
+        self._type_index = _type_table(file)
+        self._oid_index = _MappedIndex(
+            file,
+            "accelerator",
+            encode_key=_oid_key,
+            decode_key=_decode_oid_key,
+            decode_value=file.accelerator_at,
+        )
+
+    def close(self) -> None:
+        """Release the underlying mapping."""
+        self._file.close()
+
+
+class _MappedReloader:
+    """Re-maps the index when the writer has atomically replaced the file."""
+
+    def __init__(self, path: Path, stamp: tuple[int, int]) -> None:
+        self._path = path
+        self._stamp = stamp
+
+    def reload(self, registry: MibRegistry) -> tuple[MibRegistry, tuple[str, ...]]:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError as exc:
+            raise BundleValidationError(
+                "Mapped bundle index does not exist", path=self._path
+            ) from exc
+        if (stat.st_ino, stat.st_mtime_ns) == self._stamp:
+            return registry, ()
+        # The previous mapping stays open for readers still holding the old registry.
+        new_registry = MappedMibRegistry(self._path)
+        self._stamp = new_registry._file.stamp
+        old_digests = _module_digests(registry)
+        new_digests = _module_digests(new_registry)
+        changed = {
+            name
+            for name in {*old_digests, *new_digests}
+            if old_digests.get(name) != new_digests.get(name)
+        }
+        return new_registry, tuple(sorted(changed))
+
+
+class _BlobWriter:
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def add_bytes(self, data: bytes) -> tuple[int, int]:
+        offset = self._size
+        if offset + len(data) > _MAX_BLOB_SIZE:
+            raise BundleValidationError("Bundle is too large for a mapped index")
+        self._chunks.append(data)
+        self._size += len(data)
+        return offset, len(data)
+
+    def add_json(self, payload: object) -> tuple[int, int]:
+        return self.add_bytes(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    def finish(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+class _MappedIndexFile:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        try:
+            with path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError as exc:
+            raise BundleValidationError("Mapped bundle index does not exist", path=path) from exc
+        except ValueError as exc:
+            raise BundleValidationError("Mapped bundle index is empty", path=path) from exc
+
+        self.stamp = (stat.st_ino, stat.st_mtime_ns)
+        data = self._map
+        if len(data) < _HEADER.size:
+            raise BundleValidationError("Mapped bundle index is truncated", path=path)
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise BundleValidationError("File is not a mapped bundle index", path=path)
+        if version != _FORMAT_VERSION or count != len(_SECTION_NAMES):
+            raise BundleValidationError(
+                f"Unsupported mapped bundle index version {version}",
+                path=path,
+            )
+
+        self._sections: dict[str, memoryview] = {}
+        self._view = view = memoryview(data)
+        for position, name in enumerate(_SECTION_NAMES):
+            offset, length = _SECTION.unpack_from(data, _HEADER.size + position * _SECTION.size)
+            if offset + length > len(data):
+                raise BundleValidationError("Mapped bundle index is truncated", path=path)
+            self._sections[name] = view[offset : offset + length]
+        self._blob = self._sections["blob"]
+        self._nodes: dict[int, MibNode] = {}
+
+    def section(self, name: str) -> memoryview:
+        return self._sections[name]
+
+    def blob_bytes(self, offset: int, length: int) -> bytes:
+        return bytes(self._blob[offset : offset + length])
+
+    def blob_json(self, offset: int, length: int) -> Any:
+        return json.loads(self.blob_bytes(offset, length))
+
+    def node_at(self, offset: int, length: int) -> MibNode:
+        node = self._nodes.get(offset)
+        if node is not None:
+            return node
+        payload = self.blob_json(offset, length)
+        description_ref = payload["d"]
+        node = MibNode(
+            module=payload["m"],
+            name=payload["n"],
+            oid=tuple(payload["o"]),
+            class_name=payload["c"],
+            object_type=payload["t"],
+            nodetype=payload["nt"],
+            syntax=payload["s"],
+            max_access=payload["a"],
+            status=payload["st"],
+            index=None if payload["i"] is None else tuple(payload["i"]),
+            augments=payload["au"],
+            description=(
+                None
+                if description_ref is None
+                else self.blob_bytes(*description_ref).decode("utf-8")
+            ),
+            members=(
+                None
+                if payload["mb"] is None
+                else tuple(MibMemberRef(module=m, object=o) for m, o in payload["mb"])
+            ),
+            constraints=payload["cs"],
+        )
+        if len(self._nodes) >= _NODE_CACHE_SIZE:
+            self._nodes.clear()
+        self._nodes[offset] = node
+        return node
+
+    def type_at(self, offset: int, length: int) -> MibTypeRecord:
+        payload = self.blob_json(offset, length)
+        return MibTypeRecord(
+            module=payload["m"],
+            name=payload["n"],
+            class_name=payload["c"],
+            base_type=payload["b"],
+            display_hint=payload["h"],
+            status=payload["st"],
+            constraints=payload["cs"],
+        )
+
+    def accelerator_at(self, offset: int, length: int) -> _OidIndexEntry:
+        module, symbol = _decode_symbol_key(self.blob_bytes(offset, length))
+        return _OidIndexEntry(module=module, symbol=symbol)
+
+    def close(self) -> None:
+        for section in self._sections.values():
+            section.release()
+        self._view.release()
+        self._map.close()
+
+
+class _MappedIndex(Mapping[_K, _V], Generic[_K, _V]):
+    """Sorted fixed-width entry table binary-searched in place."""
+
+    def __init__(
+        self,
+        file: _MappedIndexFile,
+        section: str,
+        *,
+        encode_key: Callable[[_K], bytes],
+        decode_key: Callable[[bytes], _K],
+        decode_value: Callable[[int, int], _V],
+    ) -> None:
+        self._entries = file.section(section)
+        self._count = len(self._entries) // _ENTRY.size
+        self._file = file
+        self._encode_key = encode_key
+        self._decode_key = decode_key
+        self._decode_value = decode_value
+
+    def __getitem__(self, key: _K) -> _V:
+        position = self._find(key)
+        if position is None:
+            raise KeyError(key)
+        _, _, record_offset, record_length = _ENTRY.unpack_from(
+            self._entries, position * _ENTRY.size
+        )
+        return self._decode_value(record_offset, record_length)
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[_K]:
+        for position in range(self._count):
+            yield self._decode_key(self._key_at(position))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _find(self, key: _K) -> int | None:
+        try:
+            needle = self._encode_key(key)
+        except (TypeError, ValueError):
+            return None
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry_key = self._key_at(middle)
+            if entry_key < needle:
+                low = middle + 1
+            elif entry_key > needle:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _key_at(self, position: int) -> bytes:
+        key_offset, key_length, _, _ = _ENTRY.unpack_from(self._entries, position * _ENTRY.size)
+        return self._file.blob_bytes(key_offset, key_length)
+
+
+class _MappedModules(Mapping[str, MibModuleRecord]):
+    """Module records materialized on access with lazily resolved members."""
+
+    def __init__(self, file: _MappedIndexFile) -> None:
+        self._file = file
+        self._index: _MappedIndex[str, Any] = _MappedIndex(
+            file,
+            "modules",
+            encode_key=_text_key,
+            decode_key=_decode_text_key,
+            decode_value=file.blob_json,
+        )
+        self._records: dict[str, MibModuleRecord] = {}
+
+    def __getitem__(self, key: str) -> MibModuleRecord:
+        record = self._records.get(key)
+        if record is not None:
+            return record
+        payload = self._index.get(key)
+        if payload is None:
+            raise KeyError(key)
+        record = self._build_record(payload)
+        self._records[key] = record
+        return record
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def digests(self) -> dict[str, str]:
+        return {name: str(self._index[name]["digest"]) for name in self._index}
+
+    def _build_record(self, payload: dict[str, Any]) -> MibModuleRecord:
+        module = payload["module"]
+        symbols = _symbol_table(self._file)
+        types = _type_table(self._file)
+        return MibModuleRecord(
+            module=module,
+            language=payload["language"],
+            generated_by=payload["generated_by"],
+            generated_at=payload["generated_at"],
+            schema_version=payload["schema_version"],
+            producer_version=payload["producer_version"],
+            imports={name: tuple(names) for name, names in payload["imports"].items()},
+            objects=_ModuleMembers(module, tuple(payload["objects"]), symbols),
+            notifications=_ModuleMembers(module, tuple(payload["notifications"]), symbols),
+            types=_ModuleMembers(module, tuple(payload["types"]), types),
+            module_metadata=payload["module_metadata"],
+        )
+
+
+class _ModuleMembers(Mapping[str, _V], Generic[_V]):
+    """Name-ordered view of one module's members backed by a mapped index."""
+
+    def __init__(
+        self,
+        module: str,
+        names: tuple[str, ...],
+        index: Mapping[tuple[str, str], _V],
+    ) -> None:
+        self._module = module
+        self._names = names
+        self._name_set = frozenset(names)
+        self._index = index
+
+    def __getitem__(self, key: str) -> _V:
+        if key not in self._name_set:
+            raise KeyError(key)
+        return self._index[(self._module, key)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def _symbol_table(file: _MappedIndexFile) -> _MappedIndex[tuple[str, str], MibNode]:
+    return _MappedIndex(
+        file,
+        "symbols",
+        encode_key=_encode_symbol_key,
+        decode_key=_decode_symbol_key,
+        decode_value=file.node_at,
+    )
+
+
+def _type_table(file: _MappedIndexFile) -> _MappedIndex[tuple[str, str], MibTypeRecord]:
+    return _MappedIndex(
+        file,
+        "types",
+        encode_key=_encode_symbol_key,
+        decode_key=_decode_symbol_key,
+        decode_value=file.type_at,
+    )
+
+
+def _pack_entries(entries: list[tuple[bytes, int, int]], writer: _BlobWriter) -> bytes:
+    packed = bytearray()
+    for key, record_offset, record_length in sorted(entries, key=lambda entry: entry[0]):
+        key_offset, key_length = writer.add_bytes(key)
+        packed += _ENTRY.pack(key_offset, key_length, record_offset, record_length)
+    return bytes(packed)
+
+
+def _record_for(
+    node: MibNode,
+    records: dict[int, tuple[int, int]],
+    writer: _BlobWriter,
+) -> tuple[int, int]:
+    record = records.get(id(node))
+    if record is None:
+        record = records[id(node)] = writer.add_json(_node_payload(node, writer))
+    return record
+
+
+def _node_payload(node: MibNode, writer: _BlobWriter) -> dict[str, object]:
+    payload = _node_content(node)
+    description = payload.pop("d")
+    payload["d"] = (
+        None if description is None else writer.add_bytes(str(description).encode("utf-8"))
+    )
+    return payload
+
+
+def _node_content(node: MibNode) -> dict[str, object]:
+    return {
+        "m": node.module,
+        "n": node.name,
+        "o": list(node.oid),
+        "c": node.class_name,
+        "t": node.object_type,
+        "nt": node.nodetype,
+        "s": node.syntax,
+        "a": node.max_access,
+        "st": node.status,
+        "i": None if node.index is None else list(node.index),
+        "au": node.augments,
+        "d": node.description,
+        "mb": None if node.members is None else [[m.module, m.object] for m in node.members],
+        "cs": None if node.constraints is None else dict(node.constraints),
+    }
+
+
+def _type_payload(record: MibTypeRecord) -> dict[str, object]:
+    return {
+        "m": record.module,
+        "n": record.name,
+        "c": record.class_name,
+        "b": record.base_type,
+        "h": record.display_hint,
+        "st": record.status,
+        "cs": None if record.constraints is None else dict(record.constraints),
+    }
+
+
+def _module_payload(module: MibModuleRecord) -> dict[str, object]:
+    return {
+        "module": module.module,
+        "language": module.language,
+        "generated_by": module.generated_by,
+        "generated_at": module.generated_at,
+        "schema_version": module.schema_version,
+        "producer_version": module.producer_version,
+        "imports": {name: list(symbols) for name, symbols in module.imports.items()},
+        "objects": list(module.objects),
+        "notifications": list(module.notifications),
+        "types": list(module.types),
+        "module_metadata": dict(module.module_metadata),
+    }
+
+
+def _module_digest(module: MibModuleRecord) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(_module_payload(module), sort_keys=True).encode("utf-8"))
+    for node in module.iter_nodes():
+        digest.update(json.dumps(_node_content(node), sort_keys=True).encode("utf-8"))
+    for type_record in module.types.values():
+        digest.update(json.dumps(_type_payload(type_record), sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _module_digests(registry: MibRegistry) -> dict[str, str]:
+    if isinstance(registry, MappedMibRegistry):
+        return registry._mapped_modules.digests()
+    return {name: _module_digest(module) for name, module in registry.modules.items()}
+
+
+def _text_key(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _decode_text_key(key: bytes) -> str:
+    return key.decode("utf-8")
+
+
+def _symbol_key(module: str, name: str) -> bytes:
+    return f"{module}\0{name}".encode()
+
+
+def _encode_symbol_key(key: tuple[str, str]) -> bytes:
+    module, name = key
+    return _symbol_key(module, name)
+
+
+def _decode_symbol_key(key: bytes) -> tuple[str, str]:
+    module, _, name = key.decode("utf-8").partition("\0")
+    return module, name
+
+
+def _oid_key(oid: OID) -> bytes:
+    return oid_to_string(oid).encode("ascii")
+
+
+def _decode_oid_key(key: bytes) -> OID:
+    return parse_oid(key.decode("ascii"))
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import re
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,6 +18,8 @@ from trishul_snmp.mib.models import MibMemberRef, MibModuleRecord, MibNode, MibT
 from trishul_snmp.types import OID, OidMatch
 
 _SUPPORTED_PRODUCER = "trishul-smi"
+_TRANSLATE_CACHE_SIZE = 65536
+_CANONICAL_NUMERIC_OID = re.compile(r"(?:0|[1-9][0-9]*)(?:\.(?:0|[1-9][0-9]*))*")
 
 
 def oid_to_string(oid: OID) -> str:
@@ -89,23 +92,99 @@ class MibRegistry:
         *,
         oid_index: Mapping[OID, _OidIndexEntry] | None = None,
     ) -> None:
-        self._modules = dict(modules)
-        self._symbol_index: dict[tuple[str, str], MibNode] = {}
-        self._exact_oid_index: dict[OID, MibNode] = {}
-        self._type_index: dict[tuple[str, str], MibTypeRecord] = {}
-        self._oid_index = dict(oid_index or {})
-
-        for module in self._modules.values():
+        symbol_index: dict[tuple[str, str], MibNode] = {}
+        exact_oid_index: dict[OID, MibNode] = {}
+        type_index: dict[tuple[str, str], MibTypeRecord] = {}
+        for module in modules.values():
             for node in module.iter_nodes():
-                self._symbol_index[(module.module, node.name)] = node
-                self._exact_oid_index[node.oid] = node
+                symbol_index[(module.module, node.name)] = node
+                exact_oid_index[node.oid] = node
             for type_record in module.types.values():
-                self._type_index[(module.module, type_record.name)] = type_record
+                type_index[(module.module, type_record.name)] = type_record
+
+        self._modules: Mapping[str, MibModuleRecord] = dict(modules)
+        self._symbol_index: Mapping[tuple[str, str], MibNode] = symbol_index
+        self._exact_oid_index: Mapping[OID, MibNode] = exact_oid_index
+        self._type_index: Mapping[tuple[str, str], MibTypeRecord] = type_index
+        self._oid_index: Mapping[OID, _OidIndexEntry] = dict(oid_index or {})
 
     @property
     def modules(self) -> Mapping[str, MibModuleRecord]:
         return self._modules
 
+    def replace_modules(
+        self,
+        updated: Mapping[str, MibModuleRecord],
+        *,
+        removed: Iterable[str] = (),
+        oid_index: Mapping[OID, _OidIndexEntry] | None = None,
+        order: Sequence[str] | None = None,
+    ) -> MibRegistry:
+        """Return a new registry with *updated* modules swapped in and *removed* dropped.
+
+        *order* lists the module names in load order, which decides the winner
+        of duplicate OIDs exactly as a fresh load would; without it new modules
+        are appended. Only index entries owned by the affected modules are
+        rebuilt, unless the surviving modules were reordered. This registry is
+        left untouched so concurrent readers keep a consistent view.
+        """
+        modules = dict(self._modules)
+        symbol_index = dict(self._symbol_index)
+        exact_oid_index = dict(self._exact_oid_index)
+        type_index = dict(self._type_index)
+
+        orphaned: set[OID] = set()
+        for name in (*removed, *updated):
+            stale = modules.get(name)
+            if stale is None:
+                continue
+            for node in stale.iter_nodes():
+                symbol_index.pop((stale.module, node.name), None)
+                if exact_oid_index.get(node.oid) is node:
+                    del exact_oid_index[node.oid]
+                    orphaned.add(node.oid)
+            for type_record in stale.types.values():
+                type_index.pop((stale.module, type_record.name), None)
+
+        for name in removed:
+            modules.pop(name, None)
+        modules.update(updated)
+        kept = [name for name in self._modules if name in modules and name not in updated]
+        if order is not None:
+            modules = {name: modules[name] for name in dict.fromkeys(order) if name in modules}
+        positions = {name: position for position, name in enumerate(modules)}
+        if kept != [name for name in modules if name in self._modules and name not in updated]:
+            # Reordered modules can change the winner of any duplicate OID.
+            exact_oid_index = {}
+            orphaned = set()
+            for module in modules.values():
+                for node in module.iter_nodes():
+                    exact_oid_index[node.oid] = node
+
+        for module in updated.values():
+            for node in module.iter_nodes():
+                symbol_index[(module.module, node.name)] = node
+                current = exact_oid_index.get(node.oid)
+                if current is None or positions.get(current.module, -1) <= positions[module.module]:
+                    exact_oid_index[node.oid] = node
+            for type_record in module.types.values():
+                type_index[(module.module, type_record.name)] = type_record
+
+        if orphaned:
+            # Later modules win on duplicate OIDs, matching a fresh load.
+            for module in modules.values():
+                for node in module.iter_nodes():
+                    if node.oid in orphaned:
+                        exact_oid_index[node.oid] = node
+
+        registry = MibRegistry.__new__(MibRegistry)
+        registry._modules = modules
+        registry._symbol_index = symbol_index
+        registry._exact_oid_index = exact_oid_index
+        registry._type_index = type_index
+        registry._oid_index = dict(self._oid_index if oid_index is None else oid_index)
+        return registry
+
     def resolve_symbolic(self, target: str) -> OID:
         """Resolve MODULE::symbol[.suffix] to a numeric OID."""
         module, symbol, suffix = parse_symbolic_target(target)
@@ -160,6 +239,41 @@ class MibRegistry:
 
         return self.display_symbolic(target)
 
+    def translate_many(
+        self,
+        targets: Iterable[str | Sequence[int]],
+        *,
+        keep_unknown: bool = False,
+    ) -> Iterator[str]:
+        """Translate *targets* lazily, sharing prefix and symbol caches across items.
+
+        Numeric OIDs resolve through a memo of dotted prefixes, so OIDs under an
+        already-seen column cost a few dictionary probes. With *keep_unknown*,
+        targets that fail to translate are yielded unchanged instead of raising.
+        """
+        exact: dict[str, str] = {}
+        prefixes: dict[str, str] = {}
+        symbols: dict[tuple[str, str], str] = {}
+        for target in targets:
+            try:
+                if isinstance(target, str):
+                    text = target.strip()
+                    if not text:
+                        raise TranslationError("Translation target cannot be empty")
+                    if "::" in text and not is_numeric_oid_text(text):
+                        yield self._translate_symbolic_cached(text, symbols)
+                        continue
+                else:
+                    text = oid_to_string(parse_oid(target))
+                yield self._display_numeric_cached(text, exact, prefixes)
+            except TranslationError:
+                if not keep_unknown:
+                    raise
+                yield target.strip() if isinstance(target, str) else ".".join(map(str, target))
+            if len(exact) + len(prefixes) > _TRANSLATE_CACHE_SIZE:
+                exact.clear()
+                prefixes.clear()
+
     def display_symbolic(self, value: str | Sequence[int]) -> str:
         """Render a numeric OID using user-facing symbolic display policy."""
         match = self.lookup_oid(value)
@@ -188,6 +302,56 @@ class MibRegistry:
         """Return an object or notification node by exact module/symbol."""
         return self._symbol_index.get((module, symbol))
 
+    def _translate_symbolic_cached(self, text: str, symbols: dict[tuple[str, str], str]) -> str:
+        module, symbol, suffix = parse_symbolic_target(text)
+        base = symbols.get((module, symbol))
+        if base is None:
+            node = self._symbol_index.get((module, symbol))
+            if node is None:
+                raise UnknownSymbolError(f"Unknown symbolic target: {text}")
+            base = symbols[(module, symbol)] = oid_to_string(node.oid)
+        if not suffix:
+            return base
+        return f"{base}.{oid_to_string(suffix)}"
+
+    def _display_numeric_cached(
+        self,
+        text: str,
+        exact: dict[str, str],
+        prefixes: dict[str, str],
+    ) -> str:
+        text = text.lstrip(".")
+        if _CANONICAL_NUMERIC_OID.fullmatch(text) is None:
+            # Non-canonical spellings take the uncached path and its errors.
+            return self.display_symbolic(text)
+
+        oid = parse_oid(text)
+        if self._is_known_oid(oid):
+            # Exact matches go through the full display policy (scalar .0 aliases).
+            rendered = exact.get(text)
+            if rendered is None:
+                rendered = exact[text] = self.display_symbolic(text)
+            return rendered
+
+        end = text.rfind(".")
+        length = len(oid) - 1
+        while end > 0:
+            prefix = text[:end]
+            base = prefixes.get(prefix)
+            if base is not None:
+                return f"{base}{text[end:]}"
+            if self._is_known_oid(oid[:length]):
+                base = prefixes[prefix] = self.lookup_oid(prefix).symbolic
+                return f"{base}{text[end:]}"
+            end = text.rfind(".", 0, end)
+            length -= 1
+
+        raise UnknownOidError(f"Unknown numeric OID: {text}")
+
+    def _is_known_oid(self, oid: OID) -> bool:
+        # Probes the indexes directly; memory-mapped ones binary-search in place.
+        return oid in self._exact_oid_index or oid in self._oid_index
+
     def _lookup_exact_from_accelerator(self, oid: OID) -> MibNode | None:
         entry = self._oid_index.get(oid)
         if entry is None:
@@ -23,6 +23,7 @@ def enrich_varbinds(bundle: MibBundle | None, varbinds: tuple[VarBind, ...]) ->
             for varbind in varbinds
         )
 
+    bundle = bundle.pinned()
     enriched: list[VarBind] = []
     for varbind in varbinds:
         try:
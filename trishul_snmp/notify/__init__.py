@@ -1,18 +1,56 @@
 """Notification APIs."""
 
+from trishul_snmp.notify.aggregate import (
+    AggregationStats,
+    NotificationAggregator,
+    NotificationSummary,
+    notification_fingerprint,
+)
 from trishul_snmp.notify.client import V2cNotifier
 from trishul_snmp.notify.events import (
     NotificationEvent,
     NotificationMemberBinding,
     decode_notification,
 )
+from trishul_snmp.notify.filter import NotificationFilter
 from trishul_snmp.notify.listener import V2cNotificationListener, V3NotificationListener
+from trishul_snmp.notify.log import (
+    LoggedNotification,
+    NotificationLogReader,
+    NotificationLogWriter,
+)
+from trishul_snmp.notify.pipeline import InformPipeline, InformPipelineStats
+from trishul_snmp.notify.replay import (
+    ReplayStats,
+    read_hex_datagrams,
+    read_pcap,
+    replay_notifications,
+)
+from trishul_snmp.notify.sharding import ShardedNotificationListener
+from trishul_snmp.notify.template import TrapTemplate, blast_traps
 
 __all__ = [
+    "AggregationStats",
+    "InformPipeline",
+    "InformPipelineStats",
+    "LoggedNotification",
+    "NotificationAggregator",
     "NotificationEvent",
+    "NotificationFilter",
+    "NotificationLogReader",
+    "NotificationLogWriter",
     "NotificationMemberBinding",
+    "NotificationSummary",
+    "ReplayStats",
+    "ShardedNotificationListener",
+    "TrapTemplate",
     "V2cNotificationListener",
     "V3NotificationListener",
     "V2cNotifier",
+    "blast_traps",
     "decode_notification",
+    "notification_fingerprint",
+    "read_hex_datagrams",
+    "read_pcap",
+    "replay_notifications",
 ]
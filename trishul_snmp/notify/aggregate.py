@@ -0,0 +1,268 @@
+"""Duplicate suppression and storm aggregation for inbound notifications."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from trishul_snmp.notify.events import NotificationEvent
+from trishul_snmp.types import OID
+
+NotificationKey = Callable[[NotificationEvent], Hashable]
+
+_SYS_UPTIME_INSTANCE_OID: OID = (1, 3, 6, 1, 2, 1, 1, 3, 0)
+_SNMP_TRAP_OID_INSTANCE_OID: OID = (1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0)
+_FINGERPRINT_SKIPPED_OIDS = frozenset({_SYS_UPTIME_INSTANCE_OID, _SNMP_TRAP_OID_INSTANCE_OID})
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationSummary:
+    """Duplicates of *event* folded together by :class:`NotificationAggregator`.
+
+    *count* includes the forwarded first occurrence; *first_seen* and
+    *last_seen* are :func:`time.time` values.
+    """
+
+    event: NotificationEvent
+    count: int
+    first_seen: float
+    last_seen: float
+
+    @property
+    def suppressed(self) -> int:
+        return self.count - 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event payload plus the aggregation fields."""
+        payload = self.event.to_dict()
+        payload["aggregated"] = {
+            "count": self.count,
+            "suppressed": self.suppressed,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+        }
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class AggregationStats:
+    """Counters reported by :attr:`NotificationAggregator.stats`."""
+
+    received: int
+    forwarded: int
+    suppressed: int
+    summaries: int
+    evicted: int
+    tracked: int
+
+
+class _Window:
+    __slots__ = ("event", "count", "first_seen", "last_seen")
+
+    def __init__(self, event: NotificationEvent, now: float) -> None:
+        self.event = event
+        self.count = 1
+        self.first_seen = now
+        self.last_seen = now
+
+    def summary(self) -> NotificationSummary:
+        return NotificationSummary(
+            event=self.event,
+            count=self.count,
+            first_seen=self.first_seen,
+            last_seen=self.last_seen,
+        )
+
+
+class NotificationAggregator:
+    """Suppress repeated notifications and summarize them per sliding window.
+
+    The first event for a fingerprint is forwarded by :meth:`add`. Repeats
+    arriving less than *window* seconds after the previous one are counted
+    instead. Once a fingerprint has been quiet for *window* seconds, or its
+    window is *max_age* seconds old (*window* by default), :meth:`expire`
+    returns one :class:`NotificationSummary` for it, provided anything was
+    suppressed, and the next repeat opens a new window. At most *max_keys*
+    fingerprints are tracked; the least recently seen is evicted first and its
+    summary is returned by the next :meth:`expire`. The default fingerprint is
+    the source host, notification OID, and every varbind except
+    ``sysUpTime.0`` and ``snmpTrapOID.0``; pass *key* to use another.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 5.0,
+        max_age: float | None = None,
+        max_keys: int = 10_000,
+        key: NotificationKey | None = None,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self._window = window
+        self._max_age = window if max_age is None else max_age
+        self._max_keys = max_keys
+        self._key = notification_fingerprint if key is None else key
+        # ordered by last_seen, so the first entry is always the next to expire
+        self._windows: OrderedDict[Hashable, _Window] = OrderedDict()
+        # the same windows ordered by first_seen, so a storm that never goes quiet still closes
+        self._started: OrderedDict[Hashable, _Window] = OrderedDict()
+        self._ready: list[NotificationSummary] = []
+        self._received = 0
+        self._forwarded = 0
+        self._suppressed = 0
+        self._summaries = 0
+        self._evicted = 0
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def max_age(self) -> float:
+        return self._max_age
+
+    @property
+    def max_keys(self) -> int:
+        return self._max_keys
+
+    @property
+    def stats(self) -> AggregationStats:
+        return AggregationStats(
+            received=self._received,
+            forwarded=self._forwarded,
+            suppressed=self._suppressed,
+            summaries=self._summaries,
+            evicted=self._evicted,
+            tracked=len(self._windows),
+        )
+
+    def add(self, event: NotificationEvent) -> NotificationEvent | None:
+        """Return *event* if it should be forwarded, or ``None`` if suppressed."""
+        now = time.time()
+        self._received += 1
+        fingerprint = self._key(event)
+        windows = self._windows
+        current = windows.get(fingerprint)
+        if (
+            current is not None
+            and now - current.last_seen < self._window
+            and now - current.first_seen < self._max_age
+        ):
+            current.count += 1
+            current.last_seen = now
+            windows.move_to_end(fingerprint)
+            self._suppressed += 1
+            return None
+
+        if current is not None:
+            self._remove(fingerprint)
+        windows[fingerprint] = self._started[fingerprint] = _Window(event, now)
+        if len(windows) > self._max_keys:
+            self._evicted += 1
+            self._remove(next(iter(windows)))
+        self._forwarded += 1
+        return event
+
+    def expire(self) -> list[NotificationSummary]:
+        """Close quiet or aged windows and return summaries for those with suppressed events."""
+        now = time.time()
+        windows = self._windows
+        while windows:
+            fingerprint, oldest = next(iter(windows.items()))
+            if oldest.last_seen > now - self._window:
+                break
+            self._remove(fingerprint)
+        started = self._started
+        while started:
+            fingerprint, oldest = next(iter(started.items()))
+            if oldest.first_seen > now - self._max_age:
+                break
+            self._remove(fingerprint)
+        return self._take_ready()
+
+    def flush(self) -> list[NotificationSummary]:
+        """Close every window and return the summaries for those with suppressed events."""
+        for current in self._windows.values():
+            self._close(current)
+        self._windows.clear()
+        self._started.clear()
+        return self._take_ready()
+
+    def next_expiry(self) -> float | None:
+        """Return seconds until the next window can close, or ``None`` when idle."""
+        if self._ready:
+            return 0.0
+        if not self._windows:
+            return None
+        quiet = next(iter(self._windows.values())).last_seen + self._window
+        aged = next(iter(self._started.values())).first_seen + self._max_age
+        return max(0.0, min(quiet, aged) - time.time())
+
+    async def aggregate(
+        self,
+        events: AsyncIterable[NotificationEvent],
+    ) -> AsyncIterator[NotificationEvent | NotificationSummary]:
+        """Yield forwarded events and summaries as windows close, e.g. from a listener.
+
+        Summaries are yielded on time even while *events* is idle; remaining
+        windows are flushed when *events* ends.
+        """
+        iterator = aiter(events)
+        pending: asyncio.Future[NotificationEvent] | None = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(iterator))
+                await asyncio.wait({pending}, timeout=self.next_expiry())
+                for summary in self.expire():
+                    yield summary
+                if not pending.done():
+                    continue
+                completed, pending = pending, None
+                try:
+                    event = completed.result()
+                except StopAsyncIteration:
+                    break
+                forwarded = self.add(event)
+                if forwarded is not None:
+                    yield forwarded
+        finally:
+            if pending is not None:
+                pending.cancel()
+        for summary in self.flush():
+            yield summary
+
+    def _remove(self, fingerprint: Hashable) -> None:
+        del self._started[fingerprint]
+        self._close(self._windows.pop(fingerprint))
+
+    def _close(self, current: _Window) -> None:
+        if current.count > 1:
+            self._ready.append(current.summary())
+            self._summaries += 1
+
+    def _take_ready(self) -> list[NotificationSummary]:
+        ready, self._ready = self._ready, []
+        return ready
+
+
+def notification_fingerprint(event: NotificationEvent) -> Hashable:
+    """Return the default duplicate key: source host, notification OID, and member values."""
+    return (
+        event.source_host,
+        event.notification_oid,
+        tuple(
+            (varbind.oid, varbind.value)
+            for varbind in event.varbinds
+            if varbind.oid not in _FINGERPRINT_SKIPPED_OIDS
+        ),
+    )
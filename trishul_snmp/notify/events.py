@@ -10,7 +10,7 @@ from trishul_snmp.errors import ProtocolError, UnknownOidError
 from trishul_snmp.mib.bundle import MibBundle
 from trishul_snmp.mib.models import MibMemberRef, MibNode
 from trishul_snmp.notify.v3 import V3NotificationEnvelope, decode_v3_notification_message
-from trishul_snmp.security.usm import UsmUser
+from trishul_snmp.security.usm import UsmUser, UsmUserTable
 from trishul_snmp.types import (
     OID,
     ObjectIdentifierValue,
@@ -185,7 +185,7 @@ def decode_notification(
     *,
     bundle: MibBundle | None = None,
     source_address: SocketAddress | None = None,
-    user: UsmUser | None = None,
+    user: UsmUser | UsmUserTable | None = None,
 ) -> NotificationEvent:
     """Decode a BER-encoded trap or inform message.
 
@@ -229,6 +229,8 @@ def _notification_event_from_pdu(
     if pdu_type is None:
         raise ValueError(f"Unsupported notification PDU type: {pdu.pdu_type!r}")
 
+    if bundle is not None:
+        bundle = bundle.pinned()
     varbinds = public_varbinds_from_raw_varbinds(pdu.varbinds, bundle=bundle)
     notification_oid = _extract_notification_oid(varbinds)
     uptime = _extract_uptime(varbinds)
@@ -0,0 +1,182 @@
+"""Allow/deny pre-filtering of inbound notifications before full decode."""
+
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+
+from trishul_snmp._runtime import normalize_targets
+from trishul_snmp.errors import ProtocolError
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.types import OID, ObjectIdentifierValue, SocketAddress
+from trishul_snmp.wire.asn1 import _decode_oid, encode_value
+from trishul_snmp.wire.ber import decode_length
+from trishul_snmp.wire.pdu import RawVarBind
+
+_SEQUENCE_TAG = 0x30
+_OCTET_STRING_TAG = 0x04
+_OBJECT_IDENTIFIER_TAG = 0x06
+_SNMP_TRAP_OID_INSTANCE_OID: OID = (1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0)
+# OBJECT IDENTIFIER content octets of snmpTrapOID.0, compared without decoding
+_SNMP_TRAP_OID_CONTENT = encode_value(ObjectIdentifierValue(_SNMP_TRAP_OID_INSTANCE_OID))[2:]
+
+_Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+class NotificationFilter:
+    """Allow/deny rules a listener checks before decoding and enriching a notification.
+
+    Sources are host addresses or networks such as ``"10.0.0.0/8"``,
+    communities match exactly, and trap OIDs match the ``snmpTrapOID.0`` value
+    or any OID beneath it. An ``allow_*`` argument of ``None`` allows every
+    value, and deny rules win over allow rules. For SNMPv2c the source,
+    community, and trap OID are read with a shallow parse of the raw message.
+    """
+
+    def __init__(
+        self,
+        *,
+        allow_sources: Iterable[str] | None = None,
+        deny_sources: Iterable[str] = (),
+        allow_communities: Iterable[str] | None = None,
+        deny_communities: Iterable[str] = (),
+        allow_trap_oids: Sequence[str | Sequence[int]] | None = None,
+        deny_trap_oids: Sequence[str | Sequence[int]] = (),
+        bundle: MibBundle | None = None,
+    ) -> None:
+        self._allow_sources = None if allow_sources is None else _networks(allow_sources)
+        self._deny_sources = _networks(deny_sources)
+        self._allow_communities = (
+            None if allow_communities is None else _community_set(allow_communities)
+        )
+        self._deny_communities = _community_set(deny_communities)
+        self._allow_trap_oids = (
+            None if allow_trap_oids is None else _trap_oids(allow_trap_oids, bundle=bundle)
+        )
+        self._deny_trap_oids = _trap_oids(deny_trap_oids, bundle=bundle)
+
+    def accepts_source(self, host: str) -> bool:
+        """Return whether notifications from *host* pass the source rules."""
+        if self._allow_sources is None and not self._deny_sources:
+            return True
+        address = _address(host)
+        if address is None:
+            return self._allow_sources is None
+        if any(address in network for network in self._deny_sources):
+            return False
+        return self._allow_sources is None or any(
+            address in network for network in self._allow_sources
+        )
+
+    def accepts_community(self, community: str | bytes) -> bool:
+        """Return whether *community* passes the community rules."""
+        value = community.encode("utf-8") if isinstance(community, str) else community
+        if value in self._deny_communities:
+            return False
+        return self._allow_communities is None or value in self._allow_communities
+
+    def accepts_trap_oid(self, oid: OID | None) -> bool:
+        """Return whether a notification carrying *oid* in ``snmpTrapOID.0`` passes."""
+        if oid is None:
+            return self._allow_trap_oids is None
+        if any(oid[: len(prefix)] == prefix for prefix in self._deny_trap_oids):
+            return False
+        return self._allow_trap_oids is None or any(
+            oid[: len(prefix)] == prefix for prefix in self._allow_trap_oids
+        )
+
+    def accepts_varbinds(self, varbinds: Sequence[RawVarBind]) -> bool:
+        """Check the trap OID rules against already decoded notification varbinds."""
+        if self._allow_trap_oids is None and not self._deny_trap_oids:
+            return True
+        return self.accepts_trap_oid(_trap_oid_from_varbinds(varbinds))
+
+    def accepts_v2c(self, data: bytes, source: SocketAddress) -> bool:
+        """Check an SNMPv2c datagram without decoding its PDU; malformed data is rejected."""
+        if not self.accepts_source(source[0]):
+            return False
+        checks_trap_oid = self._allow_trap_oids is not None or bool(self._deny_trap_oids)
+        try:
+            community, oid = _peek_v2c(data, trap_oid=checks_trap_oid)
+        except ProtocolError:
+            return False
+        if not self.accepts_community(community):
+            return False
+        return not checks_trap_oid or self.accepts_trap_oid(oid)
+
+
+def _networks(values: Iterable[str]) -> tuple[_Network, ...]:
+    networks: list[_Network] = []
+    for value in values:
+        try:
+            networks.append(ipaddress.ip_network(value, strict=False))
+        except ValueError as exc:
+            raise ValueError(f"Invalid source address or network: {value!r}") from exc
+    return tuple(networks)
+
+
+def _community_set(values: Iterable[str]) -> frozenset[bytes]:
+    return frozenset(value.encode("utf-8") for value in values)
+
+
+def _trap_oids(
+    values: Sequence[str | Sequence[int]],
+    *,
+    bundle: MibBundle | None,
+) -> tuple[OID, ...]:
+    return normalize_targets(tuple(values), bundle=bundle) if values else ()
+
+
+@lru_cache(maxsize=4096)
+def _address(host: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address | None:
+    try:
+        return ipaddress.ip_address(host.split("%", 1)[0])
+    except ValueError:
+        return None
+
+
+def _trap_oid_from_varbinds(varbinds: Sequence[RawVarBind]) -> OID | None:
+    for varbind in varbinds:
+        if varbind.oid == _SNMP_TRAP_OID_INSTANCE_OID:
+            value = varbind.value
+            return value.value if isinstance(value, ObjectIdentifierValue) else None
+    return None
+
+
+def _peek_v2c(data: bytes, *, trap_oid: bool) -> tuple[bytes, OID | None]:
+    tag, offset, _ = _header(data, 0)
+    if tag != _SEQUENCE_TAG:
+        raise ProtocolError(f"Expected SNMP message SEQUENCE, found 0x{tag:02x}")
+    _, _, offset = _header(data, offset)
+    tag, start, offset = _header(data, offset)
+    if tag != _OCTET_STRING_TAG:
+        raise ProtocolError(f"Expected community OCTET STRING, found 0x{tag:02x}")
+    community = data[start:offset]
+    if not trap_oid:
+        return community, None
+
+    _, offset, _ = _header(data, offset)
+    for _ in range(3):
+        # request-id, error-status, error-index
+        _, _, offset = _header(data, offset)
+    _, offset, end = _header(data, offset)
+    while offset < end:
+        _, start, offset = _header(data, offset)
+        _, oid_start, oid_end = _header(data, start)
+        if data[oid_start:oid_end] == _SNMP_TRAP_OID_CONTENT:
+            tag, value_start, value_end = _header(data, oid_end)
+            if tag != _OBJECT_IDENTIFIER_TAG:
+                return community, None
+            return community, _decode_oid(data[value_start:value_end])
+    return community, None
+
+
+def _header(data: bytes, offset: int) -> tuple[int, int, int]:
+    if offset >= len(data):
+        raise ProtocolError("BER tag is truncated")
+    length, start = decode_length(data, offset + 1)
+    end = start + length
+    if end > len(data):
+        raise ProtocolError("BER content is truncated")
+    return data[offset], start, end
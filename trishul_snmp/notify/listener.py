@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from types import TracebackType
+from typing import TypeAlias
 
 from trishul_snmp.errors import ProtocolError, TransportError
 from trishul_snmp.mib.bundle import MibBundle
@@ -12,18 +14,27 @@ from trishul_snmp.notify.events import (
     notification_event_from_message,
     notification_event_from_v3_envelope,
 )
+from trishul_snmp.notify.filter import NotificationFilter
+from trishul_snmp.notify.log import NotificationLogWriter
 from trishul_snmp.notify.v3 import (
-    V3NotificationEnvelope,
     decode_v3_notification_message,
     encode_discovery_report,
     encode_inform_response,
     is_discovery_probe,
 )
-from trishul_snmp.security.usm import UsmLocalEngine, UsmUser
-from trishul_snmp.transport.udp import UdpServer
+from trishul_snmp.security.usm import UsmLocalEngine, UsmUser, UsmUserTable
+from trishul_snmp.transport.udp import (
+    DatagramQueueStats,
+    DropPolicy,
+    ReceivedDatagram,
+    UdpServer,
+)
 from trishul_snmp.types import SocketAddress
 from trishul_snmp.wire.message import SnmpMessage, decode_message, encode_message
 from trishul_snmp.wire.pdu import Pdu, PduType
+from trishul_snmp.wire.v3message import decode_v3_message
+
+NotificationHandler: TypeAlias = Callable[[NotificationEvent], Awaitable[None] | None]
 
 
 class _BaseNotificationListener:
@@ -33,9 +44,28 @@ class _BaseNotificationListener:
         host: str,
         port: int,
         bundle: MibBundle | None,
+        max_queue: int,
+        drop_policy: DropPolicy,
+        recv_buffer_size: int | None,
+        reuse_port: bool,
+        handler: NotificationHandler | None,
+        notification_filter: NotificationFilter | None,
+        notification_log: NotificationLogWriter | None,
     ) -> None:
         self._bundle = bundle
-        self._server = UdpServer(host, port)
+        self._handler = handler
+        self._filter = notification_filter
+        self._log = notification_log
+        self._handler_tasks: set[asyncio.Task[None]] = set()
+        self._server = UdpServer(
+            host,
+            port,
+            max_queue=max_queue,
+            drop_policy=drop_policy,
+            recv_buffer_size=recv_buffer_size,
+            reuse_port=reuse_port,
+            datagram_handler=None if handler is None else self._dispatch,
+        )
         self._closed = False
 
     async def __aenter__(self) -> _BaseNotificationListener:
@@ -66,22 +96,123 @@ class _BaseNotificationListener:
     def local_address(self) -> SocketAddress | None:
         return self._server.local_address
 
+    @property
+    def stats(self) -> DatagramQueueStats:
+        """Return received, dropped, queued, and high-water counts since :meth:`open`."""
+        return self._server.stats
+
     async def open(self) -> None:
         """Bind the listener socket."""
         self._closed = False
         await self._server.open()
 
     async def close(self) -> None:
-        """Close the listener socket."""
+        """Close the listener socket and wait for running asynchronous handlers."""
         self._closed = True
         await self._server.close()
+        if self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
+    async def wait_closed(self) -> None:
+        """Wait until the listener is closed, e.g. while a handler consumes events."""
+        await self._server.wait_closed()
 
     async def receive(self) -> NotificationEvent:
+        """Wait for the next matching trap or inform event."""
+        self._require_queue()
+        while True:
+            datagram = await self._server.receive()
+            event = await self._accept(datagram)
+            if event is not None:
+                return event
+
+    async def receive_batch(
+        self,
+        max_events: int,
+        timeout: float | None = None,
+    ) -> list[NotificationEvent]:
+        """Return up to *max_events* events, waiting at most *timeout* for the first.
+
+        Every datagram already queued when the first one arrives is decoded in
+        the same call, so a burst is drained in one wake-up. An empty list
+        means *timeout* expired.
+        """
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self._require_queue()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        events: list[NotificationEvent] = []
+        while not events:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                break
+            datagrams = await self._server.receive_batch(max_events, timeout=remaining)
+            if not datagrams:
+                break
+            for datagram in datagrams:
+                event = await self._accept(datagram)
+                if event is not None:
+                    events.append(event)
+        return events
+
+    async def _accept(self, datagram: ReceivedDatagram) -> NotificationEvent | None:
+        event, reply = self._process(datagram.data, datagram.source_address)
+        if reply is not None:
+            await self._server.sendto(reply, datagram.source_address)
+        if event is not None and self._log is not None:
+            self._log.append(datagram.data, datagram.source_address)
+        return event
+
+    def _dispatch(self, data: bytes, addr: SocketAddress) -> None:
+        event, reply = self._process(data, addr)
+        if reply is not None:
+            self._server.send_nowait(reply, addr)
+        if event is None:
+            return
+        if self._log is not None:
+            self._log.append(data, addr)
+        if self._handler is None:
+            return
+        result = self._handler(event)
+        if result is not None:
+            task = asyncio.ensure_future(result)
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_done)
+
+    def _handler_done(self, task: asyncio.Task[None]) -> None:
+        self._handler_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            task.get_loop().call_exception_handler(
+                {
+                    "message": "Notification handler failed",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+    def _require_queue(self) -> None:
+        if self._handler is not None:
+            raise TransportError("Listener delivers events to its handler")
+
+    def _process(
+        self,
+        data: bytes,
+        addr: SocketAddress,
+    ) -> tuple[NotificationEvent | None, bytes | None]:
         raise NotImplementedError
 
 
 class SnmpNotificationListener(_BaseNotificationListener):
-    """Async iterator-style SNMPv2c trap and inform listener."""
+    """Async iterator-style SNMPv2c trap and inform listener.
+
+    With *handler*, each matching event is passed to it directly from the
+    socket callback instead of being queued for :meth:`receive`; awaitable
+    results are scheduled as tasks. A *notification_filter* is checked against
+    the raw datagram, so rejected notifications are never decoded, enriched,
+    or acknowledged. The raw datagram of every accepted notification is
+    appended to *notification_log* when one is given.
+    """
 
     def __init__(
         self,
@@ -90,106 +221,168 @@ class SnmpNotificationListener(_BaseNotificationListener):
         port: int = 162,
         communities: Sequence[str] | None = None,
         bundle: MibBundle | None = None,
+        max_queue: int = 0,
+        drop_policy: DropPolicy = DropPolicy.DROP_NEWEST,
+        recv_buffer_size: int | None = None,
+        reuse_port: bool = False,
+        handler: NotificationHandler | None = None,
+        notification_filter: NotificationFilter | None = None,
+        notification_log: NotificationLogWriter | None = None,
     ) -> None:
-        super().__init__(host=host, port=port, bundle=bundle)
+        super().__init__(
+            host=host,
+            port=port,
+            bundle=bundle,
+            max_queue=max_queue,
+            drop_policy=drop_policy,
+            recv_buffer_size=recv_buffer_size,
+            reuse_port=reuse_port,
+            handler=handler,
+            notification_filter=notification_filter,
+            notification_log=notification_log,
+        )
         self._communities = _normalize_communities(communities)
 
-    async def receive(self) -> NotificationEvent:
-        """Wait for the next matching trap or inform event."""
-        while True:
-            datagram = await self._server.receive()
-            try:
-                message = decode_message(datagram.data)
-            except ProtocolError:
-                continue
-            if not _community_allowed(communities=self._communities, community=message.community):
-                continue
-            if message.pdu.pdu_type not in {PduType.SNMPV2_TRAP, PduType.INFORM_REQUEST}:
-                continue
-            if message.pdu.pdu_type is PduType.INFORM_REQUEST:
-                await self._send_inform_ack(message, datagram.source_address)
-            return notification_event_from_message(
-                message,
-                source_address=datagram.source_address,
-                bundle=self._bundle,
-            )
-
-    async def _send_inform_ack(self, message: SnmpMessage, addr: SocketAddress) -> None:
-        response = SnmpMessage(
-            version=message.version,
-            community=message.community,
-            pdu=Pdu(
-                pdu_type=PduType.RESPONSE,
-                request_id=message.pdu.request_id,
-                error_status=0,
-                error_index=0,
-                varbinds=message.pdu.varbinds,
-            ),
+    def _process(
+        self,
+        data: bytes,
+        addr: SocketAddress,
+    ) -> tuple[NotificationEvent | None, bytes | None]:
+        if self._filter is not None and not self._filter.accepts_v2c(data, addr):
+            return None, None
+        try:
+            message = decode_message(data)
+        except ProtocolError:
+            return None, None
+        if not _community_allowed(communities=self._communities, community=message.community):
+            return None, None
+        if message.pdu.pdu_type not in {PduType.SNMPV2_TRAP, PduType.INFORM_REQUEST}:
+            return None, None
+        reply = None
+        if message.pdu.pdu_type is PduType.INFORM_REQUEST:
+            reply = _inform_ack(message)
+        event = notification_event_from_message(
+            message,
+            source_address=addr,
+            bundle=self._bundle,
         )
-        await self._server.sendto(encode_message(response), addr)
+        return event, reply
 
 
 class V3NotificationListener(_BaseNotificationListener):
-    """Async iterator-style SNMPv3 notification listener for one configured user."""
+    """Async iterator-style SNMPv3 notification listener for configured USM users.
+
+    *user* and *users* populate a :class:`UsmUserTable`; each datagram is
+    matched to its user by username, and localized keys are cached for up to
+    *max_keys* ``(username, engine_id)`` pairs.
+
+    *handler* works as for :class:`SnmpNotificationListener`. A
+    *notification_filter* checks the source before any decryption and the trap
+    OID before enrichment; rejected informs are not acknowledged. Community
+    rules do not apply to SNMPv3. *notification_log* records accepted
+    datagrams still encrypted, so reading them back needs the same users.
+    """
 
     def __init__(
         self,
         *,
         host: str = "0.0.0.0",
         port: int = 162,
-        user: UsmUser,
+        user: UsmUser | None = None,
         local_engine: UsmLocalEngine,
+        users: Iterable[UsmUser] = (),
+        max_keys: int = 1024,
         bundle: MibBundle | None = None,
+        max_queue: int = 0,
+        drop_policy: DropPolicy = DropPolicy.DROP_NEWEST,
+        recv_buffer_size: int | None = None,
+        reuse_port: bool = False,
+        handler: NotificationHandler | None = None,
+        notification_filter: NotificationFilter | None = None,
+        notification_log: NotificationLogWriter | None = None,
     ) -> None:
-        super().__init__(host=host, port=port, bundle=bundle)
-        self._user = user
+        super().__init__(
+            host=host,
+            port=port,
+            bundle=bundle,
+            max_queue=max_queue,
+            drop_policy=drop_policy,
+            recv_buffer_size=recv_buffer_size,
+            reuse_port=reuse_port,
+            handler=handler,
+            notification_filter=notification_filter,
+            notification_log=notification_log,
+        )
+        self._users = UsmUserTable(
+            [*(() if user is None else (user,)), *users],
+            max_keys=max_keys,
+        )
         self._local_engine = local_engine
 
-    async def receive(self) -> NotificationEvent:
-        """Wait for the next matching SNMPv3 trap or inform event."""
-        while True:
-            datagram = await self._server.receive()
-            if is_discovery_probe(datagram.data):
-                try:
-                    report = encode_discovery_report(
-                        datagram.data,
-                        local_engine=self._local_engine,
-                    )
-                except ProtocolError:
-                    continue
-                await self._server.sendto(report, datagram.source_address)
-                continue
-
-            try:
-                envelope = decode_v3_notification_message(datagram.data, user=self._user)
-            except ProtocolError:
-                continue
-            if envelope is None:
-                continue
-            if envelope.pdu.pdu_type is PduType.INFORM_REQUEST:
-                await self._send_inform_ack(envelope, datagram.source_address)
-            return notification_event_from_v3_envelope(
-                envelope,
-                source_address=datagram.source_address,
-                bundle=self._bundle,
-            )
+    @property
+    def users(self) -> UsmUserTable:
+        return self._users
 
-    async def _send_inform_ack(
+    def _process(
         self,
-        envelope: V3NotificationEnvelope,
+        data: bytes,
         addr: SocketAddress,
-    ) -> None:
-        response = encode_inform_response(
+    ) -> tuple[NotificationEvent | None, bytes | None]:
+        notification_filter = self._filter
+        if notification_filter is not None and not notification_filter.accepts_source(addr[0]):
+            return None, None
+        # the outer message is decoded once and shared by every later stage
+        try:
+            view = decode_v3_message(data)
+        except ProtocolError:
+            return None, None
+        if is_discovery_probe(data, view=view):
+            report = encode_discovery_report(data, local_engine=self._local_engine, view=view)
+            return None, report
+
+        try:
+            envelope = decode_v3_notification_message(data, user=self._users, view=view)
+        except ProtocolError:
+            return None, None
+        if envelope is None:
+            return None, None
+        if notification_filter is not None and not notification_filter.accepts_varbinds(
+            envelope.pdu.varbinds
+        ):
+            return None, None
+        reply = None
+        if envelope.pdu.pdu_type is PduType.INFORM_REQUEST:
+            reply = encode_inform_response(
+                envelope,
+                user=self._users,
+                local_engine=self._local_engine,
+            )
+        event = notification_event_from_v3_envelope(
             envelope,
-            user=self._user,
-            local_engine=self._local_engine,
+            source_address=addr,
+            bundle=self._bundle,
         )
-        await self._server.sendto(response, addr)
+        return event, reply
 
 
 V2cNotificationListener = SnmpNotificationListener
 
 
+def _inform_ack(message: SnmpMessage) -> bytes:
+    response = SnmpMessage(
+        version=message.version,
+        community=message.community,
+        pdu=Pdu(
+            pdu_type=PduType.RESPONSE,
+            request_id=message.pdu.request_id,
+            error_status=0,
+            error_index=0,
+            varbinds=message.pdu.varbinds,
+        ),
+    )
+    return encode_message(response)
+
+
 def _normalize_communities(communities: Sequence[str] | None) -> frozenset[str] | None:
     if communities is None:
         return None
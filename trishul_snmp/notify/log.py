@@ -0,0 +1,372 @@
+"""Append-only segmented logs of raw notification datagrams."""
+
+from __future__ import annotations
+
+import struct
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+from trishul_snmp.errors import NotificationLogError, ProtocolError
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.notify.events import NotificationEvent, decode_notification
+from trishul_snmp.security.usm import UsmUser, UsmUserTable
+from trishul_snmp.types import SocketAddress
+
+_SEGMENT_MAGIC = b"TSNMPLOG"
+_INDEX_MAGIC = b"TSNMPIDX"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sI")
+# receive timestamp, datagram length, source port, source host length
+_RECORD = struct.Struct("<dIHB")
+# block offset, block length, record count, earliest and latest timestamp, source bloom
+_BLOCK = struct.Struct("<QIIdd32s")
+_BLOOM_BITS = 256
+_SEGMENT_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+_WRITE_BUFFER = 1 << 16
+
+
+@dataclass(frozen=True, slots=True)
+class LoggedNotification:
+    """One raw notification datagram read back from a notification log."""
+
+    timestamp: float
+    source_address: SocketAddress
+    data: bytes
+
+
+class NotificationLogWriter:
+    """Append raw notification datagrams to rotating segment files in *directory*.
+
+    Each record holds the receive timestamp, source address, and datagram
+    bytes. Every *index_interval* records a fixed-width entry with the block's
+    offset, time range, and a source bloom filter is appended to the segment's
+    ``.idx`` file, so :class:`NotificationLogReader` can seek past blocks
+    outside a query. A new segment is started once the current one reaches
+    *segment_bytes* or, when given, is *segment_seconds* old; with
+    *max_segments* the oldest segments are deleted. Records are buffered until
+    :meth:`flush`, rotation, or :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        segment_bytes: int = 64 * 1024 * 1024,
+        segment_seconds: float | None = None,
+        max_segments: int | None = None,
+        index_interval: int = 256,
+    ) -> None:
+        if segment_bytes < 1:
+            raise ValueError("segment_bytes must be at least 1")
+        if segment_seconds is not None and segment_seconds <= 0:
+            raise ValueError("segment_seconds must be positive")
+        if max_segments is not None and max_segments < 1:
+            raise ValueError("max_segments must be at least 1")
+        if index_interval < 1:
+            raise ValueError("index_interval must be at least 1")
+        self._directory = Path(directory).expanduser()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        self._segment_seconds = segment_seconds
+        self._max_segments = max_segments
+        self._index_interval = index_interval
+        existing = _segment_numbers(self._directory)
+        self._next_number = existing[-1] + 1 if existing else 0
+        self._segment: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._segment_path: Path | None = None
+        self._opened_at = 0.0
+        self._size = 0
+        self._block_offset = 0
+        self._block_count = 0
+        self._block_earliest = 0.0
+        self._block_latest = 0.0
+        self._block_bloom = 0
+        self._records = 0
+
+    def __enter__(self) -> NotificationLogWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        del exc_type, exc, tb
+        self.close()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def segment_path(self) -> Path | None:
+        """Return the segment currently being written, if any."""
+        return self._segment_path
+
+    @property
+    def records(self) -> int:
+        """Return the number of records appended since this writer was created."""
+        return self._records
+
+    def append(
+        self,
+        data: bytes,
+        source_address: SocketAddress,
+        *,
+        timestamp: float | None = None,
+    ) -> None:
+        """Append one datagram received from *source_address* at *timestamp*."""
+        now = time.time() if timestamp is None else timestamp
+        host = source_address[0].encode("utf-8")
+        if len(host) > 0xFF:
+            raise ValueError("Source host is too long for a notification log record")
+        segment = self._segment
+        if segment is None or self._should_rotate(now):
+            segment = self._rotate(now)
+        if self._block_count == 0:
+            self._block_offset = self._size
+            self._block_earliest = self._block_latest = now
+        segment.write(_RECORD.pack(now, len(data), source_address[1], len(host)))
+        segment.write(host)
+        segment.write(data)
+        self._size += _RECORD.size + len(host) + len(data)
+        self._block_count += 1
+        self._block_earliest = min(self._block_earliest, now)
+        self._block_latest = max(self._block_latest, now)
+        self._block_bloom |= _source_bits(source_address[0])
+        self._records += 1
+        if self._block_count >= self._index_interval:
+            self._close_block()
+
+    def flush(self) -> None:
+        """Index the records appended so far and flush both files to the OS."""
+        if self._segment is None or self._index is None:
+            return
+        self._close_block()
+        self._segment.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        """Index pending records and close the current segment."""
+        self.flush()
+        for handle in (self._segment, self._index):
+            if handle is not None:
+                handle.close()
+        self._segment = self._index = None
+        self._segment_path = None
+
+    def _should_rotate(self, now: float) -> bool:
+        if self._size >= self._segment_bytes:
+            return True
+        seconds = self._segment_seconds
+        return seconds is not None and now - self._opened_at >= seconds
+
+    def _rotate(self, now: float) -> BinaryIO:
+        self.close()
+        number = self._next_number
+        self._next_number += 1
+        path = self._directory / f"{number:010d}{_SEGMENT_SUFFIX}"
+        segment = path.open("xb", buffering=_WRITE_BUFFER)
+        index = path.with_suffix(_INDEX_SUFFIX).open("xb")
+        header = _HEADER.pack(_SEGMENT_MAGIC, _FORMAT_VERSION)
+        segment.write(header)
+        index.write(_HEADER.pack(_INDEX_MAGIC, _FORMAT_VERSION))
+        self._segment, self._index, self._segment_path = segment, index, path
+        self._opened_at = now
+        self._size = len(header)
+        self._prune()
+        return segment
+
+    def _close_block(self) -> None:
+        if self._block_count == 0 or self._index is None:
+            return
+        self._index.write(
+            _BLOCK.pack(
+                self._block_offset,
+                self._size - self._block_offset,
+                self._block_count,
+                self._block_earliest,
+                self._block_latest,
+                self._block_bloom.to_bytes(_BLOOM_BITS // 8, "little"),
+            )
+        )
+        self._block_count = 0
+        self._block_bloom = 0
+
+    def _prune(self) -> None:
+        if self._max_segments is None:
+            return
+        numbers = _segment_numbers(self._directory)
+        for number in numbers[: max(0, len(numbers) - self._max_segments)]:
+            segment = self._directory / f"{number:010d}{_SEGMENT_SUFFIX}"
+            segment.unlink(missing_ok=True)
+            segment.with_suffix(_INDEX_SUFFIX).unlink(missing_ok=True)
+
+
+class NotificationLogReader:
+    """Read records written by :class:`NotificationLogWriter` from *directory*.
+
+    Queries by time range or source host use each segment's index to skip
+    whole segments and blocks; only matching blocks, plus any records written
+    after the last index entry, are read.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._directory = Path(directory).expanduser()
+        if not self._directory.is_dir():
+            raise NotificationLogError(f"Notification log does not exist: {self._directory}")
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def segments(self) -> tuple[Path, ...]:
+        """Return the segment files in write order."""
+        return tuple(
+            self._directory / f"{number:010d}{_SEGMENT_SUFFIX}"
+            for number in _segment_numbers(self._directory)
+        )
+
+    def records(
+        self,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+        sources: Iterable[str] | None = None,
+    ) -> Iterator[LoggedNotification]:
+        """Yield records received in ``[start, end)`` from any of *sources*, in log order."""
+        hosts = None if sources is None else frozenset(sources)
+        bloom = None if hosts is None else [_source_bits(host) for host in hosts]
+        for path in self.segments:
+            yield from _read_segment(path, start=start, end=end, hosts=hosts, bloom=bloom)
+
+    def events(
+        self,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+        sources: Iterable[str] | None = None,
+        bundle: MibBundle | None = None,
+        user: UsmUser | UsmUserTable | None = None,
+    ) -> Iterator[NotificationEvent]:
+        """Yield matching records decoded with :func:`decode_notification`.
+
+        Records that do not decode, for example SNMPv3 notifications for
+        another user, are skipped.
+        """
+        for record in self.records(start=start, end=end, sources=sources):
+            try:
+                yield decode_notification(
+                    record.data,
+                    bundle=bundle,
+                    source_address=record.source_address,
+                    user=user,
+                )
+            except ProtocolError:
+                continue
+
+
+def _read_segment(
+    path: Path,
+    *,
+    start: float | None,
+    end: float | None,
+    hosts: frozenset[str] | None,
+    bloom: list[int] | None,
+) -> Iterator[LoggedNotification]:
+    blocks = _read_index(path.with_suffix(_INDEX_SUFFIX))
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        # pruned by a writer while we were reading
+        return
+    with handle:
+        header = handle.read(_HEADER.size)
+        if len(header) < _HEADER.size or _HEADER.unpack(header) != (
+            _SEGMENT_MAGIC,
+            _FORMAT_VERSION,
+        ):
+            raise NotificationLogError(f"File is not a supported notification log: {path}")
+        for offset, length, _, earliest, latest, block_bloom in blocks:
+            if (start is not None and latest < start) or (end is not None and earliest >= end):
+                continue
+            if bloom is not None and not any(bits & block_bloom == bits for bits in bloom):
+                continue
+            handle.seek(offset)
+            yield from _matching(_parse(handle.read(length)), start, end, hosts)
+        # records appended after the last index entry, e.g. by a running writer
+        indexed_end = blocks[-1][0] + blocks[-1][1] if blocks else _HEADER.size
+        handle.seek(indexed_end)
+        yield from _matching(_parse(handle.read()), start, end, hosts)
+
+
+def _read_index(path: Path) -> list[tuple[int, int, int, float, float, int]]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    if len(data) < _HEADER.size or _HEADER.unpack_from(data) != (_INDEX_MAGIC, _FORMAT_VERSION):
+        raise NotificationLogError(f"File is not a supported notification log index: {path}")
+    usable = (len(data) - _HEADER.size) // _BLOCK.size * _BLOCK.size
+    return [
+        (offset, length, count, earliest, latest, int.from_bytes(bloom, "little"))
+        for offset, length, count, earliest, latest, bloom in _BLOCK.iter_unpack(
+            data[_HEADER.size : _HEADER.size + usable]
+        )
+    ]
+
+
+def _parse(data: bytes) -> Iterator[LoggedNotification]:
+    offset = 0
+    size = len(data)
+    while offset + _RECORD.size <= size:
+        timestamp, length, port, host_length = _RECORD.unpack_from(data, offset)
+        host_start = offset + _RECORD.size
+        data_start = host_start + host_length
+        offset = data_start + length
+        if offset > size:
+            # a partially written trailing record
+            return
+        yield LoggedNotification(
+            timestamp=timestamp,
+            source_address=(data[host_start:data_start].decode("utf-8"), port),
+            data=data[data_start:offset],
+        )
+
+
+def _matching(
+    records: Iterator[LoggedNotification],
+    start: float | None,
+    end: float | None,
+    hosts: frozenset[str] | None,
+) -> Iterator[LoggedNotification]:
+    for record in records:
+        if start is not None and record.timestamp < start:
+            continue
+        if end is not None and record.timestamp >= end:
+            continue
+        if hosts is not None and record.source_address[0] not in hosts:
+            continue
+        yield record
+
+
+def _segment_numbers(directory: Path) -> list[int]:
+    return sorted(
+        int(path.stem) for path in directory.glob(f"*{_SEGMENT_SUFFIX}") if path.stem.isdigit()
+    )
+
+
+@lru_cache(maxsize=4096)
+def _source_bits(host: str) -> int:
+    digest = zlib.crc32(host.encode("utf-8"))
+    return (1 << (digest % _BLOOM_BITS)) | (1 << ((digest >> 8) % _BLOOM_BITS))
@@ -0,0 +1,305 @@
+"""Pipelined SNMP inform sending with many informs outstanding."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from types import TracebackType
+
+from trishul_snmp._runtime import response_from_pdu
+from trishul_snmp.errors import ProtocolError, RequestTimeoutError, TransportError
+from trishul_snmp.notify.client import (
+    NotificationVarBindInput,
+    SnmpNotifier,
+    _normalize_notification_target,
+    encode_notification_raw_varbinds,
+)
+from trishul_snmp.security.usm import UsmModel
+from trishul_snmp.types import Response
+from trishul_snmp.wire.pdu import PduType
+
+# timer wheel ticks per timeout; the wheel spans two timeouts so a deadline
+# never lands in the bucket being expired
+_WHEEL_TICKS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class InformPipelineStats:
+    """Counters reported by :attr:`InformPipeline.stats`.
+
+    Ack latency runs from an inform's first transmission to its response.
+    """
+
+    sent: int
+    acked: int
+    retransmits: int
+    timeouts: int
+    outstanding: int
+    mean_latency: float
+    max_latency: float
+
+
+class _PendingInform:
+    __slots__ = ("data", "future", "first_sent", "attempts")
+
+    def __init__(self, data: bytes, future: asyncio.Future[Response], now: float) -> None:
+        self.data = data
+        self.future = future
+        self.first_sent = now
+        self.attempts = 1
+
+
+class InformPipeline:
+    """Send informs through *notifier* with up to *window* awaiting a response.
+
+    :meth:`submit` encodes and sends an inform as soon as a window slot is
+    free and returns a future for its response, so many informs share each
+    round trip. One reader task matches responses by request-id and drives a
+    timer wheel that retransmits an unacknowledged inform every *timeout*
+    seconds, up to *retries* times, before failing its future with
+    :class:`RequestTimeoutError`. A full window of responses can arrive at
+    once, so large windows need *recv_buffer_size* to raise the socket's
+    ``SO_RCVBUF``. SNMPv3 notifiers discover the peer engine when the
+    pipeline opens. While the pipeline is open the notifier's own
+    ``send_inform()`` must not be used, since both read the same socket.
+    Closing the notifier stops the pipeline and fails the informs still
+    outstanding with :class:`TransportError`.
+    """
+
+    def __init__(
+        self,
+        notifier: SnmpNotifier,
+        *,
+        window: int = 64,
+        timeout: float = 2.0,
+        retries: int = 1,
+        recv_buffer_size: int | None = None,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if timeout <= 0:
+            raise ValueError("timeout must be > 0")
+        if retries < 0:
+            raise ValueError("retries cannot be negative")
+        if recv_buffer_size is not None and recv_buffer_size < 1:
+            raise ValueError("recv_buffer_size must be positive")
+        self._session = notifier._session
+        self._window_size = window
+        self._timeout = timeout
+        self._retries = retries
+        self._recv_buffer_size = recv_buffer_size
+        self._tick = timeout / _WHEEL_TICKS
+        self._wheel: list[list[tuple[int, int]]] = [[] for _ in range(2 * _WHEEL_TICKS)]
+        self._origin = 0.0
+        self._cursor = 0
+        self._window = asyncio.Semaphore(window)
+        self._pending: dict[int, _PendingInform] = {}
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._reader: asyncio.Task[None] | None = None
+        self._sent = 0
+        self._acked = 0
+        self._retransmits = 0
+        self._timeouts = 0
+        self._latency_total = 0.0
+        self._max_latency = 0.0
+
+    async def __aenter__(self) -> InformPipeline:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        del exc_type, exc, tb
+        await self.close()
+
+    @property
+    def window(self) -> int:
+        return self._window_size
+
+    @property
+    def stats(self) -> InformPipelineStats:
+        """Return a snapshot of the pipeline counters."""
+        return InformPipelineStats(
+            sent=self._sent,
+            acked=self._acked,
+            retransmits=self._retransmits,
+            timeouts=self._timeouts,
+            outstanding=len(self._pending),
+            mean_latency=self._latency_total / self._acked if self._acked else 0.0,
+            max_latency=self._max_latency,
+        )
+
+    async def open(self) -> None:
+        """Open the notifier, discover an SNMPv3 peer engine, and start the reader."""
+        if self._reader is not None:
+            return
+        session = self._session
+        await session.open(skip_prepare=True)
+        if self._recv_buffer_size is not None:
+            session.client.set_recv_buffer_size(self._recv_buffer_size)
+        security = session._security
+        if isinstance(security, UsmModel) and not security.peer_engine_discovered:
+            async with session.lock:
+                await security.prepare(session.dispatcher)
+        loop = asyncio.get_running_loop()
+        self._origin = loop.time()
+        self._cursor = 0
+        self._reader = loop.create_task(self._run())
+
+    async def close(self) -> None:
+        """Wait for outstanding informs to be acknowledged or time out, then stop."""
+        reader = self._reader
+        if reader is None:
+            return
+        await self.drain()
+        self._reader = None
+        reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+
+    async def drain(self) -> None:
+        """Wait until no inform is outstanding."""
+        await self._idle.wait()
+
+    async def submit(
+        self,
+        notification: str | Sequence[int],
+        *,
+        varbinds: Sequence[NotificationVarBindInput] = (),
+        uptime: int = 0,
+    ) -> asyncio.Future[Response]:
+        """Send an inform once the window allows and return a future for its response."""
+        if self._reader is None or self._reader.done():
+            raise TransportError("Inform pipeline is not open")
+        session = self._session
+        notification_oid = _normalize_notification_target(notification, bundle=session.bundle)
+        raw_varbinds = encode_notification_raw_varbinds(
+            notification_oid,
+            varbinds=varbinds,
+            uptime=uptime,
+            bundle=session.bundle,
+        )
+        await self._window.acquire()
+        try:
+            if self._reader is None or self._reader.done():
+                raise TransportError("Inform pipeline is not open")
+            request = session.dispatcher.prepare_request(PduType.INFORM_REQUEST, raw_varbinds)
+        except BaseException:
+            self._window.release()
+            raise
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Response] = loop.create_future()
+        now = loop.time()
+        self._pending[request.request_id] = _PendingInform(request.encoded_message, future, now)
+        self._idle.clear()
+        self._sent += 1
+        self._schedule(request.request_id, 1, now)
+        await self._transmit(request.encoded_message)
+        return future
+
+    async def send_inform(
+        self,
+        notification: str | Sequence[int],
+        *,
+        varbinds: Sequence[NotificationVarBindInput] = (),
+        uptime: int = 0,
+    ) -> Response:
+        """Send an inform through the pipeline and wait for the matching response."""
+        future = await self.submit(notification, varbinds=varbinds, uptime=uptime)
+        return await future
+
+    async def _run(self) -> None:
+        session = self._session
+        client = session.client
+        security = session._security
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                data = await client.receive(self._tick)
+            except RequestTimeoutError:
+                data = None
+            except TransportError as exc:
+                if not isinstance(exc.__cause__, OSError):
+                    # the notifier was closed under the pipeline
+                    self._fail_pending("Inform pipeline notifier was closed")
+                    return
+                # e.g. an ICMP port-unreachable for an earlier send; retransmits cover it
+                data = None
+            if data is not None:
+                try:
+                    pdu = security.unwrap_message(data)
+                except ProtocolError:
+                    pdu = None
+                if pdu is not None and pdu.pdu_type is PduType.RESPONSE:
+                    pending = self._pending.pop(pdu.request_id, None)
+                    if pending is not None:
+                        latency = loop.time() - pending.first_sent
+                        self._acked += 1
+                        self._latency_total += latency
+                        self._max_latency = max(self._max_latency, latency)
+                        if not pending.future.done():
+                            pending.future.set_result(response_from_pdu(pdu, bundle=session.bundle))
+                        self._release()
+            await self._expire(loop.time())
+
+    def _schedule(self, request_id: int, attempt: int, now: float) -> None:
+        # round the deadline up so a retransmit never fires early
+        tick = max(self._cursor, math.ceil((now + self._timeout - self._origin) / self._tick))
+        self._wheel[tick % len(self._wheel)].append((request_id, attempt))
+
+    async def _expire(self, now: float) -> None:
+        current = int((now - self._origin) / self._tick)
+        while self._cursor <= current:
+            slot = self._cursor % len(self._wheel)
+            bucket = self._wheel[slot]
+            self._cursor += 1
+            if not bucket:
+                continue
+            self._wheel[slot] = []
+            for request_id, attempt in bucket:
+                pending = self._pending.get(request_id)
+                # acknowledged, or already rescheduled by a later attempt
+                if pending is None or pending.attempts != attempt:
+                    continue
+                if attempt > self._retries:
+                    del self._pending[request_id]
+                    self._timeouts += 1
+                    if not pending.future.done():
+                        pending.future.set_exception(
+                            RequestTimeoutError("SNMP inform timed out waiting for a response")
+                        )
+                    self._release()
+                    continue
+                pending.attempts += 1
+                self._retransmits += 1
+                self._schedule(request_id, pending.attempts, now)
+                await self._transmit(pending.data)
+
+    async def _transmit(self, data: bytes) -> None:
+        try:
+            await self._session.client.send(data)
+        except TransportError:
+            # a failed send is handled like a lost datagram
+            pass
+
+    def _fail_pending(self, message: str) -> None:
+        pending, self._pending = self._pending, {}
+        for entry in pending.values():
+            if not entry.future.done():
+                entry.future.set_exception(TransportError(message))
+            self._window.release()
+        self._idle.set()
+
+    def _release(self) -> None:
+        self._window.release()
+        if not self._pending:
+            self._idle.set()
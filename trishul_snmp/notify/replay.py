@@ -0,0 +1,293 @@
+"""Rate-controlled replay of captured notification datagrams."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import re
+import struct
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from trishul_snmp.errors import TransportError
+from trishul_snmp.notify.log import LoggedNotification
+from trishul_snmp.transport.udp import UdpClient
+
+_PCAP_MAGIC_MICROSECONDS = 0xA1B2C3D4
+_PCAP_MAGIC_NANOSECONDS = 0xA1B23C4D
+_PCAP_HEADER_SIZE = 24
+_LINKTYPE_NULL = 0
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_RAW = (12, 14, 101)
+_LINKTYPE_LINUX_SLL = 113
+_LINKTYPE_IPV4 = 228
+_LINKTYPE_IPV6 = 229
+_LINKTYPE_LINUX_SLL2 = 276
+_ETHERTYPE_IPV4 = 0x0800
+_ETHERTYPE_IPV6 = 0x86DD
+_ETHERTYPE_VLAN = (0x8100, 0x88A8)
+_UDP_PROTOCOL = 17
+_HEX_SEPARATORS = re.compile(r"[\s:-]")
+# sends between explicit yields to the event loop while running behind schedule
+_YIELD_EVERY = 256
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayStats:
+    """Outcome of :func:`replay_notifications`.
+
+    *max_lag* is the largest delay, in seconds, between a datagram's scheduled
+    and actual send time; a large value means the target rate was not reached.
+    """
+
+    sent: int
+    errors: int
+    bytes_sent: int
+    elapsed: float
+    max_lag: float
+
+    @property
+    def rate(self) -> float:
+        """Return the achieved send rate in datagrams per second."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+async def replay_notifications(
+    datagrams: Iterable[LoggedNotification | bytes],
+    *,
+    host: str,
+    port: int = 162,
+    speed: float | None = 1.0,
+    rate: float | None = None,
+    max_gap: float | None = None,
+    sockets: int = 4,
+    repeat: int = 1,
+) -> ReplayStats:
+    """Send *datagrams* to *host*/*port* on the original timeline or at a fixed rate.
+
+    Inter-arrival gaps between :class:`LoggedNotification` timestamps are
+    divided by *speed* and capped at *max_gap*; ``speed=None`` sends as fast as
+    possible. *rate* instead spaces datagrams evenly at that many per second.
+    Plain ``bytes`` carry no timestamp and follow their predecessor without a
+    gap. Datagrams are sent unchanged, round-robin over *sockets* connected
+    UDP sockets, and the whole sequence is sent *repeat* times. Send failures
+    are counted rather than raised.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive")
+    if rate is not None and rate <= 0:
+        raise ValueError("rate must be positive")
+    if max_gap is not None and max_gap < 0:
+        raise ValueError("max_gap cannot be negative")
+    if sockets < 1:
+        raise ValueError("sockets must be at least 1")
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    payloads, offsets = _schedule(datagrams, speed=speed, max_gap=max_gap)
+    if rate is not None:
+        offsets = [index / rate for index in range(len(payloads))]
+    # a repeated pass starts one rate interval, or no gap, after the previous one
+    span = (offsets[-1] + (0.0 if rate is None else 1 / rate)) if offsets else 0.0
+    clients = [UdpClient(host, port) for _ in range(sockets)]
+    try:
+        for client in clients:
+            await client.open()
+        return await _send(
+            len(payloads),
+            payloads.__getitem__,
+            offsets.__getitem__,
+            span=span,
+            clients=clients,
+            repeat=repeat,
+        )
+    finally:
+        for client in clients:
+            await client.close()
+
+
+def read_pcap(path: str | Path, *, port: int | None = 162) -> list[LoggedNotification]:
+    """Return the UDP payloads sent to *port* in a libpcap capture, with capture times.
+
+    Ethernet, Linux cooked, loopback, and raw IP captures are supported;
+    ``port=None`` keeps every UDP datagram. IP fragments are skipped.
+    """
+    data = Path(path).expanduser().read_bytes()
+    if len(data) < _PCAP_HEADER_SIZE:
+        raise ValueError(f"File is not a supported pcap capture: {path}")
+    for order in "<>":
+        (magic,) = struct.unpack_from(f"{order}I", data)
+        if magic in (_PCAP_MAGIC_MICROSECONDS, _PCAP_MAGIC_NANOSECONDS):
+            break
+    else:
+        raise ValueError(f"File is not a supported pcap capture: {path}")
+    divisor = 1e9 if magic == _PCAP_MAGIC_NANOSECONDS else 1e6
+    (linktype,) = struct.unpack_from(f"{order}I", data, 20)
+    record = struct.Struct(f"{order}IIII")
+
+    records: list[LoggedNotification] = []
+    offset = _PCAP_HEADER_SIZE
+    while offset + record.size <= len(data):
+        seconds, fraction, captured, _ = record.unpack_from(data, offset)
+        offset += record.size
+        frame = data[offset : offset + captured]
+        offset += captured
+        parsed = _udp_payload(frame, linktype)
+        if parsed is None:
+            continue
+        source, destination_port, payload = parsed
+        if port is None or destination_port == port:
+            records.append(
+                LoggedNotification(
+                    timestamp=seconds + fraction / divisor,
+                    source_address=source,
+                    data=payload,
+                )
+            )
+    return records
+
+
+def read_hex_datagrams(path: str | Path) -> list[bytes]:
+    """Return one datagram per non-empty line of hex in *path*; ``#`` starts a comment line."""
+    datagrams: list[bytes] = []
+    for number, line in enumerate(Path(path).expanduser().read_text().splitlines(), start=1):
+        text = _HEX_SEPARATORS.sub("", line).removeprefix("0x")
+        if not text or text.startswith("#"):
+            continue
+        try:
+            datagrams.append(bytes.fromhex(text))
+        except ValueError as exc:
+            raise ValueError(f"Invalid hex datagram on line {number} of {path}") from exc
+    return datagrams
+
+
+def _schedule(
+    datagrams: Iterable[LoggedNotification | bytes],
+    *,
+    speed: float | None,
+    max_gap: float | None,
+) -> tuple[list[bytes], list[float]]:
+    payloads: list[bytes] = []
+    offsets: list[float] = []
+    offset = 0.0
+    previous: float | None = None
+    for item in datagrams:
+        if isinstance(item, LoggedNotification):
+            if speed is not None and previous is not None:
+                gap = max(0.0, item.timestamp - previous) / speed
+                offset += gap if max_gap is None else min(gap, max_gap)
+            previous = item.timestamp
+            payloads.append(item.data)
+        else:
+            payloads.append(item)
+        offsets.append(offset)
+    return payloads, offsets
+
+
+async def _send(
+    count: int,
+    payload: Callable[[int], bytes],
+    offset: Callable[[int], float],
+    *,
+    span: float,
+    clients: Sequence[UdpClient],
+    repeat: int = 1,
+) -> ReplayStats:
+    """Send *count* payloads, each built only once its *offset* from the start is due."""
+    loop = asyncio.get_running_loop()
+    # without any gaps every datagram is due at once, so lag is not meaningful
+    paced = span > 0
+    sent = errors = bytes_sent = 0
+    max_lag = 0.0
+    behind = 0
+    start = loop.time()
+    for cycle in range(repeat):
+        base = start + cycle * span
+        for index in range(count):
+            due = base + offset(index)
+            now = loop.time()
+            if due > now:
+                await asyncio.sleep(due - now)
+                behind = 0
+            else:
+                if paced:
+                    max_lag = max(max_lag, now - due)
+                behind += 1
+                if behind >= _YIELD_EVERY:
+                    await asyncio.sleep(0)
+                    behind = 0
+            data = payload(index)
+            try:
+                await clients[index % len(clients)].send(data)
+            except TransportError:
+                errors += 1
+                continue
+            sent += 1
+            bytes_sent += len(data)
+    return ReplayStats(
+        sent=sent,
+        errors=errors,
+        bytes_sent=bytes_sent,
+        elapsed=loop.time() - start,
+        max_lag=max_lag,
+    )
+
+
+def _udp_payload(frame: bytes, linktype: int) -> tuple[tuple[str, int], int, bytes] | None:
+    if linktype == _LINKTYPE_ETHERNET:
+        if len(frame) < 14:
+            return None
+        offset = 12
+        (ethertype,) = struct.unpack_from(">H", frame, offset)
+        while ethertype in _ETHERTYPE_VLAN and len(frame) >= offset + 6:
+            offset += 4
+            (ethertype,) = struct.unpack_from(">H", frame, offset)
+        return _ip_payload(frame[offset + 2 :], ethertype)
+    if linktype == _LINKTYPE_LINUX_SLL:
+        if len(frame) < 16:
+            return None
+        return _ip_payload(frame[16:], struct.unpack_from(">H", frame, 14)[0])
+    if linktype == _LINKTYPE_LINUX_SLL2:
+        if len(frame) < 20:
+            return None
+        return _ip_payload(frame[20:], struct.unpack_from(">H", frame, 0)[0])
+    if linktype == _LINKTYPE_NULL:
+        # the host-order address family is skipped; the IP version nibble is enough
+        return _raw_ip_payload(frame[4:])
+    if linktype in _LINKTYPE_RAW or linktype in (_LINKTYPE_IPV4, _LINKTYPE_IPV6):
+        return _raw_ip_payload(frame)
+    return None
+
+
+def _raw_ip_payload(packet: bytes) -> tuple[tuple[str, int], int, bytes] | None:
+    if not packet:
+        return None
+    return _ip_payload(packet, _ETHERTYPE_IPV6 if packet[0] >> 4 == 6 else _ETHERTYPE_IPV4)
+
+
+def _ip_payload(packet: bytes, ethertype: int) -> tuple[tuple[str, int], int, bytes] | None:
+    if ethertype == _ETHERTYPE_IPV4:
+        if len(packet) < 20 or packet[0] >> 4 != 4 or packet[9] != _UDP_PROTOCOL:
+            return None
+        (fragment,) = struct.unpack_from(">H", packet, 6)
+        if fragment & 0x3FFF:
+            return None
+        header = (packet[0] & 0x0F) * 4
+        (total,) = struct.unpack_from(">H", packet, 2)
+        host = str(ipaddress.IPv4Address(packet[12:16]))
+        udp = packet[header:total]
+    elif ethertype == _ETHERTYPE_IPV6:
+        if len(packet) < 40 or packet[0] >> 4 != 6 or packet[6] != _UDP_PROTOCOL:
+            return None
+        (length,) = struct.unpack_from(">H", packet, 4)
+        host = str(ipaddress.IPv6Address(packet[8:24]))
+        udp = packet[40 : 40 + length]
+    else:
+        return None
+    if len(udp) < 8:
+        return None
+    source_port, destination_port, udp_length = struct.unpack_from(">HHH", udp)
+    if udp_length < 8 or udp_length > len(udp):
+        return None
+    return (host, source_port), destination_port, udp[8:udp_length]
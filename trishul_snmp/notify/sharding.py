@@ -0,0 +1,317 @@
+"""Notification listeners sharded across worker processes sharing one UDP port."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from types import TracebackType
+from typing import Any, cast
+
+from trishul_snmp.errors import TransportError
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.mib.loader import load_bundle
+from trishul_snmp.mib.mapped import _MAGIC as _MAPPED_MAGIC
+from trishul_snmp.mib.mapped import load_mapped_bundle
+from trishul_snmp.notify.filter import NotificationFilter
+from trishul_snmp.notify.listener import (
+    SnmpNotificationListener,
+    V3NotificationListener,
+    _BaseNotificationListener,
+)
+from trishul_snmp.security.usm import UsmLocalEngine, UsmUser
+from trishul_snmp.transport.udp import DropPolicy
+from trishul_snmp.types import SocketAddress
+
+_STARTUP_TIMEOUT = 30.0
+_STOP_TIMEOUT = 5.0
+_MAX_PENDING_EVENTS = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerConfig:
+    host: str
+    port: int
+    communities: tuple[str, ...] | None
+    user: UsmUser | None
+    users: tuple[UsmUser, ...]
+    local_engine: UsmLocalEngine | None
+    bundle_source: Path | None
+    max_queue: int
+    drop_policy: DropPolicy
+    recv_buffer_size: int | None
+    notification_filter: NotificationFilter | None
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerStopped:
+    reason: str
+
+
+class ShardedNotificationListener:
+    """Supervisor running one notification listener per worker process on one port.
+
+    Each of *workers* spawned processes binds *host*/*port* with
+    ``SO_REUSEPORT`` and runs a :class:`V2cNotificationListener`, or a
+    :class:`V3NotificationListener` when *local_engine* and *user* or *users*
+    are given, so the kernel spreads decoding, authentication, and decryption
+    across cores. Events reach this process as :meth:`NotificationEvent.to_dict`
+    payloads. With ``port=0`` the first worker picks a free port and the rest
+    join it.
+    A *bundle* is reloaded in every worker from its ``source``, so memory-mapped
+    bundles are shared between them, and a *notification_filter* is copied to
+    each worker so rejected notifications never cross the pipe.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 162,
+        workers: int = 2,
+        communities: Sequence[str] | None = None,
+        user: UsmUser | None = None,
+        users: Sequence[UsmUser] = (),
+        local_engine: UsmLocalEngine | None = None,
+        bundle: MibBundle | None = None,
+        max_queue: int = 0,
+        drop_policy: DropPolicy = DropPolicy.DROP_NEWEST,
+        recv_buffer_size: int | None = None,
+        notification_filter: NotificationFilter | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if (user is None and not users) != (local_engine is None):
+            raise ValueError("local_engine and user or users must be provided together")
+        self._workers = workers
+        self._config = _WorkerConfig(
+            host=host,
+            port=port,
+            communities=None if communities is None else tuple(communities),
+            user=user,
+            users=tuple(users),
+            local_engine=local_engine,
+            bundle_source=None if bundle is None else bundle.source,
+            max_queue=max_queue,
+            drop_policy=drop_policy,
+            recv_buffer_size=recv_buffer_size,
+            notification_filter=notification_filter,
+        )
+        self._processes: list[BaseProcess] = []
+        self._connections: list[Connection] = []
+        self._events: asyncio.Queue[dict[str, Any] | _WorkerStopped] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._local_address: SocketAddress | None = None
+        self._paused = False
+        self._closed = False
+
+    async def __aenter__(self) -> ShardedNotificationListener:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        del exc_type, exc, tb
+        await self.close()
+
+    def __aiter__(self) -> ShardedNotificationListener:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return await self.receive()
+        except TransportError:
+            if self._closed:
+                raise StopAsyncIteration from None
+            raise
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def local_address(self) -> SocketAddress | None:
+        return self._local_address
+
+    async def open(self) -> None:
+        """Start the worker processes and wait until every one has bound the port."""
+        if self._processes:
+            return
+        self._closed = False
+        self._loop = asyncio.get_running_loop()
+        self._events = asyncio.Queue()
+        try:
+            # the first worker resolves port 0 so the others can join its port
+            self._local_address = await self._start_worker(self._config)
+            config = replace(self._config, port=self._local_address[1])
+            await asyncio.gather(*(self._start_worker(config) for _ in range(self._workers - 1)))
+        except BaseException:
+            await self.close()
+            raise
+        for connection in self._connections:
+            self._loop.add_reader(connection.fileno(), self._drain, connection)
+
+    async def close(self) -> None:
+        """Stop every worker process and wake pending receivers."""
+        self._closed = True
+        processes, connections = self._processes, self._connections
+        self._processes, self._connections = [], []
+        self._paused = False
+        loop = self._loop
+        for connection in connections:
+            if loop is not None and not connection.closed:
+                loop.remove_reader(connection.fileno())
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        if loop is not None:
+            await asyncio.gather(
+                *(loop.run_in_executor(None, _stop_process, process) for process in processes)
+            )
+        for connection in connections:
+            connection.close()
+        if self._events is not None:
+            self._events.put_nowait(_WorkerStopped("Sharded listener is closed"))
+
+    async def receive(self) -> dict[str, Any]:
+        """Wait for the next event payload forwarded by any worker."""
+        events = self._events
+        if events is None:
+            raise TransportError("Sharded listener is not open")
+        item = await events.get()
+        if isinstance(item, _WorkerStopped):
+            # Leave the marker queued so every concurrent receiver observes the stop.
+            events.put_nowait(item)
+            raise TransportError(item.reason)
+        if self._paused and events.qsize() < _MAX_PENDING_EVENTS:
+            self._resume_reading()
+        return item
+
+    async def _start_worker(self, config: _WorkerConfig) -> SocketAddress:
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_run_worker, args=(config, sender), daemon=True)
+        process.start()
+        sender.close()
+        self._processes.append(process)
+        self._connections.append(receiver)
+
+        loop = asyncio.get_running_loop()
+        ready = await loop.run_in_executor(None, receiver.poll, _STARTUP_TIMEOUT)
+        try:
+            status, detail = receiver.recv() if ready else ("error", "worker did not start")
+        except EOFError:
+            status, detail = "error", "worker exited during startup"
+        if status != "ready":
+            raise TransportError(f"Notification listener worker failed: {detail}")
+        return cast(SocketAddress, tuple(detail))
+
+    def _drain(self, connection: Connection) -> None:
+        events = self._events
+        assert events is not None
+        try:
+            while connection.poll():
+                events.put_nowait(connection.recv())
+        except (EOFError, OSError):
+            self._drop_connection(connection)
+            return
+        if events.qsize() >= _MAX_PENDING_EVENTS:
+            self._pause_reading()
+
+    def _drop_connection(self, connection: Connection) -> None:
+        assert self._loop is not None and self._events is not None
+        self._loop.remove_reader(connection.fileno())
+        self._connections.remove(connection)
+        connection.close()
+        if not self._connections:
+            self._events.put_nowait(_WorkerStopped("Every notification listener worker exited"))
+
+    def _pause_reading(self) -> None:
+        # leave further events in the worker pipes, which in turn blocks the workers
+        assert self._loop is not None
+        self._paused = True
+        for connection in self._connections:
+            self._loop.remove_reader(connection.fileno())
+
+    def _resume_reading(self) -> None:
+        assert self._loop is not None
+        self._paused = False
+        for connection in self._connections:
+            self._loop.add_reader(connection.fileno(), self._drain, connection)
+
+
+def _stop_process(process: BaseProcess) -> None:
+    process.join(_STOP_TIMEOUT)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _run_worker(config: _WorkerConfig, connection: Connection) -> None:
+    try:
+        asyncio.run(_serve_worker(config, connection))
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        connection.close()
+
+
+async def _serve_worker(config: _WorkerConfig, connection: Connection) -> None:
+    try:
+        listener = _worker_listener(config)
+        await listener.open()
+    except Exception as exc:
+        cause = f" ({exc.__cause__})" if exc.__cause__ is not None else ""
+        connection.send(("error", f"{exc}{cause}"))
+        return
+    connection.send(("ready", listener.local_address))
+    try:
+        async for event in listener:
+            connection.send(event.to_dict())
+    finally:
+        await listener.close()
+
+
+def _worker_listener(config: _WorkerConfig) -> _BaseNotificationListener:
+    bundle = None if config.bundle_source is None else _load_worker_bundle(config.bundle_source)
+    if config.local_engine is not None:
+        return V3NotificationListener(
+            host=config.host,
+            port=config.port,
+            user=config.user,
+            users=config.users,
+            local_engine=config.local_engine,
+            bundle=bundle,
+            max_queue=config.max_queue,
+            drop_policy=config.drop_policy,
+            recv_buffer_size=config.recv_buffer_size,
+            reuse_port=True,
+            notification_filter=config.notification_filter,
+        )
+    return SnmpNotificationListener(
+        host=config.host,
+        port=config.port,
+        communities=config.communities,
+        bundle=bundle,
+        max_queue=config.max_queue,
+        drop_policy=config.drop_policy,
+        recv_buffer_size=config.recv_buffer_size,
+        reuse_port=True,
+        notification_filter=config.notification_filter,
+    )
+
+
+def _load_worker_bundle(source: Path) -> MibBundle:
+    if source.is_file():
+        with source.open("rb") as handle:
+            if handle.read(len(_MAPPED_MAGIC)) == _MAPPED_MAGIC:
+                return load_mapped_bundle(source)
+    return load_bundle(source)
@@ -0,0 +1,310 @@
+"""Pre-encoded notification templates for high-rate trap generation."""
+
+from __future__ import annotations
+
+import hmac
+import time
+from collections.abc import Callable, Sequence
+
+from trishul_snmp._runtime import normalize_targets
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.notify.client import (
+    NotificationVarBindInput,
+    _normalize_notification_target,
+    build_notification_raw_varbinds,
+)
+from trishul_snmp.notify.replay import ReplayStats, _send
+from trishul_snmp.security.usm import (
+    _AUTH_TAG_LEN,
+    PrivProtocol,
+    UsmLocalEngine,
+    UsmModel,
+    UsmUser,
+)
+from trishul_snmp.transport.udp import UdpClient
+from trishul_snmp.types import (
+    OID,
+    IntegerValue,
+    ObjectIdentifierValue,
+    SnmpValueType,
+    TimeTicksValue,
+)
+from trishul_snmp.wire.asn1 import encode_value
+from trishul_snmp.wire.ber import decode_length, encode_tlv
+from trishul_snmp.wire.pdu import PduType
+from trishul_snmp.wire.v3message import UsmParams, encode_v3_message_with_auth_offset
+
+_SEQUENCE_TAG = 0x30
+_OCTET_STRING_TAG = 0x04
+# error-status and error-index, always zero in a trap
+_ERROR_FIELDS = b"\x02\x01\x00\x02\x01\x00"
+_V2C_VERSION = b"\x02\x01\x01"
+_V3_MAX_SIZE = 65507
+# the msgID follows the v3 version INTEGER and the msgGlobalData SEQUENCE header
+_V3_MSG_ID_OFFSET = 5
+_REQUEST_ID_LIMIT = 0x7FFFFFFF
+_TIMETICKS_LIMIT = 1 << 32
+
+
+class TrapTemplate:
+    """An SNMPv2c or SNMPv3 trap encoded once and re-rendered by patching it in place.
+
+    The notification is normalized and encoded when the template is built.
+    Each :meth:`render` re-encodes only the request-id, sysUpTime, and the
+    values of the varbinds listed in *variables*, writing them over the
+    previous ones; the message is only re-assembled when a patched field
+    changes length. Pass *community* for SNMPv2c, or *user* and
+    *local_engine* for SNMPv3, whose localized auth key is derived once and
+    whose HMAC is computed per message. With privacy each message is also
+    encrypted with a fresh salt.
+    """
+
+    def __init__(
+        self,
+        notification: str | Sequence[int],
+        *,
+        community: str | None = None,
+        user: UsmUser | None = None,
+        local_engine: UsmLocalEngine | None = None,
+        context_name: bytes = b"",
+        varbinds: Sequence[NotificationVarBindInput] = (),
+        variables: Sequence[str | Sequence[int]] = (),
+        uptime: int = 0,
+        bundle: MibBundle | None = None,
+    ) -> None:
+        if (community is None) == (user is None):
+            raise ValueError("TrapTemplate requires exactly one of community or user")
+        notification_oid = _normalize_notification_target(notification, bundle=bundle)
+        normalized = build_notification_raw_varbinds(
+            notification_oid, varbinds=varbinds, uptime=uptime, bundle=bundle
+        )
+        oids = [oid for oid, _ in normalized]
+        patched = [0]
+        for target in normalize_targets(tuple(variables), bundle=bundle) if variables else ():
+            # sysUpTime and snmpTrapOID lead the varbinds and are not variables
+            if target not in oids[2:]:
+                raise ValueError(f"Template variable is not a notification varbind: {target}")
+            index = oids.index(target, 2)
+            if index in patched:
+                raise ValueError(f"Duplicate template variable: {target}")
+            patched.append(index)
+
+        self._uptime = uptime
+        self._started = time.monotonic()
+        self._request_id = 0
+        self._oid_prefixes = [encode_value(ObjectIdentifierValue(oids[i])) for i in patched]
+        self._pieces: list[bytes | int] = [
+            1 + patched.index(i) if i in patched else _encode_varbind(oids[i], value)
+            for i, (_, value) in enumerate(normalized)
+        ]
+        # slot 0 is the request-id INTEGER; the others are whole patched varbinds
+        self._slots = [encode_value(IntegerValue(0))] + [
+            _encode_varbind(oids[i], normalized[i][1]) for i in patched
+        ]
+        self._offsets: list[list[int]] = []
+        self._message = bytearray()
+        self._auth_offset: int | None = None
+        self._mac: hmac.HMAC | None = None
+        self._priv = False
+
+        self._model: UsmModel | None = None
+        if user is not None:
+            model = UsmModel(user=user, context_name=context_name, local_engine=local_engine)
+            self._engine = model._select_outbound_engine(PduType.SNMPV2_TRAP)
+            self._flags = model._msg_flags(PduType.SNMPV2_TRAP)
+            self._priv = user.priv_protocol is not PrivProtocol.NONE
+            if model._auth_enabled():
+                self._mac = hmac.new(
+                    model._hmac_key(self._engine.engine_id), digestmod=model._hmac_digest()
+                )
+            self._model = model
+            self._prefix = encode_tlv(_OCTET_STRING_TAG, self._engine.engine_id) + encode_tlv(
+                _OCTET_STRING_TAG, context_name
+            )
+        else:
+            assert community is not None
+            self._prefix = _V2C_VERSION + encode_tlv(_OCTET_STRING_TAG, community.encode())
+        self._assemble()
+
+    @property
+    def variables(self) -> int:
+        """Return the number of values each :meth:`render` may patch."""
+        return len(self._oid_prefixes) - 1
+
+    @property
+    def request_id(self) -> int:
+        """Return the request-id of the most recently rendered message, or 0."""
+        return self._request_id
+
+    def render(
+        self,
+        *,
+        uptime: int | None = None,
+        values: Sequence[SnmpValueType] = (),
+    ) -> bytes:
+        """Return the next encoded trap.
+
+        Request-ids count up from 1. sysUpTime defaults to the template's
+        *uptime* plus the hundredths of a second since it was built. *values*
+        replace the template *variables* in order; when omitted the previous
+        values are kept.
+        """
+        if values and len(values) != self.variables:
+            raise ValueError(f"Expected {self.variables} template values, got {len(values)}")
+        if uptime is None:
+            uptime = self._uptime + int((time.monotonic() - self._started) * 100)
+        request_id = self._request_id % _REQUEST_ID_LIMIT + 1
+        self._request_id = request_id
+        prefixes = self._oid_prefixes
+        slots = [
+            encode_value(IntegerValue(request_id)),
+            encode_tlv(
+                _SEQUENCE_TAG,
+                prefixes[0] + encode_value(TimeTicksValue(uptime % _TIMETICKS_LIMIT)),
+            ),
+        ]
+        if values:
+            slots.extend(
+                encode_tlv(_SEQUENCE_TAG, prefix + encode_value(value))
+                for prefix, value in zip(prefixes[1:], values, strict=True)
+            )
+        else:
+            slots.extend(self._slots[2:])
+
+        resized = any(len(new) != len(old) for new, old in zip(slots, self._slots, strict=True))
+        self._slots = slots
+        if resized:
+            self._assemble()
+        message = self._message
+        if not resized:
+            for slot, data in enumerate(slots):
+                for position in self._offsets[slot]:
+                    message[position : position + len(data)] = data
+
+        if self._priv:
+            return self._encrypted(request_id)
+        offset = self._auth_offset
+        if self._mac is None or offset is None:
+            return bytes(message)
+        # the placeholder stays zeroed in the template so the next HMAC covers it
+        mac = self._mac.copy()
+        mac.update(message)
+        message[offset : offset + _AUTH_TAG_LEN] = mac.digest()[:_AUTH_TAG_LEN]
+        rendered = bytes(message)
+        message[offset : offset + _AUTH_TAG_LEN] = bytes(_AUTH_TAG_LEN)
+        return rendered
+
+    def _assemble(self) -> None:
+        slots = self._slots
+        offsets: list[list[int]] = [[] for _ in slots]
+        parts: list[bytes] = []
+        size = 0
+        for piece in self._pieces:
+            if isinstance(piece, int):
+                offsets[piece].append(size)
+                parts.append(slots[piece])
+            else:
+                parts.append(piece)
+            size += len(parts[-1])
+        content = slots[0] + _ERROR_FIELDS + encode_tlv(_SEQUENCE_TAG, b"".join(parts))
+        pdu = encode_tlv(int(PduType.SNMPV2_TRAP), content)
+        # the varbinds end the PDU, which ends the v2c message or the ScopedPDU
+        message = encode_tlv(_SEQUENCE_TAG, self._prefix + pdu)
+        varbinds_start = len(message) - size
+        self._offsets = [[len(message) - len(content)]] + [
+            [varbinds_start + offset for offset in slot] for slot in offsets[1:]
+        ]
+        self._auth_offset = None
+        if self._model is not None and not self._priv:
+            scoped_start = len(message)
+            message, auth_offset = self._wrap_v3(self._request_id, message, b"")
+            shift = len(message) - scoped_start
+            self._offsets = [[offset + shift for offset in slot] for slot in self._offsets]
+            # the msgID carries the request-id too
+            _, header = decode_length(message, 1)
+            self._offsets[0].append(header + _V3_MSG_ID_OFFSET)
+            if self._mac is not None:
+                self._auth_offset = auth_offset
+        self._message = bytearray(message)
+
+    def _wrap_v3(self, msg_id: int, msg_data: bytes, priv_params: bytes) -> tuple[bytes, int]:
+        assert self._model is not None
+        engine = self._engine
+        usm = UsmParams(
+            engine_id=engine.engine_id,
+            engine_boots=engine.engine_boots,
+            engine_time=engine.engine_time,
+            username=self._model.user.username.encode(),
+            auth_params=bytes(_AUTH_TAG_LEN) if self._mac is not None else b"",
+            priv_params=priv_params,
+        )
+        return encode_v3_message_with_auth_offset(
+            msg_id=msg_id,
+            msg_max_size=_V3_MAX_SIZE,
+            flags=self._flags,
+            usm_params=usm,
+            msg_data_bytes=msg_data,
+        )
+
+    def _encrypted(self, request_id: int) -> bytes:
+        assert self._model is not None
+        priv_params, encrypted = self._model._encrypt_scoped_pdu(bytes(self._message), self._engine)
+        raw, offset = self._wrap_v3(request_id, encrypted, priv_params)
+        # USM privacy always comes with authentication
+        assert self._mac is not None
+        mac = self._mac.copy()
+        mac.update(raw)
+        return raw[:offset] + mac.digest()[:_AUTH_TAG_LEN] + raw[offset + _AUTH_TAG_LEN :]
+
+
+async def blast_traps(
+    template: TrapTemplate,
+    *,
+    host: str,
+    port: int = 162,
+    count: int,
+    rate: float | None = None,
+    sockets: int = 4,
+    values: Callable[[int], Sequence[SnmpValueType]] | None = None,
+) -> ReplayStats:
+    """Send *count* traps rendered from *template* to *host*/*port*.
+
+    Traps are spaced evenly at *rate* per second, or sent as fast as possible
+    when *rate* is ``None``, round-robin over *sockets* connected UDP sockets.
+    Each trap is rendered when it is due; *values*, when given, returns the
+    variable values for the trap at each index. Send failures are counted
+    rather than raised.
+    """
+    if count < 0:
+        raise ValueError("count cannot be negative")
+    if rate is not None and rate <= 0:
+        raise ValueError("rate must be positive")
+    if sockets < 1:
+        raise ValueError("sockets must be at least 1")
+
+    def payload(index: int) -> bytes:
+        if values is None:
+            return template.render()
+        return template.render(values=values(index))
+
+    def offset(index: int) -> float:
+        return 0.0 if rate is None else index / rate
+
+    clients = [UdpClient(host, port) for _ in range(sockets)]
+    try:
+        for client in clients:
+            await client.open()
+        return await _send(
+            count,
+            payload,
+            offset,
+            span=0.0 if rate is None else count / rate,
+            clients=clients,
+        )
+    finally:
+        for client in clients:
+            await client.close()
+
+
+def _encode_varbind(oid: OID, value: SnmpValueType) -> bytes:
+    return encode_tlv(_SEQUENCE_TAG, encode_value(ObjectIdentifierValue(oid)) + encode_value(value))
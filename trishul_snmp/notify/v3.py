@@ -11,6 +11,7 @@ from trishul_snmp.security.usm import (
     UsmLocalEngine,
     UsmModel,
     UsmUser,
+    UsmUserTable,
 )
 from trishul_snmp.types import Counter32Value, NullValue
 from trishul_snmp.wire.asn1 import encode_value
@@ -25,6 +26,7 @@ from trishul_snmp.wire.v3message import (
     decode_v3_message,
     encode_scoped_pdu,
     encode_v3_message,
+    encode_v3_message_with_auth_offset,
 )
 
 _AUTH_TAG_LEN = 12
@@ -47,21 +49,37 @@ class V3NotificationEnvelope:
     security_level: str
 
 
-def decode_v3_notification_message(data: bytes, *, user: UsmUser) -> V3NotificationEnvelope | None:
-    """Decode an inbound SNMPv3 trap or inform for a single configured user.
-
-    Returns ``None`` for wrong-user or non-notification messages. Raises
+def decode_v3_notification_message(
+    data: bytes,
+    *,
+    user: UsmUser | UsmUserTable,
+    view: V3MessageView | None = None,
+) -> V3NotificationEnvelope | None:
+    """Decode an inbound SNMPv3 trap or inform for a configured user.
+
+    *user* is a single user or a :class:`UsmUserTable`, which selects the
+    user by the message username and reuses its localized keys. A *view*
+    already decoded from *data* is used instead of decoding it again. Returns
+    ``None`` for unknown-user or non-notification messages. Raises
     :class:`ProtocolError` or :class:`AuthenticationError` for malformed or
-    auth-failed messages that otherwise target the configured user.
+    auth-failed messages that otherwise target a configured user.
     """
-    view = decode_v3_message(data)
-    if view.usm_params.username != user.username.encode():
+    if view is None:
+        view = decode_v3_message(data)
+    username = view.usm_params.username
+    if isinstance(user, UsmUserTable):
+        selected = user.get(username)
+        if selected is None:
+            return None
+        codec = user.codec(selected, view.usm_params.engine_id)
+    elif username == user.username.encode():
+        selected = user
+        codec = _usm_codec(user=user)
+    else:
         return None
 
     flags = view.msg_flags[0]
-    _validate_security_level(flags, user=user)
-
-    codec = _usm_codec(user=user)
+    _validate_security_level(flags, user=selected)
     if flags & MSG_FLAG_AUTH:
         if len(view.usm_params.auth_params) != _AUTH_TAG_LEN:
             raise ProtocolError(
@@ -99,53 +117,37 @@ def decode_v3_notification_message(data: bytes, *, user: UsmUser) -> V3Notificat
     )
 
 
-def is_discovery_probe(data: bytes) -> bool:
-    """Whether *data* is the empty-engineID discovery probe used by V3Notifier."""
-    try:
-        view = decode_v3_message(data)
-    except ProtocolError:
-        return False
-
-    if view.msg_flags[0] != MSG_FLAG_REPORTABLE:
-        return False
-
-    params = view.usm_params
-    if (
-        params.engine_id
-        or params.engine_boots != 0
-        or params.engine_time != 0
-        or params.username
-        or params.auth_params
-        or params.priv_params
-    ):
-        return False
-
-    try:
-        context_engine_id, context_name, pdu_tag, pdu_content = _decode_scoped_fields(
-            view.msg_data_bytes
-        )
-    except ProtocolError:
-        return False
-
-    if context_engine_id or context_name or pdu_tag != int(PduType.GET):
-        return False
-
-    try:
-        probe = _decode_pdu_bytes(pdu_tag, pdu_content)
-    except ProtocolError:
-        return False
-    if len(probe.varbinds) != 1:
-        return False
+def is_discovery_probe(data: bytes, *, view: V3MessageView | None = None) -> bool:
+    """Whether *data* is the empty-engineID discovery probe used by V3Notifier.
 
-    varbind = probe.varbinds[0]
-    return varbind.oid == _DISCOVERY_PROBE_OID and isinstance(varbind.value, NullValue)
+    A *view* already decoded from *data* is used instead of decoding it again.
+    """
+    if view is None:
+        try:
+            view = decode_v3_message(data)
+        except ProtocolError:
+            return False
+    return _discovery_probe(view) is not None
 
 
-def encode_discovery_report(data: bytes, *, local_engine: UsmLocalEngine) -> bytes:
+def encode_discovery_report(
+    data: bytes,
+    *,
+    local_engine: UsmLocalEngine,
+    view: V3MessageView | None = None,
+) -> bytes:
     """Encode a minimal discovery REPORT for an empty-engineID probe."""
-    view, context_engine_id, context_name, probe = _decode_discovery_probe(data)
+    if view is None:
+        try:
+            view = decode_v3_message(data)
+        except ProtocolError as exc:
+            raise ProtocolError(f"Invalid discovery probe: {exc}") from exc
+    probe = _discovery_probe(view)
+    if probe is None:
+        raise ProtocolError("Invalid discovery probe")
+    context_engine_id, context_name, probe_pdu = probe
     report_pdu = _encode_report_pdu(
-        request_id=probe.request_id,
+        request_id=probe_pdu.request_id,
         error_status=0,
         error_index=0,
         varbinds=(RawVarBind(oid=_DISCOVERY_PROBE_OID, value=Counter32Value(1)),),
@@ -170,15 +172,29 @@ def encode_discovery_report(data: bytes, *, local_engine: UsmLocalEngine) -> byt
 def encode_inform_response(
     envelope: V3NotificationEnvelope,
     *,
-    user: UsmUser,
+    user: UsmUser | UsmUserTable,
     local_engine: UsmLocalEngine,
 ) -> bytes:
-    """Encode a USM RESPONSE that acknowledges an INFORM request."""
+    """Encode a USM RESPONSE that acknowledges an INFORM request.
+
+    With a :class:`UsmUserTable`, the inform's user and its cached codec for
+    *local_engine* are used.
+    """
     if envelope.pdu.pdu_type is not PduType.INFORM_REQUEST:
         raise ProtocolError(
             f"Inform response requires INFORM-REQUEST, found {envelope.pdu.pdu_type.name}"
         )
 
+    if isinstance(user, UsmUserTable):
+        table = user
+        selected = table.get(envelope.view.usm_params.username)
+        if selected is None:
+            raise ProtocolError("Inform user is not in the configured user table")
+        user = selected
+        codec = table.codec(user, local_engine.engine_id)
+    else:
+        codec = _usm_codec(user=user, local_engine=local_engine)
+
     flags = envelope.view.msg_flags[0]
     _validate_security_level(flags, user=user)
 
@@ -195,13 +211,12 @@ def encode_inform_response(
         response_pdu,
     )
 
-    codec = _usm_codec(user=user, local_engine=local_engine)
     priv_params = b""
     if flags & MSG_FLAG_PRIV:
         priv_params, msg_data = codec._encrypt_scoped_pdu(msg_data, local_engine)
 
     auth_params = b"\x00" * _AUTH_TAG_LEN if flags & MSG_FLAG_AUTH else b""
-    raw = encode_v3_message(
+    raw, auth_params_offset = encode_v3_message_with_auth_offset(
         msg_id=envelope.view.msg_id,
         msg_max_size=_MAX_MSG_SIZE,
         flags=flags & (MSG_FLAG_AUTH | MSG_FLAG_PRIV),
@@ -217,7 +232,7 @@ def encode_inform_response(
     )
 
     if flags & MSG_FLAG_AUTH:
-        raw = codec._stamp_auth(raw, local_engine.engine_id)
+        raw = codec._stamp_auth(raw, local_engine.engine_id, auth_params_offset)
     return raw
 
 
@@ -265,24 +280,37 @@ def _usm_codec(*, user: UsmUser, local_engine: UsmLocalEngine | None = None) ->
     return UsmModel(user=user, local_engine=local_engine)
 
 
-def _decode_discovery_probe(data: bytes) -> tuple[V3MessageView, bytes, bytes, Pdu]:
+def _discovery_probe(view: V3MessageView) -> tuple[bytes, bytes, Pdu] | None:
+    if view.msg_flags[0] != MSG_FLAG_REPORTABLE:
+        return None
+
+    params = view.usm_params
+    if (
+        params.engine_id
+        or params.engine_boots != 0
+        or params.engine_time != 0
+        or params.username
+        or params.auth_params
+        or params.priv_params
+    ):
+        return None
+
     try:
-        view = decode_v3_message(data)
         context_engine_id, context_name, pdu_tag, pdu_content = _decode_scoped_fields(
             view.msg_data_bytes
         )
-    except ProtocolError as exc:
-        raise ProtocolError(f"Invalid discovery probe: {exc}") from exc
-
-    if not is_discovery_probe(data):
-        raise ProtocolError("Invalid discovery probe")
+        if context_engine_id or context_name or pdu_tag != int(PduType.GET):
+            return None
+        probe = _decode_pdu_bytes(pdu_tag, pdu_content)
+    except ProtocolError:
+        return None
+    if len(probe.varbinds) != 1:
+        return None
 
-    return (
-        view,
-        context_engine_id,
-        context_name,
-        _decode_pdu_bytes(pdu_tag, pdu_content),
-    )
+    varbind = probe.varbinds[0]
+    if varbind.oid != _DISCOVERY_PROBE_OID or not isinstance(varbind.value, NullValue):
+        return None
+    return context_engine_id, context_name, probe
 
 
 def _decode_notification_scoped_pdu(data: bytes) -> tuple[bytes, bytes, Pdu | None]:
@@ -355,6 +383,9 @@ def _encode_varbind_list(varbinds: tuple[RawVarBind, ...]) -> bytes:
 
 
 def _encode_varbind(varbind: RawVarBind) -> bytes:
+    if varbind.encoded is not None:
+        return varbind.encoded
+
     from trishul_snmp.types import ObjectIdentifierValue
 
     return encode_tlv(
@@ -1,5 +1,6 @@
 """Responder APIs."""
 
+from trishul_snmp.responder.farm import FarmAgent, ResponderFarm
 from trishul_snmp.responder.rules import (
     CounterRule,
     RandomNumericRule,
@@ -7,21 +8,40 @@ from trishul_snmp.responder.rules import (
     TimestampRule,
     UptimeRule,
 )
-from trishul_snmp.responder.server import V2cResponder
+from trishul_snmp.responder.server import ResponderStats, V2cResponder
+from trishul_snmp.responder.snapshot import SnapshotSource, record_snapshot, write_snapshot
 from trishul_snmp.responder.sources import (
+    AsyncCallbackObjectSource,
+    AsyncResponderSource,
     CallbackObjectSource,
     InMemoryObjectSource,
+    OverlayObjectSource,
+    RangeSource,
     ResponderSource,
+    VarBindSource,
 )
+from trishul_snmp.responder.virtual import VirtualTableSource
 
 __all__ = [
+    "AsyncCallbackObjectSource",
+    "AsyncResponderSource",
     "CallbackObjectSource",
     "CounterRule",
+    "FarmAgent",
     "InMemoryObjectSource",
+    "OverlayObjectSource",
     "RandomNumericRule",
+    "RangeSource",
+    "ResponderFarm",
     "ResponderSource",
+    "ResponderStats",
     "SimulationRule",
+    "SnapshotSource",
     "TimestampRule",
     "UptimeRule",
     "V2cResponder",
+    "VarBindSource",
+    "VirtualTableSource",
+    "record_snapshot",
+    "write_snapshot",
 ]
@@ -0,0 +1,136 @@
+"""Blocked sorted OID container for large responder object stores."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+
+from trishul_snmp.types import OID
+
+_LOAD = 1000
+
+
+class SortedOidIndex:
+    """Sorted set of OIDs stored as a list of bounded, individually sorted blocks.
+
+    Locating a block is a bisect over block maxima and each block holds at most
+    ``2 * _LOAD`` OIDs, so insert, delete, and successor lookups stay
+    logarithmic in practice instead of shifting one list of every OID.
+    """
+
+    __slots__ = ("_blocks", "_maxes", "_len")
+
+    def __init__(self, oids: Iterable[OID] = ()) -> None:
+        self._blocks: list[list[OID]] = []
+        self._maxes: list[OID] = []
+        self._len = 0
+        self._rebuild(sorted(set(oids)))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[OID]:
+        for block in self._blocks:
+            yield from block
+
+    def add(self, oid: OID) -> None:
+        """Insert *oid*; the caller guarantees it is not already present."""
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([oid])
+            maxes.append(oid)
+            self._len = 1
+            return
+
+        position = bisect_left(maxes, oid)
+        if position == len(maxes):
+            position -= 1
+            self._blocks[position].append(oid)
+            maxes[position] = oid
+        else:
+            insort(self._blocks[position], oid)
+        self._len += 1
+        if len(self._blocks[position]) > 2 * _LOAD:
+            self._split(position)
+
+    def update(self, oids: Iterable[OID]) -> None:
+        """Insert many new OIDs, re-sorting once when the batch is large."""
+        values = list(oids)
+        if len(values) * 4 >= self._len:
+            values.extend(self)
+            self._rebuild(sorted(values))
+            return
+        for oid in values:
+            self.add(oid)
+
+    def discard(self, oid: OID) -> bool:
+        """Remove *oid* when present and report whether it was removed."""
+        maxes = self._maxes
+        position = bisect_left(maxes, oid)
+        if position == len(maxes):
+            return False
+        block = self._blocks[position]
+        index = bisect_left(block, oid)
+        if index == len(block) or block[index] != oid:
+            return False
+
+        del block[index]
+        self._len -= 1
+        if not block:
+            del self._blocks[position]
+            del maxes[position]
+        else:
+            maxes[position] = block[-1]
+            if len(block) < _LOAD // 2 and len(self._blocks) > 1:
+                self._merge(position)
+        return True
+
+    def successor(self, oid: OID) -> OID | None:
+        """Return the smallest stored OID strictly greater than *oid*."""
+        position = bisect_right(self._maxes, oid)
+        if position == len(self._maxes):
+            return None
+        block = self._blocks[position]
+        return block[bisect_right(block, oid)]
+
+    def iter_from(self, oid: OID) -> Iterator[OID]:
+        """Yield stored OIDs strictly greater than *oid* after a single search.
+
+        The index must not be mutated while the iterator is being consumed.
+        """
+        blocks = self._blocks
+        position = bisect_right(self._maxes, oid)
+        if position == len(blocks):
+            return
+        block = blocks[position]
+        for index in range(bisect_right(block, oid), len(block)):
+            yield block[index]
+        for following in range(position + 1, len(blocks)):
+            yield from blocks[following]
+
+    def clear(self) -> None:
+        """Remove every OID."""
+        self._blocks.clear()
+        self._maxes.clear()
+        self._len = 0
+
+    def _rebuild(self, ordered: list[OID]) -> None:
+        self._blocks = [ordered[start : start + _LOAD] for start in range(0, len(ordered), _LOAD)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(ordered)
+
+    def _split(self, position: int) -> None:
+        block = self._blocks[position]
+        half = block[_LOAD:]
+        del block[_LOAD:]
+        self._blocks.insert(position + 1, half)
+        self._maxes[position] = block[-1]
+        self._maxes.insert(position + 1, half[-1])
+
+    def _merge(self, position: int) -> None:
+        if position == len(self._blocks) - 1:
+            position -= 1
+        self._blocks[position].extend(self._blocks.pop(position + 1))
+        self._maxes[position] = self._maxes.pop(position + 1)
+        if len(self._blocks[position]) > 2 * _LOAD:
+            self._split(position)
@@ -0,0 +1,223 @@
+"""Many simulated SNMPv2c agents served from one event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections.abc import Sequence
+from functools import partial
+from types import TracebackType
+from typing import cast
+
+from trishul_snmp.errors import ProtocolError, TransportError
+from trishul_snmp.responder.server import (
+    _DEFAULT_MAX_RESPONSE_SIZE,
+    _MIN_RESPONSE_SIZE,
+    ResponderStats,
+    _community_allowed,
+    _normalize_communities,
+    _RequestHandler,
+)
+from trishul_snmp.responder.sources import ResponderSource
+from trishul_snmp.types import SocketAddress
+from trishul_snmp.wire.message import decode_message, encode_message
+
+
+class FarmAgent(_RequestHandler):
+    """One simulated agent endpoint owned by a :class:`ResponderFarm`."""
+
+    __slots__ = ("host", "port", "_transport")
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        source: ResponderSource,
+        *,
+        max_response_size: int = _DEFAULT_MAX_RESPONSE_SIZE,
+    ) -> None:
+        if inspect.iscoroutinefunction(source.lookup_exact):
+            raise TypeError("ResponderFarm agents require synchronous sources")
+        super().__init__(source, max_response_size=max_response_size)
+        self.host = host
+        self.port = port
+        self._transport: asyncio.DatagramTransport | None = None
+
+    @property
+    def local_address(self) -> SocketAddress | None:
+        if self._transport is None:
+            return None
+        sockname = self._transport.get_extra_info("sockname")
+        if (
+            isinstance(sockname, tuple)
+            and len(sockname) >= 2
+            and isinstance(sockname[0], str)
+            and isinstance(sockname[1], int)
+        ):
+            return cast(SocketAddress, sockname)
+        return None
+
+
+class _FarmProtocol(asyncio.DatagramProtocol):
+    __slots__ = ("_farm", "_agent")
+
+    def __init__(self, farm: ResponderFarm, agent: FarmAgent) -> None:
+        self._farm = farm
+        self._agent = agent
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._agent._transport = cast(asyncio.DatagramTransport, transport)
+
+    def datagram_received(self, data: bytes, addr: tuple[object, ...]) -> None:
+        self._farm._handle_datagram(self._agent, data, addr)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        del exc
+        self._agent._transport = None
+
+
+class ResponderFarm:
+    """Serve many read-only SNMPv2c agents, one UDP endpoint each, from one loop.
+
+    Requests are answered inline from the datagram callback, so an agent costs
+    one socket and a few small objects rather than a responder, queue, and task.
+    Pair with :class:`~trishul_snmp.responder.sources.OverlayObjectSource` to
+    share a single object tree and its encoded varbind cache across agents.
+    """
+
+    def __init__(
+        self,
+        *,
+        communities: Sequence[str] | None = None,
+        max_response_size: int = _DEFAULT_MAX_RESPONSE_SIZE,
+    ) -> None:
+        if max_response_size < _MIN_RESPONSE_SIZE:
+            raise ValueError(f"max_response_size must be at least {_MIN_RESPONSE_SIZE}")
+        self._communities = _normalize_communities(communities)
+        self._max_response_size = max_response_size
+        self._agents: list[FarmAgent] = []
+        self._closed: asyncio.Event | None = None
+        self._received = 0
+        self._responded = 0
+        self._discarded = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._stats_started = time.perf_counter()
+
+    async def __aenter__(self) -> ResponderFarm:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        del exc_type, exc, tb
+        await self.close()
+
+    @property
+    def agents(self) -> tuple[FarmAgent, ...]:
+        return tuple(self._agents)
+
+    @property
+    def stats(self) -> ResponderStats:
+        """Return request counters, throughput, and latency across all agents."""
+        return ResponderStats(
+            received=self._received,
+            responded=self._responded,
+            discarded=self._discarded,
+            in_flight=0,
+            elapsed=time.perf_counter() - self._stats_started,
+            total_latency=self._total_latency,
+            max_latency=self._max_latency,
+        )
+
+    def add_agent(
+        self,
+        source: ResponderSource,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> FarmAgent:
+        """Register an agent endpoint to be bound when the farm opens."""
+        if self._closed is not None:
+            raise RuntimeError("Agents must be added before the farm is opened")
+        agent = FarmAgent(host, port, source, max_response_size=self._max_response_size)
+        self._agents.append(agent)
+        return agent
+
+    async def open(self) -> None:
+        """Bind every registered agent endpoint."""
+        if self._closed is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._closed = asyncio.Event()
+        for agent in self._agents:
+            try:
+                await loop.create_datagram_endpoint(
+                    partial(_FarmProtocol, self, agent),
+                    local_addr=(agent.host, agent.port),
+                )
+            except OSError as exc:
+                await self.close()
+                raise TransportError(
+                    f"Unable to bind UDP server socket on {agent.host}:{agent.port}"
+                ) from exc
+        self._reset_stats()
+
+    async def close(self) -> None:
+        """Close every agent endpoint."""
+        closed = self._closed
+        self._closed = None
+        for agent in self._agents:
+            if agent._transport is not None:
+                agent._transport.close()
+                agent._transport = None
+        if closed is not None:
+            closed.set()
+
+    async def serve_forever(self) -> None:
+        """Wait until the farm is closed; requests are answered as they arrive."""
+        if self._closed is None:
+            raise TransportError("Responder farm is not open")
+        await self._closed.wait()
+
+    def _handle_datagram(self, agent: FarmAgent, data: bytes, addr: tuple[object, ...]) -> None:
+        started = time.perf_counter()
+        self._received += 1
+        try:
+            message = decode_message(data)
+        except ProtocolError:
+            self._discarded += 1
+            return
+        if not _community_allowed(communities=self._communities, community=message.community):
+            self._discarded += 1
+            return
+
+        response = agent._build_response_message(message)
+        transport = agent._transport
+        if response is None or transport is None:
+            self._discarded += 1
+            return
+        try:
+            transport.sendto(encode_message(response), addr)
+        except OSError:
+            self._discarded += 1
+            return
+
+        latency = time.perf_counter() - started
+        self._responded += 1
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+
+    def _reset_stats(self) -> None:
+        self._received = 0
+        self._responded = 0
+        self._discarded = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._stats_started = time.perf_counter()
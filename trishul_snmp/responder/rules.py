@@ -28,8 +28,50 @@ class SimulationRule(Protocol):
         ...
 
 
-class CounterRule:
-    """Monotonically increasing counter, incremented on each read."""
+class _TickCachedRule:
+    """Shared *ttl* caching and batched reads for the built-in rules.
+
+    With ``ttl > 0`` a rule is evaluated at most once per *ttl* seconds and the
+    same value object is returned for every read inside that tick.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        if ttl < 0:
+            raise ValueError("ttl cannot be negative")
+        self._ttl = ttl
+        self._cached: SnmpValueType | None = None
+        self._expires = 0.0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def get_value(self) -> SnmpValueType:
+        if not self._ttl:
+            return self._evaluate()
+        now = time.monotonic()
+        if self._cached is None or now >= self._expires:
+            self._cached = self._evaluate()
+            self._expires = now + self._ttl
+        return self._cached
+
+    def get_values(self, count: int) -> list[SnmpValueType]:
+        """Return *count* consecutive reads, evaluated in one batch."""
+        if count <= 0:
+            return []
+        if self._ttl:
+            return [self.get_value()] * count
+        return self._evaluate_many(count)
+
+    def _evaluate(self) -> SnmpValueType:
+        raise NotImplementedError
+
+    def _evaluate_many(self, count: int) -> list[SnmpValueType]:
+        return [self._evaluate() for _ in range(count)]
+
+
+class CounterRule(_TickCachedRule):
+    """Monotonically increasing counter, incremented on each read (or tick with *ttl*)."""
 
     def __init__(
         self,
@@ -37,19 +79,29 @@ class CounterRule:
         start: int = 0,
         increment: int = 1,
         value_type: _IntConstructible = Counter32Value,
+        ttl: float = 0.0,
     ) -> None:
+        super().__init__(ttl)
         self._current = start
         self._increment = increment
         self._value_type = value_type
 
-    def get_value(self) -> SnmpValueType:
+    def _evaluate(self) -> SnmpValueType:
         value = self._current
         self._current += self._increment
         return self._value_type(value)
 
+    def _evaluate_many(self, count: int) -> list[SnmpValueType]:
+        start, increment = self._current, self._increment
+        self._current += increment * count
+        if not increment:
+            return [self._value_type(start)] * count
+        value_type = self._value_type
+        return [value_type(value) for value in range(start, self._current, increment)]
+
 
-class RandomNumericRule:
-    """Random integer in a range, re-sampled on each read."""
+class RandomNumericRule(_TickCachedRule):
+    """Random integer in a range, re-sampled on each read (or tick with *ttl*)."""
 
     def __init__(
         self,
@@ -57,39 +109,55 @@ class RandomNumericRule:
         min: int,
         max: int,
         value_type: _IntConstructible = Gauge32Value,
+        ttl: float = 0.0,
     ) -> None:
+        super().__init__(ttl)
         self._min = min
         self._max = max
         self._value_type = value_type
 
-    def get_value(self) -> SnmpValueType:
+    def _evaluate(self) -> SnmpValueType:
         return self._value_type(random.randint(self._min, self._max))
 
+    def _evaluate_many(self, count: int) -> list[SnmpValueType]:
+        value_type = self._value_type
+        population = range(self._min, self._max + 1)
+        return [value_type(value) for value in random.choices(population, k=count)]
+
 
-class UptimeRule:
+class UptimeRule(_TickCachedRule):
     """Auto-incrementing timeticks (centiseconds) since construction."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, ttl: float = 0.0) -> None:
+        super().__init__(ttl)
         self._start = time.monotonic()
 
-    def get_value(self) -> SnmpValueType:
+    def _evaluate(self) -> SnmpValueType:
         elapsed_cs = int((time.monotonic() - self._start) * 100)
         return TimeTicksValue(elapsed_cs)
 
+    def _evaluate_many(self, count: int) -> list[SnmpValueType]:
+        return [self._evaluate()] * count
+
 
-class TimestampRule:
+class TimestampRule(_TickCachedRule):
     """Current Unix epoch time as a scalar value."""
 
     def __init__(
         self,
         *,
         value_type: _IntConstructible = IntegerValue,
+        ttl: float = 0.0,
     ) -> None:
+        super().__init__(ttl)
         self._value_type = value_type
 
-    def get_value(self) -> SnmpValueType:
+    def _evaluate(self) -> SnmpValueType:
         return self._value_type(int(time.time()))
 
+    def _evaluate_many(self, count: int) -> list[SnmpValueType]:
+        return [self._evaluate()] * count
+
 
 __all__ = [
     "CounterRule",
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import asyncio
+import inspect
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from itertools import chain, islice
+from operator import attrgetter
 from types import TracebackType
+from typing import TypeAlias, cast
 
 from trishul_snmp.errors import ProtocolError, TransportError
 from trishul_snmp.mib.bundle import MibBundle
 from trishul_snmp.responder.sources import (
+    AsyncResponderSource,
     InMemoryObjectSource,
     ObjectInput,
+    RangeSource,
     ResponderSource,
+    VarBindSource,
 )
-from trishul_snmp.transport.udp import UdpServer
+from trishul_snmp.transport.udp import ReceivedDatagram, UdpServer
 from trishul_snmp.types import (
     OID,
     EndOfMibViewValue,
@@ -22,122 +33,145 @@ from trishul_snmp.types import (
     SocketAddress,
 )
 from trishul_snmp.wire.message import SnmpMessage, decode_message, encode_message
-from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind
+from trishul_snmp.wire.pdu import Pdu, PduType, RawVarBind, build_encoded_varbind
+
+_RequestKey: TypeAlias = tuple[SocketAddress, int]
+
+# largest IPv4 UDP payload; RFC 3417 requires accepting at least 484 octets
+_DEFAULT_MAX_RESPONSE_SIZE = 65507
+_MIN_RESPONSE_SIZE = 484
+# Envelope bytes around the varbinds, excluding the community string: three
+# SEQUENCE-style headers of up to 4 octets, version, request-id (Integer32),
+# error-status, error-index, and the community header of up to 4 octets.
+_RESPONSE_OVERHEAD = 3 * 4 + 3 + 6 + 3 + 3 + 4
+# SEQUENCE header, one-octet OBJECT IDENTIFIER, and an empty value
+_MIN_VARBIND_SIZE = 7
+_ENCODED = attrgetter("encoded")
+
+
+@dataclass(frozen=True, slots=True)
+class ResponderStats:
+    """Point-in-time responder counters since the socket was opened."""
+
+    received: int
+    responded: int
+    discarded: int
+    in_flight: int
+    elapsed: float
+    total_latency: float
+    max_latency: float
 
+    @property
+    def throughput(self) -> float:
+        """Responses sent per second of elapsed serving time."""
+        return self.responded / self.elapsed if self.elapsed > 0 else 0.0
 
-class V2cResponder:
-    """Async SNMPv2c read-only responder for simulator-style use cases."""
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds between dequeuing a request and sending its response."""
+        return self.total_latency / self.responded if self.responded else 0.0
 
-    def __init__(
-        self,
-        *,
-        host: str = "0.0.0.0",
-        port: int = 161,
-        communities: Sequence[str] | None = None,
-        source: ResponderSource | None = None,
-        objects: Iterable[ObjectInput] = (),
-        bundle: MibBundle | None = None,
-    ) -> None:
-        if source is not None and tuple(objects):
-            raise ValueError("objects cannot be used when source is provided")
 
-        self._server = UdpServer(host, port)
-        self._communities = _normalize_communities(communities)
-        self._closed = False
-        self._source: ResponderSource
-        if source is None:
-            self._source = InMemoryObjectSource(bundle=bundle, objects=objects)
-        else:
-            self._source = source
-
-    async def __aenter__(self) -> V2cResponder:
-        await self.open()
-        return self
+@dataclass(slots=True)
+class _InflightRequest:
+    lock: asyncio.Lock
+    users: int = 0
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc: BaseException | None,
-        tb: TracebackType | None,
-    ) -> None:
-        del exc_type, exc, tb
-        await self.close()
 
-    @property
-    def local_address(self) -> SocketAddress | None:
-        return self._server.local_address
+class _ResponseBudget:
+    """Remaining encoded varbind bytes a response may still carry."""
 
-    @property
-    def source(self) -> ResponderSource:
-        return self._source
+    __slots__ = ("remaining",)
 
-    async def open(self) -> None:
-        """Bind the responder socket."""
-        self._closed = False
-        await self._server.open()
+    def __init__(self, remaining: int) -> None:
+        self.remaining = remaining
 
-    async def close(self) -> None:
-        """Close the responder socket."""
-        self._closed = True
-        await self._server.close()
+    def repetition_limit(self, max_repetitions: int, repeaters: int) -> int:
+        """Cap *max_repetitions* at the most repetitions that could possibly fit."""
+        if not repeaters:
+            return 0
+        fitting = -(-self.remaining // (_MIN_VARBIND_SIZE * repeaters))
+        return min(max_repetitions, fitting)
 
-    async def serve(self, *, count: int = 0) -> int:
-        """Serve up to *count* requests, or run until closed when count is ``0``."""
-        if count < 0:
-            raise ValueError("count cannot be negative")
+    def fit(self, varbinds: list[RawVarBind]) -> bool:
+        """Encode *varbinds* in place, drop those past the budget, and report if all fit."""
+        try:
+            size = sum(map(len, map(_ENCODED, varbinds)))
+        except TypeError:
+            pass  # some varbinds are not pre-encoded yet
+        else:
+            if size <= self.remaining:
+                self.remaining -= size
+                return True
+        remaining = self.remaining
+        for position, varbind in enumerate(varbinds):
+            encoded = varbind.encoded
+            if encoded is None:
+                varbind = varbinds[position] = build_encoded_varbind(varbind.oid, varbind.value)
+                encoded = cast(bytes, varbind.encoded)
+            if len(encoded) > remaining:
+                del varbinds[position:]
+                return False
+            remaining -= len(encoded)
+        self.remaining = remaining
+        return True
 
-        handled = 0
-        while count == 0 or handled < count:
-            try:
-                await self.handle_request()
-            except TransportError:
-                if self._closed:
-                    return handled
-                raise
-            handled += 1
-        return handled
 
-    async def serve_forever(self) -> None:
-        """Serve requests until the responder is closed."""
-        await self.serve(count=0)
+class _RequestHandler:
+    """Build read-only responses for one responder source."""
 
-    async def handle_request(self) -> None:
-        """Wait for and handle the next supported request."""
-        while True:
-            datagram = await self._server.receive()
-            try:
-                message = decode_message(datagram.data)
-            except ProtocolError:
-                continue
-            if not _community_allowed(communities=self._communities, community=message.community):
-                continue
+    __slots__ = (
+        "_source",
+        "_varbind_source",
+        "_range_source",
+        "_async_source",
+        "_max_response_size",
+    )
 
-            response = self._build_response_message(message)
-            if response is None:
-                continue
+    def __init__(
+        self,
+        source: ResponderSource | AsyncResponderSource,
+        *,
+        max_response_size: int = _DEFAULT_MAX_RESPONSE_SIZE,
+    ) -> None:
+        if max_response_size < _MIN_RESPONSE_SIZE:
+            raise ValueError(f"max_response_size must be at least {_MIN_RESPONSE_SIZE}")
+        self._source = source
+        self._varbind_source = source if isinstance(source, VarBindSource) else None
+        self._range_source = source if isinstance(source, RangeSource) else None
+        self._async_source: AsyncResponderSource | None = None
+        if inspect.iscoroutinefunction(source.lookup_exact):
+            self._async_source = cast(AsyncResponderSource, source)
+        self._max_response_size = max_response_size
 
-            await self._server.sendto(encode_message(response), datagram.source_address)
-            return None
+    @property
+    def source(self) -> ResponderSource | AsyncResponderSource:
+        return self._source
 
-    def set_object(self, target: str | Sequence[int], value: SnmpValueType) -> OID:
-        """Set an object value when using the default in-memory source."""
-        return self._require_in_memory_source().set_object(target, value)
+    @property
+    def max_response_size(self) -> int:
+        """Return the largest encoded response message this handler will build."""
+        return self._max_response_size
 
-    def set_objects(self, objects: Iterable[ObjectInput]) -> tuple[OID, ...]:
-        """Set multiple object values when using the default in-memory source."""
-        return self._require_in_memory_source().set_objects(objects)
+    def _build_response_message(self, message: SnmpMessage) -> SnmpMessage | None:
+        budget = self._response_budget(message)
+        return self._response_message(message, self._build_response_pdu(message.pdu, budget))
 
-    def clear_objects(self) -> None:
-        """Clear all objects when using the default in-memory source."""
-        self._require_in_memory_source().clear()
+    async def _build_response_message_async(self, message: SnmpMessage) -> SnmpMessage | None:
+        budget = self._response_budget(message)
+        return self._response_message(
+            message, await self._build_response_pdu_async(message.pdu, budget)
+        )
 
-    def _require_in_memory_source(self) -> InMemoryObjectSource:
-        if isinstance(self._source, InMemoryObjectSource):
-            return self._source
-        raise TypeError("Responder is not using an InMemoryObjectSource")
+    def _response_budget(self, message: SnmpMessage) -> _ResponseBudget:
+        overhead = _RESPONSE_OVERHEAD + len(message.community.encode("utf-8"))
+        return _ResponseBudget(self._max_response_size - overhead)
 
-    def _build_response_message(self, message: SnmpMessage) -> SnmpMessage | None:
-        response_pdu = self._build_response_pdu(message.pdu)
+    def _response_message(
+        self,
+        message: SnmpMessage,
+        response_pdu: Pdu | None,
+    ) -> SnmpMessage | None:
         if response_pdu is None:
             return None
         return SnmpMessage(
@@ -146,27 +180,85 @@ class V2cResponder:
             pdu=response_pdu,
         )
 
-    def _build_response_pdu(self, request_pdu: Pdu) -> Pdu | None:
+    def _build_response_pdu(
+        self,
+        request_pdu: Pdu,
+        budget: _ResponseBudget | None = None,
+    ) -> Pdu | None:
         if request_pdu.pdu_type is PduType.GET:
             response_varbinds = tuple(
                 self._lookup_exact_varbind(varbind.oid) for varbind in request_pdu.varbinds
             )
-            return self._response_pdu(request_pdu, varbinds=response_varbinds)
+            return self._sized_response_pdu(request_pdu, response_varbinds, budget)
 
         if request_pdu.pdu_type is PduType.GET_NEXT:
             response_varbinds = tuple(
                 self._lookup_next_varbind(varbind.oid) for varbind in request_pdu.varbinds
             )
-            return self._response_pdu(request_pdu, varbinds=response_varbinds)
+            return self._sized_response_pdu(request_pdu, response_varbinds, budget)
 
         if request_pdu.pdu_type is PduType.GET_BULK:
             response_varbinds = self._build_bulk_varbinds(
                 request_pdu.varbinds,
                 non_repeaters=request_pdu.error_status,
                 max_repetitions=request_pdu.error_index,
+                budget=budget,
             )
             return self._response_pdu(request_pdu, varbinds=response_varbinds)
 
+        return self._build_write_response_pdu(request_pdu)
+
+    async def _build_response_pdu_async(
+        self,
+        request_pdu: Pdu,
+        budget: _ResponseBudget | None = None,
+    ) -> Pdu | None:
+        if request_pdu.pdu_type is PduType.GET:
+            response_varbinds = tuple(
+                [
+                    await self._lookup_exact_varbind_async(varbind.oid)
+                    for varbind in request_pdu.varbinds
+                ]
+            )
+            return self._sized_response_pdu(request_pdu, response_varbinds, budget)
+
+        if request_pdu.pdu_type is PduType.GET_NEXT:
+            response_varbinds = tuple(
+                [
+                    await self._lookup_next_varbind_async(varbind.oid)
+                    for varbind in request_pdu.varbinds
+                ]
+            )
+            return self._sized_response_pdu(request_pdu, response_varbinds, budget)
+
+        if request_pdu.pdu_type is PduType.GET_BULK:
+            response_varbinds = await self._build_bulk_varbinds_async(
+                request_pdu.varbinds,
+                non_repeaters=request_pdu.error_status,
+                max_repetitions=request_pdu.error_index,
+                budget=budget,
+            )
+            return self._response_pdu(request_pdu, varbinds=response_varbinds)
+
+        return self._build_write_response_pdu(request_pdu)
+
+    def _sized_response_pdu(
+        self,
+        request_pdu: Pdu,
+        varbinds: tuple[RawVarBind, ...],
+        budget: _ResponseBudget | None,
+    ) -> Pdu:
+        if budget is None:
+            return self._response_pdu(request_pdu, varbinds=varbinds)
+        sized = list(varbinds)
+        if not budget.fit(sized):
+            # RFC 3416 4.2.1: an oversized response becomes an empty tooBig
+            return self._response_pdu(
+                request_pdu, varbinds=(), error_status=int(ErrorStatus.TOO_BIG)
+            )
+        return self._response_pdu(request_pdu, varbinds=tuple(sized))
+
+    def _build_write_response_pdu(self, request_pdu: Pdu) -> Pdu | None:
         if request_pdu.pdu_type is PduType.SET:
             return self._response_pdu(
                 request_pdu,
@@ -194,17 +286,33 @@ class V2cResponder:
         )
 
     def _lookup_exact_varbind(self, oid: OID) -> RawVarBind:
-        value = self._source.lookup_exact(oid)
-        if value is None:
-            return RawVarBind(oid=oid, value=NoSuchObjectValue())
-        return RawVarBind(oid=oid, value=value)
+        if self._varbind_source is not None:
+            varbind = self._varbind_source.lookup_exact_varbind(oid)
+            if varbind is None:
+                return RawVarBind(oid=oid, value=NoSuchObjectValue())
+            return varbind
+        return _exact_varbind(oid, self._require_sync_source().lookup_exact(oid))
 
     def _lookup_next_varbind(self, oid: OID) -> RawVarBind:
-        match = self._source.lookup_next(oid)
-        if match is None:
-            return RawVarBind(oid=oid, value=EndOfMibViewValue())
-        next_oid, value = match
-        return RawVarBind(oid=next_oid, value=value)
+        if self._varbind_source is not None:
+            varbind = self._varbind_source.lookup_next_varbind(oid)
+            if varbind is None:
+                return RawVarBind(oid=oid, value=EndOfMibViewValue())
+            return varbind
+        return _next_varbind(oid, self._require_sync_source().lookup_next(oid))
+
+    async def _lookup_exact_varbind_async(self, oid: OID) -> RawVarBind:
+        source = cast(AsyncResponderSource, self._async_source)
+        return _exact_varbind(oid, await source.lookup_exact(oid))
+
+    async def _lookup_next_varbind_async(self, oid: OID) -> RawVarBind:
+        source = cast(AsyncResponderSource, self._async_source)
+        return _next_varbind(oid, await source.lookup_next(oid))
+
+    def _require_sync_source(self) -> ResponderSource:
+        if self._async_source is not None:
+            raise TypeError("Responder source lookups are asynchronous")
+        return cast(ResponderSource, self._source)
 
     def _build_bulk_varbinds(
         self,
@@ -212,28 +320,301 @@ class V2cResponder:
         *,
         non_repeaters: int,
         max_repetitions: int,
+        budget: _ResponseBudget | None = None,
     ) -> tuple[RawVarBind, ...]:
-        if max_repetitions <= 0:
-            max_repetitions = 0
-        if non_repeaters < 0:
-            non_repeaters = 0
-
+        non_repeaters, max_repetitions = _bulk_bounds(non_repeaters, max_repetitions)
         request_oids = [varbind.oid for varbind in request_varbinds]
         split = min(non_repeaters, len(request_oids))
         response_varbinds = [self._lookup_next_varbind(oid) for oid in request_oids[:split]]
 
         repeaters = request_oids[split:]
-        current_oids = repeaters.copy()
+        if budget is not None:
+            max_repetitions = budget.repetition_limit(max_repetitions, len(repeaters))
+        if self._range_source is not None:
+            columns = [self._bulk_column(oid, max_repetitions) for oid in repeaters]
+            response_varbinds.extend(chain.from_iterable(zip(*columns, strict=True)))
+        else:
+            current_oids = repeaters.copy()
+            for _ in range(max_repetitions):
+                for index, current_oid in enumerate(current_oids):
+                    next_varbind = self._lookup_next_varbind(current_oid)
+                    response_varbinds.append(next_varbind)
+                    if not isinstance(next_varbind.value, EndOfMibViewValue):
+                        current_oids[index] = next_varbind.oid
+
+        if budget is not None:
+            budget.fit(response_varbinds)
+        return tuple(response_varbinds)
+
+    def _bulk_column(self, oid: OID, max_repetitions: int) -> list[RawVarBind]:
+        source = cast(RangeSource, self._range_source)
+        column = list(islice(source.iter_from(oid), max_repetitions))
+        missing = max_repetitions - len(column)
+        if missing:
+            end_oid = column[-1].oid if column else oid
+            column.extend([RawVarBind(oid=end_oid, value=EndOfMibViewValue())] * missing)
+        return column
+
+    async def _build_bulk_varbinds_async(
+        self,
+        request_varbinds: tuple[RawVarBind, ...],
+        *,
+        non_repeaters: int,
+        max_repetitions: int,
+        budget: _ResponseBudget | None = None,
+    ) -> tuple[RawVarBind, ...]:
+        non_repeaters, max_repetitions = _bulk_bounds(non_repeaters, max_repetitions)
+        request_oids = [varbind.oid for varbind in request_varbinds]
+        split = min(non_repeaters, len(request_oids))
+        response_varbinds = [
+            await self._lookup_next_varbind_async(oid) for oid in request_oids[:split]
+        ]
+
+        current_oids = request_oids[split:]
+        if budget is not None:
+            max_repetitions = budget.repetition_limit(max_repetitions, len(current_oids))
         for _ in range(max_repetitions):
             for index, current_oid in enumerate(current_oids):
-                next_varbind = self._lookup_next_varbind(current_oid)
+                next_varbind = await self._lookup_next_varbind_async(current_oid)
                 response_varbinds.append(next_varbind)
                 if not isinstance(next_varbind.value, EndOfMibViewValue):
                     current_oids[index] = next_varbind.oid
 
+        if budget is not None:
+            budget.fit(response_varbinds)
         return tuple(response_varbinds)
 
 
+class V2cResponder(_RequestHandler):
+    """Async SNMPv2c read-only responder for simulator-style use cases."""
+
+    def __init__(
+        self,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 161,
+        communities: Sequence[str] | None = None,
+        source: ResponderSource | AsyncResponderSource | None = None,
+        objects: Iterable[ObjectInput] = (),
+        bundle: MibBundle | None = None,
+        max_response_size: int = _DEFAULT_MAX_RESPONSE_SIZE,
+    ) -> None:
+        if source is not None and tuple(objects):
+            raise ValueError("objects cannot be used when source is provided")
+
+        self._server = UdpServer(host, port)
+        self._communities = _normalize_communities(communities)
+        self._closed = False
+        if source is None:
+            source = InMemoryObjectSource(bundle=bundle, objects=objects)
+        super().__init__(source, max_response_size=max_response_size)
+        self._inflight: dict[_RequestKey, _InflightRequest] = {}
+        self._received = 0
+        self._responded = 0
+        self._discarded = 0
+        self._in_flight = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._stats_started = time.perf_counter()
+
+    async def __aenter__(self) -> V2cResponder:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        del exc_type, exc, tb
+        await self.close()
+
+    @property
+    def local_address(self) -> SocketAddress | None:
+        return self._server.local_address
+
+    @property
+    def stats(self) -> ResponderStats:
+        """Return request counters, throughput, and latency since :meth:`open`."""
+        return ResponderStats(
+            received=self._received,
+            responded=self._responded,
+            discarded=self._discarded,
+            in_flight=self._in_flight,
+            elapsed=time.perf_counter() - self._stats_started,
+            total_latency=self._total_latency,
+            max_latency=self._max_latency,
+        )
+
+    async def open(self) -> None:
+        """Bind the responder socket."""
+        self._closed = False
+        await self._server.open()
+        self._reset_stats()
+
+    async def close(self) -> None:
+        """Close the responder socket."""
+        self._closed = True
+        await self._server.close()
+
+    async def serve(self, *, count: int = 0, workers: int = 1) -> int:
+        """Serve up to *count* requests, or run until closed when count is ``0``.
+
+        With *workers* greater than one, that many handlers drain the socket
+        concurrently so a slow asynchronous source lookup does not stall other
+        pollers. Responses to retransmissions of the same request-id from the
+        same peer are still sent in arrival order.
+        """
+        if count < 0:
+            raise ValueError("count cannot be negative")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if workers == 1:
+            return await self._serve_worker(count=count, claimed=[0])
+
+        claimed = [0]
+        tasks = [
+            asyncio.create_task(self._serve_worker(count=count, claimed=claimed))
+            for _ in range(workers)
+        ]
+        try:
+            return sum(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def serve_forever(self, *, workers: int = 1) -> None:
+        """Serve requests until the responder is closed."""
+        await self.serve(count=0, workers=workers)
+
+    async def handle_request(self) -> None:
+        """Wait for and handle the next supported request."""
+        while True:
+            datagram = await self._server.receive()
+            if await self._handle_datagram(datagram):
+                return None
+
+    async def _serve_worker(self, *, count: int, claimed: list[int]) -> int:
+        handled = 0
+        while count == 0 or claimed[0] < count:
+            claimed[0] += 1
+            try:
+                await self.handle_request()
+            except TransportError:
+                if self._closed:
+                    return handled
+                raise
+            handled += 1
+        return handled
+
+    async def _handle_datagram(self, datagram: ReceivedDatagram) -> bool:
+        started = time.perf_counter()
+        self._received += 1
+        try:
+            message = decode_message(datagram.data)
+        except ProtocolError:
+            self._discarded += 1
+            return False
+        if not _community_allowed(communities=self._communities, community=message.community):
+            self._discarded += 1
+            return False
+
+        self._in_flight += 1
+        try:
+            if self._async_source is None:
+                # Synchronous lookups never yield, so arrival order is kept as-is.
+                response = self._build_response_message(message)
+                sent = await self._send_response(response, datagram)
+            else:
+                key = (datagram.source_address, message.pdu.request_id)
+                async with self._ordered(key):
+                    response = await self._build_response_message_async(message)
+                    sent = await self._send_response(response, datagram)
+        finally:
+            self._in_flight -= 1
+
+        if not sent:
+            self._discarded += 1
+            return False
+        latency = time.perf_counter() - started
+        self._responded += 1
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+        return True
+
+    async def _send_response(
+        self,
+        response: SnmpMessage | None,
+        datagram: ReceivedDatagram,
+    ) -> bool:
+        if response is None:
+            return False
+        await self._server.sendto(encode_message(response), datagram.source_address)
+        return True
+
+    @asynccontextmanager
+    async def _ordered(self, key: _RequestKey) -> AsyncIterator[None]:
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = self._inflight[key] = _InflightRequest(asyncio.Lock())
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if entry.users == 0:
+                del self._inflight[key]
+
+    def _reset_stats(self) -> None:
+        self._received = 0
+        self._responded = 0
+        self._discarded = 0
+        self._in_flight = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._stats_started = time.perf_counter()
+
+    def set_object(self, target: str | Sequence[int], value: SnmpValueType) -> OID:
+        """Set an object value when using the default in-memory source."""
+        return self._require_in_memory_source().set_object(target, value)
+
+    def set_objects(self, objects: Iterable[ObjectInput]) -> tuple[OID, ...]:
+        """Set multiple object values when using the default in-memory source."""
+        return self._require_in_memory_source().set_objects(objects)
+
+    def clear_objects(self) -> None:
+        """Clear all objects when using the default in-memory source."""
+        self._require_in_memory_source().clear()
+
+    def _require_in_memory_source(self) -> InMemoryObjectSource:
+        if isinstance(self._source, InMemoryObjectSource):
+            return self._source
+        raise TypeError("Responder is not using an InMemoryObjectSource")
+
+
+def _bulk_bounds(non_repeaters: int, max_repetitions: int) -> tuple[int, int]:
+    return max(non_repeaters, 0), max(max_repetitions, 0)
+
+
+def _exact_varbind(oid: OID, value: SnmpValueType | None) -> RawVarBind:
+    if value is None:
+        return RawVarBind(oid=oid, value=NoSuchObjectValue())
+    return RawVarBind(oid=oid, value=value)
+
+
+def _next_varbind(
+    oid: OID,
+    match: tuple[OID, SnmpValueType] | None,
+) -> RawVarBind:
+    if match is None:
+        return RawVarBind(oid=oid, value=EndOfMibViewValue())
+    next_oid, value = match
+    return RawVarBind(oid=next_oid, value=value)
+
+
 def _normalize_communities(communities: Sequence[str] | None) -> frozenset[str] | None:
     if communities is None:
         return None
@@ -0,0 +1,212 @@
+"""Recorded walk snapshots served from a read-only memory mapping."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+from trishul_snmp.errors import SnapshotError
+from trishul_snmp.manager.client import SnmpManager
+from trishul_snmp.responder.sources import NextLookupResult
+from trishul_snmp.types import (
+    OID,
+    EndOfMibViewValue,
+    NoSuchInstanceValue,
+    NoSuchObjectValue,
+    ObjectIdentifierValue,
+    SnmpValueType,
+)
+from trishul_snmp.wire.asn1 import decode_value, encode_value
+from trishul_snmp.wire.ber import encode_tlv
+from trishul_snmp.wire.pdu import RawVarBind
+
+_MAGIC = b"TSNMPWLK"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sII")
+# record offset, key length, value offset within the varbind, varbind length
+_ENTRY = struct.Struct("<QHHI")
+_SEQUENCE_TAG = 0x30
+_MAX_SUB_ID = 0xFFFFFFFF
+_MAX_SUB_IDS = 128
+_EXCEPTION_VALUES = (NoSuchObjectValue, NoSuchInstanceValue, EndOfMibViewValue)
+
+
+def write_snapshot(
+    objects: Iterable[tuple[Sequence[int], SnmpValueType]],
+    path: str | Path,
+) -> Path:
+    """Write numeric OID/value pairs to a snapshot file for :class:`SnapshotSource`.
+
+    Objects are sorted by OID, later duplicates replace earlier ones, and
+    exception values such as ``endOfMibView`` are skipped.
+    """
+    target = Path(path).expanduser()
+    values: dict[OID, SnmpValueType] = {}
+    for oid, stored in objects:
+        if isinstance(stored, _EXCEPTION_VALUES):
+            continue
+        values[_checked_oid(oid)] = stored
+
+    entries = bytearray()
+    records: list[bytes] = []
+    offset = _HEADER.size + _ENTRY.size * len(values)
+    for oid in sorted(values):
+        key = _oid_key(oid)
+        value = encode_value(values[oid])
+        encoded = encode_tlv(_SEQUENCE_TAG, encode_value(ObjectIdentifierValue(oid)) + value)
+        value_offset = len(encoded) - len(value)
+        entries += _ENTRY.pack(offset, len(key), value_offset, len(encoded))
+        records.append(key)
+        records.append(encoded)
+        offset += len(key) + len(encoded)
+
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(values)))
+        handle.write(entries)
+        handle.writelines(records)
+    os.replace(tmp_path, target)
+    return target
+
+
+async def record_snapshot(
+    manager: SnmpManager,
+    path: str | Path,
+    *,
+    root: str | Sequence[int] = "1.3.6.1",
+    bulk: bool = True,
+    max_repetitions: int = 25,
+) -> Path:
+    """Walk *root* through *manager* and write the result with :func:`write_snapshot`."""
+    varbinds = await manager.walk(root, bulk=bulk, max_repetitions=max_repetitions)
+    return write_snapshot(((varbind.oid, varbind.value) for varbind in varbinds), path)
+
+
+class SnapshotSource:
+    """Read-only responder source binary-searching a mapped snapshot file.
+
+    Only the fixed-width index and the records touched by a lookup are paged
+    in, and the mapping is shared between every process serving the same
+    file, so many recorded device images can be served with a small RSS.
+    Responses splice the recorded varbind bytes without re-encoding.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path).expanduser()
+        try:
+            with self._path.open("rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError as exc:
+            raise SnapshotError(f"Snapshot does not exist: {self._path}") from exc
+        except ValueError as exc:
+            raise SnapshotError(f"Snapshot is empty: {self._path}") from exc
+
+        data = self._map
+        if len(data) < _HEADER.size:
+            self._map.close()
+            raise SnapshotError(f"Snapshot is truncated: {self._path}")
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            self._map.close()
+            raise SnapshotError(f"File is not a supported snapshot: {self._path}")
+        if len(data) < _HEADER.size + _ENTRY.size * count:
+            self._map.close()
+            raise SnapshotError(f"Snapshot is truncated: {self._path}")
+        self._count: int = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def path(self) -> Path:
+        """Return the mapped snapshot file."""
+        return self._path
+
+    def lookup_exact(self, oid: OID) -> SnmpValueType | None:
+        """Return the recorded value for *oid*, or ``None`` when missing."""
+        varbind = self.lookup_exact_varbind(oid)
+        return None if varbind is None else varbind.value
+
+    def lookup_next(self, oid: OID) -> NextLookupResult:
+        """Return the next recorded OID/value pair after *oid*."""
+        varbind = self.lookup_next_varbind(oid)
+        return None if varbind is None else (varbind.oid, varbind.value)
+
+    def lookup_exact_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the recorded varbind for *oid* with its original encoding."""
+        needle = _lookup_key(oid)
+        if needle is None:
+            return None
+        position = self._bisect(needle)
+        if position == self._count or self._key_at(position) != needle:
+            return None
+        return self._varbind_at(position)
+
+    def lookup_next_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the recorded varbind after *oid* with its original encoding."""
+        position = self._position_after(oid)
+        return None if position == self._count else self._varbind_at(position)
+
+    def iter_from(self, oid: OID) -> Iterator[RawVarBind]:
+        """Yield the recorded varbinds after *oid* in order."""
+        for position in range(self._position_after(oid), self._count):
+            yield self._varbind_at(position)
+
+    def close(self) -> None:
+        """Release the underlying mapping."""
+        self._map.close()
+
+    def _position_after(self, oid: OID) -> int:
+        needle = _lookup_key(oid)
+        if needle is None:
+            return self._count
+        position = self._bisect(needle)
+        if position < self._count and self._key_at(position) == needle:
+            position += 1
+        return position
+
+    def _bisect(self, needle: bytes) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < needle:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _key_at(self, position: int) -> bytes:
+        offset, key_length, _, _ = _ENTRY.unpack_from(
+            self._map, _HEADER.size + position * _ENTRY.size
+        )
+        return self._map[offset : offset + key_length]
+
+    def _varbind_at(self, position: int) -> RawVarBind:
+        offset, key_length, value_offset, length = _ENTRY.unpack_from(
+            self._map, _HEADER.size + position * _ENTRY.size
+        )
+        start = offset + key_length
+        encoded = self._map[start : start + length]
+        oid = struct.unpack(f">{key_length // 4}I", self._map[offset:start])
+        return RawVarBind(oid=oid, value=decode_value(encoded[value_offset:]), encoded=encoded)
+
+
+def _checked_oid(oid: Sequence[int]) -> OID:
+    normalized = tuple(oid)
+    if not 0 < len(normalized) <= _MAX_SUB_IDS or _lookup_key(normalized) is None:
+        raise ValueError(f"OID cannot be stored in a snapshot: {normalized}")
+    return normalized
+
+
+def _oid_key(oid: OID) -> bytes:
+    # fixed-width big-endian sub-identifiers make byte order match OID order
+    return struct.pack(f">{len(oid)}I", *oid)
+
+
+def _lookup_key(oid: OID) -> bytes | None:
+    if any(not 0 <= sub_id <= _MAX_SUB_ID for sub_id in oid):
+        return None
+    return _oid_key(oid)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from bisect import bisect_right, insort
-from collections.abc import Callable, Iterable, Sequence
-from typing import Protocol, TypeAlias
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from typing import Protocol, TypeAlias, runtime_checkable
 
 from trishul_snmp._runtime import normalize_targets
 from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.responder._oid_index import SortedOidIndex
 from trishul_snmp.responder.rules import CounterRule, RandomNumericRule, SimulationRule, UptimeRule
 from trishul_snmp.types import (
     OID,
@@ -17,12 +18,15 @@ from trishul_snmp.types import (
     OctetStringValue,
     SnmpValueType,
 )
+from trishul_snmp.wire.pdu import RawVarBind, build_encoded_varbind
 
 ObjectValue: TypeAlias = SnmpValueType | SimulationRule
 ObjectInput: TypeAlias = tuple[str | Sequence[int], ObjectValue]
 NextLookupResult: TypeAlias = tuple[OID, SnmpValueType] | None
 ExactLookup: TypeAlias = Callable[[OID], SnmpValueType | None]
 NextLookup: TypeAlias = Callable[[OID], NextLookupResult]
+AsyncExactLookup: TypeAlias = Callable[[OID], Awaitable[SnmpValueType | None]]
+AsyncNextLookup: TypeAlias = Callable[[OID], Awaitable[NextLookupResult]]
 
 _COUNTER32_SYNTAXES = frozenset({"Counter32", "ZeroBasedCounter32"})
 _COUNTER64_SYNTAXES = frozenset({"Counter64", "ZeroBasedCounter64", "CounterBasedGauge64"})
@@ -41,68 +45,176 @@ class ResponderSource(Protocol):
         """Return the next lexicographic OID/value pair after *oid*."""
 
 
+class AsyncResponderSource(Protocol):
+    """Protocol for responder sources whose lookups are coroutines."""
+
+    async def lookup_exact(self, oid: OID) -> SnmpValueType | None:
+        """Return the exact value for *oid*, or ``None`` when missing."""
+
+    async def lookup_next(self, oid: OID) -> NextLookupResult:
+        """Return the next lexicographic OID/value pair after *oid*."""
+
+
+@runtime_checkable
+class VarBindSource(Protocol):
+    """Optional source extension returning ready-to-encode varbinds."""
+
+    def lookup_exact_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the exact varbind for *oid*, or ``None`` when missing."""
+
+    def lookup_next_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the next lexicographic varbind after *oid*."""
+
+
+@runtime_checkable
+class RangeSource(Protocol):
+    """Optional source extension yielding consecutive varbinds from one search."""
+
+    def iter_from(self, oid: OID) -> Iterator[RawVarBind]:
+        """Yield varbinds in lexicographic order strictly after *oid*."""
+
+
 class InMemoryObjectSource:
-    """Mutable in-memory object source for responder and simulator use."""
+    """Mutable in-memory object source for responder and simulator use.
+
+    With *cache_encoded* (the default), the BER bytes of each static varbind are
+    built on first read and reused until the object is replaced or deleted.
+    Simulation rules are evaluated on every read unless *rule_ttl* is positive,
+    in which case each rule's encoded varbind is reused for reads falling in
+    the same *rule_ttl*-second tick.
+    """
 
     def __init__(
         self,
         *,
         bundle: MibBundle | None = None,
         objects: Iterable[ObjectInput] = (),
+        cache_encoded: bool = True,
+        rule_ttl: float = 0.0,
     ) -> None:
+        if rule_ttl < 0:
+            raise ValueError("rule_ttl cannot be negative")
         self._bundle = bundle
         self._values: dict[OID, ObjectValue] = {}
-        self._sorted_oids: list[OID] = []
+        self._sorted_oids = SortedOidIndex()
+        self._cache_encoded = cache_encoded
+        self._encoded: dict[OID, RawVarBind] = {}
+        self._rule_ttl = rule_ttl
+        self._rule_tick = -1
+        self._rule_encoded: dict[OID, RawVarBind] = {}
+        self._lazy_columns: dict[OID, tuple[str | None, int]] = {}
+        self._lazy_index = SortedOidIndex()
         self.set_objects(objects)
 
     def lookup_exact(self, oid: OID) -> SnmpValueType | None:
         """Return the exact value for *oid* when present."""
+        if self._lazy_columns:
+            self._materialize_containing(oid)
         stored = self._values.get(oid)
         if stored is None:
             return None
         if isinstance(stored, SimulationRule):
-            return stored.get_value()
+            return self._rule_value(oid, stored)
         return stored
 
     def lookup_next(self, oid: OID) -> NextLookupResult:
         """Return the next lexicographic OID/value pair after *oid*."""
-        index = bisect_right(self._sorted_oids, oid)
-        if index >= len(self._sorted_oids):
+        next_oid = self._next_oid(oid)
+        if next_oid is None:
             return None
-        next_oid = self._sorted_oids[index]
         stored = self._values[next_oid]
-        value = stored.get_value() if isinstance(stored, SimulationRule) else stored
-        return next_oid, value
+        if isinstance(stored, SimulationRule):
+            return next_oid, self._rule_value(next_oid, stored)
+        return next_oid, stored
+
+    def lookup_exact_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the exact varbind for *oid*, reusing cached BER bytes for static values."""
+        cached = self._encoded.get(oid) or self._cached_rule_varbind(oid)
+        if cached is not None:
+            return cached
+        if self._lazy_columns:
+            self._materialize_containing(oid)
+        stored = self._values.get(oid)
+        if stored is None:
+            return None
+        return self._varbind(oid, stored)
+
+    def lookup_next_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the next varbind after *oid*, reusing cached BER bytes for static values."""
+        next_oid = self._next_oid(oid)
+        if next_oid is None:
+            return None
+        cached = self._encoded.get(next_oid) or self._cached_rule_varbind(next_oid)
+        if cached is not None:
+            return cached
+        return self._varbind(next_oid, self._values[next_oid])
+
+    def iter_from(self, oid: OID) -> Iterator[RawVarBind]:
+        """Yield the varbinds after *oid* in order, locating the start only once."""
+        if self._lazy_columns:
+            # materializing a column mutates the index, so step one successor at a time
+            yield from _step_varbinds(self.lookup_next_varbind, oid)
+            return
+        if self._rule_ttl:
+            self._expire_rule_varbinds()
+        encoded = self._encoded
+        rule_encoded = self._rule_encoded
+        values = self._values
+        for next_oid in self._sorted_oids.iter_from(oid):
+            cached = encoded.get(next_oid) or rule_encoded.get(next_oid)
+            yield cached if cached is not None else self._varbind(next_oid, values[next_oid])
 
     def set_object(self, target: str | Sequence[int], value: ObjectValue) -> OID:
         """Insert or replace an object value or rule and return its normalized OID."""
         oid = self._normalize_target(target)
+        if self._lazy_columns:
+            self._materialize_containing(oid)
         if oid not in self._values:
-            insort(self._sorted_oids, oid)
+            self._sorted_oids.add(oid)
         self._values[oid] = value
+        self._encoded.pop(oid, None)
+        self._rule_encoded.pop(oid, None)
         return oid
 
     def set_objects(self, objects: Iterable[ObjectInput]) -> tuple[OID, ...]:
-        """Insert or replace multiple object values or rules."""
-        return tuple(self.set_object(target, value) for target, value in objects)
+        """Insert or replace multiple object values or rules, sorting new OIDs once."""
+        pairs = tuple(objects)
+        if not pairs:
+            return ()
+        oids = normalize_targets(tuple(target for target, _ in pairs), bundle=self._bundle)
+        if self._lazy_columns:
+            for oid in oids:
+                self._materialize_containing(oid)
+        self._store(zip(oids, (value for _, value in pairs), strict=True))
+        return oids
 
     def delete_object(self, target: str | Sequence[int]) -> bool:
         """Delete an object value when present."""
         oid = self._normalize_target(target)
+        if self._lazy_columns:
+            self._materialize_containing(oid)
         if oid not in self._values:
             return False
         del self._values[oid]
-        self._sorted_oids.remove(oid)
+        self._encoded.pop(oid, None)
+        self._rule_encoded.pop(oid, None)
+        self._sorted_oids.discard(oid)
         return True
 
     def clear(self) -> None:
         """Remove all stored objects."""
         self._values.clear()
+        self._encoded.clear()
+        self._rule_encoded.clear()
         self._sorted_oids.clear()
+        self._lazy_columns.clear()
+        self._lazy_index.clear()
 
     @property
     def oids(self) -> tuple[OID, ...]:
-        """Return stored OIDs in lexicographic order."""
+        """Return stored OIDs in lexicographic order, materializing lazy columns."""
+        for column in list(self._lazy_columns):
+            self._materialize(column)
         return tuple(self._sorted_oids)
 
     @classmethod
@@ -112,9 +224,18 @@ class InMemoryObjectSource:
         *,
         max_instances: int = 2,
         include_deprecated: bool = False,
+        lazy: bool = False,
+        rule_ttl: float = 0.0,
     ) -> InMemoryObjectSource:
-        """Generate a populated source from bundle objects with sensible default values."""
-        source = cls(bundle=bundle)
+        """Generate a populated source from bundle objects with sensible default values.
+
+        Node OIDs are already numeric, so objects are collected without target
+        normalization and sorted once. With *lazy*, column instances are only
+        created when a lookup or write first reaches their column. *rule_ttl*
+        is passed to the constructor to cache the generated rules per tick.
+        """
+        source = cls(bundle=bundle, rule_ttl=rule_ttl)
+        objects: list[tuple[OID, ObjectValue]] = []
         for node in bundle.iter_objects():
             if node.max_access == "not-accessible":
                 continue
@@ -123,15 +244,207 @@ class InMemoryObjectSource:
             if not include_deprecated and node.status == "deprecated":
                 continue
             if node.nodetype == "scalar":
-                source.set_object(node.oid + (0,), _default_value(node.syntax, instance=0))
+                objects.append((node.oid + (0,), _default_value(node.syntax, instance=0)))
             elif node.nodetype == "column":
-                for i in range(1, max_instances + 1):
-                    source.set_object(node.oid + (i,), _default_value(node.syntax, instance=i))
+                if lazy:
+                    source._lazy_columns[node.oid] = (node.syntax, max_instances)
+                else:
+                    objects.extend(_column_instances(node.oid, node.syntax, max_instances))
+        source._store(objects)
+        source._lazy_index.update(source._lazy_columns)
         return source
 
     def _normalize_target(self, target: str | Sequence[int]) -> OID:
         return normalize_targets((target,), bundle=self._bundle)[0]
 
+    def _store(self, objects: Iterable[tuple[OID, ObjectValue]]) -> None:
+        values = self._values
+        encoded = self._encoded
+        rule_encoded = self._rule_encoded
+        added: list[OID] = []
+        for oid, value in objects:
+            if oid not in values:
+                added.append(oid)
+            values[oid] = value
+            encoded.pop(oid, None)
+            rule_encoded.pop(oid, None)
+        self._sorted_oids.update(added)
+
+    def _next_oid(self, oid: OID) -> OID | None:
+        if self._lazy_columns:
+            self._materialize_containing(oid)
+            while (column := self._lazy_index.successor(oid)) is not None:
+                following = self._sorted_oids.successor(oid)
+                if following is not None and following < column:
+                    break
+                self._materialize(column)
+        return self._sorted_oids.successor(oid)
+
+    def _materialize_containing(self, oid: OID) -> None:
+        for end in range(len(oid) - 1, 0, -1):
+            if oid[:end] in self._lazy_columns:
+                self._materialize(oid[:end])
+                return
+
+    def _materialize(self, column: OID) -> None:
+        syntax, max_instances = self._lazy_columns.pop(column)
+        self._lazy_index.discard(column)
+        self._store(_column_instances(column, syntax, max_instances))
+
+    def _varbind(self, oid: OID, stored: ObjectValue) -> RawVarBind:
+        if isinstance(stored, SimulationRule):
+            if self._rule_ttl:
+                return self._rule_varbind(oid, stored)
+            return RawVarBind(oid=oid, value=stored.get_value())
+        if not self._cache_encoded:
+            return RawVarBind(oid=oid, value=stored)
+        varbind = self._encoded[oid] = build_encoded_varbind(oid, stored)
+        return varbind
+
+    def _rule_value(self, oid: OID, rule: SimulationRule) -> SnmpValueType:
+        if self._rule_ttl:
+            return self._rule_varbind(oid, rule).value
+        return rule.get_value()
+
+    def _rule_varbind(self, oid: OID, rule: SimulationRule) -> RawVarBind:
+        varbind = self._cached_rule_varbind(oid)
+        if varbind is None:
+            varbind = self._rule_encoded[oid] = build_encoded_varbind(oid, rule.get_value())
+        return varbind
+
+    def _cached_rule_varbind(self, oid: OID) -> RawVarBind | None:
+        if not self._rule_ttl:
+            return None
+        self._expire_rule_varbinds()
+        return self._rule_encoded.get(oid)
+
+    def _expire_rule_varbinds(self) -> None:
+        tick = int(time.monotonic() / self._rule_ttl)
+        if tick != self._rule_tick:
+            self._rule_tick = tick
+            self._rule_encoded.clear()
+
+
+class OverlayObjectSource:
+    """Per-agent overrides layered over a shared, read-mostly base source.
+
+    Lookups consult the overlay first and fall back to *base*, so many simulated
+    agents can share one object tree (and its encoded varbind cache) while each
+    keeps only its differing objects, such as ``sysName`` or offset counters.
+    """
+
+    def __init__(
+        self,
+        base: ResponderSource,
+        *,
+        bundle: MibBundle | None = None,
+        objects: Iterable[ObjectInput] = (),
+    ) -> None:
+        self._base = base
+        self._base_varbinds = base if isinstance(base, VarBindSource) else None
+        self._base_range = base if isinstance(base, RangeSource) else None
+        self._overlay = InMemoryObjectSource(bundle=bundle, objects=objects)
+
+    @property
+    def base(self) -> ResponderSource:
+        """Return the shared base source."""
+        return self._base
+
+    @property
+    def overlay(self) -> InMemoryObjectSource:
+        """Return the per-agent override source."""
+        return self._overlay
+
+    def lookup_exact(self, oid: OID) -> SnmpValueType | None:
+        """Return the overridden value for *oid*, else the base value."""
+        value = self._overlay.lookup_exact(oid)
+        if value is None:
+            return self._base.lookup_exact(oid)
+        return value
+
+    def lookup_next(self, oid: OID) -> NextLookupResult:
+        """Return the next OID/value pair across overlay and base."""
+        varbind = self.lookup_next_varbind(oid)
+        if varbind is None:
+            return None
+        return varbind.oid, varbind.value
+
+    def lookup_exact_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the overridden varbind for *oid*, else the base varbind."""
+        varbind = self._overlay.lookup_exact_varbind(oid)
+        if varbind is not None:
+            return varbind
+        if self._base_varbinds is not None:
+            return self._base_varbinds.lookup_exact_varbind(oid)
+        value = self._base.lookup_exact(oid)
+        return None if value is None else RawVarBind(oid=oid, value=value)
+
+    def lookup_next_varbind(self, oid: OID) -> RawVarBind | None:
+        """Return the next varbind after *oid*; overrides win on equal OIDs."""
+        overlay = self._overlay.lookup_next_varbind(oid)
+        base = self._base_next_varbind(oid)
+        if base is None or (overlay is not None and overlay.oid <= base.oid):
+            return overlay
+        return base
+
+    def iter_from(self, oid: OID) -> Iterator[RawVarBind]:
+        """Yield the merged varbinds after *oid*; overrides win on equal OIDs."""
+        overlay = self._overlay.iter_from(oid)
+        if self._base_range is not None:
+            base = self._base_range.iter_from(oid)
+        else:
+            base = _step_varbinds(self._base_next_varbind, oid)
+        upper = next(overlay, None)
+        lower = next(base, None)
+        while upper is not None:
+            if lower is not None and lower.oid <= upper.oid:
+                if lower.oid < upper.oid:
+                    yield lower
+                    lower = next(base, None)
+                    continue
+                lower = next(base, None)
+            yield upper
+            upper = next(overlay, None)
+        if lower is not None:
+            yield lower
+            yield from base
+
+    def set_object(self, target: str | Sequence[int], value: ObjectValue) -> OID:
+        """Override one object for this agent and return its normalized OID."""
+        return self._overlay.set_object(target, value)
+
+    def set_objects(self, objects: Iterable[ObjectInput]) -> tuple[OID, ...]:
+        """Override multiple objects for this agent."""
+        return self._overlay.set_objects(objects)
+
+    def delete_object(self, target: str | Sequence[int]) -> bool:
+        """Remove an override so the base value shows through again."""
+        return self._overlay.delete_object(target)
+
+    def _base_next_varbind(self, oid: OID) -> RawVarBind | None:
+        if self._base_varbinds is not None:
+            return self._base_varbinds.lookup_next_varbind(oid)
+        match = self._base.lookup_next(oid)
+        return None if match is None else RawVarBind(oid=match[0], value=match[1])
+
+
+def _step_varbinds(
+    lookup_next_varbind: Callable[[OID], RawVarBind | None],
+    oid: OID,
+) -> Iterator[RawVarBind]:
+    while (varbind := lookup_next_varbind(oid)) is not None:
+        yield varbind
+        oid = varbind.oid
+
+
+def _column_instances(
+    column: OID,
+    syntax: str | None,
+    max_instances: int,
+) -> Iterator[tuple[OID, ObjectValue]]:
+    for instance in range(1, max_instances + 1):
+        yield column + (instance,), _default_value(syntax, instance=instance)
+
 
 def _default_value(syntax: str | None, *, instance: int) -> ObjectValue:
     if syntax is None:
@@ -179,3 +492,24 @@ class CallbackObjectSource:
     def lookup_next(self, oid: OID) -> NextLookupResult:
         """Delegate next lookup to the configured callback."""
         return self._next_lookup(oid)
+
+
+class AsyncCallbackObjectSource:
+    """Coroutine-backed responder source for lookups that wait on I/O."""
+
+    def __init__(
+        self,
+        *,
+        exact_lookup: AsyncExactLookup,
+        next_lookup: AsyncNextLookup,
+    ) -> None:
+        self._exact_lookup = exact_lookup
+        self._next_lookup = next_lookup
+
+    async def lookup_exact(self, oid: OID) -> SnmpValueType | None:
+        """Await the configured exact lookup callback."""
+        return await self._exact_lookup(oid)
+
+    async def lookup_next(self, oid: OID) -> NextLookupResult:
+        """Await the configured next lookup callback."""
+        return await self._next_lookup(oid)
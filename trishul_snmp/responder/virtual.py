@@ -0,0 +1,142 @@
+"""Computed responder tables that never materialize their rows."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import TypeAlias, cast
+
+from trishul_snmp._runtime import normalize_targets
+from trishul_snmp.mib.bundle import MibBundle
+from trishul_snmp.responder.sources import NextLookupResult
+from trishul_snmp.types import OID, SnmpValueType
+from trishul_snmp.wire.pdu import RawVarBind
+
+ColumnValue: TypeAlias = Callable[[int], SnmpValueType]
+RowIndex: TypeAlias = Callable[[int], Sequence[int]]
+
+
+class VirtualTableSource:
+    """Read-only table whose instances are computed from row numbers on demand.
+
+    *columns* maps column OIDs, which must share one entry OID, to functions
+    returning the value for a row number drawn from *rows*. Without *row_index*
+    each row number is the single instance sub-identifier; otherwise
+    ``row_index(row)`` returns the instance suffix and must increase with the
+    row number. Lookups are arithmetic or a binary search over *rows*, so
+    memory stays constant regardless of the row count.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str | Sequence[int], ColumnValue],
+        *,
+        rows: range,
+        row_index: RowIndex | None = None,
+        bundle: MibBundle | None = None,
+    ) -> None:
+        if rows.step < 1 or (row_index is None and rows and rows.start < 0):
+            raise ValueError("rows must be an ascending range of non-negative row numbers")
+        targets = tuple(columns)
+        column_oids = normalize_targets(targets, bundle=bundle)
+        entries = {oid[:-1] for oid in column_oids}
+        if len(entries) != 1 or not next(iter(entries)):
+            raise ValueError("Virtual table columns must share one entry OID")
+
+        self._entry: OID = entries.pop()
+        values = {
+            oid[-1]: columns[target] for oid, target in zip(column_oids, targets, strict=True)
+        }
+        self._column_ids = sorted(values)
+        self._values = [values[column] for column in self._column_ids]
+        self._rows = rows
+        self._row_index = row_index
+
+    @property
+    def entry(self) -> OID:
+        """Return the table entry OID shared by every column."""
+        return self._entry
+
+    @property
+    def rows(self) -> range:
+        """Return the row numbers served by the table."""
+        return self._rows
+
+    def lookup_exact(self, oid: OID) -> SnmpValueType | None:
+        """Compute the value for *oid* when it names a table instance."""
+        size = len(self._entry)
+        if oid[:size] != self._entry or len(oid) < size + 2:
+            return None
+        position = bisect_left(self._column_ids, oid[size])
+        if position == len(self._column_ids) or self._column_ids[position] != oid[size]:
+            return None
+        row = self._row_for(oid[size + 1 :])
+        return None if row is None else self._values[position](row)
+
+    def lookup_next(self, oid: OID) -> NextLookupResult:
+        """Compute the next table instance after *oid*."""
+        start = self._start(oid)
+        if start is None:
+            return None
+        column, position = start
+        row = self._rows[position]
+        return self._instance(column, row), self._values[column](row)
+
+    def iter_from(self, oid: OID) -> Iterator[RawVarBind]:
+        """Yield table instances after *oid* in column-major lexicographic order."""
+        start = self._start(oid)
+        if start is None:
+            return
+        first_column, position = start
+        rows = self._rows
+        for column in range(first_column, len(self._column_ids)):
+            value = self._values[column]
+            for offset in range(position, len(rows)):
+                row = rows[offset]
+                yield RawVarBind(oid=self._instance(column, row), value=value(row))
+            position = 0
+
+    def _start(self, oid: OID) -> tuple[int, int] | None:
+        if not self._rows:
+            return None
+        size = len(self._entry)
+        prefix = oid[:size]
+        if prefix != self._entry:
+            return (0, 0) if prefix < self._entry else None
+        if len(oid) == size:
+            return 0, 0
+
+        column = bisect_left(self._column_ids, oid[size])
+        if column < len(self._column_ids) and self._column_ids[column] == oid[size]:
+            position = self._row_position_after(oid[size + 1 :])
+            if position < len(self._rows):
+                return column, position
+            column += 1
+        if column == len(self._column_ids):
+            return None
+        return column, 0
+
+    def _row_for(self, suffix: OID) -> int | None:
+        rows = self._rows
+        if self._row_index is None:
+            if len(suffix) == 1 and suffix[0] in rows:
+                return suffix[0]
+            return None
+        position = bisect_left(rows, suffix, key=self._row_key)
+        if position < len(rows) and self._row_key(rows[position]) == suffix:
+            return rows[position]
+        return None
+
+    def _row_position_after(self, suffix: OID) -> int:
+        if not suffix:
+            return 0
+        if self._row_index is None:
+            return bisect_right(self._rows, suffix[0])
+        return bisect_right(self._rows, suffix, key=self._row_key)
+
+    def _row_key(self, row: int) -> OID:
+        return tuple(cast(RowIndex, self._row_index)(row))
+
+    def _instance(self, column: int, row: int) -> OID:
+        suffix = (row,) if self._row_index is None else self._row_key(row)
+        return (*self._entry, self._column_ids[column], *suffix)
@@ -1,6 +1,13 @@
 from trishul_snmp.security.community import CommunityModel
 from trishul_snmp.security.model import SecurityModel
-from trishul_snmp.security.usm import AuthProtocol, PrivProtocol, UsmLocalEngine, UsmModel, UsmUser
+from trishul_snmp.security.usm import (
+    AuthProtocol,
+    PrivProtocol,
+    UsmLocalEngine,
+    UsmModel,
+    UsmUser,
+    UsmUserTable,
+)
 
 __all__ = [
     "AuthProtocol",
@@ -10,4 +17,5 @@ __all__ = [
     "UsmLocalEngine",
     "UsmModel",
     "UsmUser",
+    "UsmUserTable",
 ]
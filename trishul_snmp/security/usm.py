@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
@@ -18,6 +19,7 @@ from trishul_snmp.wire.v3message import (
     decode_v3_message,
     encode_scoped_pdu,
     encode_v3_message,
+    encode_v3_message_with_auth_offset,
 )
 
 if TYPE_CHECKING:
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
 
 _AUTH_TAG_LEN = 12  # RFC 3414: HMAC truncated to 12 bytes
 _REPORT_PDU_TAG = 0xA8  # SNMPv3 REPORT PDU tag — not in PduType enum
+_DEFAULT_MAX_KEYS = 1024
 
 
 def _require_cryptography() -> None:
@@ -99,6 +102,10 @@ class UsmModel:
     _peer_engine_boots: int = field(default=0, init=False, repr=False)
     _peer_engine_time: int = field(default=0, init=False, repr=False)
     _msg_id_counter: int = field(default=0, init=False, repr=False)
+    # localized auth/priv keys per engine ID, so the RFC 3414 KDF runs once per engine
+    _localized_keys: dict[tuple[str, bytes], bytes] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     # ── SecurityModel protocol ────────────────────────────────────────────
 
@@ -127,7 +134,7 @@ class UsmModel:
             auth_params=auth_params,
             priv_params=priv_params,
         )
-        raw = encode_v3_message(
+        raw, auth_params_offset = encode_v3_message_with_auth_offset(
             msg_id=msg_id,
             msg_max_size=65507,
             flags=flags,
@@ -136,7 +143,7 @@ class UsmModel:
         )
 
         if self._auth_enabled():
-            raw = self._stamp_auth(raw, engine.engine_id)
+            raw = self._stamp_auth(raw, engine.engine_id, auth_params_offset)
 
         return raw
 
@@ -295,31 +302,45 @@ class UsmModel:
         if self.user.auth_key_localized:
             return self.user.auth_key
         selected_engine_id = self._peer_engine_id if engine_id is None else engine_id
-        return self._localize_key(self.user.auth_key, selected_engine_id)
+        cache_key = ("auth", selected_engine_id)
+        key = self._localized_keys.get(cache_key)
+        if key is None:
+            key = self._localize_key(self.user.auth_key, selected_engine_id)
+            self._localized_keys[cache_key] = key
+        return key
 
     def _compute_auth_tag(self, msg: bytes, engine_id: bytes | None = None) -> bytes:
         """Compute 12-byte HMAC over *msg* using the localised auth key."""
         import hmac as _hmac
 
+        mac = _hmac.new(self._hmac_key(engine_id), msg, self._hmac_digest()).digest()
+        return mac[:_AUTH_TAG_LEN]
+
+    def _hmac_digest(self) -> str:
+        """Return the hashlib digest name for the configured auth protocol."""
         proto = self.user.auth_protocol
         if proto is AuthProtocol.MD5:
-            alg = "md5"
-        elif proto is AuthProtocol.SHA1:
-            alg = "sha1"
-        elif proto is AuthProtocol.SHA256:
-            alg = "sha256"
-        else:
-            raise ProtocolError(f"Unsupported auth protocol: {proto}")
+            return "md5"
+        if proto is AuthProtocol.SHA1:
+            return "sha1"
+        if proto is AuthProtocol.SHA256:
+            return "sha256"
+        raise ProtocolError(f"Unsupported auth protocol: {proto}")
 
-        mac = _hmac.new(self._hmac_key(engine_id), msg, alg).digest()
-        return mac[:_AUTH_TAG_LEN]
+    def _stamp_auth(
+        self,
+        raw: bytes,
+        engine_id: bytes | None = None,
+        auth_params_offset: int | None = None,
+    ) -> bytes:
+        """Replace the 12-byte zero auth_params placeholder with the real HMAC.
 
-    def _stamp_auth(self, raw: bytes, engine_id: bytes | None = None) -> bytes:
-        """Replace the 12-byte zero auth_params placeholder with the real HMAC."""
+        *auth_params_offset* as reported by the encoder avoids re-decoding *raw*.
+        """
         tag = self._compute_auth_tag(raw, engine_id)
-        # decode to find the auth_params_offset in the just-encoded message
-        view = decode_v3_message(raw)
-        offset = view.auth_params_offset
+        offset = auth_params_offset
+        if offset is None:
+            offset = decode_v3_message(raw).auth_params_offset
         return raw[:offset] + tag + raw[offset + _AUTH_TAG_LEN :]
 
     def _verify_auth(
@@ -440,7 +461,11 @@ class UsmModel:
     def _priv_key_aes128(self, engine_id: bytes) -> bytes:
         """Derive the 16-byte AES-128 privacy key (first 16 bytes of the localized priv key)."""
         if self.user.priv_key:
-            raw = self._localize_priv_key(self.user.priv_key, engine_id)
+            cache_key = ("priv", engine_id)
+            raw = self._localized_keys.get(cache_key)
+            if raw is None:
+                raw = self._localize_priv_key(self.user.priv_key, engine_id)
+                self._localized_keys[cache_key] = raw
             return raw[:16]
         raise ProtocolError("AES-128 privacy requires a priv_key")
 
@@ -527,6 +552,69 @@ class UsmModel:
         self._peer_engine_time = p.engine_time
 
 
+class UsmUserTable:
+    """USM users keyed by username with an LRU of engine-localized codecs.
+
+    Receivers such as :class:`V3NotificationListener` serve many users and
+    remote authoritative engines. :meth:`codec` keeps up to *max_keys*
+    ``(username, engine_id)`` codecs whose localized auth/priv keys are derived
+    once, so the RFC 3414 KDF stays off the per-message path.
+    """
+
+    def __init__(self, users: Iterable[UsmUser], *, max_keys: int = _DEFAULT_MAX_KEYS) -> None:
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self._users: dict[bytes, UsmUser] = {}
+        for user in users:
+            username = user.username.encode()
+            if username in self._users:
+                raise ValueError(f"Duplicate USM username: {user.username!r}")
+            self._users[username] = user
+        if not self._users:
+            raise ValueError("At least one USM user is required")
+        self._max_keys = max_keys
+        self._codecs: OrderedDict[tuple[bytes, bytes], UsmModel] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, username: object) -> bool:
+        return username in self._users
+
+    @property
+    def users(self) -> tuple[UsmUser, ...]:
+        """Return the configured users in insertion order."""
+        return tuple(self._users.values())
+
+    @property
+    def max_keys(self) -> int:
+        return self._max_keys
+
+    @property
+    def cached_keys(self) -> int:
+        """Return how many ``(username, engine_id)`` codecs are cached."""
+        return len(self._codecs)
+
+    def get(self, username: bytes) -> UsmUser | None:
+        """Return the user for a wire-format *username*, or ``None``."""
+        return self._users.get(username)
+
+    def codec(self, user: UsmUser, engine_id: bytes) -> UsmModel:
+        """Return the cached codec localizing *user*'s keys for *engine_id*."""
+        cache_key = (user.username.encode(), engine_id)
+        codecs = self._codecs
+        codec = codecs.get(cache_key)
+        if codec is not None and codec.user is user:
+            codecs.move_to_end(cache_key)
+            return codec
+        codec = UsmModel(user=user)
+        codecs[cache_key] = codec
+        codecs.move_to_end(cache_key)
+        if len(codecs) > self._max_keys:
+            codecs.popitem(last=False)
+        return codec
+
+
 def _peek_scoped_pdu(msg_data_bytes: bytes) -> tuple[bytes, bytes, int, int]:
     """Decode a ScopedPDU and return (engine_id, context_name, pdu_tag, end_offset).
 
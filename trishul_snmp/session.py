@@ -66,6 +66,10 @@ class SnmpSession:
         self._opened = False
         await self._client.close()
 
+    @property
+    def client(self) -> UdpClient:
+        return self._client
+
     @property
     def dispatcher(self) -> RequestDispatcher:
         return self._dispatcher
@@ -1,6 +1,6 @@
 """Transport package."""
 
 from trishul_snmp.transport.dispatcher import RequestDispatcher
-from trishul_snmp.transport.udp import UdpClient
+from trishul_snmp.transport.udp import DatagramQueueStats, DropPolicy, UdpClient
 
-__all__ = ["RequestDispatcher", "UdpClient"]
+__all__ = ["DatagramQueueStats", "DropPolicy", "RequestDispatcher", "UdpClient"]
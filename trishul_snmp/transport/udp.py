@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import socket
+from collections.abc import Callable
 from dataclasses import dataclass
+from enum import Enum
 from typing import cast
 
 from trishul_snmp.errors import RequestTimeoutError, TransportError
 from trishul_snmp.types import SocketAddress
 
+DatagramHandler = Callable[[bytes, SocketAddress], None]
+
 
 class UdpClient:
     """Connected UDP client used for request/response flows."""
@@ -59,6 +63,15 @@ class UdpClient:
             self._socket.close()
             self._socket = None
 
+    def set_recv_buffer_size(self, size: int) -> None:
+        """Set ``SO_RCVBUF`` on the open socket."""
+        if self._socket is None:
+            raise TransportError("UDP client is not open")
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+        except OSError as exc:
+            raise TransportError("Unable to set UDP client receive buffer size") from exc
+
     async def send(self, data: bytes) -> None:
         """Send a datagram."""
         if self._socket is None:
@@ -93,6 +106,24 @@ class ReceivedDatagram:
     source_address: SocketAddress
 
 
+class DropPolicy(Enum):
+    """What a bounded server queue does with datagrams arriving while it is full."""
+
+    DROP_NEWEST = "drop-newest"
+    DROP_OLDEST = "drop-oldest"
+    PAUSE = "pause"
+
+
+@dataclass(frozen=True, slots=True)
+class DatagramQueueStats:
+    """Point-in-time server receive queue counters since the socket was opened."""
+
+    received: int
+    dropped: int
+    queued: int
+    high_water: int
+
+
 @dataclass(frozen=True, slots=True)
 class _ServerClosed:
     cause: Exception | None = None
@@ -103,10 +134,21 @@ class _QueueingDatagramProtocol(asyncio.DatagramProtocol):
         self,
         queue: asyncio.Queue[ReceivedDatagram | _ServerClosed],
         closed: asyncio.Future[None],
+        *,
+        max_queue: int = 0,
+        drop_policy: DropPolicy = DropPolicy.DROP_NEWEST,
+        handler: DatagramHandler | None = None,
     ) -> None:
         self._queue = queue
         self._closed = closed
+        self._max_queue = max_queue
+        self._drop_policy = drop_policy
+        self._handler = handler
+        self._paused = False
         self.transport: asyncio.DatagramTransport | None = None
+        self.received = 0
+        self.dropped = 0
+        self.high_water = 0
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self.transport = cast(asyncio.DatagramTransport, transport)
@@ -114,12 +156,43 @@ class _QueueingDatagramProtocol(asyncio.DatagramProtocol):
     def datagram_received(self, data: bytes, addr: tuple[object, ...]) -> None:
         if not (len(addr) >= 2 and isinstance(addr[0], str) and isinstance(addr[1], int)):
             return
-        self._queue.put_nowait(
+        self.received += 1
+        if self._handler is not None:
+            self._handler(data, cast(SocketAddress, addr))
+            return
+        queue = self._queue
+        if self._max_queue and queue.qsize() >= self._max_queue:
+            if self._drop_policy is DropPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self._drop_policy is DropPolicy.DROP_OLDEST:
+                queue.get_nowait()
+                self.dropped += 1
+        queue.put_nowait(
             ReceivedDatagram(
                 data=data,
                 source_address=cast(SocketAddress, addr),
             )
         )
+        depth = queue.qsize()
+        if depth > self.high_water:
+            self.high_water = depth
+        if self._drop_policy is DropPolicy.PAUSE and self._max_queue and depth >= self._max_queue:
+            self._pause_reading()
+
+    def datagram_taken(self) -> None:
+        """Resume a paused transport once the queue has room again."""
+        if self._paused and self._queue.qsize() < self._max_queue:
+            self._paused = False
+            if self.transport is not None and not self.transport.is_closing():
+                cast(asyncio.ReadTransport, self.transport).resume_reading()
+
+    def _pause_reading(self) -> None:
+        if self._paused or self.transport is None:
+            return
+        # leave further datagrams in the kernel receive buffer until drained
+        self._paused = True
+        cast(asyncio.ReadTransport, self.transport).pause_reading()
 
     def connection_lost(self, exc: Exception | None) -> None:
         self._queue.put_nowait(_ServerClosed(exc))
@@ -131,14 +204,43 @@ class _QueueingDatagramProtocol(asyncio.DatagramProtocol):
 
 
 class UdpServer:
-    """Bound UDP server transport for inbound receive and reply flows."""
+    """Bound UDP server transport for inbound receive and reply flows.
+
+    *max_queue* bounds the datagrams waiting for :meth:`receive` (``0`` leaves
+    the queue unbounded) and *drop_policy* decides what happens when it is
+    full. *recv_buffer_size* sets ``SO_RCVBUF`` on the bound socket, and
+    *reuse_port* binds with ``SO_REUSEPORT`` so several processes can share
+    the port while the kernel balances datagrams between them. With
+    *datagram_handler*, datagrams are passed to it straight from the protocol
+    callback instead of being queued for :meth:`receive`.
+    """
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        max_queue: int = 0,
+        drop_policy: DropPolicy = DropPolicy.DROP_NEWEST,
+        recv_buffer_size: int | None = None,
+        reuse_port: bool = False,
+        datagram_handler: DatagramHandler | None = None,
+    ) -> None:
+        if max_queue < 0:
+            raise ValueError("max_queue cannot be negative")
+        if recv_buffer_size is not None and recv_buffer_size < 1:
+            raise ValueError("recv_buffer_size must be positive")
         self._host = host
         self._port = port
+        self._max_queue = max_queue
+        self._drop_policy = drop_policy
+        self._recv_buffer_size = recv_buffer_size
+        self._reuse_port = reuse_port
+        self._datagram_handler = datagram_handler
         self._transport: asyncio.DatagramTransport | None = None
         self._queue: asyncio.Queue[ReceivedDatagram | _ServerClosed] | None = None
         self._closed: asyncio.Future[None] | None = None
+        self._protocol: _QueueingDatagramProtocol | None = None
 
     @property
     def local_address(self) -> SocketAddress | None:
@@ -154,6 +256,20 @@ class UdpServer:
             return cast(SocketAddress, sockname)
         return None
 
+    @property
+    def stats(self) -> DatagramQueueStats:
+        """Return receive queue counters since :meth:`open`."""
+        protocol = self._protocol
+        if protocol is None:
+            return DatagramQueueStats(received=0, dropped=0, queued=0, high_water=0)
+        queue = self._queue
+        return DatagramQueueStats(
+            received=protocol.received,
+            dropped=protocol.dropped,
+            queued=0 if queue is None else queue.qsize(),
+            high_water=protocol.high_water,
+        )
+
     async def open(self) -> None:
         """Bind the UDP server socket."""
         if self._transport is not None:
@@ -163,18 +279,35 @@ class UdpServer:
         queue: asyncio.Queue[ReceivedDatagram | _ServerClosed] = asyncio.Queue()
         closed = loop.create_future()
         try:
-            transport, _ = await loop.create_datagram_endpoint(
-                lambda: _QueueingDatagramProtocol(queue, closed),
+            transport, protocol = await loop.create_datagram_endpoint(
+                lambda: _QueueingDatagramProtocol(
+                    queue,
+                    closed,
+                    max_queue=self._max_queue,
+                    drop_policy=self._drop_policy,
+                    handler=self._datagram_handler,
+                ),
                 local_addr=(self._host, self._port),
+                reuse_port=self._reuse_port or None,
             )
         except OSError as exc:
             raise TransportError(
                 f"Unable to bind UDP server socket on {self._host}:{self._port}"
             ) from exc
+        except ValueError as exc:
+            raise TransportError("SO_REUSEPORT is not supported on this platform") from exc
+        if self._recv_buffer_size is not None:
+            sock = transport.get_extra_info("socket")
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._recv_buffer_size)
+            except OSError as exc:
+                transport.close()
+                raise TransportError("Unable to set UDP server receive buffer size") from exc
 
         self._transport = transport
         self._queue = queue
         self._closed = closed
+        self._protocol = protocol
 
     async def close(self) -> None:
         """Close the bound UDP server socket."""
@@ -196,6 +329,10 @@ class UdpServer:
 
     async def sendto(self, data: bytes, addr: SocketAddress) -> None:
         """Send a datagram to a specific remote peer."""
+        self.send_nowait(data, addr)
+
+    def send_nowait(self, data: bytes, addr: SocketAddress) -> None:
+        """Send a datagram without awaiting, for use from datagram handlers."""
         if self._transport is None:
             raise TransportError("UDP server is not open")
         try:
@@ -205,10 +342,60 @@ class UdpServer:
 
     async def receive(self) -> ReceivedDatagram:
         """Wait for the next inbound datagram."""
-        if self._queue is None:
+        queue = self._queue
+        if queue is None:
             raise TransportError("UDP server is not open")
 
-        item = await self._queue.get()
+        item = await queue.get()
         if isinstance(item, _ServerClosed):
+            # Leave the marker queued so every concurrent receiver observes the close.
+            queue.put_nowait(item)
             raise TransportError("UDP server is closed") from item.cause
+        if self._protocol is not None:
+            self._protocol.datagram_taken()
         return item
+
+    async def receive_batch(
+        self,
+        max_count: int,
+        *,
+        timeout: float | None = None,
+    ) -> list[ReceivedDatagram]:
+        """Wait up to *timeout* for one datagram, then take up to *max_count* already queued.
+
+        Returns an empty list when *timeout* expires first.
+        """
+        if max_count < 1:
+            raise ValueError("max_count must be at least 1")
+        queue = self._queue
+        if queue is None:
+            raise TransportError("UDP server is not open")
+        try:
+            first = await asyncio.wait_for(queue.get(), timeout=timeout)
+        except (asyncio.TimeoutError, TimeoutError):
+            return []
+        batch: list[ReceivedDatagram] = []
+        item = first
+        while True:
+            if isinstance(item, _ServerClosed):
+                queue.put_nowait(item)
+                if batch:
+                    break
+                raise TransportError("UDP server is closed") from item.cause
+            batch.append(item)
+            if len(batch) == max_count or queue.empty():
+                break
+            item = queue.get_nowait()
+        if self._protocol is not None:
+            self._protocol.datagram_taken()
+        return batch
+
+    async def wait_closed(self) -> None:
+        """Wait until the bound socket is closed."""
+        closed = self._closed
+        if closed is None:
+            return
+        try:
+            await asyncio.shield(closed)
+        except Exception:
+            return
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
 
 from trishul_snmp.errors import ProtocolError
@@ -39,6 +39,8 @@ class RawVarBind:
 
     oid: OID
     value: SnmpValueType
+    # complete VarBind SEQUENCE bytes; when set, the encoder splices them verbatim
+    encoded: bytes | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True, slots=True)
@@ -64,6 +66,12 @@ def build_null_varbinds(oids: Sequence[OID]) -> tuple[RawVarBind, ...]:
     return build_raw_varbinds((oid, NullValue()) for oid in oids)
 
 
+def build_encoded_varbind(oid: OID, value: SnmpValueType) -> RawVarBind:
+    """Build a varbind that carries its own pre-encoded BER bytes."""
+    varbind = RawVarBind(oid=oid, value=value)
+    return RawVarBind(oid=oid, value=value, encoded=_encode_varbind(varbind))
+
+
 def encode_pdu(pdu: Pdu) -> bytes:
     """Encode a PDU to BER bytes."""
     content = b"".join(
@@ -130,6 +138,9 @@ def _encode_varbind_list(varbinds: tuple[RawVarBind, ...]) -> bytes:
 
 
 def _encode_varbind(varbind: RawVarBind) -> bytes:
+    if varbind.encoded is not None:
+        return varbind.encoded
+
     from trishul_snmp.types import ObjectIdentifierValue
 
     content = encode_value(ObjectIdentifierValue(varbind.oid)) + encode_value(varbind.value)
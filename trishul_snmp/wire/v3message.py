@@ -65,19 +65,43 @@ def encode_v3_message(
     HMAC before sending (or with 12 zero bytes as a placeholder during MAC
     computation).
     """
+    raw, _ = encode_v3_message_with_auth_offset(
+        msg_id, msg_max_size, flags, usm_params, msg_data_bytes
+    )
+    return raw
+
+
+def encode_v3_message_with_auth_offset(
+    msg_id: int,
+    msg_max_size: int,
+    flags: int,
+    usm_params: UsmParams,
+    msg_data_bytes: bytes,
+) -> tuple[bytes, int]:
+    """Encode like :func:`encode_v3_message` and return the auth_params offset.
+
+    The offset is the byte position of the auth_params octet-string content
+    in the returned message, as :attr:`V3MessageView.auth_params_offset`
+    reports after decoding, so an HMAC can be stamped without re-decoding.
+    """
     header_data = _encode_header_data(msg_id, msg_max_size, flags)
-    usm_bytes = _encode_usm_params(usm_params)
+    usm_bytes, auth_offset_in_usm = _encode_usm_params_with_offset(usm_params)
     security_params = encode_tlv(_OCTET_STRING_TAG, usm_bytes)
-
-    content = b"".join(
-        [
-            _encode_integer(3),  # SNMPv3 version
-            header_data,
-            security_params,
-            msg_data_bytes,
-        ]
+    version = _encode_integer(_SNMP_V3_VERSION)
+
+    content = b"".join([version, header_data, security_params, msg_data_bytes])
+    raw = encode_tlv(_SEQUENCE_TAG, content)
+    # UsmSecurityParameters start after the outer SEQUENCE header, version,
+    # msgGlobalData, and the msgSecurityParameters OCTET STRING header
+    usm_start = (
+        len(raw)
+        - len(content)
+        + len(version)
+        + len(header_data)
+        + len(security_params)
+        - len(usm_bytes)
     )
-    return encode_tlv(_SEQUENCE_TAG, content)
+    return raw, usm_start + auth_offset_in_usm
 
 
 def decode_v3_message(data: bytes) -> V3MessageView:
@@ -213,18 +237,26 @@ def _decode_header_data(data: bytes, offset: int) -> tuple[int, int, bytes, int,
     return msg_id, msg_max_size, flags_content, security_model, offset
 
 
-def _encode_usm_params(p: UsmParams) -> bytes:
-    content = b"".join(
+def _encode_usm_params_with_offset(p: UsmParams) -> tuple[bytes, int]:
+    """Encode UsmSecurityParameters and return the auth_params content offset."""
+    leading = b"".join(
         [
             encode_tlv(_OCTET_STRING_TAG, p.engine_id),
             _encode_integer(p.engine_boots),
             _encode_integer(p.engine_time),
             encode_tlv(_OCTET_STRING_TAG, p.username),
-            encode_tlv(_OCTET_STRING_TAG, p.auth_params),
-            encode_tlv(_OCTET_STRING_TAG, p.priv_params),
         ]
     )
-    return encode_tlv(_SEQUENCE_TAG, content)
+    auth = encode_tlv(_OCTET_STRING_TAG, p.auth_params)
+    content = b"".join([leading, auth, encode_tlv(_OCTET_STRING_TAG, p.priv_params)])
+    encoded = encode_tlv(_SEQUENCE_TAG, content)
+    auth_offset = len(encoded) - len(content) + len(leading) + len(auth) - len(p.auth_params)
+    return encoded, auth_offset
+
+
+def _encode_usm_params(p: UsmParams) -> bytes:
+    encoded, _ = _encode_usm_params_with_offset(p)
+    return encoded
 
 
 def _decode_usm_params_with_offset(data: bytes) -> tuple[UsmParams, int]: